@@ -0,0 +1,97 @@
+"""
+Benchmark das estatísticas de antispam
+Compara o GROUP BY sobre antispam_logs com a leitura dos rollups por hora/dia
+
+Uso:
+    python benchmarks/bench_antispam_rollups.py [--logs 200000] [--days 30] [--queries 50]
+        [--users 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.antispam_rollups import DAY, rebuild_rollups
+from src.utils.database import Database
+
+ACTIONS: tuple[str, ...] = ("delete", "warn", "mute", "kick", "ban")
+
+RAW_QUERIES: tuple[str, ...] = (
+    """SELECT action_type, COUNT(*) AS count FROM antispam_logs
+    WHERE guild_id = ? AND created_at >= ? AND created_at < ? GROUP BY action_type""",
+    """SELECT user_id, COUNT(*) AS violations FROM antispam_logs
+    WHERE guild_id = ? AND created_at >= ? AND created_at < ?
+    GROUP BY user_id ORDER BY violations DESC""",
+)
+
+
+async def main() -> None:
+    """Função principal"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logs", type=int, default=200_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--users", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    end = time.time()
+    start = end - args.days * DAY
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = Database()
+        db.db_path = str(Path(temp_dir) / "bench.db")
+        await db.create_tables()
+        await db.run_many(
+            """INSERT INTO antispam_logs (guild_id, user_id, action_type, created_at)
+            VALUES (?, ?, ?, ?)""",
+            [
+                (
+                    "1",
+                    # Poucos infratores concentram a maior parte das detecções
+                    str(int(rng.paretovariate(1.2)) % args.users),
+                    rng.choice(ACTIONS),
+                    rng.uniform(start, end),
+                )
+                for _ in range(args.logs)
+            ],
+        )
+        async with db.pool.writer() as conn:
+            backfill = time.perf_counter()
+            await rebuild_rollups(conn)
+            await conn.commit()
+            backfill = time.perf_counter() - backfill
+
+        print(f"📊 {args.logs} detecções em {args.days} dias (backfill {backfill:.2f}s)")
+        timings: dict[str, float] = {}
+        for name in ("antes", "depois"):
+            elapsed = time.perf_counter()
+            for _ in range(args.queries):
+                if name == "antes":
+                    for query in RAW_QUERIES:
+                        await db.get_all(query, ("1", start, end))
+                else:
+                    await db.get_antispam_stats("1", start, end)
+            timings[name] = (time.perf_counter() - elapsed) / args.queries * 1000
+            print(f"{name:<10} {timings[name]:>8.2f} ms por /antispam-stats")
+
+        write = time.perf_counter()
+        for index in range(1000):
+            await db.log_antispam_detection("1", str(index % 50), "warn", when=end)
+        write = (time.perf_counter() - write) / 1000 * 1000
+        print(f"✍️ Registro com rollups: {write:.3f} ms por detecção")
+        await db.close()
+
+    print(f"⚡ Estatísticas {timings['antes'] / timings['depois']:.1f}x mais rápidas")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
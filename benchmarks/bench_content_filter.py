@@ -0,0 +1,81 @@
+"""
+Benchmark do filtro de conteúdo
+Compara o laço ``word in content`` antigo com o autômato Aho-Corasick compilado
+
+Uso:
+    python benchmarks/bench_content_filter.py [--messages 2000] [--sizes 100 1000 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.content_filter import ContentFilter
+
+
+def random_word(rng: random.Random, min_size: int = 4, max_size: int = 10) -> str:
+    """Gerar uma palavra aleatória"""
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(min_size, max_size)))
+
+
+def linear_filter(words: list[str], content: str) -> bool:
+    """Implementação anterior: uma busca de substring por palavra"""
+    content = content.lower()
+    return any(word.lower() in content for word in words)
+
+
+def run_size(size: int, messages: list[str]) -> tuple[float, float, float]:
+    """Medir compilação e busca para uma lista de ``size`` palavras"""
+    rng = random.Random(size)
+    words = [random_word(rng) for _ in range(size)]
+
+    start = time.perf_counter()
+    content_filter = ContentFilter.build(words)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    linear_hits = sum(linear_filter(words, message) for message in messages)
+    linear_us = (time.perf_counter() - start) / len(messages) * 1e6
+
+    start = time.perf_counter()
+    compiled_hits = sum(content_filter.find_profanity(message) is not None for message in messages)
+    compiled_us = (time.perf_counter() - start) / len(messages) * 1e6
+
+    if linear_hits != compiled_hits:
+        print(f"⚠️ Resultados divergentes: {linear_hits} x {compiled_hits}")
+    return build_ms, linear_us, compiled_us
+
+
+def main() -> None:
+    """Função principal"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    messages = [
+        " ".join(random_word(rng, 2, 8) for _ in range(rng.randint(5, 40)))
+        for _ in range(args.messages)
+    ]
+    average = sum(map(len, messages)) / len(messages)
+    print(f"📊 {args.messages} mensagens, {average:.0f} caracteres em média")
+
+    for size in args.sizes:
+        build_ms, linear_us, compiled_us = run_size(size, messages)
+        print(
+            f"{size:>6} palavras   compilação {build_ms:>7.1f} ms"
+            f"   antes {linear_us:>9.1f} µs/msg   depois {compiled_us:>7.1f} µs/msg"
+            f"   ({linear_us / compiled_us:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
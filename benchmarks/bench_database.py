@@ -0,0 +1,121 @@
+"""
+Benchmark do perfil de PRAGMAs do SQLite
+Compara escritas/s e latência p99 de leitura antes/depois (WAL, NORMAL, mmap)
+
+Uso:
+    python benchmarks/bench_database.py [--writes 2000] [--readers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.config import Config
+from src.utils.db_pool import ConnectionPool
+
+# Perfil padrão do SQLite (journal DELETE, synchronous FULL, sem mmap)
+BASELINE_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+    "mmap_size": 0,
+    "temp_store": "DEFAULT",
+}
+
+
+async def run_profile(
+    name: str, pragmas: dict[str, str | int], statement_cache: int, writes: int, readers: int
+) -> dict[str, float]:
+    """Executar escritas de XP concorrentes com leituras de leaderboard"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pool = ConnectionPool(
+            str(Path(temp_dir) / "bench.db"),
+            max_readers=readers,
+            pragmas=pragmas,
+            statement_cache_size=statement_cache,
+        )
+
+        async with pool.writer() as db:
+            await db.execute("""
+                CREATE TABLE user_levels (
+                    guild_id TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    total_xp INTEGER DEFAULT 0,
+                    UNIQUE(guild_id, user_id)
+                )
+            """)
+            await db.commit()
+
+        latencies: list[float] = []
+        writing = True
+
+        async def writer() -> float:
+            nonlocal writing
+            start = time.perf_counter()
+            for i in range(writes):
+                async with pool.writer() as db:
+                    await db.execute(
+                        """INSERT INTO user_levels (guild_id, user_id, total_xp)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT(guild_id, user_id)
+                        DO UPDATE SET total_xp = total_xp + excluded.total_xp""",
+                        ("1", str(i % 500), 15),
+                    )
+                    await db.commit()
+            writing = False
+            return time.perf_counter() - start
+
+        async def reader() -> None:
+            while writing:
+                start = time.perf_counter()
+                async with pool.reader() as db, db.execute(
+                    "SELECT user_id FROM user_levels WHERE guild_id = ? "
+                    "ORDER BY total_xp DESC LIMIT 10",
+                    ("1",),
+                ) as cursor:
+                    await cursor.fetchall()
+                latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0)
+
+        elapsed, *_ = await asyncio.gather(writer(), *(reader() for _ in range(readers)))
+        await pool.close()
+
+    p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) >= 2 else 0.0
+    result = {"writes_per_sec": writes / elapsed, "p99_read_ms": p99 * 1000}
+    print(
+        f"{name:<10} {result['writes_per_sec']:>10.0f} escritas/s"
+        f"   p99 leitura {result['p99_read_ms']:>8.2f} ms   ({len(latencies)} leituras)"
+    )
+    return result
+
+
+async def main() -> None:
+    """Função principal"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"📊 {args.writes} escritas, {args.readers} leitores concorrentes")
+    before = await run_profile("antes", BASELINE_PRAGMAS, 0, args.writes, args.readers)
+    after = await run_profile(
+        "depois",
+        Config.get_sqlite_pragmas(),
+        Config.DB_STATEMENT_CACHE_SIZE,
+        args.writes,
+        args.readers,
+    )
+
+    speedup = after["writes_per_sec"] / before["writes_per_sec"]
+    print(f"⚡ Escritas {speedup:.1f}x mais rápidas com o perfil configurado")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+Benchmark do rastreador de taxa do antispam
+Compara o dict de listas refeitas por compreensão com o RateTracker em
+buffers circulares, com muitos usuários ativos ao mesmo tempo
+
+Uso:
+    python benchmarks/bench_rate_tracker.py [--users 100000] [--messages 1000000] [--window 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.rate_tracker import RateTracker
+
+
+def list_tracker(events: list[tuple[tuple[int, int], float]], window: float) -> dict[Any, list]:
+    """Implementação anterior: lista por usuário filtrada a cada mensagem"""
+    cache: dict[Any, list[float]] = {}
+    for key, now in events:
+        recent = [timestamp for timestamp in cache.get(key, ()) if now - timestamp < window]
+        recent.append(now)
+        cache[key] = recent
+        _ = len(recent) > 5
+    return cache
+
+
+def ring_tracker(events: list[tuple[tuple[int, int], float]], window: float) -> RateTracker:
+    """Implementação nova: RateTracker compartilhado"""
+    tracker = RateTracker(max_keys=len(events), idle_ttl=window * 6)
+    hit = tracker.hit
+    for key, now in events:
+        _ = hit(key, window, now) > 5
+    return tracker
+
+
+def measure(function, events, window) -> tuple[float, float, Any]:
+    """Medir tempo por mensagem (µs) e memória retida ao final (MiB)"""
+    start = time.perf_counter()
+    function(events, window)
+    elapsed = time.perf_counter() - start
+
+    # Segunda execução só para medir memória (tracemalloc distorce o tempo)
+    tracemalloc.start()
+    result = function(events, window)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / len(events) * 1e6, retained / 1024 / 1024, result
+
+
+def main() -> None:
+    """Função principal"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--window", type=float, default=10.0)
+    args = parser.parse_args()
+
+    # Mensagens ao longo de 60s; uma fração dos usuários concentra o tráfego
+    rng = random.Random(0)
+    guilds = max(1, args.users // 1000)
+    users = [(rng.randrange(guilds), user) for user in range(args.users)]
+    hot = users[: max(1, args.users // 20)]
+    events = []
+    for index in range(args.messages):
+        key = rng.choice(hot) if rng.random() < 0.3 else rng.choice(users)
+        events.append((key, index * 60.0 / args.messages))
+    print(f"📊 {args.users} usuários, {args.messages} mensagens, janela {args.window:.0f}s")
+
+    before_us, before_mib, _ = measure(list_tracker, events, args.window)
+    after_us, after_mib, tracker = measure(ring_tracker, events, args.window)
+    stats = tracker.stats()
+    print(f"antes   {before_us:>6.2f} µs/msg   memória {before_mib:>7.1f} MiB   (sem limite de chaves)")
+    print(
+        f"depois  {after_us:>6.2f} µs/msg   memória {after_mib:>7.1f} MiB"
+        f"   {stats['keys']} chaves, arrays {stats['array_bytes'] / 1024 / 1024:.1f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
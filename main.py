@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import asyncio
 import os
-import sys
 from pathlib import Path
 
 import discord
@@ -17,9 +16,6 @@ from dotenv import load_dotenv
 # Carregar variáveis de ambiente do arquivo .env
 load_dotenv()
 
-# Adicionar src ao path para imports
-sys.path.append(str(Path(__file__).parent / "src"))
-
 
 class ModularBot(commands.Bot):
     """Bot principal com sistema modular"""
@@ -39,6 +35,7 @@ class ModularBot(commands.Bot):
         )
 
         self.container_handler: object | None = None
+        self.loop_watchdog: object | None = None
         self._processed_interactions: set[str] = set()  # Cache para evitar processamento duplo
 
     async def load_all_extensions(self) -> tuple[int, list[str]]:
@@ -97,7 +94,31 @@ class ModularBot(commands.Bot):
                                 errors.append(f"❌ {extension}: {str(e)[:100]}")
 
         # Lista de eventos seguros para carregar (sem conflitos de tasks)
-        safe_events = ["interaction_create", "message_create", "ready"]
+        safe_events = [
+            "interaction_create",
+            "message_create",
+            "ready",
+            # Executores do agendador e o rearme dos eventos pendentes no on_ready
+            "restarts_handler",
+            "timed_event_executed",
+            "temp_role_ban_check",
+            "suggestion_expired_handler",
+            "sticky_messages_poster",
+            # Autorole, boas-vindas e punição das entradas em massa (modo raid)
+            "guild_member_add",
+            # Gravação das mensagens dos tickets para os transcripts
+            "transcript_handlers",
+            # Fechamento de threads de ticket (transcript com anexos arquivados)
+            "thread_closure_handler",
+            # Logs do servidor (entregues em lote pelo database.log_dispatcher)
+            "log_member_add",
+            "log_member_remove",
+            "log_message_delete",
+            "log_message_update",
+            "log_channel_create",
+            "log_channel_delete",
+            "log_role_update",
+        ]
 
         # Carregar apenas eventos seguros
         events_dir = Path("src/events")
@@ -129,6 +150,21 @@ class ModularBot(commands.Bot):
         """Configuração inicial do bot"""
         print("🔄 Iniciando configuração do bot...")
 
+        # Vigiar bloqueios do event loop (I/O síncrono em handlers)
+        try:
+            from src.utils.config import Config
+            from src.utils.loop_watchdog import LoopLagWatchdog
+
+            self.loop_watchdog = LoopLagWatchdog(
+                threshold_ms=Config.LOOP_LAG_THRESHOLD_MS,
+                interval=Config.LOOP_LAG_CHECK_INTERVAL,
+            )
+            self.loop_watchdog.start()
+            print("✅ Watchdog do event loop ativo")
+        except Exception as e:
+            print(f"⚠️ Erro no watchdog do event loop: {e}")
+            self.loop_watchdog = None
+
         # Configurar handler de containers de forma segura
         try:
             from src.events.container_handler import setup_container_handler
@@ -247,6 +283,18 @@ class ModularBot(commands.Bot):
         print("🔄 Encerrando bot...")
         await super().close()
 
+        # Fechar conexões persistentes do banco depois que os cogs pararam
+        try:
+            from src.utils.database import database
+
+            await database.close()
+            print("✅ Conexões do database encerradas")
+        except Exception as e:
+            print(f"⚠️ Erro ao encerrar database: {e}")
+
+        if self.loop_watchdog is not None:
+            await self.loop_watchdog.stop()
+
 
 async def main() -> None:
     """Função principal"""
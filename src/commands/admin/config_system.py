@@ -5,8 +5,6 @@ Interface para dashboard e configurações do servidor
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import discord
@@ -17,10 +15,7 @@ from discord.ui import Button, Select, View
 if TYPE_CHECKING:
     pass
 
-# Adicionar src ao path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
-from utils.permission_system import perm_system
+from ...utils.permission_system import perm_system
 
 
 class RoleSelectMenu(Select):
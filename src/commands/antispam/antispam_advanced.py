@@ -5,7 +5,6 @@ Configuração avançada de regras e exceções do antispam
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -61,14 +60,13 @@ class AntispamRules(commands.Cog):
             try:
                 from ...utils.database import database
 
-                config_data: Any = await database.get(
-                    "SELECT config_data FROM antispam_config WHERE guild_id = ?",
-                    (str(interaction.guild.id),),
+                config_data: dict[str, Any] | None = await database.antispam_policies.load_config(
+                    interaction.guild.id
                 )
 
                 config: dict[str, Any]
                 if config_data:
-                    config = json.loads(config_data["config_data"])
+                    config = config_data
                 else:
                     # Configuração padrão expandida
                     config = {
@@ -289,12 +287,7 @@ class AntispamRules(commands.Cog):
                     if success:
                         # Salvar configuração atualizada
                         config["rules"] = rules
-                        config_json: str = json.dumps(config)
-
-                        await database.execute(
-                            "UPDATE antispam_config SET config_data = ? WHERE guild_id = ?",
-                            (config_json, str(interaction.guild.id)),
-                        )
+                        await database.antispam_policies.save(interaction.guild.id, config)
 
                         edit_embed: discord.Embed = discord.Embed(
                             title="✅ **REGRA ATUALIZADA**",
@@ -351,11 +344,7 @@ class AntispamRules(commands.Cog):
                     config["rules"] = default_rules
 
                     # Salvar
-                    config_json = json.dumps(config)
-                    await database.execute(
-                        "UPDATE antispam_config SET config_data = ? WHERE guild_id = ?",
-                        (config_json, str(interaction.guild.id)),
-                    )
+                    await database.antispam_policies.save(interaction.guild.id, config)
 
                     reset_embed: discord.Embed = discord.Embed(
                         title="🔄 **REGRAS RESETADAS**",
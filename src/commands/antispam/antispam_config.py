@@ -5,9 +5,8 @@ Sistema inteligente de detecção e prevenção de spam
 
 from __future__ import annotations
 
-import json
 import re
-from collections import defaultdict, deque
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -15,16 +14,35 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+from ...utils.message_pipeline import ANTISPAM_VIOLATIONS, get_message_pipeline
+
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Callable
+
+    from ...utils.antispam_policy import AntispamPolicy
+    from ...utils.message_pipeline import MessageContext
+
+# Padrões das verificações (compilados uma única vez)
+EMOJI_PATTERN = re.compile(
+    r"<:\w+:\d+>|[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
+    r"\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251]"
+)
+SUSPICIOUS_LINK_PATTERN = re.compile(
+    r"discord\.gg/\w+"  # Convites Discord
+    r"|bit\.ly/\w+"  # Links encurtados
+    r"|tinyurl\.com/\w+"  # Links encurtados
+    r"|free\s+(nitro|money|robux)",  # Scams comuns
+    re.IGNORECASE,
+)
+REPEATED_CHARS_PATTERN = re.compile(r"(.)\1{4,}")
 
 
 class AntispamSystem:
     """Sistema de detecção de spam inteligente"""
 
     def __init__(self) -> None:
-        # Armazenamento temporário de mensagens por usuário
-        self.user_messages: dict[int, deque[datetime]] = defaultdict(lambda: deque(maxlen=20))
+        # Contadores de violações por usuário (a taxa fica em database.rate_tracker)
         self.user_violations: dict[int, int] = defaultdict(int)
         self.user_warnings: dict[int, int] = defaultdict(int)
 
@@ -54,102 +72,114 @@ class AntispamSystem:
         }
 
     def is_spam_message(
-        self, message: discord.Message, config: dict[str, Any]
+        self, message: discord.Message, policy: AntispamPolicy
     ) -> tuple[bool, list[str]]:
-        """Analisa se uma mensagem é spam"""
-        violations: list[str] = []
-
-        # Verificar se usuário está na whitelist
-        if str(message.author.id) in config.get("whitelist_users", []):
-            return False, []
+        """
+        Analisa se uma mensagem é spam
 
-        # Verificar roles ignorados
-        ignored_roles: list[str] = config.get("ignored_roles", [])
-        if any(str(role.id) in ignored_roles for role in message.author.roles):
+        As verificações rodam na ordem da política e param na primeira
+        violação; a contagem de mensagens é sempre registrada.
+        """
+        if policy.is_exempt(message.author, message.channel.id):
             return False, []
 
-        # Verificar canal ignorado
-        if str(message.channel.id) in config.get("ignored_channels", []):
-            return False, []
-
-        # Verificar permissões especiais
-        if message.author.guild_permissions.manage_messages:
-            return False, []
+        recent_count: int = 0
+        if "spam_messages" in policy.checks:
+            # Janela deslizante por servidor e usuário
+            recent_count = database.rate_tracker.hit(
+                (message.guild.id, message.author.id),
+                policy.time_window,
+                message.created_at.timestamp(),
+                message.id,
+            )
 
+        for check in policy.checks:
+            violation = self._checks[check](message, policy, recent_count)
+            if violation:
+                return True, [violation]
+        return False, []
+
+    @staticmethod
+    def _check_spam_messages(
+        message: discord.Message, policy: AntispamPolicy, recent_count: int
+    ) -> str | None:
+        """1. Spam de mensagens rápidas"""
+        if recent_count > policy.max_messages:
+            return f"Muitas mensagens ({recent_count} em {policy.time_window:g}s)"
+        return None
+
+    @staticmethod
+    def _check_duplicate_content(
+        message: discord.Message, policy: AntispamPolicy, recent_count: int
+    ) -> str | None:
+        """2. Mensagens duplicadas (verificação simples dentro da própria mensagem)"""
         content: str = message.content
-        user_id: int = message.author.id
-
-        # 1. SPAM DE MENSAGENS RÁPIDAS
-        now: datetime = datetime.now()
-        user_msgs: deque[datetime] = self.user_messages[user_id]
-
-        # Adicionar mensagem atual
-        user_msgs.append(now)
-
-        # Contar mensagens no período
-        time_window: int = config.get("time_window", 10)
-        recent_msgs: list[datetime] = [
-            msg for msg in user_msgs if (now - msg).seconds <= time_window
-        ]
-
-        if len(recent_msgs) > config.get("max_messages", 5):
-            violations.append(f"Muitas mensagens ({len(recent_msgs)} em {time_window}s)")
-
-        # 2. MENSAGENS DUPLICADAS
-        recent_content: list[Any] = []
-        for msg_time in list(user_msgs)[-10:]:  # Últimas 10 mensagens
-            # Aqui seria ideal salvar o conteúdo também, mas por simplicidade...
-            pass
-
-        # Verificação simples de duplicatas (seria melhor com histórico completo)
         if len(content) > 10:  # Só verificar mensagens com conteúdo
-            duplicate_count: int = sum(
-                1 for _ in re.finditer(re.escape(content.lower()), content.lower())
-            )
-            if duplicate_count > config.get("max_duplicates", 3):
-                violations.append("Mensagem duplicada repetida")
-
-        # 3. MUITAS MENÇÕES
+            lowered = content.lower()
+            if lowered.count(lowered) > policy.max_duplicates:
+                return "Mensagem duplicada repetida"
+        return None
+
+    @staticmethod
+    def _check_excessive_mentions(
+        message: discord.Message, policy: AntispamPolicy, recent_count: int
+    ) -> str | None:
+        """3. Muitas menções"""
         mentions_count: int = len(message.mentions) + len(message.role_mentions)
-        if mentions_count > config.get("max_mentions", 5):
-            violations.append(f"Muitas menções ({mentions_count})")
-
-        # 4. MUITOS EMOJIS
-        emoji_count: int = len(
-            re.findall(
-                r"<:\w+:\d+>|[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251]",
-                content,
-            )
-        )
-        if emoji_count > config.get("max_emojis", 10):
-            violations.append(f"Muitos emojis ({emoji_count})")
-
-        # 5. MUITO CAPS
+        if mentions_count > policy.max_mentions:
+            return f"Muitas menções ({mentions_count})"
+        return None
+
+    @staticmethod
+    def _check_excessive_emojis(
+        message: discord.Message, policy: AntispamPolicy, recent_count: int
+    ) -> str | None:
+        """4. Muitos emojis"""
+        emoji_count: int = len(EMOJI_PATTERN.findall(message.content))
+        if emoji_count > policy.max_emojis:
+            return f"Muitos emojis ({emoji_count})"
+        return None
+
+    @staticmethod
+    def _check_excessive_caps(
+        message: discord.Message, policy: AntispamPolicy, recent_count: int
+    ) -> str | None:
+        """5. Muito CAPS"""
+        content: str = message.content
         if len(content) > 10:
             caps_count: int = sum(1 for c in content if c.isupper())
             caps_percentage: float = (caps_count / len(content)) * 100
-            if caps_percentage > config.get("max_caps_percentage", 70):
-                violations.append(f"Muito CAPS ({caps_percentage:.1f}%)")
-
-        # 6. LINKS SUSPEITOS (básico)
-        suspicious_patterns: list[str] = [
-            r"discord\.gg/\w+",  # Convites Discord
-            r"bit\.ly/\w+",  # Links encurtados
-            r"tinyurl\.com/\w+",  # Links encurtados
-            r"free\s+(nitro|money|robux)",  # Scams comuns
-        ]
-
-        for pattern in suspicious_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                violations.append("Link suspeito detectado")
-                break
-
-        # 7. CARACTERES REPETIDOS
-        repeated_chars: list[Any] = re.findall(r"(.)\1{4,}", content)  # 5+ caracteres iguais seguidos
-        if repeated_chars:
-            violations.append("Caracteres repetidos excessivamente")
-
-        return len(violations) > 0, violations
+            if caps_percentage > policy.max_caps_percentage:
+                return f"Muito CAPS ({caps_percentage:.1f}%)"
+        return None
+
+    @staticmethod
+    def _check_suspicious_links(
+        message: discord.Message, policy: AntispamPolicy, recent_count: int
+    ) -> str | None:
+        """6. Links suspeitos (básico)"""
+        if SUSPICIOUS_LINK_PATTERN.search(message.content):
+            return "Link suspeito detectado"
+        return None
+
+    @staticmethod
+    def _check_repeated_chars(
+        message: discord.Message, policy: AntispamPolicy, recent_count: int
+    ) -> str | None:
+        """7. Caracteres repetidos (5+ caracteres iguais seguidos)"""
+        if REPEATED_CHARS_PATTERN.search(message.content):
+            return "Caracteres repetidos excessivamente"
+        return None
+
+    _checks: dict[str, Callable[[discord.Message, AntispamPolicy, int], str | None]] = {
+        "spam_messages": _check_spam_messages,
+        "duplicate_content": _check_duplicate_content,
+        "excessive_mentions": _check_excessive_mentions,
+        "excessive_emojis": _check_excessive_emojis,
+        "excessive_caps": _check_excessive_caps,
+        "suspicious_links": _check_suspicious_links,
+        "repeated_chars": _check_repeated_chars,
+    }
 
 
 class AntispamConfig(commands.Cog):
@@ -185,22 +215,13 @@ class AntispamConfig(commands.Cog):
 
             # Buscar configuração existente ou usar padrão
             try:
-                from ...utils.database import database
-
-                existing: Any = await database.get(
-                    "SELECT config_data FROM antispam_config WHERE guild_id = ?",
-                    (str(interaction.guild.id),),
+                existing: dict[str, Any] | None = await database.antispam_policies.load_config(
+                    interaction.guild.id
                 )
-
-                config: dict[str, Any]
-                if existing:
-                    config = json.loads(existing["config_data"])
-                else:
-                    config = self.antispam.default_config.copy()
-
             except Exception as e:
                 print(f"❌ Erro ao carregar config: {e}")
-                config = self.antispam.default_config.copy()
+                existing = None
+            config: dict[str, Any] = {**self.antispam.default_config, **(existing or {})}
 
             # Aplicar alterações
             config["enabled"] = ativo
@@ -211,20 +232,9 @@ class AntispamConfig(commands.Cog):
             if auto_mute is not None:
                 config["auto_mute"] = auto_mute
 
-            # Salvar configuração
+            # Salvar configuração (a política em memória é trocada na hora)
             try:
-                config_json: str = json.dumps(config)
-
-                if existing:
-                    await database.execute(
-                        "UPDATE antispam_config SET config_data = ? WHERE guild_id = ?",
-                        (config_json, str(interaction.guild.id)),
-                    )
-                else:
-                    await database.execute(
-                        "INSERT INTO antispam_config (guild_id, config_data) VALUES (?, ?)",
-                        (str(interaction.guild.id), config_json),
-                    )
+                await database.antispam_policies.save(interaction.guild.id, config)
             except Exception as e:
                 print(f"❌ Erro ao salvar config: {e}")
                 await interaction.followup.send("❌ Erro ao salvar configuração.", ephemeral=True)
@@ -303,20 +313,12 @@ class AntispamConfig(commands.Cog):
 
             # Buscar config
             try:
-                from ...utils.database import database
-
-                existing: Any = await database.get(
-                    "SELECT config_data FROM antispam_config WHERE guild_id = ?",
-                    (str(interaction.guild.id),),
+                existing: dict[str, Any] | None = await database.antispam_policies.load_config(
+                    interaction.guild.id
                 )
-
-                config: dict[str, Any]
-                if existing:
-                    config = json.loads(existing["config_data"])
-                else:
-                    config = self.antispam.default_config.copy()
-            except:
-                config = self.antispam.default_config.copy()
+            except Exception:
+                existing = None
+            config: dict[str, Any] = {**self.antispam.default_config, **(existing or {})}
 
             whitelist: list[str] = config.get("whitelist_users", [])
 
@@ -326,10 +328,7 @@ class AntispamConfig(commands.Cog):
                     config["whitelist_users"] = whitelist
 
                     # Salvar
-                    await database.execute(
-                        "UPDATE antispam_config SET config_data = ? WHERE guild_id = ?",
-                        (json.dumps(config), str(interaction.guild.id)),
-                    )
+                    await database.antispam_policies.save(interaction.guild.id, config)
 
                     await interaction.followup.send(
                         f"✅ **{usuario.mention} adicionado à whitelist antispam!**", ephemeral=True
@@ -345,10 +344,7 @@ class AntispamConfig(commands.Cog):
                     config["whitelist_users"] = whitelist
 
                     # Salvar
-                    await database.execute(
-                        "UPDATE antispam_config SET config_data = ? WHERE guild_id = ?",
-                        (json.dumps(config), str(interaction.guild.id)),
-                    )
+                    await database.antispam_policies.save(interaction.guild.id, config)
 
                     await interaction.followup.send(
                         f"✅ **{usuario.mention} removido da whitelist antispam!**", ephemeral=True
@@ -393,48 +389,38 @@ class AntispamConfig(commands.Cog):
             print(f"❌ Erro no antispam-whitelist: {e}")
             await interaction.followup.send("❌ Erro ao gerenciar whitelist.", ephemeral=True)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        """Event listener para detectar spam"""
-        try:
-            # Ignorar bots e DMs
-            if message.author.bot or not message.guild:
-                return
+    async def cog_load(self) -> None:
+        """Registrar estágio no pipeline de mensagens"""
+        get_message_pipeline(self.bot).register("antispam_system", self.process_message)
 
-            # Buscar configuração
-            try:
-                from ...utils.database import database
-
-                config_data: Any = await database.get(
-                    "SELECT config_data FROM antispam_config WHERE guild_id = ?",
-                    (str(message.guild.id),),
-                )
-
-                if not config_data:
-                    return
-
-                config: dict[str, Any] = json.loads(config_data["config_data"])
-
-                if not config.get("enabled", False):
-                    return
+    async def cog_unload(self) -> None:
+        """Remover estágio do pipeline de mensagens"""
+        get_message_pipeline(self.bot).unregister("antispam_system")
 
-            except Exception as e:
-                print(f"❌ Erro ao carregar config antispam: {e}")
+    async def process_message(self, ctx: MessageContext) -> None:
+        """Estágio do pipeline para detectar spam"""
+        message = ctx.message
+        try:
+            # Política compilada em memória (o banco só é lido na primeira mensagem)
+            policy: AntispamPolicy = await database.antispam_policies.get(message.guild.id)
+            if not policy.enabled:
                 return
 
             # Verificar se é spam
             is_spam: bool
             violations: list[str]
-            is_spam, violations = self.antispam.is_spam_message(message, config)
+            is_spam, violations = self.antispam.is_spam_message(message, policy)
 
             if is_spam:
-                await self.handle_spam_detection(message, violations, config)
+                # Veredito para os estágios dependentes (ex.: log do antispam_handler)
+                ctx.data[ANTISPAM_VIOLATIONS] = violations
+                await self.handle_spam_detection(message, violations, policy)
 
         except Exception as e:
             print(f"❌ Erro no antispam listener: {e}")
 
     async def handle_spam_detection(
-        self, message: discord.Message, violations: list[str], config: dict[str, Any]
+        self, message: discord.Message, violations: list[str], policy: AntispamPolicy
     ) -> None:
         """Lida com detecção de spam"""
         try:
@@ -445,27 +431,26 @@ class AntispamConfig(commands.Cog):
             violation_count: int = self.antispam.user_violations[user_id]
 
             # Deletar mensagem se configurado
-            if config.get("delete_messages", True):
+            if policy.delete_messages:
                 try:
                     await message.delete()
                 except:
                     pass
 
-            # Determinar ação
-            actions: dict[str, str] = config.get("actions", {})
-
-            action: str
-            if violation_count == 1:
-                action = actions.get("first_violation", "warn")
-            elif violation_count == 2:
-                action = actions.get("second_violation", "mute")
-            elif violation_count == 3:
-                action = actions.get("third_violation", "kick")
-            else:
-                action = actions.get("persistent_violation", "ban")
+            # Determinar ação pela escada de punições
+            action: str = policy.action_for(violation_count)
 
             # Executar ação
-            await self.execute_antispam_action(message, action, violations, violation_count, config)
+            await self.execute_antispam_action(message, action, violations, violation_count, policy)
+
+            # Registrar a detecção (alimenta os rollups do /antispam-stats)
+            await database.log_antispam_detection(
+                str(message.guild.id),
+                str(user_id),
+                action,
+                str(message.channel.id),
+                ", ".join(violations),
+            )
 
         except Exception as e:
             print(f"❌ Erro ao lidar com spam: {e}")
@@ -476,7 +461,7 @@ class AntispamConfig(commands.Cog):
         action: str,
         violations: list[str],
         count: int,
-        config: dict[str, Any],
+        policy: AntispamPolicy,
     ) -> None:
         """Executa ação antispam"""
         try:
@@ -526,9 +511,9 @@ class AntispamConfig(commands.Cog):
                 except:
                     pass
 
-            elif action == "mute" and config.get("auto_mute", True):
+            elif action == "mute" and policy.auto_mute:
                 # Aplicar timeout/mute
-                mute_duration: int = config.get("mute_duration", 300)
+                mute_duration: int = policy.mute_duration
 
                 try:
                     await member.timeout(
@@ -572,8 +557,6 @@ class AntispamConfig(commands.Cog):
 
             # Enviar log se houver canal configurado
             try:
-                from ...utils.database import database
-
                 log_config: Any = await database.get(
                     "SELECT channel_id FROM logs WHERE guild_id = ? AND log_type = 'antispam'",
                     (str(guild.id),),
@@ -18,6 +18,15 @@ if TYPE_CHECKING:
     pass
 
 
+# Ação registrada em antispam_logs -> chave das estatísticas
+ACTION_STATS: dict[str, str] = {
+    "warn": "warnings",
+    "mute": "mutes",
+    "kick": "kicks",
+    "ban": "bans",
+}
+
+
 class AntispamStats(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot: commands.Bot = bot
@@ -66,32 +75,17 @@ class AntispamStats(commands.Cog):
             else:
                 start_date = now - timedelta(days=1)  # Default: último dia
 
-            # Buscar estatísticas do banco
+            # Buscar estatísticas do banco (rollups por hora/dia)
+            top_results: list[tuple[str, int]] = []
             try:
                 from ...utils.database import database
 
-                # Query base
-                query: str
-                params: tuple[Any, ...]
-
-                if usuario:
-                    query = """
-                        SELECT action_type, COUNT(*) as count
-                        FROM antispam_logs
-                        WHERE guild_id = ? AND user_id = ? AND timestamp >= ?
-                        GROUP BY action_type
-                    """
-                    params = (str(interaction.guild.id), str(usuario.id), start_date.isoformat())
-                else:
-                    query = """
-                        SELECT action_type, COUNT(*) as count, COUNT(DISTINCT user_id) as unique_users
-                        FROM antispam_logs
-                        WHERE guild_id = ? AND timestamp >= ?
-                        GROUP BY action_type
-                    """
-                    params = (str(interaction.guild.id), start_date.isoformat())
-
-                results: Any = await database.fetch_all(query, params)
+                rollup: dict[str, Any] = await database.get_antispam_stats(
+                    str(interaction.guild.id),
+                    start_date.timestamp(),
+                    now.timestamp(),
+                    user_id=str(usuario.id) if usuario else None,
+                )
 
                 # Processar resultados
                 stats: dict[str, int] = {
@@ -103,18 +97,12 @@ class AntispamStats(commands.Cog):
                     "total": 0,
                 }
 
-                unique_users: int = 0
-
-                for row in results:
-                    action_type: str = row.get("action_type", "")
-                    count: int = row.get("count", 0)
+                for action_type, count in rollup["actions"].items():
+                    stats[ACTION_STATS.get(action_type, "detections")] += count
+                    stats["total"] += count
 
-                    if action_type in stats:
-                        stats[action_type] = count
-                        stats["total"] += count
-
-                    if not usuario and "unique_users" in row:
-                        unique_users = max(unique_users, row["unique_users"])
+                unique_users: int = rollup["unique_users"]
+                top_results = rollup["top"]
 
             except Exception as e:
                 print(f"❌ Erro ao buscar estatísticas: {e}")
@@ -174,27 +162,11 @@ class AntispamStats(commands.Cog):
             # Top violadores (se for servidor inteiro)
             if not usuario:
                 try:
-                    top_query: str = """
-                        SELECT user_id, COUNT(*) as violations
-                        FROM antispam_logs
-                        WHERE guild_id = ? AND timestamp >= ?
-                        GROUP BY user_id
-                        ORDER BY violations DESC
-                        LIMIT 5
-                    """
-
-                    top_results: Any = await database.fetch_all(
-                        top_query, (str(interaction.guild.id), start_date.isoformat())
-                    )
-
                     if top_results:
                         top_violators: str = ""
                         medals: list[str] = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"]
 
-                        for idx, row in enumerate(top_results):
-                            user_id: str = row.get("user_id", "")
-                            violations_count: int = row.get("violations", 0)
-
+                        for idx, (user_id, violations_count) in enumerate(top_results):
                             user: discord.Member | None = interaction.guild.get_member(int(user_id))
                             user_mention: str = (
                                 user.mention if user else f"Usuário não encontrado (`{user_id}`)"
@@ -450,11 +422,9 @@ class AntispamStats(commands.Cog):
                 elif tipo.lower() == "estatisticas":
                     # Resetar logs do banco de dados
                     if usuario:
-                        result: Any = await database.execute(
-                            "DELETE FROM antispam_logs WHERE guild_id = ? AND user_id = ?",
-                            (str(interaction.guild.id), str(usuario.id)),
+                        reset_count = await database.delete_antispam_logs(
+                            str(interaction.guild.id), str(usuario.id)
                         )
-                        reset_count = result.rowcount if hasattr(result, "rowcount") else 0
 
                         await interaction.followup.send(
                             f"✅ Estatísticas de {usuario.mention} resetadas!\n"
@@ -462,11 +432,9 @@ class AntispamStats(commands.Cog):
                             ephemeral=True,
                         )
                     else:
-                        result = await database.execute(
-                            "DELETE FROM antispam_logs WHERE guild_id = ?",
-                            (str(interaction.guild.id),),
+                        reset_count = await database.delete_antispam_logs(
+                            str(interaction.guild.id)
                         )
-                        reset_count = result.rowcount if hasattr(result, "rowcount") else 0
 
                         await interaction.followup.send(
                             f"✅ Todas as estatísticas foram resetadas!\n"
@@ -481,13 +449,10 @@ class AntispamStats(commands.Cog):
                         if user_id in self.temp_stats:
                             del self.temp_stats[user_id]
 
-                        result = await database.execute(
-                            "DELETE FROM antispam_logs WHERE guild_id = ? AND user_id = ?",
-                            (str(interaction.guild.id), str(usuario.id)),
+                        reset_count = await database.delete_antispam_logs(
+                            str(interaction.guild.id), str(usuario.id)
                         )
 
-                        reset_count = result.rowcount if hasattr(result, "rowcount") else 0
-
                         await interaction.followup.send(
                             f"✅ **RESET COMPLETO** de {usuario.mention}!\n"
                             f"Violações e estatísticas removidas.",
@@ -496,13 +461,10 @@ class AntispamStats(commands.Cog):
                     else:
                         self.temp_stats.clear()
 
-                        result = await database.execute(
-                            "DELETE FROM antispam_logs WHERE guild_id = ?",
-                            (str(interaction.guild.id),),
+                        reset_count = await database.delete_antispam_logs(
+                            str(interaction.guild.id)
                         )
 
-                        reset_count = result.rowcount if hasattr(result, "rowcount") else 0
-
                         await interaction.followup.send(
                             f"✅ **RESET COMPLETO DO SERVIDOR**!\n"
                             f"Todas as violações e estatísticas foram removidas.\n"
@@ -11,6 +11,11 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.page_provider import KeysetPageProvider
+
+# backup_data (o JSON completo do servidor) só é lido ao abrir ou restaurar um backup
+BACKUP_LIST_COLUMNS = "backup_id, guild_id, backup_name, backup_info, created_at, created_by"
+
 
 class BackupRestoreConfirmView(discord.ui.View):
     """View de confirmação para restaurar backup"""
@@ -66,30 +71,33 @@ class BackupRestoreConfirmView(discord.ui.View):
 class BackupListView(discord.ui.View):
     """View de paginação para lista de backups"""
 
-    def __init__(self, backups: list[dict], user: discord.Member, per_page: int = 5):
+    def __init__(self, pages: KeysetPageProvider, user: discord.Member):
         super().__init__(timeout=300)
-        self.backups = backups
+        # Backups lidos uma página por vez (ver KeysetPageProvider)
+        self.pages = pages
         self.user = user
-        self.per_page = per_page
+        self.per_page = pages.page_size
         self.current_page = 0
-        self.max_page = (len(backups) - 1) // per_page
+        self.update_buttons()
 
-        # Desabilitar botões se necessário
-        if self.max_page == 0:
-            self.prev_button.disabled = True
-            self.next_button.disabled = True
-        else:
-            self.prev_button.disabled = True  # Primeira página
+    def update_buttons(self):
+        """Atualiza estado dos botões"""
+        self.prev_button.disabled = self.current_page == 0
+        self.next_button.disabled = not self.pages.has_next(self.current_page)
 
-    def get_page_embed(self) -> discord.Embed:
+    async def get_page_embed(self) -> discord.Embed:
         """Gera embed da página atual"""
         start_idx = self.current_page * self.per_page
-        end_idx = start_idx + self.per_page
-        page_backups = self.backups[start_idx:end_idx]
+        page_backups = await self.pages.page(self.current_page)
+        total = self.pages.total
+        if total is None:
+            total = await self.pages.wait_total()
+        self.update_buttons()
 
         embed = discord.Embed(
             title="📦 **LISTA DE BACKUPS**",
-            description=f"Página {self.current_page + 1}/{self.max_page + 1} • Total: {len(self.backups)} backups",
+            description=f"{self.pages.page_label(self.current_page)} • "
+            f"Total: {total if total is not None else '...'} backups",
             color=0x4A90E2,
             timestamp=datetime.now(),
         )
@@ -142,13 +150,9 @@ class BackupListView(discord.ui.View):
             )
             return
 
-        self.current_page -= 1
-
-        # Atualizar estado dos botões
-        self.prev_button.disabled = self.current_page == 0
-        self.next_button.disabled = False
+        self.current_page = max(0, self.current_page - 1)
 
-        embed = self.get_page_embed()
+        embed = await self.get_page_embed()
         await interaction.response.edit_message(embed=embed, view=self)
 
     @discord.ui.button(label="▶️", style=discord.ButtonStyle.primary)
@@ -159,13 +163,10 @@ class BackupListView(discord.ui.View):
             )
             return
 
-        self.current_page += 1
+        if self.pages.has_next(self.current_page):
+            self.current_page += 1
 
-        # Atualizar estado dos botões
-        self.next_button.disabled = self.current_page == self.max_page
-        self.prev_button.disabled = False
-
-        embed = self.get_page_embed()
+        embed = await self.get_page_embed()
         await interaction.response.edit_message(embed=embed, view=self)
 
 
@@ -192,15 +193,21 @@ class BackupManagement(commands.Cog):
 
                 if todos and interaction.user.id == interaction.guild.owner_id:
                     # Todos os backups (apenas owner)
-                    backups = await database.get_all(
-                        "SELECT * FROM server_backups ORDER BY created_at DESC", ()
-                    )
+                    where, params = "", ()
                 else:
                     # Apenas do servidor atual
-                    backups = await database.get_all(
-                        "SELECT * FROM server_backups WHERE guild_id = ? ORDER BY created_at DESC",
-                        (str(interaction.guild.id),),
-                    )
+                    where, params = "guild_id = ?", (str(interaction.guild.id),)
+
+                pages = KeysetPageProvider(
+                    database,
+                    "server_backups",
+                    where=where,
+                    params=params,
+                    order=(("created_at", "DESC"), ("backup_id", "DESC")),
+                    columns=BACKUP_LIST_COLUMNS,
+                    page_size=5,
+                )
+                backups = await pages.page(0)
 
             except Exception as e:
                 print(f"❌ Erro ao buscar backups: {e}")
@@ -233,8 +240,8 @@ class BackupManagement(commands.Cog):
                 return
 
             # Criar view de paginação
-            view = BackupListView(backups, interaction.user)
-            embed = view.get_page_embed()
+            view = BackupListView(pages, interaction.user)
+            embed = await view.get_page_embed()
 
             await interaction.followup.send(embed=embed, view=view, ephemeral=True)
 
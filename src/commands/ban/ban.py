@@ -9,6 +9,9 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.interaction_helpers import InteractionHelpers
+from ...utils.page_provider import BanPageProvider
+
 
 class Ban(commands.Cog):
     def __init__(self, bot):
@@ -123,6 +126,93 @@ class Ban(commands.Cog):
             )
 
 
+    @app_commands.command(name="banlist", description="📋 Ver lista de usuários banidos")
+    @app_commands.describe(buscar="Buscar por nome ou ID específico")
+    async def ban_list(self, interaction: discord.Interaction, buscar: str | None = None):
+        try:
+            if not interaction.user.guild_permissions.ban_members:
+                await interaction.response.send_message(
+                    "❌ Você não tem permissão para ver a lista de banidos.", ephemeral=True
+                )
+                return
+
+            await interaction.response.defer(ephemeral=True)
+
+            # Filtrar se há busca (a lista é lida da API uma página por vez)
+            search_term = buscar.lower() if buscar else None
+
+            def matches_search(ban_entry):
+                user = ban_entry.user
+                return (
+                    search_term in user.name.lower()
+                    or search_term in (user.global_name or "").lower()
+                    or search_term == str(user.id)
+                )
+
+            pages = BanPageProvider(
+                interaction.guild,
+                predicate=matches_search if search_term else None,
+                page_size=10,
+            )
+
+            if not await pages.page(0):
+                if buscar:
+                    await interaction.followup.send(
+                        f"❌ Nenhum usuário banido encontrado com: `{buscar}`", ephemeral=True
+                    )
+                    return
+
+                empty_embed = discord.Embed(
+                    title="📋 **LISTA DE BANIDOS**",
+                    description="✅ Não há usuários banidos neste servidor.",
+                    color=0x00FF00,
+                    timestamp=datetime.now(),
+                )
+
+                await interaction.followup.send(embed=empty_embed, ephemeral=True)
+                return
+
+            def build_page(bans, index):
+                """Embed de uma página de banidos"""
+                total = pages.total
+                ban_embed = discord.Embed(
+                    title="📋 **LISTA DE USUÁRIOS BANIDOS**",
+                    description=f"Total: {total} usuário{'s' if total != 1 else ''} banido{'s' if total != 1 else ''}"
+                    if total is not None
+                    else "Total: contando...",
+                    color=0xFF6B6B,
+                    timestamp=datetime.now(),
+                )
+
+                for ban_entry in bans:
+                    user = ban_entry.user
+                    reason = ban_entry.reason or "Motivo não especificado"
+
+                    ban_info = f"**ID:** `{user.id}`\n"
+                    ban_info += f"**Motivo:** {reason[:100]}{'...' if len(reason) > 100 else ''}"
+
+                    ban_embed.add_field(
+                        name=f"🔨 {user.name}#{user.discriminator}", value=ban_info, inline=False
+                    )
+
+                ban_embed.set_footer(
+                    text=f"Consultado por {interaction.user}",
+                    icon_url=interaction.user.display_avatar.url,
+                )
+                return ban_embed
+
+            await InteractionHelpers.paginate_pages(interaction, pages, build_page, ephemeral=True)
+
+        except Exception as e:
+            print(f"❌ Erro no comando banlist: {e}")
+            try:
+                await interaction.followup.send(
+                    "❌ Erro ao consultar lista de banidos.", ephemeral=True
+                )
+            except:
+                pass
+
+
 class BanConfirmView(discord.ui.View):
     def __init__(
         self, user: discord.Member, reason: str, delete_days: int, moderator: discord.Member
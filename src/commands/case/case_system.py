@@ -3,76 +3,34 @@ Sistema de Cases Moderativos
 Gerenciamento completo de casos de moderação com histórico
 """
 
-import os
-import sqlite3
 from datetime import datetime
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+from ...utils.interaction_helpers import InteractionHelpers
+from ...utils.page_provider import KeysetPageProvider
+
 
 class CaseSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db_path = os.path.join("src", "data", "cases.db")
-        self.init_database()
-
-    def init_database(self):
-        """Inicializar banco de dados de cases"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS mod_cases (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                case_id INTEGER NOT NULL,
-                guild_id TEXT NOT NULL,
-                user_id TEXT NOT NULL,
-                moderator_id TEXT NOT NULL,
-                type TEXT NOT NULL,
-                reason TEXT,
-                evidence TEXT,
-                duration TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_active BOOLEAN DEFAULT 1,
-                UNIQUE(guild_id, case_id)
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS case_attachments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                case_id INTEGER NOT NULL,
-                guild_id TEXT NOT NULL,
-                attachment_url TEXT NOT NULL,
-                attachment_name TEXT,
-                uploaded_by TEXT NOT NULL,
-                uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (case_id) REFERENCES mod_cases (case_id)
-            )
-        """)
 
-        conn.commit()
-        conn.close()
+    async def cog_load(self):
+        """Usar o banco principal (tabelas criadas pelas migrações)"""
+        self.db = database.storage
 
-    def get_next_case_id(self, guild_id: str) -> int:
+    async def get_next_case_id(self, guild_id: str) -> int:
         """Obter próximo ID de case para o servidor"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
+        result = await self.db.get(
             """
             SELECT MAX(case_id) FROM mod_cases WHERE guild_id = ?
         """,
             (guild_id,),
         )
 
-        result = cursor.fetchone()
-        conn.close()
-
         return (result[0] or 0) + 1
 
     def get_case_emoji_color(self, case_type: str) -> tuple:
@@ -128,13 +86,10 @@ class CaseSystem(commands.Cog):
                 return
 
             # Obter próximo ID do case
-            case_id = self.get_next_case_id(str(interaction.guild.id))
+            case_id = await self.get_next_case_id(str(interaction.guild.id))
 
             # Salvar no banco de dados
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            await self.db.run(
                 """
                 INSERT INTO mod_cases 
                 (case_id, guild_id, user_id, moderator_id, type, reason, evidence)
@@ -151,9 +106,6 @@ class CaseSystem(commands.Cog):
                 ),
             )
 
-            conn.commit()
-            conn.close()
-
             # Obter emoji e cor
             emoji, color = self.get_case_emoji_color(tipo)
 
@@ -216,10 +168,7 @@ class CaseSystem(commands.Cog):
                 return
 
             # Buscar case no banco
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            case_data = await self.db.get(
                 """
                 SELECT * FROM mod_cases 
                 WHERE guild_id = ? AND case_id = ?
@@ -227,8 +176,6 @@ class CaseSystem(commands.Cog):
                 (str(interaction.guild.id), case_id),
             )
 
-            case_data = cursor.fetchone()
-
             if not case_data:
                 await interaction.response.send_message(
                     f"❌ **Case Não Encontrado**\nCase #{case_id} não existe neste servidor.",
@@ -237,7 +184,7 @@ class CaseSystem(commands.Cog):
                 return
 
             # Buscar anexos
-            cursor.execute(
+            attachments = await self.db.get_all(
                 """
                 SELECT attachment_url, attachment_name, uploaded_by, uploaded_at
                 FROM case_attachments 
@@ -246,9 +193,6 @@ class CaseSystem(commands.Cog):
                 (str(interaction.guild.id), case_id),
             )
 
-            attachments = cursor.fetchall()
-            conn.close()
-
             # Extrair dados do case
             (
                 id,
@@ -361,7 +305,7 @@ class CaseSystem(commands.Cog):
     @app_commands.describe(
         user="Usuário para listar cases (opcional)",
         tipo="Filtrar por tipo (opcional)",
-        limite="Número máximo de cases (padrão: 10)",
+        limite="Cases por página (padrão: 10, máximo: 25)",
     )
     @app_commands.choices(
         tipo=[
@@ -390,70 +334,30 @@ class CaseSystem(commands.Cog):
                 )
                 return
 
-            # Limitar número de resultados
+            # Limitar cases por página
             if limite > 25:
                 limite = 25
             elif limite < 1:
                 limite = 10
 
-            # Construir query
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            if user and tipo != "all":
-                cursor.execute(
-                    """
-                    SELECT case_id, user_id, moderator_id, type, reason, created_at, is_active
-                    FROM mod_cases 
-                    WHERE guild_id = ? AND user_id = ? AND type = ?
-                    ORDER BY case_id DESC LIMIT ?
-                """,
-                    (str(interaction.guild.id), str(user.id), tipo, limite),
-                )
-            elif user:
-                cursor.execute(
-                    """
-                    SELECT case_id, user_id, moderator_id, type, reason, created_at, is_active
-                    FROM mod_cases 
-                    WHERE guild_id = ? AND user_id = ?
-                    ORDER BY case_id DESC LIMIT ?
-                """,
-                    (str(interaction.guild.id), str(user.id), limite),
-                )
-            elif tipo != "all":
-                cursor.execute(
-                    """
-                    SELECT case_id, user_id, moderator_id, type, reason, created_at, is_active
-                    FROM mod_cases 
-                    WHERE guild_id = ? AND type = ?
-                    ORDER BY case_id DESC LIMIT ?
-                """,
-                    (str(interaction.guild.id), tipo, limite),
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT case_id, user_id, moderator_id, type, reason, created_at, is_active
-                    FROM mod_cases 
-                    WHERE guild_id = ?
-                    ORDER BY case_id DESC LIMIT ?
-                """,
-                    (str(interaction.guild.id), limite),
-                )
-
-            cases = cursor.fetchall()
-            conn.close()
-
-            if not cases:
-                await interaction.response.send_message(
-                    "❌ **Nenhum Case Encontrado**\nNão há cases com os filtros especificados.",
-                    ephemeral=True,
-                )
-                return
-
-            # Criar embed
-            embed = discord.Embed(
-                title="📋 **LISTA DE CASES**", color=0x6C5CE7, timestamp=datetime.now()
+            # Construir filtro; as páginas são lidas sob demanda, por case_id
+            where = "guild_id = ?"
+            params = [str(interaction.guild.id)]
+            if user:
+                where += " AND user_id = ?"
+                params.append(str(user.id))
+            if tipo != "all":
+                where += " AND type = ?"
+                params.append(tipo)
+
+            pages = KeysetPageProvider(
+                self.db,
+                "mod_cases",
+                where=where,
+                params=params,
+                order=(("case_id", "DESC"), ("id", "DESC")),
+                columns="case_id, user_id, moderator_id, type, reason, created_at, is_active",
+                page_size=limite,
             )
 
             # Filtros aplicados
@@ -463,59 +367,59 @@ class CaseSystem(commands.Cog):
             if tipo != "all":
                 filtros.append(f"Tipo: {tipo}")
 
-            if filtros:
-                embed.add_field(name="🔍 Filtros", value=" • ".join(filtros), inline=False)
+            def build_page(cases, index):
+                """Embed de uma página de cases"""
+                embed = discord.Embed(
+                    title="📋 **LISTA DE CASES**", color=0x6C5CE7, timestamp=datetime.now()
+                )
 
-            embed.add_field(
-                name="📊 Total",
-                value=f"**{len(cases)}** case{'s' if len(cases) != 1 else ''}",
-                inline=True,
-            )
+                if filtros:
+                    embed.add_field(name="🔍 Filtros", value=" • ".join(filtros), inline=False)
 
-            embed.add_field(name="📄 Limite", value=f"**{limite}** resultados", inline=True)
+                total = pages.total
+                embed.add_field(
+                    name="📊 Total",
+                    value=f"**{total}** case{'s' if total != 1 else ''}"
+                    if total is not None
+                    else "⏳ Contando...",
+                    inline=True,
+                )
 
-            # Lista de cases
-            cases_text = ""
-            for case_id, user_id, mod_id, case_type, reason, created_at, is_active in cases[:10]:
-                emoji, _ = self.get_case_emoji_color(case_type)
-                status = "🟢" if is_active else "🔴"
+                embed.add_field(name="📄 Por Página", value=f"**{limite}** resultados", inline=True)
 
-                # Buscar usuário
-                try:
-                    case_user = await self.bot.fetch_user(int(user_id))
-                    user_name = case_user.display_name
-                except:
-                    user_name = f"ID: {user_id}"
+                # Lista de cases (nomes do cache; sem uma requisição por case)
+                cases_text = ""
+                for case in cases:
+                    emoji, _ = self.get_case_emoji_color(case["type"])
+                    status = "🟢" if case["is_active"] else "🔴"
 
-                created_timestamp = int(datetime.fromisoformat(created_at).timestamp())
+                    case_user = self.bot.get_user(int(case["user_id"]))
+                    user_name = case_user.display_name if case_user else f"ID: {case['user_id']}"
 
-                cases_text += (
-                    f"{status}{emoji} **Case #{case_id}** - {case_type.replace('_', ' ').title()}\n"
-                )
-                cases_text += f"   👤 {user_name[:30]}{'...' if len(user_name) > 30 else ''}\n"
-                cases_text += f"   📅 <t:{created_timestamp}:R>\n"
-                cases_text += f"   📝 {(reason or 'Sem motivo')[:40]}{'...' if len(reason or '') > 40 else ''}\n\n"
+                    created_timestamp = int(datetime.fromisoformat(case["created_at"]).timestamp())
+                    reason = case["reason"]
 
-            embed.add_field(
-                name="📋 Cases",
-                value=cases_text[:1000] + ("..." if len(cases_text) > 1000 else ""),
-                inline=False,
-            )
+                    cases_text += f"{status}{emoji} **Case #{case['case_id']}** - {case['type'].replace('_', ' ').title()}\n"
+                    cases_text += f"   👤 {user_name[:30]}{'...' if len(user_name) > 30 else ''}\n"
+                    cases_text += f"   📅 <t:{created_timestamp}:R>\n"
+                    cases_text += f"   📝 {(reason or 'Sem motivo')[:40]}{'...' if len(reason or '') > 40 else ''}\n\n"
 
-            if len(cases) > 10:
-                embed.add_field(
-                    name="➕ Mais Cases",
-                    value=f"E mais **{len(cases) - 10}** cases...\nUse filtros específicos para refinar.",
-                    inline=False,
-                )
+                embed.description = cases_text[:4000] + ("..." if len(cases_text) > 4000 else "")
 
-            embed.set_footer(
-                text=f"Use /case-view [id] para ver detalhes | Solicitado por {interaction.user.display_name}",
-                icon_url=interaction.user.display_avatar.url,
+                embed.set_footer(
+                    text=f"Use /case-view [id] para ver detalhes | Solicitado por {interaction.user.display_name}",
+                    icon_url=interaction.user.display_avatar.url,
+                )
+                return embed
+
+            await InteractionHelpers.paginate_pages(
+                interaction,
+                pages,
+                build_page,
+                empty_message="❌ **Nenhum Case Encontrado**\nNão há cases com os filtros especificados.",
+                ephemeral=True,
             )
 
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-
         except Exception as e:
             print(f"❌ Erro no comando case-list: {e}")
             try:
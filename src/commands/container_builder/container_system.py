@@ -4,58 +4,24 @@ Sistema para criação e gerenciamento de containers customizados
 """
 
 import json
-import os
-import sqlite3
 from datetime import datetime
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+
 
 class ContainerSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db_path = os.path.join("src", "data", "containers.db")
         self.templates = {}
-        self.init_database()
         self.load_templates()
 
-    def init_database(self):
-        """Inicializar banco de dados de containers"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS containers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                description TEXT,
-                template_data TEXT NOT NULL,
-                creator_id TEXT NOT NULL,
-                is_public BOOLEAN DEFAULT 0,
-                usage_count INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(guild_id, name)
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS container_usage (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                container_id INTEGER NOT NULL,
-                user_id TEXT NOT NULL,
-                channel_id TEXT NOT NULL,
-                used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (container_id) REFERENCES containers (id)
-            )
-        """)
-
-        conn.commit()
-        conn.close()
+    async def cog_load(self):
+        """Usar o banco principal (tabelas criadas pelas migrações)"""
+        self.db = database.storage
 
     def load_templates(self):
         """Carregar templates de containers pré-definidos"""
@@ -243,10 +209,7 @@ class ContainerSystem(commands.Cog):
                 return
 
             # Verificar se já existe
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            existing = await self.db.get(
                 """
                 SELECT id FROM containers 
                 WHERE guild_id = ? AND name = ?
@@ -254,8 +217,7 @@ class ContainerSystem(commands.Cog):
                 (str(interaction.guild.id), nome),
             )
 
-            if cursor.fetchone():
-                conn.close()
+            if existing:
                 await interaction.response.send_message(
                     f"❌ **Container Já Existe**\nJá existe um container com o nome `{nome}`.",
                     ephemeral=True,
@@ -279,7 +241,7 @@ class ContainerSystem(commands.Cog):
                 template_data = self.templates["anuncio"].copy()
 
             # Salvar no banco
-            cursor.execute(
+            cursor = await self.db.run(
                 """
                 INSERT INTO containers 
                 (guild_id, name, description, template_data, creator_id, is_public)
@@ -296,8 +258,6 @@ class ContainerSystem(commands.Cog):
             )
 
             container_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
 
             # Criar embed de confirmação
             embed = discord.Embed(
@@ -375,11 +335,8 @@ class ContainerSystem(commands.Cog):
 
             else:
                 # Buscar containers do banco
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-
                 if filtro == "mine":
-                    cursor.execute(
+                    containers = await self.db.get_all(
                         """
                         SELECT id, name, description, creator_id, is_public, usage_count, created_at
                         FROM containers 
@@ -389,7 +346,7 @@ class ContainerSystem(commands.Cog):
                         (str(interaction.guild.id), str(interaction.user.id)),
                     )
                 elif filtro == "public":
-                    cursor.execute(
+                    containers = await self.db.get_all(
                         """
                         SELECT id, name, description, creator_id, is_public, usage_count, created_at
                         FROM containers 
@@ -399,7 +356,7 @@ class ContainerSystem(commands.Cog):
                         (str(interaction.guild.id),),
                     )
                 else:  # all
-                    cursor.execute(
+                    containers = await self.db.get_all(
                         """
                         SELECT id, name, description, creator_id, is_public, usage_count, created_at
                         FROM containers 
@@ -409,8 +366,6 @@ class ContainerSystem(commands.Cog):
                         (str(interaction.guild.id), str(interaction.user.id)),
                     )
 
-                containers = cursor.fetchall()
-                conn.close()
 
                 if not containers:
                     embed.add_field(
@@ -497,10 +452,7 @@ class ContainerSystem(commands.Cog):
                 return
 
             # Buscar container
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            result = await self.db.get(
                 """
                 SELECT id, template_data, creator_id, is_public
                 FROM containers 
@@ -509,10 +461,7 @@ class ContainerSystem(commands.Cog):
                 (str(interaction.guild.id), nome),
             )
 
-            result = cursor.fetchone()
-
             if not result:
-                conn.close()
                 await interaction.response.send_message(
                     f"❌ **Container Não Encontrado**\nNão existe um container chamado `{nome}`.",
                     ephemeral=True,
@@ -524,7 +473,6 @@ class ContainerSystem(commands.Cog):
             # Verificar permissões de uso
             if not is_public and str(interaction.user.id) != creator_id:
                 if not interaction.user.guild_permissions.manage_messages:
-                    conn.close()
                     await interaction.response.send_message(
                         "❌ **Container Privado**\n"
                         "Este container é privado e você não tem permissão para usá-lo.",
@@ -532,28 +480,26 @@ class ContainerSystem(commands.Cog):
                     )
                     return
 
-            # Atualizar contador de uso
-            cursor.execute(
-                """
-                UPDATE containers 
-                SET usage_count = usage_count + 1, updated_at = ?
-                WHERE id = ?
-            """,
-                (datetime.now(), container_id),
-            )
-
-            # Registrar uso
-            cursor.execute(
-                """
-                INSERT INTO container_usage 
-                (container_id, user_id, channel_id)
-                VALUES (?, ?, ?)
-            """,
-                (container_id, str(interaction.user.id), str(canal.id)),
-            )
+            async with self.db.transaction() as db:
+                # Atualizar contador de uso
+                await db.execute(
+                    """
+                    UPDATE containers 
+                    SET usage_count = usage_count + 1, updated_at = ?
+                    WHERE id = ?
+                """,
+                    (datetime.now(), container_id),
+                )
 
-            conn.commit()
-            conn.close()
+                # Registrar uso
+                await db.execute(
+                    """
+                    INSERT INTO container_usage 
+                    (container_id, user_id, channel_id)
+                    VALUES (?, ?, ?)
+                """,
+                    (container_id, str(interaction.user.id), str(canal.id)),
+                )
 
             # Processar template
             template = json.loads(template_data)
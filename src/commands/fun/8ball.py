@@ -3,60 +3,30 @@ Comando 8Ball - Fun Aprimorado
 Bola mágica com respostas contextuais e estatísticas
 """
 
-import os
 import random
 from datetime import datetime
 
-import aiosqlite
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+
 
 class EightBallCommand(commands.Cog):
     """Comando da bola mágica com sistema de estatísticas"""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db_path = os.path.join("src", "data", "8ball.db")
-        self.bot.loop.create_task(self.init_database())
-
-    async def init_database(self):
-        """Inicializar banco de dados de estatísticas"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS predictions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    guild_id TEXT NOT NULL,
-                    question TEXT NOT NULL,
-                    answer TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    sentiment TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS user_stats (
-                    user_id TEXT PRIMARY KEY,
-                    total_questions INTEGER DEFAULT 0,
-                    positive_answers INTEGER DEFAULT 0,
-                    neutral_answers INTEGER DEFAULT 0,
-                    negative_answers INTEGER DEFAULT 0,
-                    favorite_category TEXT
-                )
-            """)
-            await db.commit()
 
     async def save_prediction(
         self, user_id: str, guild_id: str, question: str, answer: str, category: str, sentiment: str
     ):
         """Salvar predição no banco de dados"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with database.storage.transaction() as db:
             await db.execute(
                 """
-                INSERT INTO predictions (user_id, guild_id, question, answer, category, sentiment)
+                INSERT INTO eightball_predictions (user_id, guild_id, question, answer, category, sentiment)
                 VALUES (?, ?, ?, ?, ?, ?)
             """,
                 (user_id, guild_id, question, answer, category, sentiment),
@@ -65,7 +35,7 @@ class EightBallCommand(commands.Cog):
             # Atualizar estatísticas do usuário
             await db.execute(
                 f"""
-                INSERT INTO user_stats (user_id, total_questions, {sentiment}_answers, favorite_category)
+                INSERT INTO eightball_stats (user_id, total_questions, {sentiment}_answers, favorite_category)
                 VALUES (?, 1, 1, ?)
                 ON CONFLICT(user_id) DO UPDATE SET
                     total_questions = total_questions + 1,
@@ -75,25 +45,20 @@ class EightBallCommand(commands.Cog):
                 (user_id, category, category),
             )
 
-            await db.commit()
-
     async def get_user_stats(self, user_id: str):
         """Obter estatísticas do usuário"""
-        async with aiosqlite.connect(self.db_path) as db, db.execute(
-            "SELECT * FROM user_stats WHERE user_id = ?", (user_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            if row:
-                return {
-                    "total": row[1],
-                    "positive": row[2],
-                    "neutral": row[3],
-                    "negative": row[4],
-                    "favorite": row[5],
-                }
+        row = await database.storage.get(
+            "SELECT * FROM eightball_stats WHERE user_id = ?", (user_id,)
+        )
+        if row:
+            return {
+                "total": row[1],
+                "positive": row[2],
+                "neutral": row[3],
+                "negative": row[4],
+                "favorite": row[5],
+            }
         return None
-        self.db_path = os.path.join("src", "data", "8ball.db")
-        self.bot.loop.create_task(self.init_database())
 
         # Respostas categorizadas por tipo de pergunta
         self.respostas_contextuais = {
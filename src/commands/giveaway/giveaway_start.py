@@ -12,19 +12,21 @@ from typing import TYPE_CHECKING, Any
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 if TYPE_CHECKING:
-    pass
+    from ...utils.scheduler import ScheduledEvent
 
 
 class GiveawayStart(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot: commands.Bot = bot
-        # Task temporariamente desabilitada para evitar conflitos
-        # TODO: Implementar sistema de task singleton mais robusto
-        # if not self.check_giveaways.is_running():
-        #     self.check_giveaways.start()
+
+    async def cog_load(self) -> None:
+        """Registrar a finalização dos sorteios no agendador"""
+        from ...utils.database import database
+
+        database.scheduler.register("giveaway_end", self.on_giveaway_end_event)
 
     @app_commands.command(name="giveaway-start", description="🎉 Iniciar um sorteio no servidor")
     @app_commands.describe(
@@ -158,6 +160,16 @@ class GiveawayStart(commands.Cog):
                         datetime.now().isoformat(),
                     ),
                 )
+
+                # Finalizar exatamente no fim do prazo (persistente entre restarts)
+                await database.scheduler.schedule(
+                    "giveaway_end",
+                    end_time,
+                    {"message_id": str(giveaway_message.id)},
+                    key=str(giveaway_message.id),
+                    guild_id=interaction.guild.id,  # type: ignore
+                    created_by=interaction.user.id,
+                )
             except Exception as e:
                 print(f"❌ Erro ao salvar giveaway no banco: {e}")
 
@@ -214,23 +226,16 @@ class GiveawayStart(commands.Cog):
 
         return value * multipliers.get(unit, 0)
 
-    @tasks.loop(minutes=1)
-    async def check_giveaways(self) -> None:
-        """Verificar giveaways que terminaram"""
-        try:
-            from ...utils.database import database
+    async def on_giveaway_end_event(self, event: ScheduledEvent) -> None:
+        """Executor do evento agendado ``giveaway_end``"""
+        from ...utils.database import database
 
-            # Buscar giveaways ativos que terminaram
-            expired_giveaways: list[dict[str, Any]] = await database.get_all(
-                "SELECT * FROM giveaways WHERE ended = 0 AND end_time <= ?",
-                (datetime.now().isoformat(),),
-            )
-
-            for giveaway in expired_giveaways:
-                await self.end_giveaway(giveaway)
-
-        except Exception as e:
-            print(f"❌ Erro ao verificar giveaways: {e}")
+        giveaway: dict[str, Any] | None = await database.get(
+            "SELECT * FROM giveaways WHERE message_id = ? AND ended = 0",
+            (event.data["message_id"],),
+        )
+        if giveaway:
+            await self.end_giveaway(giveaway)
 
     async def end_giveaway(self, giveaway_data: dict[str, Any]) -> None:
         """Finalizar um giveaway"""
@@ -306,9 +311,10 @@ class GiveawayStart(commands.Cog):
             print(f"❌ Erro ao finalizar giveaway: {e}")
 
     def cog_unload(self) -> None:
-        """Parar task quando o cog for removido"""
-        if self.check_giveaways.is_running():
-            self.check_giveaways.cancel()
+        """Remover o executor do agendador quando o cog for removido"""
+        from ...utils.database import database
+
+        database.scheduler.unregister("giveaway_end")
 
 
 class GiveawayView(discord.ui.View):
@@ -13,6 +13,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from ...utils.database import database
+from ...utils.xp_accumulator import xp_for_level
 
 if TYPE_CHECKING:
     from ...main import ModularBot
@@ -51,24 +52,23 @@ class LevelCard(commands.Cog):
             await interaction.response.defer()
 
             # Buscar dados do usuário no banco
-            user_data: dict[str, Any] | None = await database.get(
-                "SELECT * FROM user_levels WHERE guild_id = ? AND user_id = ?",
-                (str(interaction.guild.id), str(target_user.id)),
+            user_data: dict[str, Any] | None = await database.get_user_level(
+                str(interaction.guild.id), str(target_user.id)
             )
 
             if not user_data:
                 # Se usuário não tem dados, criar registro básico
                 user_data = {
-                    "xp": 0,
+                    "total_xp": 0,
                     "level": 0,
-                    "messages": 0,
-                    "last_xp_time": datetime.now().isoformat(),
+                    "messages_sent": 0,
+                    "last_xp_gain": datetime.now().isoformat(),
                 }
 
             # Calcular estatísticas
             current_level: int = user_data.get("level", 0)
-            current_xp: int = user_data.get("xp", 0)
-            messages: int = user_data.get("messages", 0)
+            current_xp: int = user_data.get("total_xp", 0)
+            messages: int = user_data.get("messages_sent", 0)
 
             # XP necessário para próximo nível
             xp_needed_for_next: int = self.calculate_xp_for_level(current_level + 1)
@@ -77,16 +77,11 @@ class LevelCard(commands.Cog):
             xp_required: int = xp_needed_for_next - xp_needed_for_current
 
             # Buscar posição no ranking
-            ranking: dict[str, Any] | None = await database.get(
-                """SELECT COUNT(*) + 1 as rank FROM user_levels 
-                   WHERE guild_id = ? AND (
-                       level > ? OR 
-                       (level = ? AND xp > ?)
-                   )""",
-                (str(interaction.guild.id), current_level, current_level, current_xp),
+            ranking: int | None = await database.rank_index.rank(
+                str(interaction.guild.id), str(target_user.id), "level"
             )
 
-            rank: int | str = ranking.get("rank", "?") if ranking else "?"
+            rank: int | str = ranking or "?"
 
             # Criar embed baseado no estilo
             embed: discord.Embed
@@ -109,15 +104,13 @@ class LevelCard(commands.Cog):
 
     def calculate_xp_for_level(self, level: int) -> int:
         """Calcular XP necessário para um nível específico"""
-        if level <= 0:
-            return 0
-        return int(5 * (level**2) + 50 * level + 100)
+        return xp_for_level(level)
 
     async def create_simple_card(self, user: discord.Member, data: dict[str, Any], rank: int | str) -> discord.Embed:
         """Criar card simples"""
         embed: discord.Embed = create_embed(
             title=f"📊 Nível de {user.display_name}",
-            description=f"**Nível:** {data.get('level', 0)}\n**XP:** {data.get('xp', 0):,}\n**Rank:** #{rank}",
+            description=f"**Nível:** {data.get('level', 0)}\n**XP:** {data.get('total_xp', 0):,}\n**Rank:** #{rank}",
             color=discord.Color.blue(),
         )
         embed.set_thumbnail(url=user.display_avatar.url)
@@ -126,8 +119,8 @@ class LevelCard(commands.Cog):
     async def create_stats_card(self, user: discord.Member, data: dict[str, Any], rank: int | str) -> discord.Embed:
         """Criar card de estatísticas"""
         level: int = data.get("level", 0)
-        xp: int = data.get("xp", 0)
-        messages: int = data.get("messages", 0)
+        xp: int = data.get("total_xp", 0)
+        messages: int = data.get("messages_sent", 0)
 
         embed: discord.Embed = create_embed(
             title=f"📈 Estatísticas de {user.display_name}", color=discord.Color.green()
@@ -156,7 +149,7 @@ class LevelCard(commands.Cog):
     ) -> discord.Embed:
         """Criar card completo"""
         level: int = data.get("level", 0)
-        xp: int = data.get("xp", 0)
+        xp: int = data.get("total_xp", 0)
 
         # Calcular progresso em porcentagem
         progress_percent: float = (xp_progress / xp_required * 100) if xp_required > 0 else 0
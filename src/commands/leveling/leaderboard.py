@@ -40,35 +40,20 @@ class Leaderboard(commands.Cog):
             if pagina > 50:  # Limite máximo
                 pagina = 50
 
+            # XP diário ainda não tem ordenação própria
+            ordering = tipo if tipo in ("xp", "level", "messages") else "xp"
+            per_page = 10
+
             # 📊 BUSCAR DADOS DO RANKING
             try:
                 from ...utils.database import database
 
-                # Determinar query baseada no tipo
-                order_by = "xp DESC"
-                if tipo == "level":
-                    order_by = "level DESC, xp DESC"
-                elif tipo == "messages":
-                    order_by = "messages DESC"
-                elif tipo == "daily":
-                    order_by = "xp DESC"  # Implementar XP diário depois
-
-                # Calcular offset
-                per_page = 10
-                offset = (pagina - 1) * per_page
-
-                # Buscar dados
-                leaderboard_data = await database.get_all(
-                    f"SELECT * FROM user_levels WHERE guild_id = ? ORDER BY {order_by} LIMIT ? OFFSET ?",
-                    (str(interaction.guild.id), per_page, offset),
-                )
-
-                # Contar total de usuários
-                total_users = await database.get(
-                    "SELECT COUNT(*) as count FROM user_levels WHERE guild_id = ?",
-                    (str(interaction.guild.id),),
+                # Página e total saem do índice de ranking em memória
+                guild_id = str(interaction.guild.id)
+                leaderboard_data = await database.rank_index.page(
+                    guild_id, pagina, per_page, ordering
                 )
-                total_count = total_users["count"] if total_users else 0
+                total_count = await database.rank_index.count(guild_id)
 
             except Exception as e:
                 print(f"Erro no banco: {e}")
@@ -96,8 +81,8 @@ class Leaderboard(commands.Cog):
             # 📋 CRIAR LISTA DE USUÁRIOS
             leaderboard_text = ""
 
-            for i, user_data in enumerate(leaderboard_data):
-                position = offset + i + 1
+            for user_data in leaderboard_data:
+                position = user_data["position"]
                 user_id = int(user_data["user_id"])
 
                 # Buscar usuário
@@ -122,13 +107,13 @@ class Leaderboard(commands.Cog):
 
                 # 📈 DADOS BASEADOS NO TIPO
                 if tipo == "level":
-                    value = f"Level {user_data['level']} ({user_data['xp']:,} XP)"
+                    value = f"Level {user_data['level']} ({user_data['total_xp']:,} XP)"
                 elif tipo == "messages":
-                    value = f"{user_data['messages']:,} mensagens"
+                    value = f"{user_data['messages_sent']:,} mensagens"
                 elif tipo == "daily":
-                    value = f"{user_data['xp']:,} XP (hoje)"  # Implementar XP diário depois
+                    value = f"{user_data['total_xp']:,} XP (hoje)"  # Implementar XP diário depois
                 else:  # xp
-                    value = f"{user_data['xp']:,} XP (Lv.{user_data['level']})"
+                    value = f"{user_data['total_xp']:,} XP (Lv.{user_data['level']})"
 
                 # 🔍 DESTACAR USUÁRIO ATUAL
                 if user.id == interaction.user.id:
@@ -151,19 +136,12 @@ class Leaderboard(commands.Cog):
 
             # 🔍 BUSCAR POSIÇÃO DO USUÁRIO ATUAL
             try:
-                user_position = await database.get(
-                    "SELECT COUNT(*) + 1 as position FROM user_levels WHERE guild_id = ? AND xp > (SELECT xp FROM user_levels WHERE guild_id = ? AND user_id = ?)",
-                    (
-                        str(interaction.guild.id),
-                        str(interaction.guild.id),
-                        str(interaction.user.id),
-                    ),
+                user_position = await database.rank_index.rank(
+                    str(interaction.guild.id), str(interaction.user.id), ordering
                 )
 
                 if user_position:
-                    embed.add_field(
-                        name="📍 Sua Posição", value=f"#{user_position['position']}", inline=True
-                    )
+                    embed.add_field(name="📍 Sua Posição", value=f"#{user_position}", inline=True)
             except:
                 pass
 
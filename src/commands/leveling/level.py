@@ -9,6 +9,8 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.xp_accumulator import xp_for_level
+
 
 class Level(commands.Cog):
     def __init__(self, bot):
@@ -28,9 +30,8 @@ class Level(commands.Cog):
             try:
                 from ...utils.database import database
 
-                user_data = await database.get(
-                    "SELECT * FROM user_levels WHERE guild_id = ? AND user_id = ?",
-                    (str(interaction.guild.id), str(target_user.id)),
+                user_data = await database.get_user_level(
+                    str(interaction.guild.id), str(target_user.id)
                 )
             except:
                 user_data = None
@@ -49,14 +50,8 @@ class Level(commands.Cog):
 
             # 🧮 CALCULAR PROGRESSÃO DE XP
             level = user_data["level"]
-            current_xp = user_data["xp"]
-            messages = user_data["messages"]
-
-            # Sistema de XP progressivo (mais difícil a cada level)
-            def xp_for_level(lv):
-                if lv == 0:
-                    return 0
-                return int(100 * (lv**1.5))
+            current_xp = user_data["total_xp"]
+            messages = user_data["messages_sent"]
 
             current_level_xp = xp_for_level(level)
             next_level_xp = xp_for_level(level + 1)
@@ -78,11 +73,10 @@ class Level(commands.Cog):
 
             # 🏆 BUSCAR POSIÇÃO NO RANKING
             try:
-                rank_data = await database.get(
-                    "SELECT COUNT(*) + 1 as position FROM user_levels WHERE guild_id = ? AND xp > ?",
-                    (str(interaction.guild.id), current_xp),
+                rank_position = (
+                    await database.rank_index.rank(str(interaction.guild.id), str(target_user.id))
+                    or "N/A"
                 )
-                rank_position = rank_data["position"] if rank_data else "N/A"
             except:
                 rank_position = "N/A"
 
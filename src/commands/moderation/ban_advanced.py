@@ -435,103 +435,6 @@ class AdvancedBan(commands.Cog):
             except:
                 pass
 
-    @app_commands.command(name="banlist", description="📋 Ver lista de usuários banidos")
-    @app_commands.describe(buscar="Buscar por nome ou ID específico")
-    async def ban_list(self, interaction: discord.Interaction, buscar: str | None = None):
-        try:
-            if not interaction.user.guild_permissions.ban_members:
-                await interaction.response.send_message(
-                    "❌ Você não tem permissão para ver a lista de banidos.", ephemeral=True
-                )
-                return
-
-            await interaction.response.defer(ephemeral=True)
-
-            # Buscar banidos
-            banned_users = []
-            async for ban_entry in interaction.guild.bans():
-                banned_users.append(ban_entry)
-
-            if not banned_users:
-                empty_embed = discord.Embed(
-                    title="📋 **LISTA DE BANIDOS**",
-                    description="✅ Não há usuários banidos neste servidor.",
-                    color=0x00FF00,
-                    timestamp=datetime.now(),
-                )
-
-                await interaction.followup.send(embed=empty_embed, ephemeral=True)
-                return
-
-            # Filtrar se há busca
-            if buscar:
-                filtered_bans = []
-                search_term = buscar.lower()
-
-                for ban_entry in banned_users:
-                    user = ban_entry.user
-                    if (
-                        search_term in user.name.lower()
-                        or search_term in (user.global_name or "").lower()
-                        or search_term == str(user.id)
-                    ):
-                        filtered_bans.append(ban_entry)
-
-                banned_users = filtered_bans
-
-                if not banned_users:
-                    await interaction.followup.send(
-                        f"❌ Nenhum usuário banido encontrado com: `{buscar}`", ephemeral=True
-                    )
-                    return
-
-            # Criar embed
-            ban_embed = discord.Embed(
-                title="📋 **LISTA DE USUÁRIOS BANIDOS**",
-                description=f"Total: {len(banned_users)} usuário{'s' if len(banned_users) != 1 else ''} banido{'s' if len(banned_users) != 1 else ''}",
-                color=0xFF6B6B,
-                timestamp=datetime.now(),
-            )
-
-            # Mostrar até 10 banidos por página
-            display_count = min(10, len(banned_users))
-
-            for i, ban_entry in enumerate(banned_users[:display_count], 1):
-                user = ban_entry.user
-                reason = ban_entry.reason or "Motivo não especificado"
-
-                ban_info = f"**ID:** `{user.id}`\n"
-                ban_info += f"**Motivo:** {reason[:100]}{'...' if len(reason) > 100 else ''}\n"
-                ban_info += f"**Comando Unban:** `/unban {user.id}`"
-
-                ban_embed.add_field(
-                    name=f"🔨 {user.name}#{user.discriminator}", value=ban_info, inline=False
-                )
-
-            if len(banned_users) > 10:
-                ban_embed.add_field(
-                    name="➕ Mais Usuários",
-                    value=f"... e mais {len(banned_users) - 10} usuários banidos.\n"
-                    f"Use `/banlist buscar:<nome_ou_id>` para encontrar específicos.",
-                    inline=False,
-                )
-
-            ban_embed.set_footer(
-                text=f"Consultado por {interaction.user}",
-                icon_url=interaction.user.display_avatar.url,
-            )
-
-            await interaction.followup.send(embed=ban_embed, ephemeral=True)
-
-        except Exception as e:
-            print(f"❌ Erro no comando banlist: {e}")
-            try:
-                await interaction.followup.send(
-                    "❌ Erro ao consultar lista de banidos.", ephemeral=True
-                )
-            except:
-                pass
-
 
 async def setup(bot):
     await bot.add_cog(AdvancedBan(bot))
@@ -3,12 +3,12 @@ Comando Kick - Moderation
 Expulsa usuários do servidor com sistema de confirmação
 """
 
-import sqlite3
-
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+
 
 class KickCommand(commands.Cog):
     """Comando de expulsão de membros"""
@@ -16,40 +16,18 @@ class KickCommand(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    def get_db_connection(self):
-        """Obter conexão com o banco de dados"""
-        conn = sqlite3.connect("data/bot.db")
-        conn.row_factory = sqlite3.Row
-        return conn
-
-    def create_mod_case(
+    async def create_mod_case(
         self, guild_id: int, user_id: int, moderator_id: int, case_type: str, reason: str
     ):
         """Criar um caso de moderação"""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
-        # Criar tabela se não existir
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS mod_cases (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER,
-                case_id INTEGER,
-                user_id INTEGER,
-                moderator_id INTEGER,
-                type TEXT,
-                reason TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
         # Obter próximo case_id
-        cursor.execute("SELECT MAX(case_id) FROM mod_cases WHERE guild_id = ?", (guild_id,))
-        result = cursor.fetchone()
-        next_case_id = (result[0] + 1) if result[0] else 1
+        result = await database.get(
+            "SELECT MAX(case_id) AS last_case FROM mod_cases WHERE guild_id = ?", (guild_id,)
+        )
+        next_case_id = (result["last_case"] + 1) if result and result["last_case"] else 1
 
         # Inserir caso
-        cursor.execute(
+        await database.run(
             """
             INSERT INTO mod_cases (guild_id, case_id, user_id, moderator_id, type, reason)
             VALUES (?, ?, ?, ?, ?, ?)
@@ -57,10 +35,7 @@ class KickCommand(commands.Cog):
             (guild_id, next_case_id, user_id, moderator_id, case_type, reason),
         )
 
-        conn.commit()
-        case_id = next_case_id
-        conn.close()
-        return case_id
+        return next_case_id
 
     @app_commands.command(name="kick", description="Expulsa um usuário do servidor")
     @app_commands.describe(user="Usuário para expulsar", motivo="Motivo da expulsão")
@@ -184,7 +159,7 @@ class KickCommand(commands.Cog):
                 await user.kick(reason=f"{motivo} - Por: {interaction.user}")
 
                 # Criar caso de moderação
-                case_id = self.create_mod_case(
+                case_id = await self.create_mod_case(
                     interaction.guild.id, user.id, interaction.user.id, "kick", motivo
                 )
 
@@ -3,9 +3,7 @@ Comandos de Moderação Avançados v2.0
 Com sistema de permissões personalizado e logs detalhados
 """
 
-import sys
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Literal
 
 import discord
@@ -13,9 +11,7 @@ from discord import app_commands
 from discord.ext import commands
 from discord.ui import Button, Modal, TextInput, View
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
-from utils.permission_system import require_permission
+from ...utils.permission_system import require_permission
 
 
 class ReasonModal(Modal, title="Motivo da Ação"):
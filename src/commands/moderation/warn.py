@@ -3,13 +3,14 @@ Comando Warn - Moderation
 Sistema completo de avisos com ações automáticas
 """
 
-import sqlite3
 from datetime import datetime, timedelta
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+
 
 class WarnCommand(commands.Cog):
     """Sistema de avisos para moderação"""
@@ -17,72 +18,18 @@ class WarnCommand(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    def get_db_connection(self):
-        """Obter conexão com o banco de dados"""
-        conn = sqlite3.connect("data/bot.db")
-        conn.row_factory = sqlite3.Row
-        return conn
-
-    def setup_database(self):
-        """Configurar tabelas do banco de dados"""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
-        # Tabela de avisos
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS warnings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER,
-                user_id INTEGER,
-                moderator_id INTEGER,
-                reason TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Tabela de casos de moderação
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS mod_cases (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER,
-                case_id INTEGER,
-                user_id INTEGER,
-                moderator_id INTEGER,
-                type TEXT,
-                reason TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Tabela de configurações de ações automáticas
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS auto_warn_actions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER,
-                warn_count INTEGER,
-                action_type TEXT,
-                duration INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        conn.commit()
-        conn.close()
-
-    def create_mod_case(
+    async def create_mod_case(
         self, guild_id: int, user_id: int, moderator_id: int, case_type: str, reason: str
     ):
         """Criar um caso de moderação"""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
         # Obter próximo case_id
-        cursor.execute("SELECT MAX(case_id) FROM mod_cases WHERE guild_id = ?", (guild_id,))
-        result = cursor.fetchone()
-        next_case_id = (result[0] + 1) if result[0] else 1
+        result = await database.get(
+            "SELECT MAX(case_id) AS last_case FROM mod_cases WHERE guild_id = ?", (guild_id,)
+        )
+        next_case_id = (result["last_case"] + 1) if result and result["last_case"] else 1
 
         # Inserir caso
-        cursor.execute(
+        await database.run(
             """
             INSERT INTO mod_cases (guild_id, case_id, user_id, moderator_id, type, reason)
             VALUES (?, ?, ?, ?, ?, ?)
@@ -90,17 +37,11 @@ class WarnCommand(commands.Cog):
             (guild_id, next_case_id, user_id, moderator_id, case_type, reason),
         )
 
-        conn.commit()
-        case_id = next_case_id
-        conn.close()
-        return case_id
+        return next_case_id
 
-    def add_warning(self, guild_id: int, user_id: int, moderator_id: int, reason: str):
+    async def add_warning(self, guild_id: int, user_id: int, moderator_id: int, reason: str):
         """Adicionar um aviso"""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
+        await database.run(
             """
             INSERT INTO warnings (guild_id, user_id, moderator_id, reason)
             VALUES (?, ?, ?, ?)
@@ -108,31 +49,20 @@ class WarnCommand(commands.Cog):
             (guild_id, user_id, moderator_id, reason),
         )
 
-        conn.commit()
-        conn.close()
-
-    def get_warning_count(self, guild_id: int, user_id: int):
+    async def get_warning_count(self, guild_id: int, user_id: int):
         """Obter contagem de avisos de um usuário"""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
+        result = await database.get(
             """
-            SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND user_id = ?
+            SELECT COUNT(*) AS total FROM warnings WHERE guild_id = ? AND user_id = ?
         """,
             (guild_id, user_id),
         )
 
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count
+        return result["total"] if result else 0
 
-    def get_auto_action(self, guild_id: int, warn_count: int):
+    async def get_auto_action(self, guild_id: int, warn_count: int):
         """Buscar ação automática baseada no número de avisos"""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
+        result = await database.get(
             """
             SELECT action_type, duration FROM auto_warn_actions 
             WHERE guild_id = ? AND warn_count = ?
@@ -140,11 +70,8 @@ class WarnCommand(commands.Cog):
             (guild_id, warn_count),
         )
 
-        result = cursor.fetchone()
-        conn.close()
-
         if result:
-            return {"action": result[0], "duration": result[1]}
+            return {"action": result["action_type"], "duration": result["duration"]}
 
         # Ações padrão se não configuradas
         default_actions = {
@@ -213,9 +140,6 @@ class WarnCommand(commands.Cog):
     ):
         """Aplicar aviso a um membro"""
 
-        # Configurar banco se necessário
-        self.setup_database()
-
         # Verificar permissões
         if not interaction.user.guild_permissions.moderate_members:
             await interaction.response.send_message(
@@ -247,15 +171,15 @@ class WarnCommand(commands.Cog):
 
         try:
             # Adicionar aviso ao banco
-            self.add_warning(interaction.guild.id, user.id, interaction.user.id, motivo)
+            await self.add_warning(interaction.guild.id, user.id, interaction.user.id, motivo)
 
             # Criar caso de moderação
-            case_id = self.create_mod_case(
+            case_id = await self.create_mod_case(
                 interaction.guild.id, user.id, interaction.user.id, "warning", motivo
             )
 
             # Contar avisos totais
-            warn_count = self.get_warning_count(interaction.guild.id, user.id)
+            warn_count = await self.get_warning_count(interaction.guild.id, user.id)
 
             # Tentar enviar DM
             dm_sent = False
@@ -326,7 +250,7 @@ class WarnCommand(commands.Cog):
                 await log_channel.send(embed=log_embed)
 
             # Verificar ação automática
-            auto_action = self.get_auto_action(interaction.guild.id, warn_count)
+            auto_action = await self.get_auto_action(interaction.guild.id, warn_count)
             if auto_action:
                 await self.execute_auto_action(interaction, user, auto_action, warn_count)
 
@@ -348,10 +272,7 @@ class WarnCommand(commands.Cog):
             )
             return
 
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
+        warnings = await database.get_all(
             """
             SELECT reason, moderator_id, created_at 
             FROM warnings 
@@ -362,9 +283,7 @@ class WarnCommand(commands.Cog):
             (interaction.guild.id, user.id),
         )
 
-        warnings = cursor.fetchall()
         warn_count = len(warnings)
-        conn.close()
 
         embed = discord.Embed(
             title=f"⚠️ Avisos de {user.display_name}",
@@ -378,14 +297,14 @@ class WarnCommand(commands.Cog):
             embed.description = f"**Total de avisos:** {warn_count}"
 
             for i, warning in enumerate(warnings[:5], 1):  # Mostrar só os 5 mais recentes
-                moderator = interaction.guild.get_member(warning[1])
+                moderator = interaction.guild.get_member(int(warning["moderator_id"]))
                 mod_name = moderator.display_name if moderator else "Moderador desconhecido"
 
-                date_str = datetime.fromisoformat(warning[2]).strftime("%d/%m/%Y %H:%M")
+                date_str = datetime.fromisoformat(warning["created_at"]).strftime("%d/%m/%Y %H:%M")
 
                 embed.add_field(
                     name=f"📋 Aviso #{i}",
-                    value=f"**Motivo:** {warning[0]}\n**Moderador:** {mod_name}\n**Data:** {date_str}",
+                    value=f"**Motivo:** {warning['reason']}\n**Moderador:** {mod_name}\n**Data:** {date_str}",
                     inline=False,
                 )
 
@@ -4,8 +4,6 @@ Reprodução de músicas do YouTube com controles completos
 """
 
 import asyncio
-import os
-import sqlite3
 from datetime import datetime
 
 import discord
@@ -13,6 +11,8 @@ import youtube_dl
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+
 
 class MusicPlayer:
     """Player de música personalizado para cada servidor"""
@@ -54,39 +54,10 @@ class MusicSystem(commands.Cog):
         }
 
         self.ytdl = youtube_dl.YoutubeDL(self.ytdl_format_options)
-        self.db_path = os.path.join("src", "data", "music.db")
-        self.init_database()
-
-    def init_database(self):
-        """Inicializar banco de dados de histórico musical"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS music_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                user_id TEXT NOT NULL,
-                song_title TEXT NOT NULL,
-                song_url TEXT NOT NULL,
-                duration TEXT,
-                played_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS music_settings (
-                guild_id TEXT PRIMARY KEY,
-                default_volume INTEGER DEFAULT 50,
-                auto_leave BOOLEAN DEFAULT 1,
-                dj_role_id TEXT,
-                max_queue_length INTEGER DEFAULT 50
-            )
-        """)
 
-        conn.commit()
-        conn.close()
+    async def cog_load(self):
+        """Usar o banco principal (tabelas criadas pelas migrações)"""
+        self.db = database.storage
 
     def get_player(self, guild_id):
         """Obter ou criar player para um servidor"""
@@ -292,10 +263,7 @@ class MusicSystem(commands.Cog):
     async def save_to_history(self, guild_id, user_id, title, url, duration):
         """Salvar música no histórico"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            await self.db.run(
                 """
                 INSERT INTO music_history 
                 (guild_id, user_id, song_title, song_url, duration)
@@ -303,9 +271,6 @@ class MusicSystem(commands.Cog):
             """,
                 (str(guild_id), str(user_id), title, url, duration),
             )
-
-            conn.commit()
-            conn.close()
         except Exception as e:
             print(f"❌ Erro ao salvar histórico: {e}")
 
@@ -3,54 +3,23 @@ Sistema de Mute/Timeout Avançado
 Controle completo de timeouts com duração e histórico
 """
 
-import os
 import re
-import sqlite3
 from datetime import datetime, timedelta
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+
 
 class MuteSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db_path = os.path.join("src", "data", "mutes.db")
-        self.init_database()
-
-    def init_database(self):
-        """Inicializar banco de dados de mutes"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS mute_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                user_id TEXT NOT NULL,
-                moderator_id TEXT NOT NULL,
-                reason TEXT,
-                duration_minutes INTEGER,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                expires_at TIMESTAMP,
-                is_active BOOLEAN DEFAULT 1
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS mute_settings (
-                guild_id TEXT PRIMARY KEY,
-                max_mute_duration INTEGER DEFAULT 10080,
-                default_reason TEXT DEFAULT 'Violação das regras',
-                log_channel_id TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
 
-        conn.commit()
-        conn.close()
+    async def cog_load(self):
+        """Usar o banco principal (tabelas criadas pelas migrações)"""
+        self.db = database.storage
 
     def parse_time_string(self, time_str: str) -> timedelta | None:
         """Converter string de tempo para timedelta"""
@@ -209,10 +178,7 @@ class MuteSystem(commands.Cog):
             await user.timeout(expires_at, reason=f"Mute por {interaction.user}: {motivo}")
 
             # Salvar no banco de dados
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            cursor = await self.db.run(
                 """
                 INSERT INTO mute_history 
                 (guild_id, user_id, moderator_id, reason, duration_minutes, expires_at)
@@ -228,9 +194,6 @@ class MuteSystem(commands.Cog):
                 ),
             )
 
-            conn.commit()
-            conn.close()
-
             # Criar embed de confirmação
             embed = discord.Embed(
                 title="🔇 **USUÁRIO MUTADO**", color=0xFF6600, timestamp=datetime.now()
@@ -263,7 +226,7 @@ class MuteSystem(commands.Cog):
             embed.set_thumbnail(url=user.display_avatar.url)
 
             embed.set_footer(
-                text=f"ID do Mute: {cursor.lastrowid if 'cursor' in locals() else 'N/A'}",
+                text=f"ID do Mute: {cursor.lastrowid}",
                 icon_url=interaction.user.display_avatar.url,
             )
 
@@ -338,10 +301,7 @@ class MuteSystem(commands.Cog):
             await user.timeout(None, reason=f"Unmute por {interaction.user}: {motivo}")
 
             # Atualizar banco de dados
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            await self.db.run(
                 """
                 UPDATE mute_history 
                 SET is_active = 0 
@@ -350,9 +310,6 @@ class MuteSystem(commands.Cog):
                 (str(interaction.guild.id), str(user.id)),
             )
 
-            conn.commit()
-            conn.close()
-
             # Criar embed de confirmação
             embed = discord.Embed(
                 title="🔊 **TIMEOUT REMOVIDO**", color=0x00FF00, timestamp=datetime.now()
@@ -418,10 +375,7 @@ class MuteSystem(commands.Cog):
     @app_commands.default_permissions(moderate_members=True)
     async def mute_history(self, interaction: discord.Interaction, user: discord.Member):
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            results = await self.db.get_all(
                 """
                 SELECT moderator_id, reason, duration_minutes, applied_at, expires_at, is_active
                 FROM mute_history 
@@ -432,9 +386,6 @@ class MuteSystem(commands.Cog):
                 (str(interaction.guild.id), str(user.id)),
             )
 
-            results = cursor.fetchall()
-            conn.close()
-
             embed = discord.Embed(
                 title="📋 **HISTÓRICO DE MUTES**", color=0x6C5CE7, timestamp=datetime.now()
             )
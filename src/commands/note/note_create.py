@@ -5,6 +5,7 @@ Sistema completo para moderadores criarem anotações sobre usuários
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -12,6 +13,9 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.interaction_helpers import InteractionHelpers
+from ...utils.page_provider import COUNT_WAIT, KeysetPageProvider
+
 if TYPE_CHECKING:
     pass
 
@@ -284,23 +288,31 @@ class NotesCreation(commands.Cog):
 
             await interaction.response.defer(ephemeral=True)
 
-            # Buscar anotações
+            # Buscar anotações (uma página por vez; estatísticas em paralelo)
             try:
                 from ...utils.database import database
 
-                query: str = "SELECT * FROM user_notes WHERE guild_id = ? AND user_id = ?"
+                where: str = "guild_id = ? AND user_id = ?"
                 params: list[str] = [str(interaction.guild.id), str(usuario.id)]  # type: ignore
 
                 if categoria:
-                    query += " AND category = ?"
+                    where += " AND category = ?"
                     params.append(categoria.lower())
 
                 if ativo:
-                    query += " AND active = 1"
-
-                query += " ORDER BY created_at DESC"
+                    where += " AND active = 1"
 
-                notes: list[dict[str, Any]] = await database.get_all(query, params)
+                pages: KeysetPageProvider = KeysetPageProvider(
+                    database, "user_notes", where=where, params=params, page_size=5
+                )
+                stats_task: asyncio.Task[list[dict[str, Any]]] = asyncio.create_task(
+                    database.get_all(
+                        f"""SELECT category, severity, COUNT(*) AS total FROM user_notes
+                        WHERE {where} GROUP BY category, severity""",
+                        params,
+                    )
+                )
+                notes: list[dict[str, Any]] = await pages.page(0)
 
             except Exception as e:
                 print(f"❌ Erro ao buscar anotações: {e}")
@@ -310,6 +322,7 @@ class NotesCreation(commands.Cog):
                 return
 
             if not notes:
+                stats_task.cancel()
                 empty_embed: discord.Embed = discord.Embed(
                     title="📋 **NENHUMA ANOTAÇÃO ENCONTRADA**",
                     description=f"Não há anotações {'ativas' if ativo else ''} para {usuario.mention}.",
@@ -321,29 +334,23 @@ class NotesCreation(commands.Cog):
                 await interaction.followup.send(embed=empty_embed, ephemeral=True)
                 return
 
-            # Criar embed com lista de anotações
-            list_embed: discord.Embed = discord.Embed(
-                title=f"📋 **ANOTAÇÕES - {usuario.display_name}**",
-                description=f"Total: {len(notes)} anotação{'s' if len(notes) != 1 else ''}",
-                color=0x4A90E2,
-                timestamp=datetime.now(),
-            )
-
-            # Agrupar por categoria para estatísticas
-            category_stats: dict[str, int] = {}
-            severity_stats: dict[str, int] = {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0}
-
-            for note in notes:
-                cat: str = note["category"]
-                sev: str = str(note["severity"])
-
-                category_stats[cat] = category_stats.get(cat, 0) + 1
-                severity_stats[sev] += 1
+            await asyncio.wait({stats_task}, timeout=COUNT_WAIT)
+
+            def build_page(page_notes: list[dict[str, Any]], index: int) -> discord.Embed:
+                """Embed de uma página de anotações"""
+                total: int | None = pages.total
+                list_embed: discord.Embed = discord.Embed(
+                    title=f"📋 **ANOTAÇÕES - {usuario.display_name}**",
+                    description=(
+                        f"Total: {total} anotação{'s' if total != 1 else ''}"
+                        if total is not None
+                        else "Total: contando..."
+                    ),
+                    color=0x4A90E2,
+                    timestamp=datetime.now(),
+                )
 
-            # Mostrar estatísticas
-            if len(notes) <= 10:
-                # Mostrar todas as anotações se forem poucas
-                for i, note in enumerate(notes[:10], 1):
+                for i, note in enumerate(page_notes, index * pages.page_size + 1):
                     created_date: datetime = datetime.fromisoformat(note["created_at"])
                     moderator: discord.Member | None = interaction.guild.get_member(int(note["moderator_id"]))  # type: ignore
                     moderator_name: str = (
@@ -365,53 +372,50 @@ class NotesCreation(commands.Cog):
                     note_value += f"{cat_info['emoji']} {cat_info['name']} • {severity_emoji} Sev. {note['severity']}"
 
                     list_embed.add_field(name=f"📝 Anotação #{i}", value=note_value, inline=False)
-            else:
-                # Mostrar resumo se forem muitas
-                recent_notes: list[dict[str, Any]] = notes[:5]
-                for i, note in enumerate(recent_notes, 1):
-                    created_date_recent: datetime = datetime.fromisoformat(note["created_at"])
-                    cat_info_recent: dict[str, Any] = self.categories.get(note["category"], self.categories["other"])
-
-                    note_value_recent: str = f"**{note['title']}** - {cat_info_recent['emoji']} {cat_info_recent['name']}\n"
-                    note_value_recent += f"{created_date_recent.strftime('%d/%m/%Y %H:%M')}"
-
-                    list_embed.add_field(name=f"📝 Recente #{i}", value=note_value_recent, inline=True)
-
-                if len(notes) > 5:
-                    list_embed.add_field(
-                        name="➕ Mais Anotações",
-                        value=f"... e mais {len(notes) - 5} anotações\nUse `/note-search` para buscar específicas",
-                        inline=False,
-                    )
 
-            # Estatísticas por categoria
-            if category_stats:
-                stats_text: str = ""
-                for cat, count in sorted(category_stats.items(), key=lambda x: x[1], reverse=True)[
-                    :5
-                ]:
-                    cat_info_stat: dict[str, Any] = self.categories.get(cat, self.categories["other"])
-                    stats_text += f"{cat_info_stat['emoji']} **{cat_info_stat['name']}:** {count}\n"
-
-                list_embed.add_field(name="📊 Por Categoria", value=stats_text, inline=True)
-
-            # Estatísticas por severidade
-            severity_text: str = ""
-            for sev in ["5", "4", "3", "2", "1"]:
-                if severity_stats[sev] > 0:
-                    emoji: str = "🔴" if sev in ["4", "5"] else "🟡" if sev == "3" else "🟢"
-                    severity_text += f"{emoji} **Nível {sev}:** {severity_stats[sev]}\n"
-
-            if severity_text:
-                list_embed.add_field(name="⚡ Por Severidade", value=severity_text, inline=True)
-
-            list_embed.set_thumbnail(url=usuario.display_avatar.url)
-            list_embed.set_footer(
-                text=f"Consultado por {interaction.user}",
-                icon_url=interaction.user.display_avatar.url,
-            )
+                # Estatísticas (todas as anotações filtradas, não só a página)
+                if stats_task.done() and not stats_task.cancelled() and not stats_task.exception():
+                    category_stats: dict[str, int] = {}
+                    severity_stats: dict[str, int] = {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0}
+
+                    for row in stats_task.result():
+                        cat: str = row["category"]
+                        sev: str = str(row["severity"])
+
+                        category_stats[cat] = category_stats.get(cat, 0) + row["total"]
+                        if sev in severity_stats:
+                            severity_stats[sev] += row["total"]
+
+                    if category_stats:
+                        stats_text: str = ""
+                        for cat, count in sorted(
+                            category_stats.items(), key=lambda x: x[1], reverse=True
+                        )[:5]:
+                            cat_info_stat: dict[str, Any] = self.categories.get(cat, self.categories["other"])
+                            stats_text += f"{cat_info_stat['emoji']} **{cat_info_stat['name']}:** {count}\n"
+
+                        list_embed.add_field(name="📊 Por Categoria", value=stats_text, inline=True)
+
+                    # Estatísticas por severidade
+                    severity_text: str = ""
+                    for sev in ["5", "4", "3", "2", "1"]:
+                        if severity_stats[sev] > 0:
+                            emoji: str = "🔴" if sev in ["4", "5"] else "🟡" if sev == "3" else "🟢"
+                            severity_text += f"{emoji} **Nível {sev}:** {severity_stats[sev]}\n"
+
+                    if severity_text:
+                        list_embed.add_field(name="⚡ Por Severidade", value=severity_text, inline=True)
+
+                list_embed.set_thumbnail(url=usuario.display_avatar.url)
+                list_embed.set_footer(
+                    text=f"Consultado por {interaction.user}",
+                    icon_url=interaction.user.display_avatar.url,
+                )
+                return list_embed
 
-            await interaction.followup.send(embed=list_embed, ephemeral=True)
+            await InteractionHelpers.paginate_pages(
+                interaction, pages, build_page, ephemeral=True
+            )
 
         except Exception as e:
             print(f"❌ Erro no comando note-list: {e}")
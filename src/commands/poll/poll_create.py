@@ -5,7 +5,6 @@ Comando para criar enquetes/votações interativas
 
 from __future__ import annotations
 
-import asyncio
 import json
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
@@ -18,6 +17,8 @@ from discord.ext import commands
 if TYPE_CHECKING:
     from typing import Callable
 
+    from ...utils.scheduler import ScheduledEvent
+
 
 class PollView(discord.ui.View):
     """Interface de votação para polls"""
@@ -79,7 +80,7 @@ class PollView(discord.ui.View):
                 if existing_vote:
                     if existing_vote["option_index"] == option_index:
                         # Remover voto (toggle)
-                        await database.execute(
+                        await database.run(
                             "DELETE FROM poll_votes WHERE poll_id = ? AND user_id = ?",
                             (self.poll_id, str(interaction.user.id)),
                         )
@@ -91,7 +92,7 @@ class PollView(discord.ui.View):
                         )
                     else:
                         # Alterar voto
-                        await database.execute(
+                        await database.run(
                             "UPDATE poll_votes SET option_index = ?, voted_at = ? WHERE poll_id = ? AND user_id = ?",
                             (
                                 option_index,
@@ -111,7 +112,7 @@ class PollView(discord.ui.View):
                         )
                 else:
                     # Novo voto
-                    await database.execute(
+                    await database.run(
                         "INSERT INTO poll_votes (poll_id, user_id, option_index, voted_at) VALUES (?, ?, ?, ?)",
                         (
                             self.poll_id,
@@ -227,6 +228,17 @@ class PollCreate(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot: commands.Bot = bot
 
+    async def cog_load(self) -> None:
+        """Registrar a finalização automática no agendador"""
+        from ...utils.database import database
+
+        database.scheduler.register("poll_end", self.on_poll_end_event)
+
+    async def cog_unload(self) -> None:
+        from ...utils.database import database
+
+        database.scheduler.unregister("poll_end")
+
     @app_commands.command(name="poll-create", description="🗳️ Criar uma enquete/votação")
     @app_commands.describe(
         pergunta="A pergunta da votação",
@@ -386,7 +398,7 @@ class PollCreate(commands.Cog):
             try:
                 from ...utils.database import database
 
-                await database.execute(
+                await database.run(
                     """INSERT INTO polls 
                        (id, guild_id, channel_id, message_id, user_id, question, description, options, status, created_at, end_time) 
                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
@@ -442,7 +454,16 @@ class PollCreate(commands.Cog):
 
             # Agendar finalização automática se houver duração
             if duracao:
-                asyncio.create_task(self.auto_end_poll(poll_id, duracao * 60))
+                from ...utils.database import database
+
+                await database.scheduler.schedule(
+                    "poll_end",
+                    datetime.fromisoformat(end_time),
+                    {"poll_id": poll_id},
+                    key=poll_id,
+                    guild_id=interaction.guild.id,
+                    created_by=interaction.user.id,
+                )
 
         except Exception as e:
             print(f"❌ Erro no comando poll-create: {e}")
@@ -453,11 +474,13 @@ class PollCreate(commands.Cog):
             except:
                 pass
 
-    async def auto_end_poll(self, poll_id: str, duration_seconds: int) -> None:
-        """Finaliza poll automaticamente após duração especificada"""
-        try:
-            await asyncio.sleep(duration_seconds)
+    async def on_poll_end_event(self, event: ScheduledEvent) -> None:
+        """Executor do evento agendado ``poll_end``"""
+        await self.auto_end_poll(event.data["poll_id"])
 
+    async def auto_end_poll(self, poll_id: str) -> None:
+        """Finaliza poll automaticamente ao fim da duração especificada"""
+        try:
             # Buscar poll no banco
             from ...utils.database import database
 
@@ -467,7 +490,7 @@ class PollCreate(commands.Cog):
 
             if poll:
                 # Atualizar status
-                await database.execute(
+                await database.run(
                     "UPDATE polls SET status = 'finished' WHERE id = ?", (poll_id,)
                 )
 
@@ -13,8 +13,30 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.page_provider import KeysetPageProvider
+
 if TYPE_CHECKING:
-    pass
+    from ...utils.database import Database
+
+
+def poll_pages(
+    database: Database, guild_id: int, status: str = "all", user: discord.Member | None = None
+) -> KeysetPageProvider:
+    """Votações do servidor com os filtros, lidas uma página por vez"""
+    where: str = "guild_id = ?"
+    params: list[str] = [str(guild_id)]
+
+    if status != "all":
+        where += " AND status = ?"
+        params.append(status)
+
+    if user:
+        where += " AND user_id = ?"
+        params.append(str(user.id))
+
+    return KeysetPageProvider(
+        database, "polls", where=where, params=params, group_by="status", page_size=4
+    )
 
 
 class PollListView(discord.ui.View):
@@ -22,38 +44,42 @@ class PollListView(discord.ui.View):
 
     def __init__(
         self,
-        polls: list[dict[str, Any]],
+        pages: KeysetPageProvider,
         guild: discord.Guild,
         filter_status: str = "all",
         filter_user: discord.Member | None = None,
         page: int = 0,
     ) -> None:
         super().__init__(timeout=300)
-        self.polls: list[dict[str, Any]] = polls
+        # Votações lidas uma página por vez (ver KeysetPageProvider)
+        self.pages: KeysetPageProvider = pages
         self.guild: discord.Guild = guild
         self.filter_status: str = filter_status
         self.filter_user: discord.Member | None = filter_user
         self.page: int = page
-        self.items_per_page: int = 4
-        self.max_pages: int = max(1, (len(polls) + self.items_per_page - 1) // self.items_per_page)
+        self.items_per_page: int = pages.page_size
 
         self.update_buttons()
 
     def update_buttons(self) -> None:
         """Atualiza estado dos botões"""
         self.previous_button.disabled = self.page <= 0
-        self.next_button.disabled = self.page >= self.max_pages - 1
-        self.page_button.label = f"Página {self.page + 1}/{self.max_pages}"
+        self.next_button.disabled = not self.pages.has_next(self.page)
+        self.page_button.label = self.pages.page_label(self.page)
 
-    def get_page_embed(self) -> discord.Embed:
+    async def get_page_embed(self) -> discord.Embed:
         """Gera embed da página atual"""
         start_idx: int = self.page * self.items_per_page
-        end_idx: int = start_idx + self.items_per_page
-        page_polls: list[dict[str, Any]] = self.polls[start_idx:end_idx]
+        page_polls: list[dict[str, Any]] = await self.pages.page(self.page)
+        if self.pages.total is None:
+            await self.pages.wait_total()
+        self.update_buttons()
+        stats: dict[str, int] | None = self.get_statistics()
 
         embed: discord.Embed = discord.Embed(
             title="🗳️ **LISTA DE VOTAÇÕES**",
-            description=f"Mostrando {len(page_polls)} de {len(self.polls)} votações",
+            description=f"Mostrando {len(page_polls)} de "
+            f"{stats['total'] if stats else '...'} votações",
             color=0x2F3136,
             timestamp=datetime.now(),
         )
@@ -123,13 +149,16 @@ class PollListView(discord.ui.View):
             )
 
         # Estatísticas
-        stats: dict[str, int] = self.get_statistics()
         embed.add_field(
             name="📊 Estatísticas",
-            value=f"**Total:** {stats['total']}\n"
-            f"**Ativas:** {stats['active']} 🟢\n"
-            f"**Finalizadas:** {stats['finished']} 🔴\n"
-            f"**Pausadas:** {stats.get('paused', 0)} 🟡",
+            value=(
+                f"**Total:** {stats['total']}\n"
+                f"**Ativas:** {stats['active']} 🟢\n"
+                f"**Finalizadas:** {stats['finished']} 🔴\n"
+                f"**Pausadas:** {stats.get('paused', 0)} 🟡"
+            )
+            if stats
+            else "⏳ Contando...",
             inline=True,
         )
 
@@ -147,20 +176,27 @@ class PollListView(discord.ui.View):
         )
 
         embed.set_footer(
-            text=f"Página {self.page + 1}/{self.max_pages} • Use os IDs para interagir com votações",
+            text=f"{self.pages.page_label(self.page)} • Use os IDs para interagir com votações",
             icon_url=self.guild.icon.url if self.guild.icon else None,
         )
 
         return embed
 
-    def get_statistics(self) -> dict[str, int]:
-        """Calcula estatísticas das votações"""
-        stats: dict[str, int] = {"total": len(self.polls), "active": 0, "finished": 0, "paused": 0}
-
-        for poll in self.polls:
-            status: str = poll["status"]
+    def get_statistics(self) -> dict[str, int] | None:
+        """Estatísticas das votações (None enquanto a contagem não terminou)"""
+        groups: dict[Any, int] | None = self.pages.groups
+        if groups is None:
+            return None
+
+        stats: dict[str, int] = {
+            "total": sum(groups.values()),
+            "active": 0,
+            "finished": 0,
+            "paused": 0,
+        }
+        for status, count in groups.items():
             if status in stats:
-                stats[status] += 1
+                stats[status] += count
 
         return stats
 
@@ -170,8 +206,8 @@ class PollListView(discord.ui.View):
     ) -> None:
         if self.page > 0:
             self.page -= 1
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
+            embed: discord.Embed = await self.get_page_embed()
+            await interaction.response.edit_message(embed=embed, view=self)
         else:
             await interaction.response.defer()
 
@@ -185,10 +221,10 @@ class PollListView(discord.ui.View):
     async def next_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ) -> None:
-        if self.page < self.max_pages - 1:
+        if self.pages.has_next(self.page):
             self.page += 1
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
+            embed: discord.Embed = await self.get_page_embed()
+            await interaction.response.edit_message(embed=embed, view=self)
         else:
             await interaction.response.defer()
 
@@ -197,33 +233,15 @@ class PollListView(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ) -> None:
         try:
-            # Recarregar votações
-            from ...utils.database import database
+            # Recarregar votações (páginas e total descartados)
+            self.pages.reset()
 
-            query: str = "SELECT * FROM polls WHERE guild_id = ?"
-            params: list[str] = [str(self.guild.id)]
+            if self.page > 0 and not await self.pages.page(self.page):
+                page_count: int = max(1, -(-await self.pages.count() // self.items_per_page))
+                self.page = min(self.page, page_count - 1)
 
-            if self.filter_status != "all":
-                query += " AND status = ?"
-                params.append(self.filter_status)
-
-            if self.filter_user:
-                query += " AND user_id = ?"
-                params.append(str(self.filter_user.id))
-
-            query += " ORDER BY created_at DESC"
-
-            fresh_polls: list[dict[str, Any]] | None = await database.get_all(query, params)
-            self.polls = fresh_polls or []
-            self.max_pages = max(
-                1, (len(self.polls) + self.items_per_page - 1) // self.items_per_page
-            )
-
-            if self.page >= self.max_pages:
-                self.page = max(0, self.max_pages - 1)
-
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
+            embed: discord.Embed = await self.get_page_embed()
+            await interaction.response.edit_message(embed=embed, view=self)
 
         except Exception as e:
             await interaction.response.send_message(f"❌ Erro ao atualizar: {e}", ephemeral=True)
@@ -253,20 +271,10 @@ class PollList(commands.Cog):
             try:
                 from ...utils.database import database
 
-                query: str = "SELECT * FROM polls WHERE guild_id = ?"
-                params: list[str] = [str(interaction.guild.id)]
-
-                if status != "all":
-                    query += " AND status = ?"
-                    params.append(status)
-
-                if criador:
-                    query += " AND user_id = ?"
-                    params.append(str(criador.id))
-
-                query += " ORDER BY created_at DESC"
-
-                polls: list[dict[str, Any]] | None = await database.get_all(query, params)
+                pages: KeysetPageProvider = poll_pages(
+                    database, interaction.guild.id, status, criador
+                )
+                polls: list[dict[str, Any]] = await pages.page(0)
 
             except Exception as e:
                 print(f"❌ Erro ao buscar votações: {e}")
@@ -307,8 +315,8 @@ class PollList(commands.Cog):
                 return
 
             # Criar interface de lista paginada
-            view: PollListView = PollListView(polls, interaction.guild, status, criador)
-            embed: discord.Embed = view.get_page_embed()
+            view: PollListView = PollListView(pages, interaction.guild, status, criador)
+            embed: discord.Embed = await view.get_page_embed()
 
             await interaction.followup.send(embed=embed, view=view, ephemeral=True)
 
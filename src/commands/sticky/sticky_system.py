@@ -3,170 +3,32 @@ Sistema de Mensagens Sticky Avançado
 Mensagens que permanecem fixas nos canais com repostagem automática
 """
 
-import json
-import os
-import sqlite3
 from datetime import datetime
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+from ...utils.message_pipeline import MessageContext, get_message_pipeline
+
 
 class StickySystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db_path = os.path.join("src", "data", "sticky.db")
-        self.sticky_cache = {}  # Cache das mensagens sticky ativas
-        self.message_counters = {}  # Contador de mensagens por canal
-        self.init_database()
-
-        # Carregar configurações na inicialização (será chamado manualmente)
-        # self.bot.loop.create_task(self.load_sticky_cache())
-
-    def init_database(self):
-        """Inicializar banco de dados de sticky messages"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sticky_messages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                channel_id TEXT NOT NULL,
-                message_content TEXT NOT NULL,
-                embed_data TEXT,
-                frequency INTEGER DEFAULT 5,
-                last_message_id TEXT,
-                is_active BOOLEAN DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(guild_id, channel_id)
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sticky_stats (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                channel_id TEXT NOT NULL,
-                reposts_count INTEGER DEFAULT 0,
-                last_repost TIMESTAMP,
-                total_views INTEGER DEFAULT 0
-            )
-        """)
-
-        conn.commit()
-        conn.close()
-
-    async def load_sticky_cache(self):
-        """Carregar configurações sticky no cache"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT guild_id, channel_id, message_content, embed_data, frequency, last_message_id
-                FROM sticky_messages 
-                WHERE is_active = 1
-            """)
-
-            results = cursor.fetchall()
-            conn.close()
-
-            for guild_id, channel_id, content, embed_data, frequency, last_msg_id in results:
-                key = f"{guild_id}_{channel_id}"
-                self.sticky_cache[key] = {
-                    "content": content,
-                    "embed_data": json.loads(embed_data) if embed_data else None,
-                    "frequency": frequency,
-                    "last_message_id": last_msg_id,
-                }
-                self.message_counters[key] = 0
-
-            print(f"✅ Carregadas {len(results)} mensagens sticky")
-        except Exception as e:
-            print(f"❌ Erro ao carregar sticky cache: {e}")
-
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        """Monitorar mensagens para repostar sticky quando necessário"""
-        if message.author.bot:
-            return
-
-        if not message.guild:
-            return
-
-        key = f"{message.guild.id}_{message.channel.id}"
-
-        if key not in self.sticky_cache:
-            return
-
-        # Incrementar contador
-        self.message_counters[key] = self.message_counters.get(key, 0) + 1
-
-        # Verificar se deve repostar
-        sticky_data = self.sticky_cache[key]
-        if self.message_counters[key] >= sticky_data["frequency"]:
-            await self.repost_sticky(message.channel, key)
-
-    async def repost_sticky(self, channel, key):
-        """Repostar mensagem sticky"""
-        try:
-            sticky_data = self.sticky_cache[key]
-
-            # Deletar mensagem sticky anterior
-            if sticky_data.get("last_message_id"):
-                try:
-                    old_message = await channel.fetch_message(sticky_data["last_message_id"])
-                    await old_message.delete()
-                except:
-                    pass
-
-            # Criar nova mensagem
-            if sticky_data.get("embed_data"):
-                embed_data = sticky_data["embed_data"]
-                embed = discord.Embed.from_dict(embed_data)
-                new_message = await channel.send(
-                    content=sticky_data["content"] or None, embed=embed
-                )
-            else:
-                new_message = await channel.send(sticky_data["content"])
-
-            # Atualizar ID da mensagem no cache e banco
-            sticky_data["last_message_id"] = str(new_message.id)
-            self.message_counters[key] = 0
 
-            # Atualizar banco de dados
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+    async def cog_load(self):
+        """Usar o banco principal e registrar estágio no pipeline de mensagens"""
+        self.db = database.storage
+        get_message_pipeline(self.bot).register("sticky_system", self.process_message)
 
-            guild_id, channel_id = key.split("_")
-            cursor.execute(
-                """
-                UPDATE sticky_messages 
-                SET last_message_id = ?, updated_at = ?
-                WHERE guild_id = ? AND channel_id = ?
-            """,
-                (str(new_message.id), datetime.now(), guild_id, channel_id),
-            )
+    async def cog_unload(self):
+        """Remover estágio do pipeline de mensagens"""
+        get_message_pipeline(self.bot).unregister("sticky_system")
 
-            # Atualizar estatísticas
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO sticky_stats 
-                (guild_id, channel_id, reposts_count, last_repost)
-                VALUES (?, ?, COALESCE((SELECT reposts_count FROM sticky_stats WHERE guild_id = ? AND channel_id = ?), 0) + 1, ?)
-            """,
-                (guild_id, channel_id, guild_id, channel_id, datetime.now()),
-            )
-
-            conn.commit()
-            conn.close()
-
-        except Exception as e:
-            print(f"❌ Erro ao repostar sticky: {e}")
+    async def process_message(self, ctx: MessageContext):
+        """Contar a mensagem (único estágio do contador das stickies)"""
+        await database.stickies.record_message(ctx.message.channel)
 
     @app_commands.command(name="sticky", description="📌 Configurar mensagem sticky")
     @app_commands.describe(
@@ -215,18 +77,16 @@ class StickySystem(commands.Cog):
                 )
                 return
 
-            key = f"{interaction.guild.id}_{canal.id}"
-
             if acao == "view":
-                await self.show_sticky_status(interaction, canal, key)
+                await self.show_sticky_status(interaction, canal)
                 return
 
             if acao == "remove":
-                await self.remove_sticky(interaction, canal, key)
+                await self.remove_sticky(interaction, canal)
                 return
 
             if acao == "repost":
-                await self.manual_repost(interaction, canal, key)
+                await self.manual_repost(interaction, canal)
                 return
 
             if acao == "set":
@@ -238,7 +98,7 @@ class StickySystem(commands.Cog):
                     )
                     return
 
-                await self.set_sticky(interaction, canal, mensagem, frequencia, key)
+                await self.set_sticky(interaction, canal, mensagem, frequencia)
                 return
 
         except Exception as e:
@@ -250,10 +110,12 @@ class StickySystem(commands.Cog):
             except:
                 pass
 
-    async def show_sticky_status(self, interaction, canal, key):
+    async def show_sticky_status(self, interaction, canal):
         """Mostrar status da mensagem sticky"""
         try:
-            if key not in self.sticky_cache:
+            await database.stickies.load()
+            sticky = database.stickies.get(canal.id)
+            if sticky is None:
                 await interaction.response.send_message(
                     f"❌ **Sticky Não Configurado**\n"
                     f"Nenhuma mensagem sticky configurada para {canal.mention}.",
@@ -261,13 +123,11 @@ class StickySystem(commands.Cog):
                 )
                 return
 
-            sticky_data = self.sticky_cache[key]
+            # Gravar os reposts pendentes antes de ler as estatísticas
+            await database.stickies.flush()
 
             # Buscar estatísticas
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            stats = await self.db.get(
                 """
                 SELECT reposts_count, last_repost, total_views
                 FROM sticky_stats 
@@ -276,9 +136,6 @@ class StickySystem(commands.Cog):
                 (str(interaction.guild.id), str(canal.id)),
             )
 
-            stats = cursor.fetchone()
-            conn.close()
-
             embed = discord.Embed(
                 title="📌 **STATUS MENSAGEM STICKY**", color=0x00BFFF, timestamp=datetime.now()
             )
@@ -287,13 +144,13 @@ class StickySystem(commands.Cog):
 
             embed.add_field(
                 name="🔄 Frequência",
-                value=f"A cada **{sticky_data['frequency']}** mensagens",
+                value=f"A cada **{sticky.threshold}** mensagens",
                 inline=True,
             )
 
             embed.add_field(
                 name="📊 Contador Atual",
-                value=f"**{self.message_counters.get(key, 0)}** / {sticky_data['frequency']}",
+                value=f"**{sticky.counter}** / {sticky.threshold}",
                 inline=True,
             )
 
@@ -308,17 +165,15 @@ class StickySystem(commands.Cog):
                     )
 
             # Prévia da mensagem
-            content_preview = sticky_data["content"][:200] + (
-                "..." if len(sticky_data["content"]) > 200 else ""
-            )
+            content_preview = sticky.content[:200] + ("..." if len(sticky.content) > 200 else "")
             embed.add_field(
                 name="💬 Prévia da Mensagem", value=f"```{content_preview}```", inline=False
             )
 
             # Status da última mensagem
-            if sticky_data.get("last_message_id"):
+            if sticky.message_id:
                 try:
-                    await canal.fetch_message(sticky_data["last_message_id"])
+                    await canal.fetch_message(sticky.message_id)
                     status = "✅ Mensagem ativa no canal"
                 except:
                     status = "⚠️ Mensagem não encontrada (pode ter sido deletada)"
@@ -336,10 +191,12 @@ class StickySystem(commands.Cog):
             print(f"❌ Erro ao mostrar status sticky: {e}")
             await interaction.response.send_message("❌ Erro ao buscar status.", ephemeral=True)
 
-    async def remove_sticky(self, interaction, canal, key):
+    async def remove_sticky(self, interaction, canal):
         """Remover mensagem sticky"""
         try:
-            if key not in self.sticky_cache:
+            await database.stickies.load()
+            sticky = database.stickies.get(canal.id)
+            if sticky is None:
                 await interaction.response.send_message(
                     f"❌ **Sticky Não Configurado**\n"
                     f"Nenhuma mensagem sticky configurada para {canal.mention}.",
@@ -347,25 +204,19 @@ class StickySystem(commands.Cog):
                 )
                 return
 
-            # Remover mensagem atual se existir
-            sticky_data = self.sticky_cache[key]
-            if sticky_data.get("last_message_id"):
+            # Remover mensagem atual se existir (pelo ID, sem buscar)
+            if sticky.message_id:
                 try:
-                    message = await canal.fetch_message(sticky_data["last_message_id"])
-                    await message.delete()
+                    await canal.get_partial_message(sticky.message_id).delete()
                 except:
                     pass
 
-            # Remover do cache
-            del self.sticky_cache[key]
-            if key in self.message_counters:
-                del self.message_counters[key]
+            # Remover da memória (cancela o repost pendente)
+            await database.stickies.flush()
+            database.stickies.remove(canal.id)
 
             # Remover do banco
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            await self.db.run(
                 """
                 UPDATE sticky_messages 
                 SET is_active = 0, updated_at = ?
@@ -374,9 +225,6 @@ class StickySystem(commands.Cog):
                 (datetime.now(), str(interaction.guild.id), str(canal.id)),
             )
 
-            conn.commit()
-            conn.close()
-
             embed = discord.Embed(
                 title="🗑️ **STICKY REMOVIDO**",
                 description=f"Mensagem sticky removida de {canal.mention} com sucesso!",
@@ -395,10 +243,11 @@ class StickySystem(commands.Cog):
             print(f"❌ Erro ao remover sticky: {e}")
             await interaction.response.send_message("❌ Erro ao remover sticky.", ephemeral=True)
 
-    async def manual_repost(self, interaction, canal, key):
+    async def manual_repost(self, interaction, canal):
         """Repostar mensagem sticky manualmente"""
         try:
-            if key not in self.sticky_cache:
+            await database.stickies.load()
+            if database.stickies.get(canal.id) is None:
                 await interaction.response.send_message(
                     f"❌ **Sticky Não Configurado**\n"
                     f"Nenhuma mensagem sticky configurada para {canal.mention}.",
@@ -409,7 +258,7 @@ class StickySystem(commands.Cog):
             await interaction.response.defer(ephemeral=True)
 
             # Repostar sticky
-            await self.repost_sticky(canal, key)
+            await database.stickies.repost(canal)
 
             embed = discord.Embed(
                 title="🔄 **STICKY REPOSTADO**",
@@ -429,7 +278,7 @@ class StickySystem(commands.Cog):
             print(f"❌ Erro ao repostar sticky: {e}")
             await interaction.followup.send("❌ Erro ao repostar sticky.", ephemeral=True)
 
-    async def set_sticky(self, interaction, canal, mensagem, frequencia, key):
+    async def set_sticky(self, interaction, canal, mensagem, frequencia):
         """Configurar nova mensagem sticky"""
         try:
             # Validar frequência
@@ -442,24 +291,20 @@ class StickySystem(commands.Cog):
 
             await interaction.response.defer()
 
-            # Remover mensagem anterior se existir
-            if key in self.sticky_cache:
-                old_data = self.sticky_cache[key]
-                if old_data.get("last_message_id"):
-                    try:
-                        old_message = await canal.fetch_message(old_data["last_message_id"])
-                        await old_message.delete()
-                    except:
-                        pass
+            # Remover mensagem anterior se existir (pelo ID, sem buscar)
+            await database.stickies.load()
+            old_sticky = database.stickies.get(canal.id)
+            if old_sticky and old_sticky.message_id:
+                try:
+                    await canal.get_partial_message(old_sticky.message_id).delete()
+                except:
+                    pass
 
             # Postar primeira vez
             new_message = await canal.send(mensagem)
 
             # Salvar no banco
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            await self.db.run(
                 """
                 INSERT OR REPLACE INTO sticky_messages 
                 (guild_id, channel_id, message_content, frequency, last_message_id, updated_at)
@@ -475,17 +320,8 @@ class StickySystem(commands.Cog):
                 ),
             )
 
-            conn.commit()
-            conn.close()
-
-            # Atualizar cache
-            self.sticky_cache[key] = {
-                "content": mensagem,
-                "embed_data": None,
-                "frequency": frequencia,
-                "last_message_id": str(new_message.id),
-            }
-            self.message_counters[key] = 0
+            # Atualizar a sticky em memória
+            await database.stickies.reload(canal.id)
 
             # Embed de confirmação
             embed = discord.Embed(
@@ -12,8 +12,38 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.page_provider import KeysetPageProvider
+
 if TYPE_CHECKING:
-    pass
+    from ...utils.database import Database
+
+
+def suggestion_pages(
+    database: Database,
+    guild_id: int,
+    status: str = "all",
+    user: discord.Member | None = None,
+    category: str | None = None,
+) -> KeysetPageProvider:
+    """Sugestões do servidor com os filtros, lidas uma página por vez"""
+    where: str = "guild_id = ?"
+    params: list[str] = [str(guild_id)]
+
+    if status != "all":
+        where += " AND status = ?"
+        params.append(status)
+
+    if user:
+        where += " AND user_id = ?"
+        params.append(str(user.id))
+
+    if category:
+        where += " AND category = ?"
+        params.append(category)
+
+    return KeysetPageProvider(
+        database, "suggestions", where=where, params=params, group_by="status", page_size=5
+    )
 
 
 class SuggestionListView(discord.ui.View):
@@ -21,38 +51,42 @@ class SuggestionListView(discord.ui.View):
 
     def __init__(
         self,
-        suggestions: list[dict[str, Any]],
+        pages: KeysetPageProvider,
         guild: discord.Guild,
         filter_status: str = "all",
         filter_user: discord.Member | None = None,
         page: int = 0,
     ) -> None:
         super().__init__(timeout=300)
-        self.suggestions: list[dict[str, Any]] = suggestions
+        # Sugestões lidas uma página por vez (ver KeysetPageProvider)
+        self.pages: KeysetPageProvider = pages
         self.guild: discord.Guild = guild
         self.filter_status: str = filter_status
         self.filter_user: discord.Member | None = filter_user
         self.page: int = page
-        self.items_per_page: int = 5
-        self.max_pages: int = max(1, (len(suggestions) + self.items_per_page - 1) // self.items_per_page)
+        self.items_per_page: int = pages.page_size
 
         self.update_buttons()
 
     def update_buttons(self) -> None:
         """Atualiza estado dos botões"""
         self.previous_button.disabled = self.page <= 0
-        self.next_button.disabled = self.page >= self.max_pages - 1
-        self.page_button.label = f"Página {self.page + 1}/{self.max_pages}"
+        self.next_button.disabled = not self.pages.has_next(self.page)
+        self.page_button.label = self.pages.page_label(self.page)
 
-    def get_page_embed(self) -> discord.Embed:
+    async def get_page_embed(self) -> discord.Embed:
         """Gera embed da página atual"""
         start_idx: int = self.page * self.items_per_page
-        end_idx: int = start_idx + self.items_per_page
-        page_suggestions: list[dict[str, Any]] = self.suggestions[start_idx:end_idx]
+        page_suggestions: list[dict[str, Any]] = await self.pages.page(self.page)
+        if self.pages.total is None:
+            await self.pages.wait_total()
+        self.update_buttons()
+        stats: dict[str, int] | None = self.get_statistics()
 
         embed: discord.Embed = discord.Embed(
             title="💡 **LISTA DE SUGESTÕES**",
-            description=f"Mostrando {len(page_suggestions)} de {len(self.suggestions)} sugestões",
+            description=f"Mostrando {len(page_suggestions)} de "
+            f"{stats['total'] if stats else '...'} sugestões",
             color=0x2F3136,
             timestamp=datetime.now(),
         )
@@ -107,13 +141,16 @@ class SuggestionListView(discord.ui.View):
             )
 
         # Estatísticas
-        stats: dict[str, int] = self.get_statistics()
         embed.add_field(
             name="📊 Estatísticas",
-            value=f"**Total:** {stats['total']}\n"
-            f"**Pendentes:** {stats['pending']} 🟡\n"
-            f"**Aprovadas:** {stats['approved']} ✅\n"
-            f"**Rejeitadas:** {stats['rejected']} ❌",
+            value=(
+                f"**Total:** {stats['total']}\n"
+                f"**Pendentes:** {stats['pending']} 🟡\n"
+                f"**Aprovadas:** {stats['approved']} ✅\n"
+                f"**Rejeitadas:** {stats['rejected']} ❌"
+            )
+            if stats
+            else "⏳ Contando...",
             inline=True,
         )
 
@@ -125,26 +162,29 @@ class SuggestionListView(discord.ui.View):
         embed.add_field(name="🔍 Filtros", value=filters_text, inline=True)
 
         embed.set_footer(
-            text=f"Página {self.page + 1}/{self.max_pages} • Use /suggestion-manage para gerenciar",
+            text=f"{self.pages.page_label(self.page)} • Use /suggestion-manage para gerenciar",
             icon_url=self.guild.icon.url if self.guild.icon else None,
         )
 
         return embed
 
-    def get_statistics(self) -> dict[str, int]:
-        """Calcula estatísticas das sugestões"""
+    def get_statistics(self) -> dict[str, int] | None:
+        """Estatísticas das sugestões (None enquanto a contagem não terminou)"""
+        groups: dict[Any, int] | None = self.pages.groups
+        if groups is None:
+            return None
+
         stats: dict[str, int] = {
-            "total": len(self.suggestions),
+            "total": sum(groups.values()),
             "pending": 0,
             "approved": 0,
             "rejected": 0,
             "paused": 0,
         }
 
-        for suggestion in self.suggestions:
-            status: str = suggestion["status"]
+        for status, count in groups.items():
             if status in stats:
-                stats[status] += 1
+                stats[status] += count
 
         return stats
 
@@ -152,8 +192,8 @@ class SuggestionListView(discord.ui.View):
     async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
         if self.page > 0:
             self.page -= 1
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
+            embed: discord.Embed = await self.get_page_embed()
+            await interaction.response.edit_message(embed=embed, view=self)
         else:
             await interaction.response.defer()
 
@@ -163,43 +203,25 @@ class SuggestionListView(discord.ui.View):
 
     @discord.ui.button(label="Próxima ▶️", style=discord.ButtonStyle.secondary)
     async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-        if self.page < self.max_pages - 1:
+        if self.pages.has_next(self.page):
             self.page += 1
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
+            embed: discord.Embed = await self.get_page_embed()
+            await interaction.response.edit_message(embed=embed, view=self)
         else:
             await interaction.response.defer()
 
     @discord.ui.button(label="🔄 Atualizar", style=discord.ButtonStyle.success)
     async def refresh_button(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
         try:
-            # Recarregar sugestões
-            from ...utils.database import database
-
-            query: str = "SELECT * FROM suggestions WHERE guild_id = ?"
-            params: list[str] = [str(self.guild.id)]
-
-            if self.filter_status != "all":
-                query += " AND status = ?"
-                params.append(self.filter_status)
-
-            if self.filter_user:
-                query += " AND user_id = ?"
-                params.append(str(self.filter_user.id))
+            # Recarregar sugestões (páginas e total descartados)
+            self.pages.reset()
 
-            query += " ORDER BY created_at DESC"
+            if self.page > 0 and not await self.pages.page(self.page):
+                page_count: int = max(1, -(-await self.pages.count() // self.items_per_page))
+                self.page = min(self.page, page_count - 1)
 
-            fresh_suggestions: list[dict[str, Any]] | None = await database.get_all(query, params)
-            self.suggestions = fresh_suggestions or []
-            self.max_pages = max(
-                1, (len(self.suggestions) + self.items_per_page - 1) // self.items_per_page
-            )
-
-            if self.page >= self.max_pages:
-                self.page = max(0, self.max_pages - 1)
-
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
+            embed: discord.Embed = await self.get_page_embed()
+            await interaction.response.edit_message(embed=embed, view=self)
 
         except Exception as e:
             await interaction.response.send_message(f"❌ Erro ao atualizar: {e}", ephemeral=True)
@@ -229,24 +251,10 @@ class SuggestionList(commands.Cog):
             try:
                 from ...utils.database import database
 
-                query: str = "SELECT * FROM suggestions WHERE guild_id = ?"
-                params: list[str] = [str(interaction.guild.id)]
-
-                if status != "all":
-                    query += " AND status = ?"
-                    params.append(status)
-
-                if usuario:
-                    query += " AND user_id = ?"
-                    params.append(str(usuario.id))
-
-                if categoria:
-                    query += " AND category = ?"
-                    params.append(categoria)
-
-                query += " ORDER BY created_at DESC"
-
-                suggestions: list[dict[str, Any]] | None = await database.get_all(query, params)
+                pages: KeysetPageProvider = suggestion_pages(
+                    database, interaction.guild.id, status, usuario, categoria
+                )
+                suggestions: list[dict[str, Any]] = await pages.page(0)
 
             except Exception as e:
                 print(f"❌ Erro ao buscar sugestões: {e}")
@@ -288,8 +296,8 @@ class SuggestionList(commands.Cog):
                 return
 
             # Criar interface de lista paginada
-            view: SuggestionListView = SuggestionListView(suggestions, interaction.guild, status, usuario)
-            embed: discord.Embed = view.get_page_embed()
+            view: SuggestionListView = SuggestionListView(pages, interaction.guild, status, usuario)
+            embed: discord.Embed = await view.get_page_embed()
 
             await interaction.followup.send(embed=embed, view=view, ephemeral=True)
 
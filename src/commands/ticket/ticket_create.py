@@ -173,7 +173,7 @@ class TicketView(discord.ui.View):
             try:
                 from ...utils.database import database
 
-                await database.execute(
+                ticket_id = await database.run(
                     """INSERT INTO tickets 
                        (channel_id, user_id, guild_id, created_at, status, initial_message_id) 
                        VALUES (?, ?, ?, ?, ?, ?)""",
@@ -186,6 +186,7 @@ class TicketView(discord.ui.View):
                         str(initial_message.id),
                     ),
                 )
+                await database.tickets.track(ticket_id)
             except Exception as e:
                 print(f"❌ Erro ao salvar ticket no banco: {e}")
 
@@ -288,7 +289,7 @@ class TicketControlView(discord.ui.View):
             try:
                 from ...utils.database import database
 
-                await database.execute(
+                await database.run(
                     "UPDATE tickets SET status = 'closed', closed_at = ?, closed_by = ? WHERE channel_id = ?",
                     (
                         datetime.now().isoformat(),
@@ -296,6 +297,7 @@ class TicketControlView(discord.ui.View):
                         str(interaction.channel.id),
                     ),
                 )
+                database.tickets.closed(interaction.channel.id)
             except Exception as e:
                 print(f"❌ Erro ao atualizar ticket no banco: {e}")
 
@@ -12,6 +12,8 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.page_provider import KeysetPageProvider
+
 if TYPE_CHECKING:
     pass
 
@@ -19,17 +21,13 @@ if TYPE_CHECKING:
 class TicketListView(discord.ui.View):
     """Interface para navegação na lista de tickets"""
 
-    def __init__(
-        self, tickets_data: list[dict[str, Any]], guild: discord.Guild, page: int = 0
-    ) -> None:
+    def __init__(self, pages: KeysetPageProvider, guild: discord.Guild, page: int = 0) -> None:
         super().__init__(timeout=300)
-        self.tickets_data: list[dict[str, Any]] = tickets_data
+        # Tickets lidos uma página por vez (ver KeysetPageProvider)
+        self.pages: KeysetPageProvider = pages
         self.guild: discord.Guild = guild
         self.page: int = page
-        self.items_per_page: int = 5
-        self.max_pages: int = max(
-            1, (len(tickets_data) + self.items_per_page - 1) // self.items_per_page
-        )
+        self.items_per_page: int = pages.page_size
 
         # Atualizar botões
         self.update_buttons()
@@ -37,20 +35,24 @@ class TicketListView(discord.ui.View):
     def update_buttons(self) -> None:
         """Atualiza estado dos botões de navegação"""
         self.previous_page.disabled = self.page <= 0
-        self.next_page.disabled = self.page >= self.max_pages - 1
+        self.next_page.disabled = not self.pages.has_next(self.page)
 
         # Atualizar label da página
-        self.page_info.label = f"Página {self.page + 1}/{self.max_pages}"
+        self.page_info.label = self.pages.page_label(self.page)
 
-    def get_page_embed(self) -> discord.Embed:
+    async def get_page_embed(self) -> discord.Embed:
         """Gera embed da página atual"""
         start_idx: int = self.page * self.items_per_page
-        end_idx: int = start_idx + self.items_per_page
-        page_tickets: list[dict[str, Any]] = self.tickets_data[start_idx:end_idx]
+        page_tickets: list[dict[str, Any]] = await self.pages.page(self.page)
+        total: int | None = self.pages.total
+        if total is None:
+            total = await self.pages.wait_total()
+        total_text: str = str(total) if total is not None else "..."
+        self.update_buttons()
 
         embed: discord.Embed = discord.Embed(
             title="🎫 **LISTA DE TICKETS**",
-            description=f"Mostrando {len(page_tickets)} de {len(self.tickets_data)} tickets",
+            description=f"Mostrando {len(page_tickets)} de {total_text} tickets",
             color=0x2F3136,
             timestamp=datetime.now(),
         )
@@ -112,7 +114,7 @@ class TicketListView(discord.ui.View):
             )
 
         embed.set_footer(
-            text=f"Página {self.page + 1}/{self.max_pages} • Total: {len(self.tickets_data)} tickets",
+            text=f"{self.pages.page_label(self.page)} • Total: {total_text} tickets",
             icon_url=self.guild.icon.url if self.guild.icon else None,
         )
 
@@ -124,8 +126,8 @@ class TicketListView(discord.ui.View):
     ) -> None:
         if self.page > 0:
             self.page -= 1
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
+            embed: discord.Embed = await self.get_page_embed()
+            await interaction.response.edit_message(embed=embed, view=self)
         else:
             await interaction.response.defer()
 
@@ -139,10 +141,10 @@ class TicketListView(discord.ui.View):
     async def next_page(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ) -> None:
-        if self.page < self.max_pages - 1:
+        if self.pages.has_next(self.page):
             self.page += 1
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
+            embed: discord.Embed = await self.get_page_embed()
+            await interaction.response.edit_message(embed=embed, view=self)
         else:
             await interaction.response.defer()
 
@@ -150,25 +152,17 @@ class TicketListView(discord.ui.View):
     async def refresh(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ) -> None:
-        # Recarregar dados do banco
+        # Recarregar dados do banco (mesmos filtros, páginas e total descartados)
         try:
-            from ...utils.database import database
-
-            fresh_tickets: list[dict[str, Any]] | None = await database.get_all(
-                "SELECT * FROM tickets WHERE guild_id = ? ORDER BY created_at DESC",
-                (str(self.guild.id),),
-            )
-            self.tickets_data = fresh_tickets or []
-            self.max_pages = max(
-                1, (len(self.tickets_data) + self.items_per_page - 1) // self.items_per_page
-            )
+            self.pages.reset()
 
             # Ajustar página se necessário
-            if self.page >= self.max_pages:
-                self.page = max(0, self.max_pages - 1)
+            if self.page > 0 and not await self.pages.page(self.page):
+                page_count: int = max(1, -(-await self.pages.count() // self.items_per_page))
+                self.page = min(self.page, page_count - 1)
 
-            self.update_buttons()
-            await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
+            embed: discord.Embed = await self.get_page_embed()
+            await interaction.response.edit_message(embed=embed, view=self)
         except Exception as e:
             await interaction.response.send_message(f"❌ Erro ao atualizar: {e}", ephemeral=True)
 
@@ -187,10 +181,11 @@ class TicketListView(discord.ui.View):
             # Contar tickets fechados
             from ...utils.database import database
 
-            closed_tickets: list[dict[str, Any]] | None = await database.get_all(
-                "SELECT * FROM tickets WHERE guild_id = ? AND status = 'closed'",
+            row: dict[str, Any] | None = await database.get(
+                "SELECT COUNT(*) AS total FROM tickets WHERE guild_id = ? AND status = 'closed'",
                 (str(self.guild.id),),
             )
+            closed_tickets: int = row["total"] if row else 0
 
             if not closed_tickets:
                 await interaction.response.send_message(
@@ -201,7 +196,7 @@ class TicketListView(discord.ui.View):
             # Confirmar limpeza
             confirm_embed: discord.Embed = discord.Embed(
                 title="⚠️ **CONFIRMAR LIMPEZA**",
-                description=f"Isso irá **remover permanentemente** {len(closed_tickets)} tickets fechados do banco de dados.\n\n"
+                description=f"Isso irá **remover permanentemente** {closed_tickets} tickets fechados do banco de dados.\n\n"
                 f"**⚠️ Esta ação não pode ser desfeita!**",
                 color=0xFF6B6B,
                 timestamp=datetime.now(),
@@ -220,11 +215,9 @@ class TicketListView(discord.ui.View):
 class ConfirmCleanupView(discord.ui.View):
     """View para confirmar limpeza de tickets"""
 
-    def __init__(
-        self, tickets_to_clean: list[dict[str, Any]], parent_view: TicketListView
-    ) -> None:
+    def __init__(self, tickets_to_clean: int, parent_view: TicketListView) -> None:
         super().__init__(timeout=60)
-        self.tickets_to_clean: list[dict[str, Any]] = tickets_to_clean
+        self.tickets_to_clean: int = tickets_to_clean
         self.parent_view: TicketListView = parent_view
 
     @discord.ui.button(label="✅ Confirmar Limpeza", style=discord.ButtonStyle.danger)
@@ -237,24 +230,19 @@ class ConfirmCleanupView(discord.ui.View):
             # Remover tickets fechados do banco
             from ...utils.database import database
 
-            await database.execute(
+            await database.run(
                 "DELETE FROM tickets WHERE guild_id = ? AND status = 'closed'",
                 (str(interaction.guild.id),),
             )
 
             # Atualizar view principal
-            fresh_tickets: list[dict[str, Any]] | None = await database.get_all(
-                "SELECT * FROM tickets WHERE guild_id = ? ORDER BY created_at DESC",
-                (str(interaction.guild.id),),
-            )
-            self.parent_view.tickets_data = fresh_tickets or []
-            self.parent_view.max_pages = max(1, (len(fresh_tickets or []) + 5 - 1) // 5)
+            self.parent_view.pages.reset()
             self.parent_view.page = 0
             self.parent_view.update_buttons()
 
             success_embed: discord.Embed = discord.Embed(
                 title="✅ Limpeza Concluída!",
-                description=f"**{len(self.tickets_to_clean)} tickets fechados** foram removidos do banco de dados.",
+                description=f"**{self.tickets_to_clean} tickets fechados** foram removidos do banco de dados.",
                 color=0x00FF00,
                 timestamp=datetime.now(),
             )
@@ -307,34 +295,39 @@ class TicketList(commands.Cog):
             try:
                 from ...utils.database import database
 
-                # Construir query baseada nos filtros
-                query: str = "SELECT * FROM tickets WHERE guild_id = ?"
+                # Construir filtro; as páginas são lidas sob demanda
+                where: str = "guild_id = ?"
                 params: list[str] = [str(interaction.guild.id)]
 
                 if filtro == "abertos":
-                    query += " AND status = 'open'"
+                    where += " AND status = 'open'"
                 elif filtro == "fechados":
-                    query += " AND status = 'closed'"
+                    where += " AND status = 'closed'"
 
                 if usuario:
-                    query += " AND user_id = ?"
+                    where += " AND user_id = ?"
                     params.append(str(usuario.id))
 
-                query += " ORDER BY created_at DESC"
-
-                tickets: list[dict[str, Any]] | None = await database.get_all(query, params)
+                pages: KeysetPageProvider = KeysetPageProvider(
+                    database, "tickets", where=where, params=params, group_by="status", page_size=5
+                )
+                view: TicketListView = TicketListView(pages, interaction.guild)
+                embed: discord.Embed = await view.get_page_embed()
+                tickets: list[dict[str, Any]] = await pages.page(0)
 
             except Exception as e:
                 print(f"❌ Erro ao buscar tickets: {e}")
-                tickets = None
-
-            # Garantir lista vazia se None
-            tickets = tickets or []
-
-            # 📊 ESTATÍSTICAS GERAIS
-            total_tickets: int = len(tickets)
-            open_tickets: int = len([t for t in tickets if t["status"] == "open"])
-            closed_tickets: int = len([t for t in tickets if t["status"] == "closed"])
+                tickets = []
+
+            # 📊 ESTATÍSTICAS GERAIS (contadas em segundo plano pelo provedor)
+            groups: dict[Any, int] | None = pages.groups if tickets else {}
+            total_tickets: int | str = "⏳"
+            open_tickets: int | str = "⏳"
+            closed_tickets: int | str = "⏳"
+            if groups is not None:
+                total_tickets = sum(groups.values())
+                open_tickets = groups.get("open", 0)
+                closed_tickets = groups.get("closed", 0)
 
             if not tickets:
                 # 📝 NENHUM TICKET ENCONTRADO
@@ -368,10 +361,6 @@ class TicketList(commands.Cog):
                 await interaction.followup.send(embed=no_tickets_embed, ephemeral=True)
                 return
 
-            # 🎮 CRIAR VIEW COM PAGINAÇÃO
-            view: TicketListView = TicketListView(tickets, interaction.guild)
-            embed: discord.Embed = view.get_page_embed()
-
             # Adicionar estatísticas no embed
             stats_text: str = "**📊 Estatísticas:**\n"
             stats_text += f"• Total: {total_tickets}\n"
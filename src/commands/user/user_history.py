@@ -51,32 +51,13 @@ class UserHistory(commands.Cog):
         try:
             await interaction.response.defer(ephemeral=True)
 
-            # Buscar casos de moderação
-            mod_cases: list[dict[str, Any]] = await database.get_all(
-                """SELECT * FROM mod_cases 
-                   WHERE guild_id = ? AND user_id = ? 
-                   ORDER BY created_at DESC 
-                   LIMIT ?""",
-                (str(interaction.guild.id), str(user.id), limite),  # type: ignore
-            )
-
-            # Buscar avisos
-            warnings: list[dict[str, Any]] = await database.get_all(
-                """SELECT * FROM warnings 
-                   WHERE guild_id = ? AND user_id = ? 
-                   ORDER BY created_at DESC 
-                   LIMIT ?""",
-                (str(interaction.guild.id), str(user.id), limite),  # type: ignore
-            )
-
-            # Buscar notas
-            notes: list[dict[str, Any]] = await database.get_all(
-                """SELECT * FROM user_notes 
-                   WHERE guild_id = ? AND user_id = ? 
-                   ORDER BY created_at DESC 
-                   LIMIT ?""",
-                (str(interaction.guild.id), str(user.id), limite),  # type: ignore
+            # Casos, avisos, notas e mutes em uma única consulta
+            history: list[dict[str, Any]] = await database.get_user_history(
+                str(interaction.guild.id), str(user.id), limite  # type: ignore
             )
+            mod_cases: list[dict[str, Any]] = [row for row in history if row["kind"] == "case"]
+            warnings: list[dict[str, Any]] = [row for row in history if row["kind"] == "warning"]
+            notes: list[dict[str, Any]] = [row for row in history if row["kind"] == "note"]
 
             embed: discord.Embed = create_embed(
                 title=f"📋 Histórico de Moderação - {user.display_name}",
@@ -101,8 +82,8 @@ class UserHistory(commands.Cog):
             if mod_cases:
                 case_text: str = ""
                 for case in mod_cases[:5]:  # Mostrar apenas os 5 mais recentes
-                    case_type: str = case.get("type", "Desconhecido")
-                    reason: str = case.get("reason", "Sem motivo")
+                    case_type: str = case.get("type") or "Desconhecido"
+                    reason: str = case.get("reason") or "Sem motivo"
                     created: str = case.get("created_at", "")
                     moderator_id: str | None = case.get("moderator_id")
 
@@ -131,7 +112,7 @@ class UserHistory(commands.Cog):
             if warnings:
                 warning_text: str = ""
                 for warning in warnings[:3]:  # Mostrar apenas os 3 mais recentes
-                    reason_warn: str = warning.get("reason", "Sem motivo")
+                    reason_warn: str = warning.get("reason") or "Sem motivo"
                     created_warn: str = warning.get("created_at", "")
 
                     date_str_warn: str
@@ -158,7 +139,7 @@ class UserHistory(commands.Cog):
             if notes:
                 note_text: str = ""
                 for note in notes[:3]:  # Mostrar apenas as 3 mais recentes
-                    content: str = note.get("note", "Sem conteúdo")
+                    content: str = note.get("reason") or "Sem conteúdo"
                     created_note: str = note.get("created_at", "")
 
                     date_str_note: str
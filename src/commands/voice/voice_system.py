@@ -3,51 +3,22 @@ Sistema de Controles de Voz Avançado
 Gerenciamento completo de usuários em canais de voz
 """
 
-import os
-import sqlite3
 from datetime import datetime
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.database import database
+
 
 class VoiceSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db_path = os.path.join("src", "data", "voice.db")
-        self.init_database()
-
-    def init_database(self):
-        """Inicializar banco de dados de ações de voz"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS voice_actions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                user_id TEXT NOT NULL,
-                moderator_id TEXT NOT NULL,
-                action_type TEXT NOT NULL,
-                channel_id TEXT,
-                reason TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS voice_settings (
-                guild_id TEXT PRIMARY KEY,
-                log_voice_actions BOOLEAN DEFAULT 1,
-                auto_move_timeout INTEGER DEFAULT 300,
-                max_voice_actions_per_hour INTEGER DEFAULT 20
-            )
-        """)
-
-        conn.commit()
-        conn.close()
+
+    async def cog_load(self):
+        """Usar o banco principal (tabelas criadas pelas migrações)"""
+        self.db = database.storage
 
     async def log_voice_action(
         self,
@@ -60,10 +31,7 @@ class VoiceSystem(commands.Cog):
     ):
         """Registrar ação de voz no banco de dados"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            await self.db.run(
                 """
                 INSERT INTO voice_actions 
                 (guild_id, user_id, moderator_id, action_type, channel_id, reason)
@@ -78,9 +46,6 @@ class VoiceSystem(commands.Cog):
                     reason,
                 ),
             )
-
-            conn.commit()
-            conn.close()
         except Exception as e:
             print(f"❌ Erro ao registrar ação de voz: {e}")
 
@@ -10,6 +10,8 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ...utils.embeds import EmbedBuilder
+
 
 class WelcomePreview(discord.ui.View):
     """Preview das mensagens de boas-vindas"""
@@ -508,6 +510,26 @@ class WelcomeSetup(commands.Cog):
             if not channel:
                 return
 
+            # Modo raid: uma mensagem resumida por intervalo em vez de uma por membro
+            policy = await database.antispam_policies.get(member.guild.id)
+            if database.join_bursts.observe(
+                member.guild.id,
+                member.id,
+                threshold=policy.join_raid_threshold,
+                window=policy.join_raid_window,
+            ):
+                database.join_bursts.summarize(
+                    member.guild.id,
+                    ("welcome_config", channel.id),
+                    member,
+                    lambda summary: channel.send(
+                        embed=EmbedBuilder.build_join_summary_embed(
+                            summary, f"👋 Bem-vindos ao {member.guild.name}!", color=0x00FF00
+                        )
+                    ),
+                )
+                return
+
             # Preparar conteúdo
             content = None
             embed = None
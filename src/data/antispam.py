@@ -2,20 +2,24 @@
 Antispam Data Module - Funções para manipular configuração anti-spam
 """
 
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 async def save_antispam(guild_id: int, config: dict) -> bool:
     """Salvar configuração de anti-spam"""
     try:
         await database.run(
-            """INSERT OR REPLACE INTO antispam_config 
+            """INSERT INTO antispam_config
                (guild_id, enabled, limite, intervalo, acao, warn_threshold, mute_threshold, kick_threshold, ban_threshold)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(guild_id) DO UPDATE SET
+                   enabled = excluded.enabled, limite = excluded.limite,
+                   intervalo = excluded.intervalo, acao = excluded.acao,
+                   warn_threshold = excluded.warn_threshold,
+                   mute_threshold = excluded.mute_threshold,
+                   kick_threshold = excluded.kick_threshold,
+                   ban_threshold = excluded.ban_threshold,
+                   updated_at = CURRENT_TIMESTAMP""",
             (
                 str(guild_id),
                 config.get("enabled", False),
@@ -28,6 +32,7 @@ async def save_antispam(guild_id: int, config: dict) -> bool:
                 config.get("ban_threshold", 10),
             ),
         )
+        database.antispam_policies.invalidate(guild_id)
         return True
 
     except Exception as e:
@@ -65,6 +70,7 @@ async def delete_antispam(guild_id: int) -> bool:
     """Deletar configuração de anti-spam"""
     try:
         await database.run("DELETE FROM antispam_config WHERE guild_id = ?", (str(guild_id),))
+        database.antispam_policies.invalidate(guild_id)
         return True
 
     except Exception as e:
@@ -110,6 +116,7 @@ async def update_antispam_setting(guild_id: int, setting: str, value) -> bool:
         await database.run(
             f"UPDATE antispam_config SET {setting} = ? WHERE guild_id = ?", (value, str(guild_id))
         )
+        database.antispam_policies.invalidate(guild_id)
 
         return True
 
@@ -3,44 +3,14 @@ Backup Data Module - Sistema de backup de configurações
 """
 
 import json
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 async def initialize_backup_tables():
-    """Inicializar tabelas de backup"""
+    """Inicializar tabelas de backup (definidas em utils/schema.py)"""
     try:
-        # Tabela de backups
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS backups (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                backup_name TEXT NOT NULL,
-                backup_data TEXT NOT NULL,
-                backup_size INTEGER DEFAULT 0,
-                created_by TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                description TEXT,
-                UNIQUE(guild_id, backup_name)
-            )
-        """)
-
-        # Tabela de histórico de restore
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS backup_restore_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                backup_id INTEGER NOT NULL,
-                restored_by TEXT NOT NULL,
-                restored_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                success BOOLEAN DEFAULT 0,
-                error_message TEXT,
-                FOREIGN KEY (backup_id) REFERENCES backups (id) ON DELETE CASCADE
-            )
-        """)
-
+        await database.create_tables()
         print("✅ Tabelas de backup inicializadas")
 
     except Exception as e:
@@ -5,45 +5,14 @@ Giveaways Data Module - Funções para manipular giveaways
 import datetime
 import json
 import random
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 async def initialize_giveaway_tables():
-    """Inicializar tabelas de giveaway"""
+    """Inicializar tabelas de giveaway (definidas em utils/schema.py)"""
     try:
-        # Tabela principal de giveaways
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS giveaways (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                channel_id TEXT NOT NULL,
-                message_id TEXT NOT NULL UNIQUE,
-                prize TEXT NOT NULL,
-                winners INTEGER NOT NULL DEFAULT 1,
-                end_time TEXT NOT NULL,
-                creator_id TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'active',
-                requirements TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Tabela de participantes dos giveaways
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS giveaway_entries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                giveaway_id INTEGER NOT NULL,
-                user_id TEXT NOT NULL,
-                joined_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (giveaway_id) REFERENCES giveaways (id) ON DELETE CASCADE,
-                UNIQUE(giveaway_id, user_id)
-            )
-        """)
-
+        await database.create_tables()
         print("✅ Tabelas de giveaway inicializadas")
 
     except Exception as e:
@@ -2,59 +2,14 @@
 Leveling Data Module - Funções para sistema de leveling/XP
 """
 
-import math
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
+from ..utils.xp_accumulator import calculate_level, xp_for_level
 
 
 async def initialize_leveling_tables():
-    """Inicializar tabelas de leveling"""
+    """Inicializar tabelas de leveling (definidas em utils/schema.py)"""
     try:
-        # Tabela de XP dos usuários
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS user_levels (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                user_id TEXT NOT NULL,
-                xp INTEGER NOT NULL DEFAULT 0,
-                level INTEGER NOT NULL DEFAULT 1,
-                total_messages INTEGER NOT NULL DEFAULT 0,
-                last_message DATETIME,
-                UNIQUE(guild_id, user_id)
-            )
-        """)
-
-        # Tabela de configuração de leveling
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS leveling_config (
-                guild_id TEXT PRIMARY KEY,
-                enabled BOOLEAN DEFAULT 1,
-                xp_per_message INTEGER DEFAULT 15,
-                xp_cooldown INTEGER DEFAULT 60,
-                level_up_channel_id TEXT,
-                level_up_message TEXT DEFAULT 'Parabéns {user}! Você subiu para o level {level}!',
-                announce_level_up BOOLEAN DEFAULT 1,
-                ignore_bots BOOLEAN DEFAULT 1,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Tabela de recompensas por level
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS level_rewards (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                level INTEGER NOT NULL,
-                role_id TEXT,
-                role_name TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(guild_id, level)
-            )
-        """)
-
+        await database.create_tables()
         print("✅ Tabelas de leveling inicializadas")
 
     except Exception as e:
@@ -62,22 +17,13 @@ async def initialize_leveling_tables():
 
 
 def calculate_level_from_xp(xp: int) -> int:
-    """Calcular level baseado no XP"""
-    if xp < 0:
-        return 1
-
-    # Fórmula: level = √(xp / 100) + 1
-    level = math.floor(math.sqrt(xp / 100)) + 1
-    return max(1, level)
+    """Calcular level baseado no XP (mesma fórmula do acumulador de XP)"""
+    return calculate_level(max(xp, 0))
 
 
 def calculate_xp_for_level(level: int) -> int:
     """Calcular XP necessário para um level"""
-    if level <= 1:
-        return 0
-
-    # Fórmula inversa: xp = (level - 1)² * 100
-    return (level - 1) ** 2 * 100
+    return xp_for_level(max(level, 0))
 
 
 def get_xp_for_next_level(current_xp: int) -> tuple:
@@ -146,29 +92,9 @@ async def save_leveling_config(guild_id: int, config: dict) -> bool:
 
 
 async def get_user_level(guild_id: int, user_id: int) -> dict | None:
-    """Buscar level do usuário"""
+    """Buscar level do usuário (incluindo XP ainda não gravado)"""
     try:
-        result = await database.fetchone(
-            "SELECT * FROM user_levels WHERE guild_id = ? AND user_id = ?",
-            (str(guild_id), str(user_id)),
-        )
-
-        if result:
-            user_data = dict(result)
-            # Recalcular level baseado no XP atual
-            correct_level = calculate_level_from_xp(user_data["xp"])
-
-            if correct_level != user_data["level"]:
-                # Atualizar level correto
-                await database.run(
-                    "UPDATE user_levels SET level = ? WHERE guild_id = ? AND user_id = ?",
-                    (correct_level, str(guild_id), str(user_id)),
-                )
-                user_data["level"] = correct_level
-
-            return user_data
-
-        return None
+        return await database.get_user_level(str(guild_id), str(user_id))
 
     except Exception as e:
         print(f"❌ Erro buscando level do usuário: {e}")
@@ -178,64 +104,36 @@ async def get_user_level(guild_id: int, user_id: int) -> dict | None:
 async def add_xp(guild_id: int, user_id: int, xp_amount: int) -> dict:
     """Adicionar XP ao usuário"""
     try:
-        # Buscar dados atuais do usuário
-        user_data = await get_user_level(guild_id, user_id)
-
-        if user_data:
-            # Atualizar XP existente
-            new_xp = user_data["xp"] + xp_amount
-            new_level = calculate_level_from_xp(new_xp)
-            old_level = user_data["level"]
-
-            await database.run(
-                """UPDATE user_levels 
-                   SET xp = ?, level = ?, total_messages = total_messages + 1, last_message = ?
-                   WHERE guild_id = ? AND user_id = ?""",
-                (new_xp, new_level, "now", str(guild_id), str(user_id)),
-            )
-
-            return {
-                "xp": new_xp,
-                "level": new_level,
-                "old_level": old_level,
-                "level_up": new_level > old_level,
-                "total_messages": user_data["total_messages"] + 1,
-            }
-        # Criar novo registro
-        initial_xp = xp_amount
-        initial_level = calculate_level_from_xp(initial_xp)
-
-        await database.run(
-            """INSERT INTO user_levels 
-                   (guild_id, user_id, xp, level, total_messages, last_message)
-                   VALUES (?, ?, ?, ?, 1, ?)""",
-            (str(guild_id), str(user_id), initial_xp, initial_level, "now"),
-        )
+        award = await database.xp_accumulator.add_xp(str(guild_id), str(user_id), xp_amount)
+        entry = database.xp_accumulator.peek(str(guild_id), str(user_id))
 
         return {
-            "xp": initial_xp,
-            "level": initial_level,
-            "old_level": 0,
-            "level_up": initial_level > 1,
-            "total_messages": 1,
+            "total_xp": award.total_xp,
+            "level": award.new_level,
+            "old_level": award.old_level,
+            "level_up": award.leveled_up,
+            "messages_sent": entry.messages_sent if entry else 1,
         }
 
     except Exception as e:
         print(f"❌ Erro adicionando XP: {e}")
-        return {"xp": 0, "level": 1, "old_level": 0, "level_up": False, "total_messages": 0}
+        return {"total_xp": 0, "level": 0, "old_level": 0, "level_up": False, "messages_sent": 0}
 
 
 async def set_user_xp(guild_id: int, user_id: int, xp: int) -> bool:
     """Definir XP do usuário"""
     try:
-        level = calculate_level_from_xp(xp)
-
+        # XP pendente do acumulador seria somado ao valor novo
+        await database.xp_accumulator.flush()
         await database.run(
-            """INSERT OR REPLACE INTO user_levels 
-               (guild_id, user_id, xp, level, total_messages, last_message)
-               VALUES (?, ?, ?, ?, COALESCE((SELECT total_messages FROM user_levels WHERE guild_id = ? AND user_id = ?), 0), ?)""",
-            (str(guild_id), str(user_id), xp, level, str(guild_id), str(user_id), "now"),
+            """INSERT INTO user_levels (guild_id, user_id, total_xp, level)
+               VALUES (?, ?, ?, ?)
+               ON CONFLICT(guild_id, user_id) DO UPDATE SET
+                   total_xp = excluded.total_xp, level = excluded.level""",
+            (str(guild_id), str(user_id), xp, calculate_level_from_xp(xp)),
         )
+        database.xp_accumulator.forget(str(guild_id), str(user_id))
+        database.rank_index.invalidate(str(guild_id))
 
         return True
 
@@ -247,15 +145,7 @@ async def set_user_xp(guild_id: int, user_id: int, xp: int) -> bool:
 async def get_leaderboard(guild_id: int, limit: int = 10) -> list[dict]:
     """Buscar ranking de XP do servidor"""
     try:
-        result = await database.fetchall(
-            """SELECT * FROM user_levels 
-               WHERE guild_id = ? 
-               ORDER BY xp DESC, level DESC, total_messages DESC 
-               LIMIT ?""",
-            (str(guild_id), limit),
-        )
-
-        return [dict(row) for row in result] if result else []
+        return await database.rank_index.page(str(guild_id), 1, limit)
 
     except Exception as e:
         print(f"❌ Erro buscando leaderboard: {e}")
@@ -265,16 +155,7 @@ async def get_leaderboard(guild_id: int, limit: int = 10) -> list[dict]:
 async def get_user_rank(guild_id: int, user_id: int) -> int:
     """Buscar posição do usuário no ranking"""
     try:
-        result = await database.fetchall(
-            "SELECT user_id FROM user_levels WHERE guild_id = ? ORDER BY xp DESC, level DESC",
-            (str(guild_id),),
-        )
-
-        for i, row in enumerate(result):
-            if row["user_id"] == str(user_id):
-                return i + 1
-
-        return 0
+        return await database.rank_index.rank(str(guild_id), str(user_id)) or 0
 
     except Exception as e:
         print(f"❌ Erro buscando rank do usuário: {e}")
@@ -337,6 +218,8 @@ async def reset_user_level(guild_id: int, user_id: int) -> bool:
             "DELETE FROM user_levels WHERE guild_id = ? AND user_id = ?",
             (str(guild_id), str(user_id)),
         )
+        database.xp_accumulator.forget(str(guild_id), str(user_id))
+        database.rank_index.remove(str(guild_id), str(user_id))
 
         return True
 
@@ -349,6 +232,8 @@ async def reset_guild_levels(guild_id: int) -> bool:
     """Resetar todos os levels do servidor"""
     try:
         await database.run("DELETE FROM user_levels WHERE guild_id = ?", (str(guild_id),))
+        database.xp_accumulator.forget(str(guild_id))
+        database.rank_index.invalidate(str(guild_id))
 
         return True
 
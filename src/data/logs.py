@@ -4,49 +4,15 @@ Logs Data Module - Sistema de logs de eventos
 
 import datetime
 import json
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
+from ..utils.log_store import format_timestamp
 
 
 async def initialize_logs_tables():
-    """Inicializar tabelas de logs"""
+    """Inicializar tabelas de logs (definidas em utils/schema.py)"""
     try:
-        # Tabela principal de logs
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                user_id TEXT,
-                target_id TEXT,
-                channel_id TEXT,
-                message_id TEXT,
-                data TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Tabela de configuração de logs
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS log_config (
-                guild_id TEXT PRIMARY KEY,
-                enabled BOOLEAN DEFAULT 1,
-                log_channel_id TEXT,
-                events_enabled TEXT DEFAULT '[]',
-                ignore_bots BOOLEAN DEFAULT 1,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Índices para performance
-        await database.run(
-            "CREATE INDEX IF NOT EXISTS idx_logs_guild_event ON logs(guild_id, event_type)"
-        )
-        await database.run("CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp)")
-
+        await database.create_tables()
         print("✅ Tabelas de logs inicializadas")
 
     except Exception as e:
@@ -112,6 +78,17 @@ async def save_log_config(guild_id: int, config: dict) -> bool:
         return False
 
 
+def _decode_logs(rows: list[dict]) -> list[dict]:
+    """Converter o campo ``data`` (JSON) das linhas de log"""
+    logs = []
+    for row in rows:
+        log_entry = dict(row)
+        if log_entry.get("data"):
+            log_entry["data"] = json.loads(log_entry["data"])
+        logs.append(log_entry)
+    return logs
+
+
 async def add_log_entry(
     guild_id: int,
     event_type: str,
@@ -121,25 +98,18 @@ async def add_log_entry(
     message_id: int = None,
     data: dict = None,
 ) -> int:
-    """Adicionar entrada de log"""
+    """Adicionar entrada de log (gravada em lote pelo LogStore)"""
     try:
-        result = await database.run(
-            """INSERT INTO logs 
-               (guild_id, event_type, user_id, target_id, channel_id, message_id, data)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                str(guild_id),
-                event_type,
-                str(user_id) if user_id else None,
-                str(target_id) if target_id else None,
-                str(channel_id) if channel_id else None,
-                str(message_id) if message_id else None,
-                json.dumps(data) if data else None,
-            ),
+        return await database.log_store.append(
+            str(guild_id),
+            event_type,
+            user_id=str(user_id) if user_id else None,
+            target_id=str(target_id) if target_id else None,
+            channel_id=str(channel_id) if channel_id else None,
+            message_id=str(message_id) if message_id else None,
+            data=json.dumps(data) if data else None,
         )
 
-        return result.lastrowid if hasattr(result, "lastrowid") else 0
-
     except Exception as e:
         print(f"❌ Erro adicionando log: {e}")
         return 0
@@ -161,21 +131,15 @@ async def get_logs(
             conditions.append("user_id = ?")
             params.append(str(user_id))
 
-        query = f"""SELECT * FROM logs 
-                   WHERE {" AND ".join(conditions)}
-                   ORDER BY timestamp DESC LIMIT ? OFFSET ?"""
-        params.extend([limit, offset])
+        logs_sql, logs_params = await database.log_store.select(
+            " AND ".join(conditions), params, newest=limit + offset
+        )
+        query = f"""SELECT * FROM ({logs_sql})
+                   ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"""
 
-        result = await database.fetchall(query, params)
+        result = await database.fetchall(query, [*logs_params, limit, offset])
 
-        logs = []
-        for row in result:
-            log_entry = dict(row)
-            if log_entry.get("data"):
-                log_entry["data"] = json.loads(log_entry["data"])
-            logs.append(log_entry)
-
-        return logs
+        return _decode_logs(result)
 
     except Exception as e:
         print(f"❌ Erro buscando logs: {e}")
@@ -191,28 +155,23 @@ async def get_logs_by_date_range(
 ) -> list[dict]:
     """Buscar logs por período"""
     try:
+        start, end = format_timestamp(start_date), format_timestamp(end_date)
         conditions = ["guild_id = ?", "timestamp BETWEEN ? AND ?"]
-        params = [str(guild_id), start_date.isoformat(), end_date.isoformat()]
+        params = [str(guild_id), start, end]
 
         if event_type:
             conditions.append("event_type = ?")
             params.append(event_type)
 
-        query = f"""SELECT * FROM logs 
-                   WHERE {" AND ".join(conditions)}
-                   ORDER BY timestamp DESC LIMIT ?"""
-        params.append(limit)
+        logs_sql, logs_params = await database.log_store.select(
+            " AND ".join(conditions), params, start=start, end=end, newest=limit
+        )
+        query = f"""SELECT * FROM ({logs_sql})
+                   ORDER BY timestamp DESC, id DESC LIMIT ?"""
 
-        result = await database.fetchall(query, params)
+        result = await database.fetchall(query, [*logs_params, limit])
 
-        logs = []
-        for row in result:
-            log_entry = dict(row)
-            if log_entry.get("data"):
-                log_entry["data"] = json.loads(log_entry["data"])
-            logs.append(log_entry)
-
-        return logs
+        return _decode_logs(result)
 
     except Exception as e:
         print(f"❌ Erro buscando logs por data: {e}")
@@ -222,42 +181,36 @@ async def get_logs_by_date_range(
 async def get_log_stats(guild_id: int, days: int = 7) -> dict:
     """Buscar estatísticas de logs"""
     try:
-        cutoff_date = (datetime.datetime.utcnow() - datetime.timedelta(days=days)).isoformat()
-
-        # Contagem por tipo de evento
-        result = await database.fetchall(
-            """SELECT event_type, COUNT(*) as count 
-               FROM logs 
-               WHERE guild_id = ? AND timestamp >= ?
-               GROUP BY event_type
-               ORDER BY count DESC""",
-            (str(guild_id), cutoff_date),
+        cutoff_date = format_timestamp(
+            datetime.datetime.utcnow() - datetime.timedelta(days=days)
         )
 
-        event_stats = {row["event_type"]: row["count"] for row in result} if result else {}
-
-        # Total de logs
-        total_result = await database.fetchone(
-            "SELECT COUNT(*) as total FROM logs WHERE guild_id = ? AND timestamp >= ?",
+        # Uma leitura das partições do período; os agrupamentos saem dela
+        logs_sql, logs_params = await database.log_store.select(
+            "guild_id = ? AND timestamp >= ?",
             (str(guild_id), cutoff_date),
+            start=cutoff_date,
+            columns="event_type, DATE(timestamp) AS date",
         )
-
-        total_logs = total_result["total"] if total_result else 0
-
-        # Logs por dia
-        daily_result = await database.fetchall(
-            """SELECT DATE(timestamp) as date, COUNT(*) as count
-               FROM logs 
-               WHERE guild_id = ? AND timestamp >= ?
-               GROUP BY DATE(timestamp)
-               ORDER BY date DESC""",
-            (str(guild_id), cutoff_date),
+        result = await database.fetchall(
+            f"""SELECT event_type, date, COUNT(*) as count
+               FROM ({logs_sql})
+               GROUP BY event_type, date""",
+            logs_params,
         )
 
-        daily_stats = {row["date"]: row["count"] for row in daily_result} if daily_result else {}
+        # Contagem por tipo de evento e logs por dia
+        event_stats: dict[str, int] = {}
+        daily_stats: dict[str, int] = {}
+        for row in result:
+            event_stats[row["event_type"]] = event_stats.get(row["event_type"], 0) + row["count"]
+            daily_stats[row["date"]] = daily_stats.get(row["date"], 0) + row["count"]
+
+        event_stats = dict(sorted(event_stats.items(), key=lambda item: item[1], reverse=True))
+        daily_stats = dict(sorted(daily_stats.items(), reverse=True))
 
         return {
-            "total_logs": total_logs,
+            "total_logs": sum(event_stats.values()),
             "event_stats": event_stats,
             "daily_stats": daily_stats,
             "period_days": days,
@@ -268,16 +221,35 @@ async def get_log_stats(guild_id: int, days: int = 7) -> dict:
         return {"total_logs": 0, "event_stats": {}, "daily_stats": {}, "period_days": days}
 
 
-async def cleanup_old_logs(guild_id: int, days_old: int = 90) -> int:
-    """Limpar logs antigos"""
-    try:
-        cutoff_date = (datetime.datetime.utcnow() - datetime.timedelta(days=days_old)).isoformat()
+async def cleanup_old_logs(guild_id: int = None, days_old: int = 90) -> int:
+    """
+    Limpar logs antigos
 
-        result = await database.run(
-            "DELETE FROM logs WHERE guild_id = ? AND timestamp < ?", (str(guild_id), cutoff_date)
+    Sem ``guild_id`` apaga as partições inteiras anteriores ao corte
+    (retenção global, sem DELETE linha a linha) e retorna quantas foram
+    apagadas; com ``guild_id`` apaga só as linhas do servidor e retorna
+    quantas foram removidas.
+    """
+    try:
+        cutoff_date = format_timestamp(
+            datetime.datetime.utcnow() - datetime.timedelta(days=days_old)
         )
 
-        return result.rowcount if hasattr(result, "rowcount") else 0
+        if guild_id is None:
+            return await database.log_store.drop_before(cutoff_date)
+
+        await database.log_store.flush()
+        removed = 0
+        async with database.pool.writer() as db:
+            for partition in await database.log_store.partitions(end=cutoff_date):
+                cursor = await db.execute(
+                    f'DELETE FROM "{partition}" WHERE guild_id = ? AND timestamp < ?',
+                    (str(guild_id), cutoff_date),
+                )
+                removed += cursor.rowcount
+            await db.commit()
+
+        return removed
 
     except Exception as e:
         print(f"❌ Erro limpando logs antigos: {e}")
@@ -288,35 +260,23 @@ async def search_logs(guild_id: int, search_term: str, limit: int = 50) -> list[
     """Buscar logs por termo"""
     try:
         # Buscar em dados JSON e IDs
-        result = await database.fetchall(
-            """SELECT * FROM logs 
-               WHERE guild_id = ? AND (
-                   data LIKE ? OR 
-                   user_id LIKE ? OR 
-                   target_id LIKE ? OR 
+        logs_sql, logs_params = await database.log_store.select(
+            """guild_id = ? AND (
+                   data LIKE ? OR
+                   user_id LIKE ? OR
+                   target_id LIKE ? OR
                    channel_id LIKE ? OR
                    message_id LIKE ?
-               )
-               ORDER BY timestamp DESC LIMIT ?""",
-            (
-                str(guild_id),
-                f"%{search_term}%",
-                f"%{search_term}%",
-                f"%{search_term}%",
-                f"%{search_term}%",
-                f"%{search_term}%",
-                limit,
-            ),
+               )""",
+            (str(guild_id), *[f"%{search_term}%"] * 5),
+            newest=limit,
+        )
+        result = await database.fetchall(
+            f"SELECT * FROM ({logs_sql}) ORDER BY timestamp DESC, id DESC LIMIT ?",
+            [*logs_params, limit],
         )
 
-        logs = []
-        for row in result:
-            log_entry = dict(row)
-            if log_entry.get("data"):
-                log_entry["data"] = json.loads(log_entry["data"])
-            logs.append(log_entry)
-
-        return logs
+        return _decode_logs(result)
 
     except Exception as e:
         print(f"❌ Erro buscando logs: {e}")
@@ -333,32 +293,30 @@ async def export_logs(
     try:
         conditions = ["guild_id = ?"]
         params = [str(guild_id)]
+        start = format_timestamp(start_date) if start_date else None
+        end = format_timestamp(end_date) if end_date else None
 
-        if start_date:
+        if start:
             conditions.append("timestamp >= ?")
-            params.append(start_date.isoformat())
+            params.append(start)
 
-        if end_date:
+        if end:
             conditions.append("timestamp <= ?")
-            params.append(end_date.isoformat())
+            params.append(end)
 
         if event_types:
             placeholders = ",".join(["?" for _ in event_types])
             conditions.append(f"event_type IN ({placeholders})")
             params.extend(event_types)
 
-        query = f"""SELECT * FROM logs 
-                   WHERE {" AND ".join(conditions)}
-                   ORDER BY timestamp ASC"""
+        logs_sql, logs_params = await database.log_store.select(
+            " AND ".join(conditions), params, start=start, end=end
+        )
+        query = f"SELECT * FROM ({logs_sql}) ORDER BY timestamp ASC, id ASC"
 
-        result = await database.fetchall(query, params)
+        result = await database.fetchall(query, logs_params)
 
-        logs = []
-        for row in result:
-            log_entry = dict(row)
-            if log_entry.get("data"):
-                log_entry["data"] = json.loads(log_entry["data"])
-            logs.append(log_entry)
+        logs = _decode_logs(result)
 
         export_data = {
             "export_info": {
@@ -382,21 +340,17 @@ async def export_logs(
 async def get_user_activity_logs(guild_id: int, user_id: int, limit: int = 20) -> list[dict]:
     """Buscar logs de atividade de um usuário específico"""
     try:
+        logs_sql, logs_params = await database.log_store.select(
+            "guild_id = ? AND (user_id = ? OR target_id = ?)",
+            (str(guild_id), str(user_id), str(user_id)),
+            newest=limit,
+        )
         result = await database.fetchall(
-            """SELECT * FROM logs 
-               WHERE guild_id = ? AND (user_id = ? OR target_id = ?)
-               ORDER BY timestamp DESC LIMIT ?""",
-            (str(guild_id), str(user_id), str(user_id), limit),
+            f"SELECT * FROM ({logs_sql}) ORDER BY timestamp DESC, id DESC LIMIT ?",
+            [*logs_params, limit],
         )
 
-        logs = []
-        for row in result:
-            log_entry = dict(row)
-            if log_entry.get("data"):
-                log_entry["data"] = json.loads(log_entry["data"])
-            logs.append(log_entry)
-
-        return logs
+        return _decode_logs(result)
 
     except Exception as e:
         print(f"❌ Erro buscando logs do usuário: {e}")
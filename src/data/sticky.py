@@ -4,45 +4,14 @@ Sticky Messages Data Module - Sistema de mensagens fixas
 
 import datetime
 import json
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 async def initialize_sticky_tables():
-    """Inicializar tabelas de sticky messages"""
+    """Inicializar tabelas de sticky messages (definidas em utils/schema.py)"""
     try:
-        # Tabela principal de sticky messages
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS sticky_messages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                channel_id TEXT NOT NULL UNIQUE,
-                content TEXT NOT NULL,
-                embed_data TEXT,
-                current_message_id TEXT,
-                enabled BOOLEAN DEFAULT 1,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Tabela de histórico de sticky messages
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS sticky_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                sticky_id INTEGER NOT NULL,
-                old_message_id TEXT,
-                new_message_id TEXT,
-                trigger_user_id TEXT,
-                trigger_message_id TEXT,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (sticky_id) REFERENCES sticky_messages (id) ON DELETE CASCADE
-            )
-        """)
-
+        await database.create_tables()
         print("✅ Tabelas de sticky messages inicializadas")
 
     except Exception as e:
@@ -65,6 +34,7 @@ async def create_sticky_message(
                 json.dumps(embed_data) if embed_data else None,
             ),
         )
+        await database.stickies.reload(channel_id)
 
         return result.lastrowid if hasattr(result, "lastrowid") else 0
 
@@ -121,6 +91,7 @@ async def update_sticky_message(
         query = f"UPDATE sticky_messages SET {', '.join(updates)} WHERE channel_id = ?"
 
         await database.run(query, params)
+        await database.stickies.reload(channel_id)
 
         return True
 
@@ -148,6 +119,10 @@ async def update_sticky_message_id(
             "UPDATE sticky_messages SET current_message_id = ?, updated_at = ? WHERE channel_id = ?",
             (str(new_message_id), datetime.datetime.utcnow().isoformat(), str(channel_id)),
         )
+        sticky_state = database.stickies.get(channel_id)
+        if sticky_state is not None:
+            sticky_state.message_id = int(new_message_id)
+            sticky_state.dirty = True
 
         # Salvar no histórico
         await database.run(
@@ -174,6 +149,7 @@ async def delete_sticky_message(channel_id: int) -> bool:
     """Deletar sticky message"""
     try:
         await database.run("DELETE FROM sticky_messages WHERE channel_id = ?", (str(channel_id),))
+        database.stickies.remove(channel_id)
 
         return True
 
@@ -189,6 +165,7 @@ async def enable_sticky_message(channel_id: int, enabled: bool = True) -> bool:
             "UPDATE sticky_messages SET enabled = ?, updated_at = ? WHERE channel_id = ?",
             (enabled, datetime.datetime.utcnow().isoformat(), str(channel_id)),
         )
+        await database.stickies.reload(channel_id)
 
         return True
 
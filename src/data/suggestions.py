@@ -3,65 +3,14 @@ Suggestions Data Module - Sistema de sugestões
 """
 
 import datetime
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 async def initialize_suggestions_tables():
-    """Inicializar tabelas de sugestões"""
+    """Inicializar tabelas de sugestões (definidas em utils/schema.py)"""
     try:
-        # Tabela principal de sugestões
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS suggestions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                channel_id TEXT NOT NULL,
-                message_id TEXT NOT NULL UNIQUE,
-                user_id TEXT NOT NULL,
-                content TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'pending',
-                votes_up INTEGER DEFAULT 0,
-                votes_down INTEGER DEFAULT 0,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                reviewed_at DATETIME,
-                reviewed_by TEXT,
-                review_reason TEXT
-            )
-        """)
-
-        # Tabela de votos em sugestões
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS suggestion_votes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                suggestion_id INTEGER NOT NULL,
-                user_id TEXT NOT NULL,
-                vote_type TEXT NOT NULL CHECK(vote_type IN ('up', 'down')),
-                voted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (suggestion_id) REFERENCES suggestions (id) ON DELETE CASCADE,
-                UNIQUE(suggestion_id, user_id)
-            )
-        """)
-
-        # Tabela de configuração de sugestões
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS suggestion_config (
-                guild_id TEXT PRIMARY KEY,
-                enabled BOOLEAN DEFAULT 1,
-                suggestion_channel_id TEXT,
-                review_channel_id TEXT,
-                auto_react BOOLEAN DEFAULT 1,
-                up_emoji TEXT DEFAULT '👍',
-                down_emoji TEXT DEFAULT '👎',
-                dm_user BOOLEAN DEFAULT 1,
-                anonymous_suggestions BOOLEAN DEFAULT 0,
-                cooldown_minutes INTEGER DEFAULT 5,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
+        await database.create_tables()
         print("✅ Tabelas de sugestões inicializadas")
 
     except Exception as e:
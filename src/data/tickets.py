@@ -4,83 +4,14 @@ Tickets Data Module - Funções para sistema de tickets
 
 import datetime
 import json
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 async def initialize_tickets_tables():
-    """Inicializar tabelas de tickets"""
+    """Inicializar tabelas de tickets (definidas em utils/schema.py)"""
     try:
-        # Tabela principal de tickets
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS tickets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                channel_id TEXT NOT NULL UNIQUE,
-                user_id TEXT NOT NULL,
-                category TEXT,
-                status TEXT NOT NULL DEFAULT 'open',
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                closed_at DATETIME,
-                closed_by TEXT,
-                transcript_url TEXT,
-                ticket_number INTEGER
-            )
-        """)
-
-        # Tabela de configuração de tickets
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS ticket_config (
-                guild_id TEXT PRIMARY KEY,
-                enabled BOOLEAN DEFAULT 1,
-                category_id TEXT,
-                support_role_id TEXT,
-                log_channel_id TEXT,
-                max_tickets INTEGER DEFAULT 3,
-                ticket_name_format TEXT DEFAULT 'ticket-{user}-{number}',
-                welcome_message TEXT,
-                close_message TEXT,
-                auto_close_hours INTEGER DEFAULT 0,
-                transcript_enabled BOOLEAN DEFAULT 1,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Tabela de categorias de tickets
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS ticket_categories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                description TEXT,
-                emoji TEXT,
-                role_id TEXT,
-                auto_close_hours INTEGER DEFAULT 0,
-                welcome_message TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(guild_id, name)
-            )
-        """)
-
-        # Tabela de mensagens de transcript
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS ticket_transcripts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ticket_id INTEGER NOT NULL,
-                message_id TEXT NOT NULL,
-                author_id TEXT NOT NULL,
-                author_name TEXT NOT NULL,
-                content TEXT,
-                attachments TEXT,
-                embeds TEXT,
-                timestamp DATETIME NOT NULL,
-                FOREIGN KEY (ticket_id) REFERENCES tickets (id) ON DELETE CASCADE
-            )
-        """)
-
+        await database.create_tables()
         print("✅ Tabelas de tickets inicializadas")
 
     except Exception as e:
@@ -123,8 +54,8 @@ async def save_ticket_config(guild_id: int, config: dict) -> bool:
             """INSERT OR REPLACE INTO ticket_config 
                (guild_id, enabled, category_id, support_role_id, log_channel_id, 
                 max_tickets, ticket_name_format, welcome_message, close_message, 
-                auto_close_hours, transcript_enabled)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                auto_close_hours, transcript_enabled, pool_size)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
             (
                 str(guild_id),
                 config.get("enabled", True),
@@ -137,8 +68,12 @@ async def save_ticket_config(guild_id: int, config: dict) -> bool:
                 config.get("close_message"),
                 config.get("auto_close_hours", 0),
                 config.get("transcript_enabled", True),
+                config.get("pool_size"),
             ),
         )
+        database.ticket_pool.configure(
+            guild_id, config.get("category_id"), config.get("pool_size")
+        )
 
         return True
 
@@ -158,14 +93,15 @@ async def create_ticket(guild_id: int, channel_id: int, user_id: int, category:
         ticket_number = (result["max_num"] or 0) + 1 if result else 1
 
         # Criar ticket
-        result = await database.run(
+        ticket_id = await database.run(
             """INSERT INTO tickets 
                (guild_id, channel_id, user_id, category, ticket_number)
                VALUES (?, ?, ?, ?, ?)""",
             (str(guild_id), str(channel_id), str(user_id), category, ticket_number),
         )
+        await database.tickets.track(ticket_id)
 
-        return result.lastrowid if hasattr(result, "lastrowid") else 0
+        return ticket_id or 0
 
     except Exception as e:
         print(f"❌ Erro criando ticket: {e}")
@@ -226,6 +162,8 @@ async def close_ticket(channel_id: int, closed_by: int, transcript_url: str = No
                 str(channel_id),
             ),
         )
+        database.tickets.closed(channel_id)
+        await database.transcripts.flush(int(channel_id))
 
         return True
 
@@ -238,6 +176,7 @@ async def delete_ticket(channel_id: int) -> bool:
     """Deletar ticket"""
     try:
         await database.run("DELETE FROM tickets WHERE channel_id = ?", (str(channel_id),))
+        database.tickets.closed(channel_id)
 
         return True
 
@@ -4,50 +4,14 @@ Welcome Data Module - Sistema de mensagens de boas-vindas
 
 import datetime
 import json
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 async def initialize_welcome_tables():
-    """Inicializar tabelas de welcome"""
+    """Inicializar tabelas de welcome (definidas em utils/schema.py)"""
     try:
-        # Tabela de configuração de welcome
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS welcome_config (
-                guild_id TEXT PRIMARY KEY,
-                enabled BOOLEAN DEFAULT 1,
-                welcome_channel_id TEXT,
-                welcome_message TEXT DEFAULT 'Bem-vindo(a) ao servidor, {user}!',
-                welcome_embed BOOLEAN DEFAULT 0,
-                welcome_embed_data TEXT,
-                goodbye_enabled BOOLEAN DEFAULT 0,
-                goodbye_channel_id TEXT,
-                goodbye_message TEXT DEFAULT 'Tchau, {user}! Esperamos te ver novamente.',
-                dm_welcome BOOLEAN DEFAULT 0,
-                dm_message TEXT DEFAULT 'Bem-vindo(a) ao {server}!',
-                auto_role_enabled BOOLEAN DEFAULT 0,
-                auto_roles TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Tabela de histórico de welcome
-        await database.run("""
-            CREATE TABLE IF NOT EXISTS welcome_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id TEXT NOT NULL,
-                user_id TEXT NOT NULL,
-                event_type TEXT NOT NULL CHECK(event_type IN ('join', 'leave')),
-                message_sent BOOLEAN DEFAULT 0,
-                dm_sent BOOLEAN DEFAULT 0,
-                roles_assigned BOOLEAN DEFAULT 0,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
+        await database.create_tables()
         print("✅ Tabelas de welcome inicializadas")
 
     except Exception as e:
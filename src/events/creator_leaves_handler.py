@@ -3,16 +3,11 @@ Creator Leaves Handler - Gerencia quando criador de ticket sai
 Trata situações quando criador de ticket deixa o servidor
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
+from ..utils.database import database
+from ..utils.history_scan import MessageCounter
 
 
 class CreatorLeavesHandler(commands.Cog):
@@ -35,14 +30,9 @@ class CreatorLeavesHandler(commands.Cog):
             print(f"❌ Erro no creator leaves handler: {e}")
 
     async def get_user_active_tickets(self, guild_id: int, user_id: int) -> list:
-        """Buscar tickets ativos do usuário"""
+        """Buscar tickets ativos do usuário (registro em memória)"""
         try:
-            result = await database.fetchall(
-                """SELECT * FROM tickets 
-                   WHERE guild_id = ? AND creator_id = ? AND status = 'open'""",
-                (str(guild_id), str(user_id)),
-            )
-            return result or []
+            return await database.tickets.owner_tickets(guild_id, user_id)
 
         except Exception as e:
             print(f"❌ Erro buscando tickets do usuário: {e}")
@@ -149,6 +139,7 @@ class CreatorLeavesHandler(commands.Cog):
                 "UPDATE tickets SET status = 'closed', closed_by = ?, closed_at = ? WHERE id = ?",
                 ("system", discord.utils.utcnow().isoformat(), ticket["id"]),
             )
+            database.tickets.closed(channel.id)
 
             # Criar transcript se necessário
             await self.create_ticket_transcript(ticket, channel, "Criador saiu do servidor")
@@ -182,6 +173,7 @@ class CreatorLeavesHandler(commands.Cog):
                 "UPDATE tickets SET assigned_to = ? WHERE id = ?",
                 (str(staff_role.id), ticket["id"]),
             )
+            database.tickets.update(channel.id, assigned_to=str(staff_role.id))
 
             # Mencionar equipe
             await channel.send(
@@ -238,13 +230,15 @@ class CreatorLeavesHandler(commands.Cog):
         try:
             # Implementar geração de transcript
             # Por simplicidade, vamos apenas salvar informações básicas
+            counter = MessageCounter()
+            await database.history.scan(channel, counter, key=f"creator_left:{channel.id}")
             transcript_data = {
                 "ticket_id": ticket["id"],
                 "channel_id": ticket["channel_id"],
-                "creator_id": ticket["creator_id"],
+                "creator_id": ticket["user_id"],
                 "closed_reason": reason,
                 "closed_at": discord.utils.utcnow().isoformat(),
-                "message_count": len(await channel.history(limit=None).flatten()),
+                "message_count": counter.messages,
             }
 
             await database.run(
@@ -254,7 +248,7 @@ class CreatorLeavesHandler(commands.Cog):
                 (
                     ticket["id"],
                     ticket["channel_id"],
-                    ticket["creator_id"],
+                    ticket["user_id"],
                     reason,
                     transcript_data["closed_at"],
                     str(transcript_data),
@@ -3,16 +3,10 @@ Custom Variable Change Handler - Mudanças de variáveis customizadas
 Gerencia alterações em variáveis personalizadas do servidor
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
+from ..utils.database import database
 
 
 class CustomVariableChangeHandler(commands.Cog):
@@ -3,16 +3,10 @@ Giveaway Button Handler - Sistema de botões de sorteios
 Gerencia participação em sorteios através de botões
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
+from ..utils.database import database
 
 
 class GiveawayButtonHandler(commands.Cog):
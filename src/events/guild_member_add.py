@@ -3,17 +3,14 @@ Guild Member Add Event - Boas vindas e autorole
 Evento disparado quando um membro entra no servidor
 """
 
-import sys
-from pathlib import Path
+from datetime import timedelta
 
 import discord
 from discord.ext import commands
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
-from utils.embeds import EmbedBuilder
+from ..utils.antispam_policy import AntispamPolicy
+from ..utils.database import database
+from ..utils.embeds import EmbedBuilder
 
 
 class GuildMemberAdd(commands.Cog):
@@ -26,9 +23,26 @@ class GuildMemberAdd(commands.Cog):
     async def on_member_join(self, member: discord.Member):
         """Executado quando membro entra no servidor"""
         try:
+            # Estimar a taxa de entradas (o mesmo resultado vale para todos os listeners)
+            policy = await database.antispam_policies.get(member.guild.id)
+            raid = database.join_bursts.observe(
+                member.guild.id,
+                member.id,
+                threshold=policy.join_raid_threshold,
+                window=policy.join_raid_window,
+            )
+
             # Buscar configurações do servidor
             settings = await database.get_guild_settings(str(member.guild.id))
 
+            if raid:
+                # 🚨 Modo raid: autorole pausado, boas-vindas em resumo, punição na fila
+                self.queue_raid_action(member, policy)
+                if settings:
+                    self.summarize_welcome(member, settings)
+                await self.update_member_stats(member)
+                return
+
             if not settings:
                 return
 
@@ -44,6 +58,53 @@ class GuildMemberAdd(commands.Cog):
         except Exception as e:
             print(f"❌ Erro no evento member_join: {e}")
 
+    def queue_raid_action(self, member: discord.Member, policy: AntispamPolicy):
+        """Enfileirar a punição configurada para entradas durante o raid"""
+        if policy.join_raid_action == "none":
+            return
+        database.bulk_actions.submit(
+            (member.guild.id, member.id),
+            lambda: self.apply_raid_action(member, policy),
+        )
+
+    async def apply_raid_action(self, member: discord.Member, policy: AntispamPolicy):
+        """Aplicar timeout ou expulsão (executado pela fila em ritmo controlado)"""
+        if member.guild.get_member(member.id) is None:
+            return
+
+        if policy.join_raid_action == "timeout":
+            await member.timeout(
+                timedelta(seconds=policy.mute_duration), reason="Modo raid: entrada em massa"
+            )
+            action = "mute"
+        else:
+            await member.kick(reason="Modo raid: entrada em massa")
+            action = "kick"
+
+        await database.log_antispam_detection(
+            str(member.guild.id), str(member.id), action, reason="Raid de entradas"
+        )
+
+    def summarize_welcome(self, member: discord.Member, settings: dict):
+        """Acumular o membro no resumo de boas-vindas do modo raid"""
+        welcome_channel_id = settings.get("welcome_channel_id")
+        if not welcome_channel_id:
+            return
+
+        welcome_channel = member.guild.get_channel(int(welcome_channel_id))
+        if not welcome_channel:
+            return
+
+        async def send_summary(summary):
+            embed = EmbedBuilder.build_join_summary_embed(
+                summary, f"👋 Bem-vindos ao {member.guild.name}!", color=0x00FF00
+            )
+            await welcome_channel.send(embed=embed)
+
+        database.join_bursts.summarize(
+            member.guild.id, ("welcome", welcome_channel.id), member, send_summary
+        )
+
     async def apply_autorole(self, member: discord.Member, settings: dict):
         """Aplicar autorole automaticamente"""
         try:
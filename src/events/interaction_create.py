@@ -3,18 +3,13 @@ Event handler para interações - VERSÃO COMPLETA ADAPTADA DO JS
 Gerencia todos os tipos: slash commands, buttons, selects, modals
 """
 
-import sys
 import time
 import traceback
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
+from ..utils.database import database
 
 
 class InteractionCreate(commands.Cog):
@@ -311,9 +306,17 @@ class InteractionCreate(commands.Cog):
                         read_messages=True, send_messages=True, manage_messages=True
                     )
 
-            ticket_channel = await interaction.guild.create_text_channel(
-                f"ticket-{interaction.user.name}", category=category, overwrites=overwrites
+            # Canal pré-criado do pool (se houver), senão criar agora
+            ticket_channel = await database.ticket_pool.acquire(
+                interaction.guild,
+                name=f"ticket-{interaction.user.name}",
+                overwrites=overwrites,
+                category=category,
             )
+            if ticket_channel is None:
+                ticket_channel = await interaction.guild.create_text_channel(
+                    f"ticket-{interaction.user.name}", category=category, overwrites=overwrites
+                )
 
             # Salvar no banco
             await database.create_ticket(
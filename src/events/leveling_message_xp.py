@@ -4,15 +4,14 @@ Gerencia ganho de XP e level up através de mensagens
 """
 
 import random
-import sys
 import time
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
+from ..utils.message_pipeline import MessageContext, get_message_pipeline
+from ..utils.xp_accumulator import xp_for_level
 
 
 class LevelingMessageXP(commands.Cog):
@@ -20,10 +19,25 @@ class LevelingMessageXP(commands.Cog):
         self.bot = bot
         self.xp_cooldowns = {}  # Cache de cooldowns de XP
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        if message.author.bot or not message.guild:
-            return
+    async def cog_load(self):
+        """Registrar estágio no pipeline de mensagens"""
+        get_message_pipeline(self.bot).register(
+            "leveling_xp",
+            self.process_message,
+            depends_on=(
+                "content_filters",
+                "raid_detector",
+                "antispam_system",
+            ),
+        )
+
+    async def cog_unload(self):
+        """Remover estágio do pipeline de mensagens"""
+        get_message_pipeline(self.bot).unregister("leveling_xp")
+
+    async def process_message(self, ctx: MessageContext):
+        """Conceder XP pela mensagem"""
+        message = ctx.message
 
         try:
             # Verificar se leveling está habilitado
@@ -129,57 +143,16 @@ class LevelingMessageXP(commands.Cog):
         return base_xp
 
     async def add_xp(self, guild_id: int, user_id: int, xp_amount: int) -> dict:
-        """Adicionar XP ao usuário"""
+        """Adicionar XP ao usuário (gravado em lote pelo acumulador)"""
         try:
-            # Buscar dados atuais do usuário
-            user_data = await database.fetchone(
-                "SELECT * FROM user_levels WHERE guild_id = ? AND user_id = ?",
-                (str(guild_id), str(user_id)),
-            )
-
-            if user_data:
-                # Usuário existe, atualizar XP
-                new_xp = user_data["xp"] + xp_amount
-                new_total_xp = user_data["total_xp"] + xp_amount
-
-                await database.run(
-                    "UPDATE user_levels SET xp = ?, total_xp = ?, last_message = ? WHERE guild_id = ? AND user_id = ?",
-                    (
-                        new_xp,
-                        new_total_xp,
-                        discord.utils.utcnow().isoformat(),
-                        str(guild_id),
-                        str(user_id),
-                    ),
-                )
-
-                return {
-                    "user_id": user_id,
-                    "guild_id": guild_id,
-                    "xp": new_xp,
-                    "total_xp": new_total_xp,
-                    "level": user_data["level"],
-                }
-            # Novo usuário
-            await database.run(
-                """INSERT INTO user_levels (guild_id, user_id, xp, total_xp, level, last_message) 
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                (
-                    str(guild_id),
-                    str(user_id),
-                    xp_amount,
-                    xp_amount,
-                    1,
-                    discord.utils.utcnow().isoformat(),
-                ),
-            )
+            award = await database.xp_accumulator.add_xp(str(guild_id), str(user_id), xp_amount)
 
             return {
                 "user_id": user_id,
                 "guild_id": guild_id,
-                "xp": xp_amount,
-                "total_xp": xp_amount,
-                "level": 1,
+                "total_xp": award.total_xp,
+                "old_level": award.old_level,
+                "level": award.new_level,
             }
 
         except Exception as e:
@@ -189,40 +162,23 @@ class LevelingMessageXP(commands.Cog):
     async def check_level_up(self, message: discord.Message, user_data: dict, config: dict):
         """Verificar e processar level up"""
         try:
-            current_level = user_data["level"]
-            current_xp = user_data["xp"]
-
-            # Calcular XP necessário para próximo nível
-            xp_needed = self.calculate_xp_for_level(current_level + 1)
-
-            if current_xp >= xp_needed:
-                # Level up!
-                new_level = current_level + 1
-                remaining_xp = current_xp - xp_needed
-
-                # Atualizar nível no banco
-                await database.run(
-                    "UPDATE user_levels SET level = ?, xp = ? WHERE guild_id = ? AND user_id = ?",
-                    (new_level, remaining_xp, str(message.guild.id), str(message.author.id)),
-                )
-
-                # Enviar mensagem de level up
-                await self.send_level_up_message(message, new_level, config)
+            # O nível já é recalculado em memória pelo acumulador
+            new_level = user_data["level"]
+            if new_level <= user_data.get("old_level", new_level):
+                return
 
-                # Aplicar role de nível se configurado
-                await self.apply_level_role(message.guild, message.author, new_level, config)
+            # Enviar mensagem de level up
+            await self.send_level_up_message(message, new_level, config)
 
-                # Verificar se ainda pode subir mais níveis
-                updated_user_data = {**user_data, "level": new_level, "xp": remaining_xp}
-                await self.check_level_up(message, updated_user_data, config)
+            # Aplicar role de nível se configurado
+            await self.apply_level_role(message.guild, message.author, new_level, config)
 
         except Exception as e:
             print(f"❌ Erro verificando level up: {e}")
 
     def calculate_xp_for_level(self, level: int) -> int:
-        """Calcular XP necessário para atingir determinado nível"""
-        # Fórmula: 100 * level^1.5
-        return int(100 * (level**1.5))
+        """Calcular XP total necessário para atingir determinado nível"""
+        return xp_for_level(level)
 
     async def send_level_up_message(self, message: discord.Message, new_level: int, config: dict):
         """Enviar mensagem de level up"""
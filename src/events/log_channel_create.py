@@ -2,14 +2,10 @@
 Log Channel Create - Registra criação de canais
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class LogChannelCreate(commands.Cog):
@@ -38,7 +34,7 @@ class LogChannelCreate(commands.Cog):
 
             embed.set_footer(text=f"Canal ID: {channel.id}")
 
-            await log_channel.send(embed=embed)
+            database.log_dispatcher.send(log_channel, embed)
 
         except Exception as e:
             print(f"❌ Erro log canal criado: {e}")
@@ -2,14 +2,10 @@
 Log Channel Delete - Registra exclusão de canais
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class LogChannelDelete(commands.Cog):
@@ -35,7 +31,7 @@ class LogChannelDelete(commands.Cog):
                 embed.add_field(name="📁 Categoria", value=channel.category.name, inline=True)
 
             embed.set_footer(text=f"Canal ID: {channel.id}")
-            await log_channel.send(embed=embed)
+            database.log_dispatcher.send(log_channel, embed)
 
         except Exception as e:
             print(f"❌ Erro log canal deletado: {e}")
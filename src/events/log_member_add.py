@@ -2,14 +2,11 @@
 Log Member Add - Registra entrada de membros
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
+from ..utils.embeds import EmbedBuilder
 
 
 class LogMemberAdd(commands.Cog):
@@ -23,6 +20,19 @@ class LogMemberAdd(commands.Cog):
             if not log_channel:
                 return
 
+            policy = await database.antispam_policies.get(member.guild.id)
+            if database.join_bursts.observe(
+                member.guild.id,
+                member.id,
+                threshold=policy.join_raid_threshold,
+                window=policy.join_raid_window,
+            ):
+                # Modo raid: um log resumido por intervalo em vez de um por membro
+                database.join_bursts.summarize(
+                    member.guild.id, ("log", log_channel.id), member, self.send_raid_summary
+                )
+                return
+
             embed = discord.Embed(
                 title="📥 Membro Entrou", color=0x00FF00, timestamp=discord.utils.utcnow()
             )
@@ -39,15 +49,19 @@ class LogMemberAdd(commands.Cog):
             )
             embed.set_footer(text=f"ID: {member.id}")
 
-            await log_channel.send(embed=embed)
+            database.log_dispatcher.send(log_channel, embed)
 
         except Exception as e:
             print(f"❌ Erro log membro entrou: {e}")
 
+    async def send_raid_summary(self, summary):
+        log_channel = self.bot.get_channel(summary.key[1])
+        if log_channel:
+            embed = EmbedBuilder.build_join_summary_embed(summary, "📥 Membros Entraram")
+            database.log_dispatcher.send(log_channel, embed)
+
     async def get_log_channel(self, guild_id):
-        result = await database.fetchone(
-            "SELECT log_channel_id FROM guild_settings WHERE guild_id = ?", (str(guild_id),)
-        )
+        result = await database.get_guild_settings(str(guild_id))
         if result and result.get("log_channel_id"):
             return self.bot.get_channel(int(result["log_channel_id"]))
         return None
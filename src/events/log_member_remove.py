@@ -2,14 +2,10 @@
 Log Member Remove - Registra saída de membros
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class LogMemberRemove(commands.Cog):
@@ -47,7 +43,7 @@ class LogMemberRemove(commands.Cog):
                     embed.add_field(name="🏷️ Cargos", value=" ".join(roles), inline=False)
 
             embed.set_footer(text=f"ID: {member.id}")
-            await log_channel.send(embed=embed)
+            database.log_dispatcher.send(log_channel, embed)
 
         except Exception as e:
             print(f"❌ Erro log membro saiu: {e}")
@@ -2,14 +2,10 @@
 Log Message Delete - Registra exclusão de mensagens
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class LogMessageDelete(commands.Cog):
@@ -53,7 +49,7 @@ class LogMessageDelete(commands.Cog):
                 embed.add_field(name="📎 Anexos", value=attachments, inline=False)
 
             embed.set_footer(text=f"ID da mensagem: {message.id}")
-            await log_channel.send(embed=embed)
+            database.log_dispatcher.send(log_channel, embed)
 
         except Exception as e:
             print(f"❌ Erro log mensagem deletada: {e}")
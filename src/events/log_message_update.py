@@ -2,14 +2,10 @@
 Log Message Update - Registra edição de mensagens
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class LogMessageUpdate(commands.Cog):
@@ -51,7 +47,7 @@ class LogMessageUpdate(commands.Cog):
             embed.add_field(name="📝 Depois", value=f"```{new_content}```", inline=False)
 
             embed.set_footer(text=f"ID da mensagem: {after.id}")
-            await log_channel.send(embed=embed)
+            database.log_dispatcher.send(log_channel, embed)
 
         except Exception as e:
             print(f"❌ Erro log mensagem editada: {e}")
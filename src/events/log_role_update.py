@@ -2,14 +2,10 @@
 Log Role Update - Registra alterações de cargos
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class LogRoleUpdate(commands.Cog):
@@ -51,7 +47,7 @@ class LogRoleUpdate(commands.Cog):
             embed.add_field(name="👥 Membros", value=f"`{len(role.members)}`", inline=True)
             embed.set_footer(text=f"ID: {role.id}")
 
-            await log_channel.send(embed=embed)
+            database.log_dispatcher.send(log_channel, embed)
 
         except Exception as e:
             print(f"❌ Erro log cargo: {e}")
@@ -111,7 +107,7 @@ class LogRoleUpdate(commands.Cog):
                     )
 
             embed.set_footer(text=f"ID: {after.id}")
-            await log_channel.send(embed=embed)
+            database.log_dispatcher.send(log_channel, embed)
 
         except Exception as e:
             print(f"❌ Erro log cargo atualizado: {e}")
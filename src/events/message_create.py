@@ -1,21 +1,18 @@
 """
 Event handler para mensagens - Sistema completo ADAPTADO DO JS
-Inclui: Antispam, Leveling, Sticky Messages, Logs
+Inclui: Filtros, Raid, Leveling, Logs (sticky messages ficam em commands/sticky)
 """
 
 import asyncio
-import re
-import sys
 import time
-from pathlib import Path
+from collections import defaultdict
 
 import discord
 from discord.ext import commands
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
+from ..utils.antispam_policy import AntispamPolicy
+from ..utils.database import database
+from ..utils.message_pipeline import MessageContext, get_message_pipeline
 
 
 class MessageCreate(commands.Cog):
@@ -23,95 +20,120 @@ class MessageCreate(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        # Cache para antispam
-        self.spam_cache = {}
-        # Cache para sticky messages
-        self.sticky_cache = {}
-
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        """Processar todas as mensagens"""
-        # Ignorar bots
-        if message.author.bot:
-            return
-
-        # Ignorar DMs
-        if not message.guild:
-            return
 
+    async def cog_load(self):
+        """Registrar estágios no pipeline de mensagens"""
+        pipeline = get_message_pipeline(self.bot)
+        # Filtros e antispam rodam juntos; o resto só roda se a mensagem ficou
+        pipeline.register("content_filters", self.stage_content_filters)
+        pipeline.register("raid_detector", self.stage_raid_detector)
+        pipeline.register(
+            "leveling",
+            self.stage_leveling,
+            depends_on=(
+                "content_filters",
+                "raid_detector",
+                "antispam_system",
+            ),
+        )
+        pipeline.register(
+            "message_logging", self.stage_message_logging, depends_on=("content_filters",)
+        )
+
+    async def cog_unload(self):
+        """Remover estágios do pipeline de mensagens"""
+        pipeline = get_message_pipeline(self.bot)
+        for name in (
+            "content_filters",
+            "raid_detector",
+            "leveling",
+            "message_logging",
+        ):
+            pipeline.unregister(name)
+
+    async def stage_raid_detector(self, ctx: MessageContext):
+        """🚨 Detector de Raid (mesmo conteúdo entre contas e canais)"""
+        if await self.handle_raid_detection(ctx.message):
+            ctx.halt("raid_detector")
+
+    async def stage_leveling(self, ctx: MessageContext):
+        """📈 Sistema de Leveling/XP"""
+        await self.handle_leveling(ctx.message, ctx.settings)
+
+    async def stage_message_logging(self, ctx: MessageContext):
+        """📝 Message Logging"""
+        await self.handle_message_logging(ctx.message, ctx.settings)
+
+    async def stage_content_filters(self, ctx: MessageContext):
+        """🔍 Filtros de Conteúdo"""
+        if await self.handle_content_filters(ctx.message, ctx.settings):
+            ctx.halt("content_filters")
+
+    async def handle_raid_detection(self, message: discord.Message) -> bool:
+        """Detectar conteúdo copiado por várias contas ou em vários canais"""
         try:
-            # 🛡️ Sistema de Antispam
-            await self.handle_antispam(message)
-
-            # 📈 Sistema de Leveling/XP
-            await self.handle_leveling(message)
-
-            # 📌 Sticky Messages
-            await self.handle_sticky_messages(message)
-
-            # 📝 Message Logging
-            await self.handle_message_logging(message)
+            # Isentos (inclui moderadores, que podem repetir avisos em vários canais)
+            policy = await database.antispam_policies.get(message.guild.id)
+            if not policy.enabled or policy.is_exempt(message.author, message.channel.id):
+                return False
+
+            flagged = database.raid_detector.observe(
+                message.guild.id,
+                message.content,
+                message.author.id,
+                message.channel.id,
+                message,
+                min_authors=policy.raid_min_authors,
+                min_channels=policy.raid_min_channels,
+                window=policy.raid_window,
+                now=message.created_at.timestamp(),
+            )
+            if not flagged:
+                return False
 
-            # 🔍 Filtros de Conteúdo
-            await self.handle_content_filters(message)
+            await self.execute_raid_action(flagged, policy)
+            return True
 
         except Exception as e:
-            print(f"❌ Erro processando mensagem: {e}")
-
-    async def handle_antispam(self, message: discord.Message):
-        """Sistema completo de antispam ADAPTADO DO JS"""
-        try:
-            # Buscar configurações do servidor
-            settings = await database.get_guild_settings(str(message.guild.id))
-
-            if not settings or not settings.get("antispam_enabled", False):
-                return
-
-            antispam_config = settings.get(
-                "antispam_config",
-                {
-                    "message_limit": 5,
-                    "time_window": 10,  # segundos
-                    "action": "warn",  # warn, mute, kick, ban
-                    "mute_duration": 300,  # 5 minutos
-                },
+            print(f"❌ Erro detector de raid: {e}")
+            return False
+
+    async def execute_raid_action(self, messages: list[discord.Message], policy: AntispamPolicy):
+        """Apagar as cópias em lote e aplicar a ação de antispam uma vez por autor"""
+        by_channel: dict[int, list[discord.Message]] = defaultdict(list)
+        by_author: dict[int, discord.Message] = {}
+        for flagged in messages:
+            by_channel[flagged.channel.id].append(flagged)
+            by_author.setdefault(flagged.author.id, flagged)
+
+        # Criar a role de mute antes, para as ações em paralelo não criarem várias
+        guild = messages[0].guild
+        if policy.action == "mute" and not discord.utils.get(guild.roles, name="Muted"):
+            await self.create_mute_role(guild)
+
+        await asyncio.gather(
+            *(self.delete_raid_messages(batch) for batch in by_channel.values()),
+            *(self.execute_antispam_action(flagged, policy) for flagged in by_author.values()),
+            return_exceptions=True,
+        )
+
+        if len(messages) > 1:
+            print(
+                f"🚨 Raid detectado em {guild.name}: "
+                f"{len(messages)} mensagens de {len(by_author)} usuários"
             )
 
-            user_id = str(message.author.id)
-            current_time = time.time()
-
-            # Inicializar cache do usuário
-            if user_id not in self.spam_cache:
-                self.spam_cache[user_id] = []
-
-            user_messages = self.spam_cache[user_id]
-
-            # Limpar mensagens antigas (IGUAL AO JS)
-            time_window = antispam_config["time_window"]
-            recent_messages = [
-                timestamp for timestamp in user_messages if current_time - timestamp < time_window
-            ]
-
-            # Adicionar mensagem atual
-            recent_messages.append(current_time)
-            self.spam_cache[user_id] = recent_messages
-
-            # Verificar se ultrapassou o limite
-            message_limit = antispam_config["message_limit"]
-            if len(recent_messages) > message_limit:
-                await self.execute_antispam_action(message, antispam_config)
-
-            # Limpeza automática do cache (performance)
-            if len(self.spam_cache) > 1000:
-                self.cleanup_spam_cache()
-
-        except Exception as e:
-            print(f"❌ Erro antispam: {e}")
+    async def delete_raid_messages(self, messages: list[discord.Message]):
+        """Apagar mensagens de um mesmo canal (uma chamada de API por canal)"""
+        try:
+            await messages[0].channel.delete_messages(messages, reason="Antispam: raid")
+        except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
+            print(f"⚠️ Não foi possível apagar mensagens do raid: {e}")
 
-    async def execute_antispam_action(self, message: discord.Message, config: dict):
+    async def execute_antispam_action(self, message: discord.Message, policy: AntispamPolicy):
         """Executar ação de antispam IGUAL AO JS"""
         try:
-            action = config.get("action", "warn")
+            action = policy.action
             user = message.author
 
             # Verificar se usuário tem permissões administrativas (bypass)
@@ -135,7 +157,7 @@ class MessageCreate(commands.Cog):
                 await user.add_roles(mute_role, reason="Antispam automático")
 
                 # Remover mute depois do tempo
-                duration = config.get("mute_duration", 300)
+                duration = policy.mute_duration
 
                 embed = discord.Embed(
                     title="🔇 Usuário Mutado - Antispam",
@@ -144,15 +166,27 @@ class MessageCreate(commands.Cog):
                 )
                 await message.channel.send(embed=embed)
 
-                # Programar unmute automático
-                async def auto_unmute():
-                    await asyncio.sleep(duration)
-                    try:
-                        await user.remove_roles(mute_role, reason="Fim do mute de antispam")
-                    except:
-                        pass
+                # Programar unmute automático (persistente, sobrevive a restarts)
+                await database.scheduler.schedule(
+                    "unmute",
+                    time.time() + duration,
+                    {
+                        "guild_id": str(message.guild.id),
+                        "user_id": str(user.id),
+                        "reason": "Fim do mute de antispam",
+                    },
+                    key=f"{message.guild.id}:{user.id}",
+                    guild_id=message.guild.id,
+                )
 
-                asyncio.create_task(auto_unmute())
+            # Registrar a detecção (alimenta os rollups do /antispam-stats)
+            await database.log_antispam_detection(
+                str(message.guild.id),
+                str(user.id),
+                action,
+                str(message.channel.id),
+                "Raid: conteúdo repetido",
+            )
 
             # Registrar caso no sistema de moderação
             await database.add_moderation_case(
@@ -161,7 +195,7 @@ class MessageCreate(commands.Cog):
                 str(self.bot.user.id),  # Bot como moderador
                 action,
                 "Antispam automático",
-                config.get("mute_duration", 0) if action == "mute" else 0,
+                duration=policy.mute_duration if action == "mute" else None,
             )
 
         except Exception as e:
@@ -192,11 +226,10 @@ class MessageCreate(commands.Cog):
             print(f"❌ Erro criando mute role: {e}")
             return None
 
-    async def handle_leveling(self, message: discord.Message):
+    async def handle_leveling(self, message: discord.Message, settings: dict | None):
         """Sistema de XP e Leveling ADAPTADO DO JS"""
         try:
             # Verificar se leveling está habilitado
-            settings = await database.get_guild_settings(str(message.guild.id))
             if not settings or not settings.get("leveling_enabled", True):
                 return
 
@@ -221,44 +254,22 @@ class MessageCreate(commands.Cog):
             length_bonus = min(len(message.content) // 10, 10)  # Max 10 bonus
             total_xp = base_xp + length_bonus
 
-            # Buscar dados atuais do usuário
-            user_data = await database.get_user_level_data(guild_id, user_id)
-
-            if not user_data:
-                # Criar novo usuário
-                await database.create_user_level_data(guild_id, user_id, total_xp)
-                return
-
-            # Atualizar XP
-            new_xp = user_data["xp"] + total_xp
-            current_level = user_data["level"]
-
-            # Calcular novo nível (FÓRMULA IGUAL AO JS)
-            new_level = self.calculate_level(new_xp)
-
-            # Atualizar no banco
-            await database.update_user_level_data(guild_id, user_id, new_xp, new_level)
+            # Conceder XP em memória (gravado em lote pelo acumulador)
+            award = await database.xp_accumulator.add_xp(guild_id, user_id, total_xp)
 
             # Verificar se subiu de nível
-            if new_level > current_level:
-                await self.handle_level_up(message, new_level)
+            if award.leveled_up:
+                await self.handle_level_up(message, award.new_level, settings)
 
         except Exception as e:
             print(f"❌ Erro sistema leveling: {e}")
 
-    def calculate_level(self, xp: int) -> int:
-        """Calcular nível baseado no XP - FÓRMULA DO JS"""
-        # Fórmula: level = sqrt(xp / 100)
-        import math
-
-        return int(math.sqrt(xp / 100))
-
-    async def handle_level_up(self, message: discord.Message, new_level: int):
+    async def handle_level_up(
+        self, message: discord.Message, new_level: int, settings: dict | None
+    ):
         """Lidar com subida de nível IGUAL AO JS"""
         try:
             # Verificar se mensagens de level up estão habilitadas
-            settings = await database.get_guild_settings(str(message.guild.id))
-
             if settings and not settings.get("levelup_messages", True):
                 return
 
@@ -291,67 +302,9 @@ class MessageCreate(commands.Cog):
         except Exception as e:
             print(f"❌ Erro level up: {e}")
 
-    async def handle_sticky_messages(self, message: discord.Message):
-        """Sistema de Sticky Messages ADAPTADO DO JS"""
-        try:
-            channel_id = str(message.channel.id)
-
-            # Verificar se canal tem sticky message ativa
-            sticky_data = await database.get_sticky_message(channel_id)
-
-            if not sticky_data or not sticky_data.get("is_active"):
-                return
-
-            # Atualizar contador de mensagens
-            message_count = sticky_data.get("message_count", 0) + 1
-            await database.increment_sticky_message_count(channel_id)
-
-            # Verificar se deve reenviar (a cada X mensagens - IGUAL AO JS)
-            message_threshold = sticky_data.get("message_threshold", 5)
-
-            if message_count >= message_threshold:
-                await self.repost_sticky_message(message.channel, sticky_data)
-                await database.reset_sticky_message_count(channel_id)
-
-        except Exception as e:
-            print(f"❌ Erro sticky messages: {e}")
-
-    async def repost_sticky_message(self, channel: discord.TextChannel, sticky_data: dict):
-        """Reenviar sticky message IGUAL AO JS"""
-        try:
-            # Deletar mensagem anterior se existir
-            if sticky_data.get("current_message_id"):
-                try:
-                    old_message = await channel.fetch_message(
-                        int(sticky_data["current_message_id"])
-                    )
-                    await old_message.delete()
-                except:
-                    pass
-
-            # Criar embed da sticky message (FORMATAÇÃO DO JS)
-            embed = discord.Embed(
-                title="📌 Mensagem Fixada", description=sticky_data["content"], color=0x00AAFF
-            )
-
-            if sticky_data.get("image_url"):
-                embed.set_image(url=sticky_data["image_url"])
-
-            # Enviar nova mensagem
-            new_message = await channel.send(embed=embed)
-
-            # Atualizar ID da mensagem no banco
-            await database.update_sticky_message_id(sticky_data["channel_id"], str(new_message.id))
-
-        except Exception as e:
-            print(f"❌ Erro reenviando sticky: {e}")
-
-    async def handle_message_logging(self, message: discord.Message):
+    async def handle_message_logging(self, message: discord.Message, settings: dict | None):
         """Sistema de logs de mensagens IGUAL AO JS"""
         try:
-            # Buscar canal de logs
-            settings = await database.get_guild_settings(str(message.guild.id))
-
             if not settings or not settings.get("message_logs_enabled", False):
                 return
 
@@ -381,81 +334,56 @@ class MessageCreate(commands.Cog):
 
             embed.set_footer(text=f"ID: {message.id}")
 
-            await log_channel.send(embed=embed)
+            database.log_dispatcher.send(log_channel, embed)
 
         except Exception as e:
             print(f"❌ Erro message logging: {e}")
 
-    async def handle_content_filters(self, message: discord.Message):
-        """Filtros de conteúdo ADAPTADO DO JS"""
+    async def handle_content_filters(
+        self, message: discord.Message, settings: dict | None
+    ) -> bool:
+        """Filtros de conteúdo ADAPTADO DO JS (retorna True se a mensagem foi removida)"""
         try:
-            settings = await database.get_guild_settings(str(message.guild.id))
-
             if not settings:
-                return
-
-            content = message.content.lower()
+                return False
 
-            # Filtro de palavrões (IGUAL AO JS)
-            if settings.get("filter_profanity", False):
-                profanity_list = settings.get("profanity_words", [])
-                for word in profanity_list:
-                    if word.lower() in content:
-                        await message.delete()
+            # Filtro compilado uma vez por servidor (recompilado quando as configurações mudam)
+            content_filter = database.content_filters.get(message.guild.id, settings)
+            content = message.content
 
-                        embed = discord.Embed(
-                            title="🚫 Mensagem Filtrada",
-                            description=f"{message.author.mention}, sua mensagem foi removida por conter linguagem inadequada.",
-                            color=0xFF6600,
-                        )
+            # Filtro de palavrões
+            if content_filter.find_profanity(content):
+                await message.delete()
 
-                        await message.channel.send(embed=embed, delete_after=10)
-                        return
-
-            # Filtro de links (IGUAL AO JS)
-            if settings.get("filter_links", False):
-                link_pattern = r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+                embed = discord.Embed(
+                    title="🚫 Mensagem Filtrada",
+                    description=f"{message.author.mention}, sua mensagem foi removida por conter linguagem inadequada.",
+                    color=0xFF6600,
+                )
 
-                if re.search(link_pattern, content):
-                    # Verificar se usuário tem permissão para postar links
-                    if not message.author.guild_permissions.manage_messages:
-                        await message.delete()
+                await message.channel.send(embed=embed, delete_after=10)
+                return True
+
+            # Filtro de links
+            if content_filter.has_link(content):
+                # Verificar se usuário tem permissão para postar links
+                if not message.author.guild_permissions.manage_messages:
+                    await message.delete()
+
+                    embed = discord.Embed(
+                        title="🚫 Link Bloqueado",
+                        description=f"{message.author.mention}, você não tem permissão para enviar links.",
+                        color=0xFF6600,
+                    )
 
-                        embed = discord.Embed(
-                            title="🚫 Link Bloqueado",
-                            description=f"{message.author.mention}, você não tem permissão para enviar links.",
-                            color=0xFF6600,
-                        )
+                    await message.channel.send(embed=embed, delete_after=10)
+                    return True
 
-                        await message.channel.send(embed=embed, delete_after=10)
-                        return
+            return False
 
         except Exception as e:
             print(f"❌ Erro filtros: {e}")
-
-    def cleanup_spam_cache(self):
-        """Limpar cache de spam antigo - PERFORMANCE"""
-        try:
-            current_time = time.time()
-            users_to_remove = []
-
-            for user_id, messages in self.spam_cache.items():
-                # Remover mensagens antigas
-                recent = [msg for msg in messages if current_time - msg < 3600]  # 1 hora
-
-                if recent:
-                    self.spam_cache[user_id] = recent
-                else:
-                    users_to_remove.append(user_id)
-
-            # Remover usuários sem mensagens recentes
-            for user_id in users_to_remove:
-                del self.spam_cache[user_id]
-
-            print(f"✅ Cache limpo: {len(users_to_remove)} usuários removidos")
-
-        except Exception as e:
-            print(f"❌ Erro limpando cache: {e}")
+            return False
 
 
 async def setup(bot):
@@ -2,14 +2,10 @@
 Moderation Handler - Sistema principal de moderação
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class ModerationHandler(commands.Cog):
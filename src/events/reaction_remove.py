@@ -2,13 +2,9 @@
 Reaction Remove Handler - Gerencia remoção de reações
 """
 
-import sys
-from pathlib import Path
-
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class ReactionRemoveHandler(commands.Cog):
@@ -3,16 +3,12 @@ Event handler para quando o bot fica pronto - VERSÃO COMPLETA
 """
 
 import asyncio
-import sys
 from pathlib import Path
 
 import discord
 from discord.ext import commands
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
+from ..utils.database import database
 
 
 class Ready(commands.Cog):
@@ -82,14 +78,18 @@ class Ready(commands.Cog):
     async def _load_persistent_data(self):
         """Carregar dados persistentes como sticky messages, etc"""
         try:
-            # Carregar sticky messages ativas
-            sticky_messages = await database.get_all_sticky_messages()
-            if not hasattr(self.bot, "sticky_messages"):
-                self.bot.sticky_messages = {}
+            # Carregar sticky messages ativas (ficam em memória no registro)
+            sticky_count = await database.stickies.load()
+
+            # Canais de ticket abertos (consultados a cada mensagem)
+            ticket_count = await database.tickets.load()
 
-            for sticky in sticky_messages:
-                if sticky["is_active"]:
-                    self.bot.sticky_messages[sticky["channel_id"]] = sticky
+            # Pool de canais de ticket pré-criados (servidores com pool configurado)
+            await database.ticket_pool.load()
+            pooled = 0
+            for guild in self.bot.guilds:
+                if database.ticket_pool.target(guild.id) > 0:
+                    pooled += await database.ticket_pool.warm(guild)
 
             # Carregar giveaways ativos
             active_giveaways = await database.get_active_giveaways()
@@ -100,7 +100,9 @@ class Ready(commands.Cog):
                 self.bot.active_giveaways[giveaway["message_id"]] = giveaway
 
             print("✅ Dados persistentes carregados")
-            print(f"  - {len(self.bot.sticky_messages)} sticky messages ativas")
+            print(f"  - {sticky_count} sticky messages ativas")
+            print(f"  - {ticket_count} tickets abertos")
+            print(f"  - {pooled} canais livres no pool de tickets")
             print(f"  - {len(self.bot.active_giveaways)} giveaways ativos")
 
         except Exception as e:
@@ -111,10 +113,8 @@ async def setup(bot):
     """Setup function para carregar o cog"""
     await bot.add_cog(Ready(bot))
 
-
 import json
 import os
-import sqlite3
 from pathlib import Path
 
 from discord.ext import commands
@@ -126,161 +126,19 @@ class ReadyEvent(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    def setup_database(self):
-        """Configurar todas as tabelas do banco de dados"""
+    async def setup_database(self):
+        """Configurar todas as tabelas do banco de dados (migrações de utils/schema.py)"""
         try:
-            conn = sqlite3.connect("data/bot.db")
-            cursor = conn.cursor()
-
-            # Tabela de giveaways
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS giveaways (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    channel_id INTEGER,
-                    message_id INTEGER UNIQUE,
-                    host_id INTEGER,
-                    title TEXT,
-                    description TEXT,
-                    winners_count INTEGER DEFAULT 1,
-                    end_time TIMESTAMP,
-                    status TEXT DEFAULT 'active',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Tabela de tickets
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tickets (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    channel_id INTEGER,
-                    user_id INTEGER,
-                    category TEXT,
-                    status TEXT DEFAULT 'open',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    closed_at TIMESTAMP
-                )
-            """)
-
-            # Tabela de leveling
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS user_levels (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    user_id INTEGER,
-                    xp INTEGER DEFAULT 0,
-                    level INTEGER DEFAULT 0,
-                    messages INTEGER DEFAULT 0,
-                    last_xp_time TIMESTAMP,
-                    UNIQUE(guild_id, user_id)
-                )
-            """)
-
-            # Tabela de avisos
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS warnings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    user_id INTEGER,
-                    moderator_id INTEGER,
-                    reason TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Tabela de casos de moderação
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mod_cases (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    case_id INTEGER,
-                    user_id INTEGER,
-                    moderator_id INTEGER,
-                    type TEXT,
-                    reason TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Tabela de sugestões
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS suggestions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    channel_id INTEGER,
-                    message_id INTEGER,
-                    user_id INTEGER,
-                    title TEXT,
-                    description TEXT,
-                    status TEXT DEFAULT 'pending',
-                    upvotes INTEGER DEFAULT 0,
-                    downvotes INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Tabela de sticky messages
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sticky_messages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    channel_id INTEGER,
-                    content TEXT,
-                    embed_data TEXT,
-                    last_message_id INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(guild_id, channel_id)
-                )
-            """)
-
-            # Tabela de configurações de servidor
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS guild_settings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER UNIQUE,
-                    welcome_channel INTEGER,
-                    log_channel INTEGER,
-                    autorole_id INTEGER,
-                    leveling_enabled BOOLEAN DEFAULT 1,
-                    antispam_enabled BOOLEAN DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Tabela de notas/anotações
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS user_notes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    user_id INTEGER,
-                    moderator_id INTEGER,
-                    note TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Tabela de backups
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS guild_backups (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    backup_data TEXT,
-                    backup_type TEXT,
-                    created_by INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            conn.commit()
-            conn.close()
+            applied = await database.create_tables()
+            if applied:
+                print(f"🔧 {len(applied)} migrações do banco aplicadas")
 
             print("✅ Todas as tabelas do banco de dados foram inicializadas")
 
         except Exception as e:
             print(f"❌ Erro configurando banco de dados: {e}")
 
-    def load_sticky_messages(self):
+    async def load_sticky_messages(self):
         """Carregar mensagens sticky do arquivo JSON (compatibilidade)"""
         try:
             sticky_file = Path("data/sticky.json")
@@ -289,30 +147,29 @@ class ReadyEvent(commands.Cog):
                     sticky_data = json.load(f)
 
                 # Migrar para banco de dados se necessário
-                conn = sqlite3.connect("data/bot.db")
-                cursor = conn.cursor()
-
+                rows = []
                 for channel_id, data in sticky_data.items():
                     try:
-                        cursor.execute(
-                            """
-                            INSERT OR REPLACE INTO sticky_messages 
-                            (guild_id, channel_id, content, embed_data, last_message_id)
-                            VALUES (?, ?, ?, ?, ?)
-                        """,
+                        rows.append(
                             (
                                 data.get("guild_id", 0),
                                 int(channel_id),
                                 data.get("content", ""),
                                 json.dumps(data.get("embed", {})) if data.get("embed") else None,
                                 data.get("last_message_id", 0),
-                            ),
+                            )
                         )
                     except Exception as e:
                         print(f"Erro migrando sticky message {channel_id}: {e}")
 
-                conn.commit()
-                conn.close()
+                await database.run_many(
+                    """
+                    INSERT OR REPLACE INTO sticky_messages 
+                    (guild_id, channel_id, content, embed_data, last_message_id)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
 
                 print(f"✅ {len(sticky_data)} mensagens sticky carregadas e migradas")
             else:
@@ -328,33 +185,25 @@ class ReadyEvent(commands.Cog):
             """Verificar giveaways expirados"""
             while not self.bot.is_closed():
                 try:
-                    conn = sqlite3.connect("data/bot.db")
-                    cursor = conn.cursor()
-
                     # Buscar giveaways expirados
-                    cursor.execute("""
+                    expired_giveaways = await database.get_all("""
                         SELECT * FROM giveaways 
                         WHERE status = 'active' AND end_time <= datetime('now')
                     """)
 
-                    expired_giveaways = cursor.fetchall()
-
                     for giveaway in expired_giveaways:
                         try:
                             # Marcar como finalizado
-                            cursor.execute(
+                            await database.run(
                                 """
                                 UPDATE giveaways SET status = 'ended' WHERE id = ?
                             """,
-                                (giveaway[0],),
+                                (giveaway["id"],),
                             )
 
-                            print(f"🎉 Giveaway expirado finalizado: ID {giveaway[0]}")
+                            print(f"🎉 Giveaway expirado finalizado: ID {giveaway['id']}")
                         except Exception as e:
-                            print(f"❌ Erro finalizando giveaway {giveaway[0]}: {e}")
-
-                    conn.commit()
-                    conn.close()
+                            print(f"❌ Erro finalizando giveaway {giveaway['id']}: {e}")
 
                 except Exception as e:
                     print(f"❌ Erro verificando giveaways expirados: {e}")
@@ -365,34 +214,26 @@ class ReadyEvent(commands.Cog):
             """Verificar sugestões expiradas"""
             while not self.bot.is_closed():
                 try:
-                    conn = sqlite3.connect("data/bot.db")
-                    cursor = conn.cursor()
-
                     # Buscar sugestões antigas (exemplo: 30 dias)
-                    cursor.execute("""
+                    old_suggestions = await database.get_all("""
                         SELECT * FROM suggestions 
                         WHERE status = 'pending' 
                         AND created_at <= datetime('now', '-30 days')
                     """)
 
-                    old_suggestions = cursor.fetchall()
-
                     for suggestion in old_suggestions:
                         try:
                             # Marcar como expirada
-                            cursor.execute(
+                            await database.run(
                                 """
                                 UPDATE suggestions SET status = 'expired' WHERE id = ?
                             """,
-                                (suggestion[0],),
+                                (suggestion["id"],),
                             )
 
-                            print(f"💡 Sugestão expirada: ID {suggestion[0]}")
+                            print(f"💡 Sugestão expirada: ID {suggestion['id']}")
                         except Exception as e:
-                            print(f"❌ Erro processando sugestão {suggestion[0]}: {e}")
-
-                    conn.commit()
-                    conn.close()
+                            print(f"❌ Erro processando sugestão {suggestion['id']}: {e}")
 
                 except Exception as e:
                     print(f"❌ Erro verificando sugestões expiradas: {e}")
@@ -421,10 +262,10 @@ class ReadyEvent(commands.Cog):
         await self.bot.change_presence(activity=activity, status=discord.Status.online)
 
         # Configurar banco de dados
-        self.setup_database()
+        await self.setup_database()
 
         # Carregar mensagens sticky
-        self.load_sticky_messages()
+        await self.load_sticky_messages()
 
         # Sincronizar comandos slash (apenas em desenvolvimento)
         if os.getenv("NODE_ENV") == "development" or True:  # Por enquanto sempre sincronizar
@@ -446,11 +287,10 @@ class ReadyEvent(commands.Cog):
         """Verificação de saúde do sistema"""
         try:
             # Verificar conexão com banco
-            conn = sqlite3.connect("data/bot.db")
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM sqlite_master WHERE type="table"')
-            table_count = cursor.fetchone()[0]
-            conn.close()
+            result = await database.get(
+                "SELECT COUNT(*) AS total FROM sqlite_master WHERE type = 'table'"
+            )
+            table_count = result["total"] if result else 0
 
             print(f"💾 Banco de dados: {table_count} tabelas ativas")
 
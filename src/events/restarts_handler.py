@@ -3,14 +3,11 @@ Restarts Handler - Gerencia reinicializações do bot
 """
 
 import os
-import sys
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class RestartsHandler(commands.Cog):
@@ -117,12 +114,9 @@ class RestartsHandler(commands.Cog):
             # Restaurar status rotativo se configurado
             await self.restore_rotating_status()
 
-            # Restaurar timers ativos
+            # Restaurar timers ativos (inclui o fim de mutes/bans temporários)
             await self.restore_active_timers()
 
-            # Restaurar auto-moderação
-            await self.restore_auto_moderation()
-
         except Exception as e:
             print(f"❌ Erro restaurando estados: {e}")
 
@@ -143,80 +137,15 @@ class RestartsHandler(commands.Cog):
             print(f"❌ Erro restaurando status rotativo: {e}")
 
     async def restore_active_timers(self):
-        """Restaurar timers ativos"""
+        """Rearmar os eventos agendados pendentes (utils/scheduler.py)"""
         try:
-            # Buscar timers que ainda devem estar ativos
-            active_timers = await database.fetchall(
-                "SELECT * FROM active_timers WHERE expires_at > ?",
-                (discord.utils.utcnow().isoformat(),),
-            )
-
-            for timer in active_timers:
-                # Reagendar timer
-                await self.reschedule_timer(timer)
+            # Eventos vencidos durante o restart são executados logo em seguida
+            armed = await database.scheduler.start()
+            print(f"⏰ {armed} eventos agendados rearmados")
 
         except Exception as e:
             print(f"❌ Erro restaurando timers: {e}")
 
-    async def restore_auto_moderation(self):
-        """Restaurar sistemas de auto-moderação"""
-        try:
-            # Limpar estados de spam temporários
-            # (será resetado naturalmente)
-
-            # Verificar mutes temporários expirados
-            expired_mutes = await database.fetchall(
-                "SELECT * FROM temp_mutes WHERE expires_at < ?",
-                (discord.utils.utcnow().isoformat(),),
-            )
-
-            for mute in expired_mutes:
-                await self.remove_expired_mute(mute)
-
-        except Exception as e:
-            print(f"❌ Erro restaurando auto-moderação: {e}")
-
-    async def reschedule_timer(self, timer_data):
-        """Reagendar um timer após restart"""
-        try:
-            # Implementar reagendamento baseado no tipo de timer
-            timer_type = timer_data.get("type")
-
-            if timer_type == "reminder":
-                # Reagendar reminder
-                pass
-            elif timer_type == "temp_mute":
-                # Reagendar unmute
-                pass
-            elif timer_type == "temp_ban":
-                # Reagendar unban
-                pass
-
-        except Exception as e:
-            print(f"❌ Erro reagendando timer: {e}")
-
-    async def remove_expired_mute(self, mute_data):
-        """Remover mute expirado"""
-        try:
-            guild = self.bot.get_guild(int(mute_data["guild_id"]))
-            if not guild:
-                return
-
-            member = guild.get_member(int(mute_data["user_id"]))
-            if not member:
-                return
-
-            # Buscar role de mute
-            mute_role = discord.utils.get(guild.roles, name="Muted")
-            if mute_role and mute_role in member.roles:
-                await member.remove_roles(mute_role, reason="Mute temporário expirado")
-
-            # Remover do banco
-            await database.run("DELETE FROM temp_mutes WHERE id = ?", (mute_data["id"],))
-
-        except Exception as e:
-            print(f"❌ Erro removendo mute expirado: {e}")
-
     async def schedule_restart_message(self, guild_id: int, channel_id: int):
         """Agendar mensagem de restart"""
         try:
@@ -3,14 +3,11 @@ Rotating Status Handler - Gerencia status rotativos do bot
 """
 
 import random
-import sys
-from pathlib import Path
 
 import discord
 from discord.ext import commands, tasks
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class RotatingStatusHandler(commands.Cog):
@@ -2,45 +2,69 @@
 Sticky Messages Poster - Sistema automático de postagem de mensagens fixas
 """
 
-import sys
-from pathlib import Path
+import time
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
+from ..utils.scheduler import ScheduledEvent
 
 
 class StickyMessagesPoster(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.post_scheduled_stickies.start()
 
-    def cog_unload(self):
-        self.post_scheduled_stickies.cancel()
+    async def cog_load(self):
+        database.scheduler.register("sticky_repost", self.on_sticky_repost_event)
+        await self.backfill_reposts()
 
-    @tasks.loop(minutes=5)  # Verificar a cada 5 minutos
-    async def post_scheduled_stickies(self):
-        """Postar mensagens sticky agendadas"""
+    def cog_unload(self):
+        database.scheduler.unregister("sticky_repost")
+
+    async def schedule_next_repost(self, channel_id, interval_minutes):
+        """Agendar a próxima repostagem de uma sticky (substitui a anterior)"""
+        await database.scheduler.schedule(
+            "sticky_repost",
+            time.time() + int(interval_minutes) * 60,
+            {"channel_id": str(channel_id)},
+            key=str(channel_id),
+        )
+
+    async def backfill_reposts(self) -> int:
+        """Agendar a repostagem das stickies com auto repost que ainda não têm evento"""
         try:
-            # Buscar sticky messages que precisam ser repostadas
-            stickies_to_post = await database.fetchall(
-                """SELECT * FROM sticky_messages 
-                   WHERE enabled = 1 AND auto_repost = 1 
-                   AND (last_posted IS NULL OR 
-                        datetime(last_posted) <= datetime('now', '-' || repost_interval || ' minutes'))"""
+            rows = await database.get_all(
+                """SELECT s.channel_id, s.repost_interval FROM sticky_messages s
+                   WHERE s.enabled = 1 AND s.auto_repost = 1
+                   AND NOT EXISTS (
+                       SELECT 1 FROM scheduled_events e
+                       WHERE e.event_type = 'sticky_repost'
+                       AND e.event_key = s.channel_id
+                       AND e.status = 'pending')"""
             )
-
-            for sticky in stickies_to_post:
-                await self.auto_repost_sticky(sticky)
+            for row in rows:
+                await self.schedule_next_repost(row["channel_id"], row["repost_interval"] or 60)
+            if rows:
+                print(f"⏰ {len(rows)} repostagens de stickies agendadas")
+            return len(rows)
 
         except Exception as e:
-            print(f"❌ Erro postando stickies agendadas: {e}")
+            print(f"❌ Erro agendando repostagens de stickies: {e}")
+            return 0
 
-    @post_scheduled_stickies.before_loop
-    async def before_post_scheduled_stickies(self):
-        await self.bot.wait_until_ready()
+    async def on_sticky_repost_event(self, event: ScheduledEvent):
+        """Executor do evento agendado ``sticky_repost``"""
+        sticky = await database.get(
+            """SELECT * FROM sticky_messages
+               WHERE channel_id = ? AND enabled = 1 AND auto_repost = 1""",
+            (event.data["channel_id"],),
+        )
+        if not sticky:
+            return
+
+        await self.auto_repost_sticky(sticky)
+        await self.schedule_next_repost(sticky["channel_id"], sticky["repost_interval"] or 60)
 
     async def auto_repost_sticky(self, sticky_data):
         """Repostar mensagem sticky automaticamente"""
@@ -51,6 +75,7 @@ class StickyMessagesPoster(commands.Cog):
                 await database.run(
                     "UPDATE sticky_messages SET enabled = 0 WHERE id = ?", (sticky_data["id"],)
                 )
+                database.stickies.remove(int(sticky_data["channel_id"]))
                 return
 
             # Verificar se precisa repostar baseado na atividade do canal
@@ -59,38 +84,8 @@ class StickyMessagesPoster(commands.Cog):
             if not should_repost:
                 return
 
-            # Deletar mensagem anterior se existir
-            if sticky_data.get("last_message_id"):
-                try:
-                    old_message = await channel.fetch_message(int(sticky_data["last_message_id"]))
-                    await old_message.delete()
-                except:
-                    pass
-
-            # Preparar conteúdo
-            content = sticky_data.get("content", "")
-            embed = None
-
-            # Processar embed se houver
-            if sticky_data.get("embed_data"):
-                try:
-                    import json
-
-                    embed_dict = json.loads(sticky_data["embed_data"])
-                    embed = discord.Embed.from_dict(embed_dict)
-                except:
-                    pass
-
-            # Postar nova mensagem
-            if content or embed:
-                new_message = await channel.send(content=content or None, embed=embed)
-
-                # Atualizar informações
-                await database.run(
-                    "UPDATE sticky_messages SET last_message_id = ?, last_posted = ? WHERE id = ?",
-                    (str(new_message.id), discord.utils.utcnow().isoformat(), sticky_data["id"]),
-                )
-
+            # Apaga a anterior pelo ID guardado e posta a nova
+            if await database.stickies.repost(channel):
                 print(f"📌 Sticky repostada automaticamente em #{channel.name}")
 
         except Exception as e:
@@ -99,21 +94,14 @@ class StickyMessagesPoster(commands.Cog):
     async def should_auto_repost(self, channel, sticky_data) -> bool:
         """Verificar se deve repostar automaticamente"""
         try:
-            # Verificar se há atividade suficiente no canal
+            # Atividade desde a última postagem (contador em memória, sem ler o histórico)
             min_messages = sticky_data.get("min_messages_to_repost", 10)
+            await database.stickies.load()
+            sticky = database.stickies.get(channel.id)
+            if sticky is None or not sticky.message_id:
+                return True  # Primeira vez, pode postar
 
-            if sticky_data.get("last_posted"):
-                # Contar mensagens desde a última postagem
-                last_posted = discord.utils.parse_time(sticky_data["last_posted"])
-
-                message_count = 0
-                async for message in channel.history(after=last_posted, limit=50):
-                    if not message.author.bot:
-                        message_count += 1
-
-                return message_count >= min_messages
-
-            return True  # Primeira vez, pode postar
+            return sticky.counter >= min_messages
 
         except Exception as e:
             print(f"❌ Erro verificando repost automático: {e}")
@@ -126,6 +114,7 @@ class StickyMessagesPoster(commands.Cog):
                 "UPDATE sticky_messages SET auto_repost = 1, repost_interval = ? WHERE channel_id = ?",
                 (interval_minutes, str(channel_id)),
             )
+            await self.schedule_next_repost(channel_id, interval_minutes)
 
             return True
 
@@ -140,6 +129,7 @@ class StickyMessagesPoster(commands.Cog):
                 "UPDATE sticky_messages SET auto_repost = 0 WHERE channel_id = ?",
                 (str(channel_id),),
             )
+            await database.scheduler.cancel_key("sticky_repost", str(channel_id))
 
             return True
 
@@ -191,40 +181,8 @@ class StickyMessagesPoster(commands.Cog):
             if not channel:
                 return False
 
-            # Deletar mensagem anterior
-            if sticky_data.get("last_message_id"):
-                try:
-                    old_message = await channel.fetch_message(int(sticky_data["last_message_id"]))
-                    await old_message.delete()
-                except:
-                    pass
-
-            # Preparar conteúdo
-            content = sticky_data.get("content", "")
-            embed = None
-
-            if sticky_data.get("embed_data"):
-                try:
-                    import json
-
-                    embed_dict = json.loads(sticky_data["embed_data"])
-                    embed = discord.Embed.from_dict(embed_dict)
-                except:
-                    pass
-
-            # Postar
-            if content or embed:
-                new_message = await channel.send(content=content or None, embed=embed)
-
-                # Atualizar
-                await database.run(
-                    "UPDATE sticky_messages SET last_message_id = ?, last_posted = ? WHERE id = ?",
-                    (str(new_message.id), discord.utils.utcnow().isoformat(), sticky_data["id"]),
-                )
-
-                return True
-
-            return False
+            await database.stickies.load()
+            return await database.stickies.repost(channel) is not None
 
         except Exception as e:
             print(f"❌ Erro forçando repost de sticky: {e}")
@@ -2,45 +2,67 @@
 Suggestion Expired Handler - Gerencia expiração de sugestões
 """
 
-import sys
-from pathlib import Path
+from datetime import datetime
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
+from ..utils.scheduler import ScheduledEvent
 
 
 class SuggestionExpiredHandler(commands.Cog):
+    """
+    Expiração de sugestões.
+
+    Cada sugestão pendente com ``expires_at`` tem um evento ``suggestion_expire``
+    agendado (chave = ID da sugestão). Ao carregar, as sugestões que ainda não
+    têm evento pendente são agendadas; quem gravar ``expires_at`` deve chamar
+    ``schedule_suggestion_expiry``.
+    """
+
     def __init__(self, bot):
         self.bot = bot
-        self.check_expired_suggestions.start()
+
+    async def cog_load(self):
+        database.scheduler.register("suggestion_expire", self.on_suggestion_expire_event)
+        await self.backfill_expirations()
 
     def cog_unload(self):
-        self.check_expired_suggestions.cancel()
+        database.scheduler.unregister("suggestion_expire")
 
-    @tasks.loop(hours=1)  # Verificar a cada hora
-    async def check_expired_suggestions(self):
-        """Verificar sugestões expiradas"""
+    async def backfill_expirations(self) -> int:
+        """Agendar a expiração das sugestões pendentes que ainda não têm evento"""
         try:
-            # Buscar sugestões que expiraram
-            current_time = discord.utils.utcnow().isoformat()
-
-            expired_suggestions = await database.fetchall(
-                "SELECT * FROM suggestions WHERE expires_at <= ? AND status = 'pending'",
-                (current_time,),
+            rows = await database.get_all(
+                """SELECT s.id, s.expires_at FROM suggestions s
+                   WHERE s.status = 'pending' AND s.expires_at IS NOT NULL
+                   AND NOT EXISTS (
+                       SELECT 1 FROM scheduled_events e
+                       WHERE e.event_type = 'suggestion_expire'
+                       AND e.event_key = CAST(s.id AS TEXT)
+                       AND e.status = 'pending')"""
             )
-
-            for suggestion in expired_suggestions:
-                await self.handle_expired_suggestion(suggestion)
+            scheduled = 0
+            for row in rows:
+                if await schedule_suggestion_expiry(row["id"], row["expires_at"]):
+                    scheduled += 1
+            if scheduled:
+                print(f"⏰ {scheduled} expirações de sugestões agendadas")
+            return scheduled
 
         except Exception as e:
-            print(f"❌ Erro verificando sugestões expiradas: {e}")
-
-    @check_expired_suggestions.before_loop
-    async def before_check_expired_suggestions(self):
-        await self.bot.wait_until_ready()
+            print(f"❌ Erro agendando expirações de sugestões: {e}")
+            return 0
+
+    async def on_suggestion_expire_event(self, event: ScheduledEvent):
+        """Executor do evento agendado ``suggestion_expire``"""
+        suggestion = await database.get(
+            "SELECT * FROM suggestions WHERE id = ? AND status = 'pending'",
+            (event.data["suggestion_id"],),
+        )
+        if suggestion:
+            await self.handle_expired_suggestion(suggestion)
 
     async def handle_expired_suggestion(self, suggestion):
         """Tratar sugestão expirada"""
@@ -79,5 +101,32 @@ class SuggestionExpiredHandler(commands.Cog):
             print(f"❌ Erro tratando sugestão expirada: {e}")
 
 
+async def schedule_suggestion_expiry(suggestion_id, expires_at) -> bool:
+    """
+    Agendar (ou reagendar) a expiração de uma sugestão
+
+    Args:
+        suggestion_id: ID da sugestão
+        expires_at: ``datetime`` ou texto ISO 8601 gravado em ``suggestions.expires_at``
+
+    Returns:
+        True se o evento foi agendado
+    """
+    if isinstance(expires_at, str):
+        try:
+            expires_at = datetime.fromisoformat(expires_at)
+        except ValueError:
+            print(f"⚠️ expires_at inválido na sugestão {suggestion_id}: {expires_at!r}")
+            return False
+
+    await database.scheduler.schedule(
+        "suggestion_expire",
+        expires_at,
+        {"suggestion_id": suggestion_id},
+        key=str(suggestion_id),
+    )
+    return True
+
+
 async def setup(bot):
     await bot.add_cog(SuggestionExpiredHandler(bot))
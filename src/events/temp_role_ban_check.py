@@ -2,192 +2,121 @@
 Temp Role Ban Check - Sistema de verificação de bans temporários
 """
 
-import sys
-from pathlib import Path
-
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
+from ..utils.scheduler import ScheduledEvent
 
 
 class TempRoleBanCheck(commands.Cog):
+    """
+    Expiração de bans, mutes e roles temporários.
+
+    Quem aplica a punição agenda o fim dela no agendador, com os dados da
+    punição (guild_id, user_id, duration, reason, created_at...):
+    ``database.scheduler.schedule("temp_ban", expires_at, dados)`` (ver
+    ``ModerationHandler.schedule_expiry`` na auto-moderação por warnings).
+    """
+
+    # Tipo de evento -> nome do método executor
+    EVENT_HANDLERS = {
+        "temp_ban": "remove_temp_ban",
+        "temp_mute": "remove_temp_mute",
+        "temp_role": "remove_temp_role",
+    }
+
     def __init__(self, bot):
         self.bot = bot
-        self.check_temp_bans.start()
-
-    def cog_unload(self):
-        self.check_temp_bans.cancel()
-
-    @tasks.loop(minutes=1)  # Verificar a cada minuto
-    async def check_temp_bans(self):
-        """Verificar bans temporários expirados"""
-        try:
-            # Buscar bans expirados
-            expired_bans = await database.fetchall(
-                "SELECT * FROM temp_bans WHERE expires_at <= ? AND active = 1",
-                (discord.utils.utcnow().isoformat(),),
-            )
-
-            for ban in expired_bans:
-                await self.remove_temp_ban(ban)
-
-            # Buscar mutes expirados
-            expired_mutes = await database.fetchall(
-                "SELECT * FROM temp_mutes WHERE expires_at <= ? AND active = 1",
-                (discord.utils.utcnow().isoformat(),),
-            )
-
-            for mute in expired_mutes:
-                await self.remove_temp_mute(mute)
-
-            # Buscar roles temporários expirados
-            expired_roles = await database.fetchall(
-                "SELECT * FROM temp_roles WHERE expires_at <= ? AND active = 1",
-                (discord.utils.utcnow().isoformat(),),
-            )
 
-            for role_data in expired_roles:
-                await self.remove_temp_role(role_data)
+    async def cog_load(self):
+        """Registrar os executores no agendador"""
+        for event_type, method in self.EVENT_HANDLERS.items():
+            database.scheduler.register(event_type, getattr(self, method))
 
-        except Exception as e:
-            print(f"❌ Erro verificando bans temporários: {e}")
-
-    @check_temp_bans.before_loop
-    async def before_check_temp_bans(self):
-        """Aguardar bot ficar online"""
-        await self.bot.wait_until_ready()
+    def cog_unload(self):
+        for event_type in self.EVENT_HANDLERS:
+            database.scheduler.unregister(event_type)
 
-    async def remove_temp_ban(self, ban_data):
+    async def remove_temp_ban(self, event: ScheduledEvent):
         """Remover ban temporário"""
-        try:
-            guild = self.bot.get_guild(int(ban_data["guild_id"]))
-            if not guild:
-                return
-
-            user_id = int(ban_data["user_id"])
+        ban_data = event.data
+        guild = self.bot.get_guild(int(ban_data["guild_id"]))
+        if not guild:
+            return False
 
-            # Verificar se usuário ainda está banido
-            try:
-                ban_entry = await guild.fetch_ban(discord.Object(id=user_id))
+        user_id = int(ban_data["user_id"])
 
-                # Desbanir usuário
-                await guild.unban(
-                    discord.Object(id=user_id),
-                    reason=f"Ban temporário expirado - Duração: {ban_data.get('duration', 'N/A')}",
-                )
-
-                # Marcar como inativo no banco
-                await database.run(
-                    "UPDATE temp_bans SET active = 0, removed_at = ? WHERE id = ?",
-                    (discord.utils.utcnow().isoformat(), ban_data["id"]),
-                )
-
-                # Log do desban
-                await self.log_temp_ban_removal(guild, user_id, ban_data)
-
-                print(f"✅ Ban temporário removido: {user_id} em {guild.name}")
-
-            except discord.NotFound:
-                # Usuário já foi desbanido manualmente
-                await database.run(
-                    "UPDATE temp_bans SET active = 0, removed_at = ? WHERE id = ?",
-                    (discord.utils.utcnow().isoformat(), ban_data["id"]),
-                )
-
-        except Exception as e:
-            print(f"❌ Erro removendo ban temporário: {e}")
-
-    async def remove_temp_mute(self, mute_data):
-        """Remover mute temporário"""
         try:
-            guild = self.bot.get_guild(int(mute_data["guild_id"]))
-            if not guild:
-                return
-
-            member = guild.get_member(int(mute_data["user_id"]))
-            if not member:
-                # Usuário saiu do servidor
-                await database.run(
-                    "UPDATE temp_mutes SET active = 0, removed_at = ? WHERE id = ?",
-                    (discord.utils.utcnow().isoformat(), mute_data["id"]),
-                )
-                return
+            # Desbanir usuário
+            await guild.unban(
+                discord.Object(id=user_id),
+                reason=f"Ban temporário expirado - Duração: {ban_data.get('duration', 'N/A')}",
+            )
+        except discord.NotFound:
+            # Usuário já foi desbanido manualmente
+            return True
 
-            # Buscar role de mute
-            mute_role = discord.utils.get(guild.roles, name="Muted")
-            if not mute_role:
-                # Role de mute não existe mais
-                await database.run(
-                    "UPDATE temp_mutes SET active = 0, removed_at = ? WHERE id = ?",
-                    (discord.utils.utcnow().isoformat(), mute_data["id"]),
-                )
-                return
+        # Log do desban
+        await self.log_temp_ban_removal(guild, user_id, ban_data)
 
-            # Remover role de mute
-            if mute_role in member.roles:
-                await member.remove_roles(
-                    mute_role,
-                    reason=f"Mute temporário expirado - Duração: {mute_data.get('duration', 'N/A')}",
-                )
+        print(f"✅ Ban temporário removido: {user_id} em {guild.name}")
+        return True
 
-            # Marcar como inativo
-            await database.run(
-                "UPDATE temp_mutes SET active = 0, removed_at = ? WHERE id = ?",
-                (discord.utils.utcnow().isoformat(), mute_data["id"]),
+    async def remove_temp_mute(self, event: ScheduledEvent):
+        """Remover mute temporário"""
+        mute_data = event.data
+        guild = self.bot.get_guild(int(mute_data["guild_id"]))
+        if not guild:
+            return False
+
+        member = guild.get_member(int(mute_data["user_id"]))
+        if not member:
+            # Usuário saiu do servidor
+            return True
+
+        # Buscar role de mute
+        mute_role = discord.utils.get(guild.roles, name="Muted")
+        if not mute_role:
+            # Role de mute não existe mais
+            return True
+
+        # Remover role de mute
+        if mute_role in member.roles:
+            await member.remove_roles(
+                mute_role,
+                reason=f"Mute temporário expirado - Duração: {mute_data.get('duration', 'N/A')}",
             )
 
-            # Log do unmute
-            await self.log_temp_mute_removal(guild, member, mute_data)
+        # Log do unmute
+        await self.log_temp_mute_removal(guild, member, mute_data)
 
-            print(f"✅ Mute temporário removido: {member} em {guild.name}")
+        print(f"✅ Mute temporário removido: {member} em {guild.name}")
+        return True
 
-        except Exception as e:
-            print(f"❌ Erro removendo mute temporário: {e}")
-
-    async def remove_temp_role(self, role_data):
+    async def remove_temp_role(self, event: ScheduledEvent):
         """Remover role temporário"""
-        try:
-            guild = self.bot.get_guild(int(role_data["guild_id"]))
-            if not guild:
-                return
-
-            member = guild.get_member(int(role_data["user_id"]))
-            if not member:
-                # Usuário saiu do servidor
-                await database.run(
-                    "UPDATE temp_roles SET active = 0, removed_at = ? WHERE id = ?",
-                    (discord.utils.utcnow().isoformat(), role_data["id"]),
-                )
-                return
-
-            role = guild.get_role(int(role_data["role_id"]))
-            if not role:
-                # Role foi deletado
-                await database.run(
-                    "UPDATE temp_roles SET active = 0, removed_at = ? WHERE id = ?",
-                    (discord.utils.utcnow().isoformat(), role_data["id"]),
-                )
-                return
-
-            # Remover role
-            if role in member.roles:
-                await member.remove_roles(
-                    role,
-                    reason=f"Role temporário expirado - Duração: {role_data.get('duration', 'N/A')}",
-                )
-
-            # Marcar como inativo
-            await database.run(
-                "UPDATE temp_roles SET active = 0, removed_at = ? WHERE id = ?",
-                (discord.utils.utcnow().isoformat(), role_data["id"]),
+        role_data = event.data
+        guild = self.bot.get_guild(int(role_data["guild_id"]))
+        if not guild:
+            return False
+
+        member = guild.get_member(int(role_data["user_id"]))
+        role = guild.get_role(int(role_data["role_id"]))
+
+        # Remover role (usuário pode ter saído ou o role ter sido deletado)
+        if member and role and role in member.roles:
+            await member.remove_roles(
+                role,
+                reason=f"Role temporário expirado - Duração: {role_data.get('duration', 'N/A')}",
             )
-
             print(f"✅ Role temporário removido: {role.name} de {member} em {guild.name}")
 
-        except Exception as e:
-            print(f"❌ Erro removendo role temporário: {e}")
+        if role_data.get("temp_role_id"):
+            await database.run(
+                "DELETE FROM temp_roles WHERE id = ?", (role_data["temp_role_id"],)
+            )
+        return True
 
     async def log_temp_ban_removal(self, guild, user_id, ban_data):
         """Log da remoção de ban temporário"""
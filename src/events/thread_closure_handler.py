@@ -2,14 +2,25 @@
 Thread Closure Handler - Gerencia fechamento de threads
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.config import Config
+from ..utils.database import database
+from ..utils.history_scan import MessageCounter, ParticipantCounter, TranscriptRows
+
+
+def thread_transcript_row(message: discord.Message) -> dict:
+    """Linha do transcript de uma thread de ticket"""
+    return {
+        "author": str(message.author),
+        "content": message.content,
+        "timestamp": message.created_at.isoformat(),
+        "attachments": [
+            {"filename": att.filename, "url": att.url, "size": att.size}
+            for att in message.attachments
+        ],
+    }
 
 
 class ThreadClosureHandler(commands.Cog):
@@ -31,12 +42,10 @@ class ThreadClosureHandler(commands.Cog):
     async def handle_thread_closure(self, thread):
         """Tratar fechamento de thread"""
         try:
-            # Verificar se é thread de ticket
-            ticket_data = await database.fetchone(
-                "SELECT * FROM tickets WHERE channel_id = ? AND type = 'thread'", (str(thread.id),)
-            )
+            # Verificar se é thread de ticket (registro em memória)
+            ticket_data = await database.tickets.get(thread.id)
 
-            if ticket_data:
+            if ticket_data and ticket_data.get("type") == "thread":
                 await self.handle_ticket_thread_closure(thread, ticket_data)
                 return
 
@@ -66,32 +75,49 @@ class ThreadClosureHandler(commands.Cog):
                 "UPDATE tickets SET status = 'closed', closed_at = ?, closed_by = ? WHERE id = ?",
                 (discord.utils.utcnow().isoformat(), "system", ticket_data["id"]),
             )
+            database.tickets.closed(thread.id)
+
+            # Uma única leitura do histórico para o transcript e o log
+            counter, participants = MessageCounter(), ParticipantCounter()
+            rows = TranscriptRows(thread_transcript_row, limit=100)
+            await database.history.scan(
+                thread, counter, participants, rows, key=f"thread_closure:{thread.id}"
+            )
 
             # Criar transcript se configurado
-            await self.create_thread_transcript(thread, ticket_data)
+            await self.create_thread_transcript(thread, ticket_data, counter, rows)
 
             # Notificar criador se possível
             await self.notify_ticket_creator(thread, ticket_data)
 
             # Log específico do ticket
-            await self.log_ticket_thread_closure(thread, ticket_data)
+            await self.log_ticket_thread_closure(thread, ticket_data, counter, participants)
 
         except Exception as e:
             print(f"❌ Erro tratando fechamento de ticket thread: {e}")
 
-    async def create_thread_transcript(self, thread, ticket_data):
-        """Criar transcript da thread"""
+    async def create_thread_transcript(
+        self,
+        thread,
+        ticket_data,
+        counter: MessageCounter | None = None,
+        rows: TranscriptRows | None = None,
+    ):
+        """Criar transcript da thread (com os resultados de uma leitura já feita, se houver)"""
         try:
-            # Coletar mensagens da thread
-            messages = []
-            async for message in thread.history(limit=None, oldest_first=True):
-                messages.append(
-                    {
-                        "author": str(message.author),
-                        "content": message.content,
-                        "timestamp": message.created_at.isoformat(),
-                        "attachments": [att.url for att in message.attachments],
-                    }
+            if counter is None or rows is None:
+                counter = MessageCounter()
+                rows = TranscriptRows(thread_transcript_row, limit=100)
+                await database.history.scan(
+                    thread, counter, rows, key=f"thread_transcript:{thread.id}"
+                )
+            # Só as primeiras 100 mensagens são guardadas, para não sobrecarregar
+            messages = rows.rows
+
+            # Copiar os anexos guardados antes que as URLs expirem (downloads em paralelo)
+            if Config.ATTACHMENT_ARCHIVE_ENABLED:
+                await database.attachments.archive(
+                    att for message in messages for att in message["attachments"]
                 )
 
             # Salvar transcript
@@ -101,11 +127,11 @@ class ThreadClosureHandler(commands.Cog):
                 "ticket_id": ticket_data["id"],
                 "thread_id": str(thread.id),
                 "thread_name": thread.name,
-                "creator_id": ticket_data["creator_id"],
+                "creator_id": ticket_data["user_id"],
                 "created_at": ticket_data["created_at"],
                 "closed_at": discord.utils.utcnow().isoformat(),
-                "message_count": len(messages),
-                "messages": messages[:100],  # Limitar para não sobrecarregar
+                "message_count": counter.messages,
+                "messages": messages,
             }
 
             await database.run(
@@ -115,10 +141,10 @@ class ThreadClosureHandler(commands.Cog):
                 (
                     ticket_data["id"],
                     str(thread.id),
-                    ticket_data["creator_id"],
+                    ticket_data["user_id"],
                     discord.utils.utcnow().isoformat(),
                     json.dumps(transcript_data),
-                    len(messages),
+                    counter.messages,
                 ),
             )
 
@@ -128,7 +154,7 @@ class ThreadClosureHandler(commands.Cog):
     async def notify_ticket_creator(self, thread, ticket_data):
         """Notificar criador do ticket sobre fechamento"""
         try:
-            creator = self.bot.get_user(int(ticket_data["creator_id"]))
+            creator = self.bot.get_user(int(ticket_data["user_id"]))
             if not creator:
                 return
 
@@ -195,11 +221,12 @@ class ThreadClosureHandler(commands.Cog):
                 inline=True,
             )
 
-            # Contar mensagens se possível
+            # Contar mensagens se possível (leitura em streaming, sem guardar as mensagens)
             try:
-                message_count = len([msg async for msg in thread.history(limit=None)])
-                embed.add_field(name="💬 Mensagens", value=f"{message_count:,}", inline=True)
-            except:
+                counter = MessageCounter()
+                await database.history.scan(thread, counter, key=f"thread_log:{thread.id}")
+                embed.add_field(name="💬 Mensagens", value=f"{counter.messages:,}", inline=True)
+            except Exception:
                 pass
 
             embed.set_footer(text=f"Thread ID: {thread.id}")
@@ -209,7 +236,13 @@ class ThreadClosureHandler(commands.Cog):
         except Exception as e:
             print(f"❌ Erro logando fechamento de thread: {e}")
 
-    async def log_ticket_thread_closure(self, thread, ticket_data):
+    async def log_ticket_thread_closure(
+        self,
+        thread,
+        ticket_data,
+        counter: MessageCounter | None = None,
+        participants: ParticipantCounter | None = None,
+    ):
         """Log específico de fechamento de ticket thread"""
         try:
             log_channel = await self.get_log_channel(thread.guild.id)
@@ -226,7 +259,7 @@ class ThreadClosureHandler(commands.Cog):
                 inline=True,
             )
 
-            embed.add_field(name="👤 Criador", value=f"<@{ticket_data['creator_id']}>", inline=True)
+            embed.add_field(name="👤 Criador", value=f"<@{ticket_data['user_id']}>", inline=True)
 
             embed.add_field(
                 name="📅 Aberto em",
@@ -234,6 +267,15 @@ class ThreadClosureHandler(commands.Cog):
                 inline=True,
             )
 
+            if counter is not None:
+                embed.add_field(name="💬 Mensagens", value=f"{counter.messages:,}", inline=True)
+            if participants is not None and participants.counts:
+                embed.add_field(
+                    name="👥 Participantes",
+                    value=" ".join(f"<@{user_id}>" for user_id, _ in participants.top(10)),
+                    inline=True,
+                )
+
             embed.add_field(
                 name="📋 Motivo do Fechamento",
                 value="Thread arquivada automaticamente",
@@ -288,6 +330,7 @@ class ThreadClosureHandler(commands.Cog):
             await database.run(
                 "UPDATE tickets SET status = 'deleted' WHERE channel_id = ?", (str(thread_id),)
             )
+            database.tickets.closed(thread_id)
 
             # Limpar outros dados relacionados se necessário
 
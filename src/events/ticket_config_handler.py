@@ -2,14 +2,10 @@
 Ticket Config Handler - Gerencia configurações de tickets
 """
 
-import sys
-from pathlib import Path
-
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class TicketConfigHandler(commands.Cog):
@@ -20,6 +16,13 @@ class TicketConfigHandler(commands.Cog):
     async def on_guild_channel_delete(self, channel):
         """Limpar configurações quando canal é deletado"""
         try:
+            database.ticket_pool.discard(channel.id)
+
+            # Canal de ticket: só encerrar o ticket (não é referenciado pela configuração)
+            if await database.tickets.is_ticket_channel(channel.id):
+                await database.update_ticket_status(str(channel.id), "deleted")
+                return
+
             await self.cleanup_deleted_channel_configs(channel.guild.id, channel.id)
         except Exception as e:
             print(f"❌ Erro limpando configs de canal deletado: {e}")
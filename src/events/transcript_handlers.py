@@ -2,16 +2,15 @@
 Transcript Handlers - Sistema de transcrições de tickets
 """
 
-import io
-import json
-import sys
-from pathlib import Path
+import asyncio
 
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.config import Config
+from ..utils.database import database
+from ..utils.message_pipeline import MessageContext, get_message_pipeline
+from ..utils.transcript_renderer import TranscriptPart, render_ticket_transcript
 
 
 class TranscriptHandlers(commands.Cog):
@@ -19,6 +18,8 @@ class TranscriptHandlers(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        # channel_id -> mensagens esperando o arquivamento dos anexos
+        self._archiving: dict[int, set[asyncio.Task]] = {}
 
     @commands.Cog.listener()
     async def on_message_delete(self, message):
@@ -40,24 +41,24 @@ class TranscriptHandlers(commands.Cog):
         if await self.is_ticket_channel(before.channel.id):
             await self.log_updated_message(before, after)
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        """Registrar nova mensagem para transcripts"""
-        if message.author.bot or not message.guild:
-            return
+    async def cog_load(self):
+        """Registrar estágio no pipeline de mensagens"""
+        get_message_pipeline(self.bot).register("transcript", self.process_message)
 
-        # Verificar se é canal de ticket
-        if await self.is_ticket_channel(message.channel.id):
-            await self.log_new_message(message)
+    async def cog_unload(self):
+        """Remover estágio do pipeline de mensagens"""
+        get_message_pipeline(self.bot).unregister("transcript")
+
+    async def process_message(self, ctx: MessageContext):
+        """Registrar nova mensagem para transcripts"""
+        # Flag de canal de ticket resolvida uma vez por mensagem no contexto
+        if await ctx.is_ticket_channel():
+            await self.log_new_message(ctx.message)
 
     async def is_ticket_channel(self, channel_id: int) -> bool:
-        """Verificar se canal é de ticket"""
+        """Verificar se canal é de ticket (registro em memória)"""
         try:
-            result = await database.fetchone(
-                "SELECT id FROM tickets WHERE channel_id = ? AND status IN ('open', 'pending')",
-                (str(channel_id),),
-            )
-            return result is not None
+            return await database.tickets.is_ticket_channel(channel_id)
 
         except Exception as e:
             print(f"❌ Erro verificando canal de ticket: {e}")
@@ -81,20 +82,16 @@ class TranscriptHandlers(commands.Cog):
                 "type": "new",
             }
 
-            # Salvar no banco
-            await database.run(
-                """INSERT INTO transcript_messages 
-                   (channel_id, message_id, author_id, content, message_data, timestamp, action_type)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    str(message.channel.id),
-                    str(message.id),
-                    str(message.author.id),
-                    message.content,
-                    json.dumps(message_data),
-                    message.created_at.isoformat(),
-                    "new",
-                ),
+            # Gravado em lote pelo TranscriptRecorder
+            self.record_event(
+                message_data["attachments"],
+                message.channel.id,
+                message.id,
+                message.author.id,
+                message.content,
+                message_data,
+                message.created_at.isoformat(),
+                "new",
             )
 
         except Exception as e:
@@ -118,19 +115,15 @@ class TranscriptHandlers(commands.Cog):
                 "type": "deleted",
             }
 
-            await database.run(
-                """INSERT INTO transcript_messages 
-                   (channel_id, message_id, author_id, content, message_data, timestamp, action_type)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    str(message.channel.id),
-                    str(message.id),
-                    str(message.author.id),
-                    message.content,
-                    json.dumps(message_data),
-                    discord.utils.utcnow().isoformat(),
-                    "deleted",
-                ),
+            self.record_event(
+                message_data["attachments"],
+                message.channel.id,
+                message.id,
+                message.author.id,
+                message.content,
+                message_data,
+                discord.utils.utcnow().isoformat(),
+                "deleted",
             )
 
         except Exception as e:
@@ -160,225 +153,109 @@ class TranscriptHandlers(commands.Cog):
                 "type": "edited",
             }
 
-            await database.run(
-                """INSERT INTO transcript_messages 
-                   (channel_id, message_id, author_id, content, message_data, timestamp, action_type)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    str(after.channel.id),
-                    str(after.id),
-                    str(after.author.id),
-                    f"ANTES: {before.content}\\nDEPOIS: {after.content}",
-                    json.dumps(message_data),
-                    discord.utils.utcnow().isoformat(),
-                    "edited",
-                ),
+            self.record_event(
+                message_data["attachments_before"] + message_data["attachments_after"],
+                after.channel.id,
+                after.id,
+                after.author.id,
+                f"ANTES: {before.content}\\nDEPOIS: {after.content}",
+                message_data,
+                discord.utils.utcnow().isoformat(),
+                "edited",
             )
 
         except Exception as e:
             print(f"❌ Erro registrando mensagem editada: {e}")
 
-    async def generate_ticket_transcript(self, ticket_id: int, format_type: str = "html") -> str:
-        """Gerar transcript completo do ticket"""
-        try:
-            # Buscar dados do ticket
-            ticket = await database.fetchone("SELECT * FROM tickets WHERE id = ?", (ticket_id,))
-
-            if not ticket:
-                return None
+    def record_event(self, attachments: list[dict], channel_id: int, *event) -> None:
+        """Gravar um evento; com anexos, só depois de arquivá-los (em segundo plano)"""
+        if not attachments or not Config.ATTACHMENT_ARCHIVE_ENABLED:
+            database.transcripts.record(channel_id, *event)
+            return
 
-            # Buscar mensagens do transcript
-            messages = await database.fetchall(
-                "SELECT * FROM transcript_messages WHERE channel_id = ? ORDER BY timestamp",
-                (ticket["channel_id"],),
-            )
+        task = asyncio.create_task(self._archive_and_record(attachments, channel_id, *event))
+        tasks = self._archiving.setdefault(channel_id, set())
+        tasks.add(task)
 
-            if format_type == "html":
-                return await self.generate_html_transcript(ticket, messages)
-            if format_type == "txt":
-                return await self.generate_text_transcript(ticket, messages)
-            if format_type == "json":
-                return await self.generate_json_transcript(ticket, messages)
+        def done(finished: asyncio.Task) -> None:
+            tasks.discard(finished)
+            if not tasks and self._archiving.get(channel_id) is tasks:
+                del self._archiving[channel_id]
 
-            return None
+        task.add_done_callback(done)
 
-        except Exception as e:
-            print(f"❌ Erro gerando transcript: {e}")
-            return None
-
-    async def generate_html_transcript(self, ticket: dict, messages: list) -> str:
-        """Gerar transcript em formato HTML"""
+    async def _archive_and_record(self, attachments: list[dict], channel_id: int, *event) -> None:
+        """Baixar os anexos (anotados com a cópia local) e gravar o evento"""
         try:
-            guild = self.bot.get_guild(int(ticket["guild_id"]))
-            guild_name = guild.name if guild else "Servidor Desconhecido"
-
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <title>Transcript - Ticket #{ticket["id"]}</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-                    .header {{ background-color: #7289da; color: white; padding: 20px; border-radius: 5px; }}
-                    .message {{ margin: 10px 0; padding: 10px; background-color: white; border-radius: 5px; }}
-                    .message.deleted {{ background-color: #ffebee; border-left: 4px solid #f44336; }}
-                    .message.edited {{ background-color: #fff3e0; border-left: 4px solid #ff9800; }}
-                    .author {{ font-weight: bold; color: #7289da; }}
-                    .timestamp {{ font-size: 0.8em; color: #666; }}
-                    .content {{ margin: 5px 0; }}
-                    .attachment {{ background-color: #e8f5e8; padding: 5px; margin: 5px 0; border-radius: 3px; }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>Transcript - Ticket #{ticket["id"]}</h1>
-                    <p>Servidor: {guild_name}</p>
-                    <p>Criador: <@{ticket["creator_id"]}></p>
-                    <p>Criado em: {ticket["created_at"]}</p>
-                    <p>Status: {ticket["status"]}</p>
-                </div>
-            """
-
-            for msg in messages:
-                try:
-                    msg_data = json.loads(msg["message_data"]) if msg["message_data"] else {}
-
-                    css_class = ""
-                    if msg["action_type"] == "deleted":
-                        css_class = "deleted"
-                    elif msg["action_type"] == "edited":
-                        css_class = "edited"
-
-                    author_name = msg_data.get("author_name", "Usuário Desconhecido")
-                    timestamp = msg_data.get("timestamp", msg["timestamp"])
-
-                    html_content += f"""
-                    <div class="message {css_class}">
-                        <div class="author">{author_name}</div>
-                        <div class="timestamp">{timestamp}</div>
-                        <div class="content">{msg["content"]}</div>
-                    """
-
-                    # Anexos
-                    attachments = msg_data.get("attachments", [])
-                    for att in attachments:
-                        html_content += f'<div class="attachment">📎 {att["filename"]} ({att["size"]} bytes)</div>'
-
-                    html_content += "</div>"
-
-                except Exception as e:
-                    print(f"❌ Erro processando mensagem no transcript: {e}")
-                    continue
-
-            html_content += """
-                </body>
-            </html>
-            """
-
-            return html_content
-
+            await database.attachments.archive(attachments)
         except Exception as e:
-            print(f"❌ Erro gerando HTML transcript: {e}")
-            return None
+            print(f"⚠️ Erro arquivando anexos do ticket: {e}")
+        database.transcripts.record(channel_id, *event)
+
+    async def wait_archiving(self, channel_id: int) -> None:
+        """Esperar os anexos em arquivamento de um canal"""
+        tasks = self._archiving.get(int(channel_id))
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def render_transcript_parts(
+        self, ticket_id: int, format_type: str = "html", compress: bool | None = None
+    ) -> list[TranscriptPart]:
+        """Renderizar o transcript em partes dentro do limite de anexos do servidor"""
+        ticket = await database.fetchone("SELECT * FROM tickets WHERE id = ?", (ticket_id,))
+        if not ticket:
+            return []
+
+        await self.wait_archiving(int(ticket["channel_id"]))
+        guild = self.bot.get_guild(int(ticket["guild_id"]))
+        max_size = guild.filesize_limit if guild else Config.TRANSCRIPT_MAX_FILE_SIZE
+        return await render_ticket_transcript(
+            database,
+            ticket,
+            format_type,
+            guild_name=guild.name if guild else "Servidor Desconhecido",
+            compress=Config.TRANSCRIPT_COMPRESS if compress is None else compress,
+            max_part_size=min(max_size, Config.TRANSCRIPT_MAX_FILE_SIZE),
+            spool_size=Config.TRANSCRIPT_SPOOL_SIZE,
+        )
 
-    async def generate_text_transcript(self, ticket: dict, messages: list) -> str:
-        """Gerar transcript em formato texto"""
+    async def generate_ticket_transcript(self, ticket_id: int, format_type: str = "html") -> str:
+        """Gerar transcript completo do ticket"""
         try:
-            guild = self.bot.get_guild(int(ticket["guild_id"]))
-            guild_name = guild.name if guild else "Servidor Desconhecido"
-
-            content = f"""
-===== TRANSCRIPT - TICKET #{ticket["id"]} =====
-Servidor: {guild_name}
-Criador: {ticket["creator_id"]}
-Criado em: {ticket["created_at"]}
-Status: {ticket["status"]}
-================================================
-
-"""
-
-            for msg in messages:
-                try:
-                    msg_data = json.loads(msg["message_data"]) if msg["message_data"] else {}
-                    author_name = msg_data.get("author_name", "Usuário Desconhecido")
-                    timestamp = msg_data.get("timestamp", msg["timestamp"])
-
-                    prefix = ""
-                    if msg["action_type"] == "deleted":
-                        prefix = "[DELETADA] "
-                    elif msg["action_type"] == "edited":
-                        prefix = "[EDITADA] "
-
-                    content += f"[{timestamp}] {prefix}{author_name}: {msg['content']}\\n"
-
-                    # Anexos
-                    attachments = msg_data.get("attachments", [])
-                    for att in attachments:
-                        content += f"    📎 Anexo: {att['filename']}\\n"
-
-                except Exception as e:
-                    print(f"❌ Erro processando mensagem no transcript texto: {e}")
-                    continue
+            parts = await self.render_transcript_parts(ticket_id, format_type, compress=False)
+            if not parts:
+                return None
 
-            return content
+            content = []
+            for part in parts:
+                with part.file:
+                    content.append(part.file.read().decode("utf-8"))
+            return "".join(content)
 
         except Exception as e:
-            print(f"❌ Erro gerando texto transcript: {e}")
+            print(f"❌ Erro gerando transcript: {e}")
             return None
 
-    async def generate_json_transcript(self, ticket: dict, messages: list) -> str:
-        """Gerar transcript em formato JSON"""
+    async def save_transcript_files(
+        self, ticket_id: int, format_type: str = "html", compress: bool | None = None
+    ) -> list[discord.File]:
+        """Salvar transcript como arquivos (um por parte)"""
         try:
-            transcript_data = {
-                "ticket": dict(ticket),
-                "messages": [],
-                "generated_at": discord.utils.utcnow().isoformat(),
-                "message_count": len(messages),
-            }
-
-            for msg in messages:
-                try:
-                    msg_data = json.loads(msg["message_data"]) if msg["message_data"] else {}
-                    transcript_data["messages"].append(
-                        {
-                            "id": msg["message_id"],
-                            "author_id": msg["author_id"],
-                            "content": msg["content"],
-                            "timestamp": msg["timestamp"],
-                            "action_type": msg["action_type"],
-                            "data": msg_data,
-                        }
-                    )
-                except Exception as e:
-                    print(f"❌ Erro processando mensagem no JSON transcript: {e}")
-                    continue
-
-            return json.dumps(transcript_data, indent=2, ensure_ascii=False)
+            parts = await self.render_transcript_parts(ticket_id, format_type, compress)
+            return [discord.File(part.file, filename=part.filename) for part in parts]
 
         except Exception as e:
-            print(f"❌ Erro gerando JSON transcript: {e}")
-            return None
+            print(f"❌ Erro salvando arquivo transcript: {e}")
+            return []
 
     async def save_transcript_file(self, ticket_id: int, format_type: str = "html") -> discord.File:
-        """Salvar transcript como arquivo"""
-        try:
-            content = await self.generate_ticket_transcript(ticket_id, format_type)
-            if not content:
-                return None
-
-            # Determinar extensão
-            extension = {"html": "html", "txt": "txt", "json": "json"}.get(format_type, "txt")
-            filename = f"ticket_{ticket_id}_transcript.{extension}"
-
-            # Criar arquivo em memória
-            file_data = io.BytesIO(content.encode("utf-8"))
-
-            return discord.File(file_data, filename=filename)
-
-        except Exception as e:
-            print(f"❌ Erro salvando arquivo transcript: {e}")
+        """Salvar transcript como arquivo (primeira parte, se houver divisão)"""
+        files = await self.save_transcript_files(ticket_id, format_type)
+        if not files:
             return None
+        for extra in files[1:]:
+            extra.close()
+        return files[0]
 
 
 async def setup(bot):
@@ -3,14 +3,12 @@ Updates Handler - Gerencia atualizações do bot
 """
 
 import os
-import sys
 from pathlib import Path
 
 import discord
 from discord.ext import commands
 
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.database import database
+from ..utils.database import database
 
 
 class UpdatesHandler(commands.Cog):
@@ -87,112 +85,16 @@ class UpdatesHandler(commands.Cog):
     async def run_version_migrations(self, old_version: str, new_version: str):
         """Executar migrações necessárias"""
         try:
-            # Definir migrações por versão
-            migrations = {
-                "1.1.0": self.migrate_to_v1_1_0,
-                "1.2.0": self.migrate_to_v1_2_0,
-                "2.0.0": self.migrate_to_v2_0_0,
-            }
+            # O esquema tem versão própria (PRAGMA user_version), então cada
+            # migração roda uma única vez, seja qual for o salto de versão do bot
+            applied = await database.create_tables()
 
-            # Executar migrações necessárias
-            for version, migration_func in migrations.items():
-                if self.version_greater_than(version, old_version) and self.version_less_equal(
-                    version, new_version
-                ):
-                    print(f"🔧 Executando migração para v{version}")
-                    await migration_func()
+            for migration in applied:
+                print(f"🔧 Executando migração v{migration.version}: {migration.description}")
 
         except Exception as e:
             print(f"❌ Erro executando migrações: {e}")
 
-    async def migrate_to_v1_1_0(self):
-        """Migração para versão 1.1.0"""
-        try:
-            # Criar tabelas de tickets se não existirem
-            await database.run("""
-                CREATE TABLE IF NOT EXISTS tickets (
-                    id INTEGER PRIMARY KEY,
-                    guild_id TEXT,
-                    channel_id TEXT,
-                    creator_id TEXT,
-                    status TEXT,
-                    created_at TEXT,
-                    closed_at TEXT
-                )
-            """)
-
-            # Criar tabelas de sugestões
-            await database.run("""
-                CREATE TABLE IF NOT EXISTS suggestions (
-                    id INTEGER PRIMARY KEY,
-                    guild_id TEXT,
-                    channel_id TEXT,
-                    message_id TEXT,
-                    author_id TEXT,
-                    content TEXT,
-                    status TEXT,
-                    upvotes INTEGER DEFAULT 0,
-                    downvotes INTEGER DEFAULT 0,
-                    created_at TEXT
-                )
-            """)
-
-        except Exception as e:
-            print(f"❌ Erro migração v1.1.0: {e}")
-
-    async def migrate_to_v1_2_0(self):
-        """Migração para versão 1.2.0"""
-        try:
-            # Criar tabelas de leveling
-            await database.run("""
-                CREATE TABLE IF NOT EXISTS user_levels (
-                    id INTEGER PRIMARY KEY,
-                    guild_id TEXT,
-                    user_id TEXT,
-                    xp INTEGER DEFAULT 0,
-                    level INTEGER DEFAULT 1,
-                    total_xp INTEGER DEFAULT 0,
-                    last_message TEXT
-                )
-            """)
-
-            # Criar tabelas de auto-moderação
-            await database.run("""
-                CREATE TABLE IF NOT EXISTS antispam_config (
-                    id INTEGER PRIMARY KEY,
-                    guild_id TEXT,
-                    enabled INTEGER DEFAULT 1,
-                    limite INTEGER DEFAULT 5,
-                    intervalo INTEGER DEFAULT 10
-                )
-            """)
-
-        except Exception as e:
-            print(f"❌ Erro migração v1.2.0: {e}")
-
-    async def migrate_to_v2_0_0(self):
-        """Migração para versão 2.0.0 (Python)"""
-        try:
-            # Migrar dados do formato JavaScript para Python
-            # Atualizar estruturas de banco se necessário
-
-            # Adicionar campos novos se não existirem
-            try:
-                await database.run(
-                    "ALTER TABLE guild_settings ADD COLUMN python_version TEXT DEFAULT '2.0.0'"
-                )
-            except:
-                pass  # Campo já existe
-
-            # Limpar dados incompatíveis
-            await database.run(
-                "DELETE FROM temp_sessions WHERE created_at < ?",
-                (discord.utils.utcnow().isoformat(),),
-            )
-
-        except Exception as e:
-            print(f"❌ Erro migração v2.0.0: {e}")
-
     def version_greater_than(self, version1: str, version2: str) -> bool:
         """Verificar se version1 > version2"""
         try:
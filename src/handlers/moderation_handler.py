@@ -3,17 +3,12 @@ Handler de Moderação - Sistema completo
 Gerencia bans temporários, warns, mutes, cases
 """
 
-import sys
-from datetime import datetime
-from pathlib import Path
+import time
+from datetime import datetime, timezone
 
 import discord
-from discord.ext import tasks
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
+from ..utils.database import database
 
 
 class ModerationHandler:
@@ -21,122 +16,39 @@ class ModerationHandler:
 
     def __init__(self, bot):
         self.bot = bot
-        # Iniciar task de verificação de bans temporários
-        self.check_temp_bans.start()
-        self.check_temp_mutes.start()
-
-    @tasks.loop(minutes=1)
-    async def check_temp_bans(self):
-        """Verificar e remover bans temporários expirados"""
-        try:
-            # Buscar bans temporários expirados
-            expired_bans = await database.get_expired_temp_bans()
-
-            for ban_data in expired_bans:
-                try:
-                    guild = self.bot.get_guild(int(ban_data["guild_id"]))
-                    if not guild:
-                        continue
-
-                    user_id = int(ban_data["user_id"])
-
-                    # Remover ban
-                    try:
-                        await guild.unban(
-                            discord.Object(id=user_id), reason="Ban temporário expirado"
-                        )
-
-                        # Atualizar status no banco
-                        await database.mark_temp_ban_as_expired(
-                            ban_data["guild_id"], ban_data["user_id"]
-                        )
 
-                        print(f"✅ Ban temporário removido: {user_id} no servidor {guild.name}")
-
-                        # Log do unban
-                        log_channel = await self.get_log_channel(guild)
-                        if log_channel:
-                            embed = discord.Embed(
-                                title="🔓 Ban Temporário Expirado",
-                                description=f"**Usuário:** <@{user_id}>\\n"
-                                f"**Razão:** Ban temporário expirado",
-                                color=0x00FF00,
-                                timestamp=datetime.now(),
-                            )
-                            await log_channel.send(embed=embed)
-
-                    except discord.NotFound:
-                        # Usuário não estava banido
-                        await database.mark_temp_ban_as_expired(
-                            ban_data["guild_id"], ban_data["user_id"]
-                        )
-
-                except Exception as e:
-                    print(f"❌ Erro removendo ban temporário: {e}")
-
-        except Exception as e:
-            print(f"❌ Erro verificando bans temporários: {e}")
-
-    @tasks.loop(minutes=1)
-    async def check_temp_mutes(self):
-        """Verificar e remover mutes temporários expirados"""
-        try:
-            # Buscar mutes temporários expirados
-            expired_mutes = await database.get_expired_temp_mutes()
-
-            for mute_data in expired_mutes:
-                try:
-                    guild = self.bot.get_guild(int(mute_data["guild_id"]))
-                    if not guild:
-                        continue
-
-                    member = guild.get_member(int(mute_data["user_id"]))
-                    if not member:
-                        # Marcar como expirado mesmo se membro não estiver no servidor
-                        await database.mark_temp_mute_as_expired(
-                            mute_data["guild_id"], mute_data["user_id"]
-                        )
-                        continue
-
-                    # Buscar role de mute
-                    mute_role = discord.utils.get(guild.roles, name="Muted")
-                    if mute_role and mute_role in member.roles:
-                        await member.remove_roles(mute_role, reason="Mute temporário expirado")
-
-                    # Atualizar status no banco
-                    await database.mark_temp_mute_as_expired(
-                        mute_data["guild_id"], mute_data["user_id"]
-                    )
-
-                    print(f"✅ Mute temporário removido: {member} no servidor {guild.name}")
-
-                    # Log do unmute
-                    log_channel = await self.get_log_channel(guild)
-                    if log_channel:
-                        embed = discord.Embed(
-                            title="🔊 Mute Temporário Expirado",
-                            description=f"**Usuário:** {member.mention}\\n"
-                            f"**Razão:** Mute temporário expirado",
-                            color=0x00FF00,
-                            timestamp=datetime.now(),
-                        )
-                        await log_channel.send(embed=embed)
-
-                except Exception as e:
-                    print(f"❌ Erro removendo mute temporário: {e}")
-
-        except Exception as e:
-            print(f"❌ Erro verificando mutes temporários: {e}")
-
-    @check_temp_bans.before_loop
-    async def before_check_temp_bans(self):
-        """Aguardar bot ficar pronto antes de iniciar verificação"""
-        await self.bot.wait_until_ready()
-
-    @check_temp_mutes.before_loop
-    async def before_check_temp_mutes(self):
-        """Aguardar bot ficar pronto antes de iniciar verificação"""
-        await self.bot.wait_until_ready()
+    async def schedule_expiry(
+        self,
+        event_type: str,
+        guild: discord.Guild,
+        user: discord.abc.User,
+        seconds: int,
+        reason: str,
+    ) -> None:
+        """
+        Agendar o fim de uma punição temporária (executado por TempRoleBanCheck)
+
+        Args:
+            event_type: ``temp_ban`` ou ``temp_mute``
+            guild: Servidor
+            user: Usuário punido
+            seconds: Duração da punição
+            reason: Motivo da punição
+        """
+        await database.scheduler.schedule(
+            event_type,
+            time.time() + seconds,
+            {
+                "guild_id": str(guild.id),
+                "user_id": str(user.id),
+                "duration": f"{seconds // 3600}h" if seconds >= 3600 else f"{seconds // 60}min",
+                "reason": reason,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            },
+            key=f"{guild.id}:{user.id}",
+            guild_id=guild.id,
+            created_by=self.bot.user.id,
+        )
 
     async def get_log_channel(self, guild: discord.Guild):
         """Buscar canal de logs do servidor"""
@@ -166,7 +78,13 @@ class ModerationHandler:
         """Criar novo case de moderação"""
         try:
             case_id = await database.add_moderation_case(
-                guild_id, user_id, moderator_id, action, reason, duration, evidence_url
+                guild_id,
+                user_id,
+                moderator_id,
+                action,
+                reason,
+                duration=duration,
+                evidence_url=evidence_url,
             )
 
             return case_id
@@ -327,28 +245,18 @@ class ModerationHandler:
                 if action == "mute":
                     mute_role = await self.create_mute_role(guild)
                     if mute_role:
-                        await user.add_roles(
-                            mute_role, reason=f"Auto-moderação: {warning_count} warnings"
-                        )
+                        reason = f"Auto-moderação: {warning_count} warnings"
+                        await user.add_roles(mute_role, reason=reason)
 
                         # Programar unmute em 1 hora
-                        await database.add_temp_mute(
-                            str(guild.id),
-                            str(user.id),
-                            3600,  # 1 hora
-                        )
+                        await self.schedule_expiry("temp_mute", guild, user, 3600, reason)
 
                 elif action == "temp_ban":
-                    await user.ban(
-                        reason=f"Auto-moderação: {warning_count} warnings", delete_message_days=1
-                    )
+                    reason = f"Auto-moderação: {warning_count} warnings"
+                    await user.ban(reason=reason, delete_message_days=1)
 
                     # Programar unban em 1 dia
-                    await database.add_temp_ban(
-                        str(guild.id),
-                        str(user.id),
-                        86400,  # 1 dia
-                    )
+                    await self.schedule_expiry("temp_ban", guild, user, 86400, reason)
 
                 elif action == "ban":
                     await user.ban(
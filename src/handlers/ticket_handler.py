@@ -4,16 +4,11 @@ Gerencia criação, fechamento, transcrições
 """
 
 import io
-import sys
 from datetime import datetime
-from pathlib import Path
 
 import discord
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
+from ..utils.database import database
 
 
 class TicketHandler:
@@ -84,12 +79,15 @@ class TicketHandler:
 
             channel_name = f"ticket-{ticket_number:04d}"
 
-            ticket_channel = await guild.create_text_channel(
-                name=channel_name,
-                category=category,
-                overwrites=overwrites,
-                topic=f"Ticket de {user.display_name} - #{ticket_number}",
+            # Canal pré-criado do pool (se houver), senão criar agora
+            topic = f"Ticket de {user.display_name} - #{ticket_number}"
+            ticket_channel = await database.ticket_pool.acquire(
+                guild, name=channel_name, overwrites=overwrites, category=category, topic=topic
             )
+            if ticket_channel is None:
+                ticket_channel = await guild.create_text_channel(
+                    name=channel_name, category=category, overwrites=overwrites, topic=topic
+                )
 
             # Salvar no banco de dados
             ticket_id = await database.create_ticket(
@@ -258,13 +256,8 @@ class TicketHandler:
             transcript_lines.append("=" * 50)
             transcript_lines.append("")
 
-            # Buscar mensagens do canal
-            messages = []
-            async for message in channel.history(limit=None, oldest_first=True):
-                messages.append(message)
-
-            # Processar mensagens
-            for message in messages:
+            # Processar mensagens (lidas em streaming, sem guardar a lista)
+            async for message in database.history.iterate(channel):
                 timestamp = message.created_at.strftime("%d/%m/%Y %H:%M:%S")
                 author = f"{message.author.display_name} ({message.author.id})"
 
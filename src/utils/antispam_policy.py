@@ -0,0 +1,445 @@
+"""
+Política de Antispam Compilada
+Um único modelo de configuração por servidor, montado a partir das colunas
+de antispam_config, do JSON config_data e de guild_settings, e mantido em
+memória até a próxima gravação
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .cache import TTLCache
+from .join_burst import JOIN_RAID_ACTIONS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import discord
+
+    from .database import Database
+
+# Ações de punição, da mais leve para a mais grave
+ACTIONS: tuple[str, ...] = ("delete", "warn", "mute", "kick", "ban")
+
+# Verificações na ordem padrão de avaliação (mesmos nomes das regras de /antispam-rules)
+CHECKS: tuple[str, ...] = (
+    "spam_messages",
+    "excessive_mentions",
+    "excessive_caps",
+    "repeated_chars",
+    "excessive_emojis",
+    "suspicious_links",
+    "duplicate_content",
+)
+
+DEFAULT_ESCALATION: tuple[tuple[int, str], ...] = (
+    (1, "warn"),
+    (2, "mute"),
+    (3, "kick"),
+    (4, "ban"),
+)
+
+# Escada antiga do config_data: nº da violação -> ação
+LEGACY_ACTION_STEPS: dict[str, int] = {
+    "first_violation": 1,
+    "second_violation": 2,
+    "third_violation": 3,
+    "persistent_violation": 4,
+}
+
+# Maior limite de mensagens aceito por /antispam-rules; o rastreador de taxa
+# guarda ao menos MAX_MESSAGES_LIMIT + 1 timestamps por usuário
+MAX_MESSAGES_LIMIT: int = 50
+
+# Parâmetros das regras (config_data["rules"][regra][chave] -> campo da política)
+RULE_FIELDS: dict[str, dict[str, str]] = {
+    "spam_messages": {"max_messages": "max_messages", "time_window": "time_window"},
+    "duplicate_content": {"max_duplicates": "max_duplicates"},
+    "excessive_mentions": {"max_mentions": "max_mentions"},
+    "excessive_emojis": {"max_emojis": "max_emojis"},
+    "excessive_caps": {"max_percentage": "max_caps_percentage"},
+}
+
+UPSERT_QUERY = """
+    INSERT INTO antispam_config (guild_id, enabled, limite, intervalo, acao, config_data)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(guild_id) DO UPDATE SET
+        enabled = excluded.enabled,
+        limite = excluded.limite,
+        intervalo = excluded.intervalo,
+        acao = excluded.acao,
+        config_data = excluded.config_data,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def _parse_json(raw: Any) -> dict[str, Any]:
+    """Aceitar dict ou texto JSON; qualquer outra coisa vira dict vazio"""
+    if isinstance(raw, dict):
+        return raw
+    if isinstance(raw, str) and raw:
+        try:
+            parsed = json.loads(raw)
+        except ValueError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    return {}
+
+
+def _ids(values: Iterable[Any] | None) -> frozenset[int]:
+    """Converter uma lista de IDs (texto ou número) em frozenset de int"""
+    result: set[int] = set()
+    for value in values or ():
+        try:
+            result.add(int(value))
+        except (TypeError, ValueError):
+            continue
+    return frozenset(result)
+
+
+def _steps(values: Iterable[Any] | None) -> list[tuple[int, str]]:
+    """Converter degraus ``(limite, ação)`` em tuplas, ignorando os malformados"""
+    result: list[tuple[int, str]] = []
+    for step in values or ():
+        try:
+            result.append((int(step[0]), str(step[1])))
+        except (TypeError, ValueError, IndexError, KeyError):
+            continue
+    return result
+
+
+def _action(value: Any, default: str) -> str:
+    """Validar o nome de uma ação"""
+    value = str(value or "").lower()
+    return value if value in ACTIONS else default
+
+
+@dataclass(frozen=True, slots=True)
+class AntispamPolicy:
+    """Configuração de antispam compilada de um servidor (imutável)"""
+
+    enabled: bool = False
+    max_messages: int = 5
+    time_window: float = 10.0
+    # Ação aplicada antes do primeiro degrau da escada
+    action: str = "delete"
+    delete_messages: bool = True
+    auto_mute: bool = True
+    mute_duration: int = 300
+    warn_message: str = "⚠️ Você está enviando mensagens muito rapidamente!"
+    # (nº de violações, ação), em ordem crescente
+    escalation: tuple[tuple[int, str], ...] = DEFAULT_ESCALATION
+    # Verificações ativas, na ordem de avaliação
+    checks: tuple[str, ...] = CHECKS
+    max_duplicates: int = 3
+    max_mentions: int = 5
+    max_emojis: int = 10
+    max_caps_percentage: float = 70.0
+    exempt_users: frozenset[int] = field(default_factory=frozenset)
+    exempt_roles: frozenset[int] = field(default_factory=frozenset)
+    exempt_channels: frozenset[int] = field(default_factory=frozenset)
+    raid_min_authors: int = 4
+    raid_min_channels: int = 3
+    raid_window: float = 60.0
+    # Modo raid de entradas: entradas na janela e punição das contas novas
+    join_raid_threshold: int = 10
+    join_raid_window: float = 10.0
+    join_raid_action: str = "none"
+
+    @classmethod
+    def compile(
+        cls, row: dict[str, Any] | None = None, settings: dict[str, Any] | None = None
+    ) -> AntispamPolicy:
+        """
+        Montar a política a partir das fontes existentes
+
+        Precedência (da menor para a maior): padrões,
+        ``guild_settings.antispam_config``, colunas de ``antispam_config`` e
+        o JSON ``config_data`` (incluindo ``rules`` de /antispam-rules).
+
+        Args:
+            row: Linha de antispam_config (ou None)
+            settings: Linha de guild_settings (ou None)
+
+        Returns:
+            AntispamPolicy pronta para o caminho quente
+        """
+        values: dict[str, Any] = {}
+        settings = settings or {}
+        row = row or {}
+
+        # 1. guild_settings: flag antispam_enabled + antispam_config (coluna ou settings_json)
+        legacy = _parse_json(settings.get("antispam_config")) or _parse_json(
+            _parse_json(settings.get("settings_json")).get("antispam_config")
+        )
+        if "antispam_enabled" in settings:
+            values["enabled"] = bool(settings["antispam_enabled"])
+        for source, target in (
+            ("message_limit", "max_messages"),
+            ("time_window", "time_window"),
+            ("action", "action"),
+            ("mute_duration", "mute_duration"),
+            ("raid_min_authors", "raid_min_authors"),
+            ("raid_min_channels", "raid_min_channels"),
+            ("raid_window", "raid_window"),
+            ("join_raid_threshold", "join_raid_threshold"),
+            ("join_raid_window", "join_raid_window"),
+            ("join_raid_action", "join_raid_action"),
+        ):
+            if legacy.get(source) is not None:
+                values[target] = legacy[source]
+
+        # 2. Colunas de antispam_config
+        escalation: list[tuple[int, str]] | None = None
+        if row:
+            if row.get("enabled") is not None:
+                values["enabled"] = bool(row["enabled"])
+            for source, target in (
+                ("limite", "max_messages"),
+                ("intervalo", "time_window"),
+                ("acao", "action"),
+            ):
+                if row.get(source) is not None:
+                    values[target] = row[source]
+            thresholds = [
+                (row.get(f"{action}_threshold"), action)
+                for action in ("warn", "mute", "kick", "ban")
+            ]
+            if any(threshold is not None for threshold, _ in thresholds):
+                escalation = _steps((t, a) for t, a in thresholds if t is not None)
+
+        # 3. config_data (salvo por /antispam-setup, /antispam-whitelist e /antispam-rules)
+        config = _parse_json(row.get("config_data"))
+        for key in (
+            "enabled",
+            "max_messages",
+            "time_window",
+            "action",
+            "delete_messages",
+            "auto_mute",
+            "mute_duration",
+            "warn_message",
+            "max_duplicates",
+            "max_mentions",
+            "max_emojis",
+            "max_caps_percentage",
+            "raid_min_authors",
+            "raid_min_channels",
+            "raid_window",
+            "join_raid_threshold",
+            "join_raid_window",
+            "join_raid_action",
+        ):
+            if config.get(key) is not None:
+                values[key] = config[key]
+
+        if isinstance(config.get("escalation"), list):
+            escalation = _steps(config["escalation"])
+        elif isinstance(config.get("actions"), dict):
+            escalation = [
+                (LEGACY_ACTION_STEPS[name], action)
+                for name, action in config["actions"].items()
+                if name in LEGACY_ACTION_STEPS
+            ]
+
+        order = config.get("check_order")
+        checks = [name for name in order if name in CHECKS] if isinstance(order, list) else []
+        checks += [name for name in CHECKS if name not in checks]
+        rules = config.get("rules") if isinstance(config.get("rules"), dict) else {}
+        for rule, options in rules.items():
+            if not isinstance(options, dict):
+                continue
+            if options.get("enabled") is False and rule in checks:
+                checks.remove(rule)
+            for source, target in RULE_FIELDS.get(rule, {}).items():
+                if options.get(source) is not None:
+                    values[target] = options[source]
+
+        defaults = cls()
+        steps = list(DEFAULT_ESCALATION)
+        if escalation:
+            # Um degrau por limite; o último definido prevalece
+            steps = sorted({t: _action(action, "warn") for t, action in escalation}.items())
+        return cls(
+            enabled=bool(values.get("enabled", defaults.enabled)),
+            max_messages=min(
+                MAX_MESSAGES_LIMIT,
+                max(1, int(values.get("max_messages", defaults.max_messages))),
+            ),
+            time_window=max(1.0, float(values.get("time_window", defaults.time_window))),
+            action=_action(values.get("action"), defaults.action),
+            delete_messages=bool(values.get("delete_messages", defaults.delete_messages)),
+            auto_mute=bool(values.get("auto_mute", defaults.auto_mute)),
+            mute_duration=max(0, int(values.get("mute_duration", defaults.mute_duration))),
+            warn_message=str(values.get("warn_message") or defaults.warn_message),
+            escalation=tuple((max(1, threshold), action) for threshold, action in steps),
+            checks=tuple(checks),
+            max_duplicates=int(values.get("max_duplicates", defaults.max_duplicates)),
+            max_mentions=int(values.get("max_mentions", defaults.max_mentions)),
+            max_emojis=int(values.get("max_emojis", defaults.max_emojis)),
+            max_caps_percentage=float(
+                values.get("max_caps_percentage", defaults.max_caps_percentage)
+            ),
+            exempt_users=_ids(config.get("whitelist_users")),
+            exempt_roles=_ids(config.get("ignored_roles")),
+            exempt_channels=_ids(config.get("ignored_channels")),
+            raid_min_authors=int(values.get("raid_min_authors", defaults.raid_min_authors)),
+            raid_min_channels=int(values.get("raid_min_channels", defaults.raid_min_channels)),
+            raid_window=float(values.get("raid_window", defaults.raid_window)),
+            join_raid_threshold=max(
+                2, int(values.get("join_raid_threshold", defaults.join_raid_threshold))
+            ),
+            join_raid_window=max(
+                1.0, float(values.get("join_raid_window", defaults.join_raid_window))
+            ),
+            join_raid_action=(
+                action
+                if (action := str(values.get("join_raid_action") or "").lower())
+                in JOIN_RAID_ACTIONS
+                else defaults.join_raid_action
+            ),
+        )
+
+    def is_exempt(self, member: discord.Member | discord.User, channel_id: int) -> bool:
+        """
+        Verificar se o autor ou o canal está isento
+
+        Args:
+            member: Autor da mensagem
+            channel_id: Canal da mensagem
+
+        Returns:
+            True para whitelist, role ou canal ignorado, ou quem gerencia mensagens
+        """
+        if member.id in self.exempt_users or channel_id in self.exempt_channels:
+            return True
+        roles = getattr(member, "roles", ())
+        if self.exempt_roles and any(role.id in self.exempt_roles for role in roles):
+            return True
+        permissions = getattr(member, "guild_permissions", None)
+        return bool(permissions and permissions.manage_messages)
+
+    def action_for(self, violations: int) -> str:
+        """
+        Ação da escada para o número de violações
+
+        Args:
+            violations: Violações acumuladas (incluindo a atual)
+
+        Returns:
+            Ação do maior degrau alcançado, ou ``action`` se nenhum foi alcançado
+        """
+        selected = self.action
+        for threshold, action in self.escalation:
+            if violations < threshold:
+                break
+            selected = action
+        return selected
+
+
+class AntispamPolicyStore:
+    """
+    Políticas compiladas por servidor, em memória.
+
+    O caminho quente (``get``) só consulta o banco na primeira mensagem de um
+    servidor; gravações feitas por ``save`` trocam a política em memória na
+    hora, e ``invalidate`` descarta a versão compilada após escritas externas.
+    """
+
+    def __init__(self, database: Database, max_size: int = 5000, ttl: float = 3600.0) -> None:
+        """
+        Inicializa o armazenamento
+
+        Args:
+            database: Banco principal
+            max_size: Servidores com política em memória
+            ttl: Tempo (s) até recompilar mesmo sem gravações
+        """
+        self.database = database
+        self._cache: TTLCache[str, AntispamPolicy] = TTLCache(max_size=max_size, ttl=ttl)
+        self.compilations: int = 0
+
+    async def _load(self, guild_id: str) -> AntispamPolicy:
+        """Ler as fontes do banco e compilar"""
+        row = await self.database.get(
+            "SELECT * FROM antispam_config WHERE guild_id = ?", (guild_id,)
+        )
+        settings = await self.database.get_guild_settings(guild_id)
+        self.compilations += 1
+        return AntispamPolicy.compile(row, settings)
+
+    async def get(self, guild_id: str | int) -> AntispamPolicy:
+        """
+        Obter a política de um servidor
+
+        Args:
+            guild_id: ID do servidor
+
+        Returns:
+            AntispamPolicy (desativada se o servidor não configurou antispam)
+        """
+        key = str(guild_id)
+        return await self._cache.get_or_load(key, lambda: self._load(key))
+
+    async def load_config(self, guild_id: str | int) -> dict[str, Any] | None:
+        """
+        Ler o ``config_data`` salvo, para edição pelos comandos
+
+        Returns:
+            Dict do JSON salvo, ou None se o servidor não tem configuração
+        """
+        row = await self.database.get(
+            "SELECT config_data FROM antispam_config WHERE guild_id = ?", (str(guild_id),)
+        )
+        if row is None:
+            return None
+        return _parse_json(row.get("config_data"))
+
+    async def save(self, guild_id: str | int, config: dict[str, Any]) -> AntispamPolicy:
+        """
+        Gravar o ``config_data`` e trocar a política em memória
+
+        As colunas ``enabled``/``limite``/``intervalo``/``acao`` recebem os
+        valores compilados, para quem ainda lê a tabela por colunas.
+
+        Args:
+            guild_id: ID do servidor
+            config: JSON completo da configuração
+
+        Returns:
+            Política recém-compilada, já ativa no caminho quente
+        """
+        key = str(guild_id)
+        row = await self.database.get("SELECT * FROM antispam_config WHERE guild_id = ?", (key,))
+        row = {**(row or {}), "config_data": json.dumps(config)}
+        policy = AntispamPolicy.compile(row, await self.database.get_guild_settings(key))
+        await self.database.run(
+            UPSERT_QUERY,
+            (
+                key,
+                int(policy.enabled),
+                policy.max_messages,
+                int(policy.time_window),
+                policy.action,
+                row["config_data"],
+            ),
+        )
+        self.compilations += 1
+        # invalidate descarta também uma carga em andamento, que traria a versão antiga
+        self._cache.invalidate(key)
+        self._cache.set(key, policy)
+        return policy
+
+    def invalidate(self, guild_id: str | int | None = None) -> None:
+        """Descartar a política compilada de um servidor (ou de todos)"""
+        if guild_id is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate(str(guild_id))
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do cache de políticas"""
+        return {**self._cache.stats(), "compilations": self.compilations}
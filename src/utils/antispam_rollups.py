@@ -0,0 +1,179 @@
+"""
+Rollups de Estatísticas do Antispam
+Contagens pré-agregadas por hora e por dia (por ação e por usuário), mantidas
+junto com cada detecção registrada em antispam_logs
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+    from .database import Database
+
+HOUR: int = 3600
+DAY: int = 86400
+
+# Tabela de rollup -> tamanho do bucket em segundos (buckets alinhados em UTC)
+ROLLUP_TABLES: dict[str, int] = {
+    "antispam_rollup_hourly": HOUR,
+    "antispam_rollup_daily": DAY,
+}
+
+# user_id vazio = total do servidor naquele bucket
+GUILD_TOTAL: str = ""
+
+
+def _upsert_query(table: str) -> str:
+    return f"""
+        INSERT INTO {table} (guild_id, user_id, bucket, action_type, count)
+        VALUES (?, ?, ?, ?, 1)
+        ON CONFLICT(guild_id, user_id, bucket, action_type) DO UPDATE SET count = count + 1
+    """
+
+
+def _rebuild_query(table: str, size: int, per_user: bool, where: str) -> str:
+    user = "user_id" if per_user else f"'{GUILD_TOTAL}'"
+    return f"""
+        INSERT INTO {table} (guild_id, user_id, bucket, action_type, count)
+        SELECT guild_id, {user}, CAST(created_at / {size} AS INTEGER) * {size},
+               action_type, COUNT(*)
+        FROM antispam_logs {where}
+        GROUP BY 1, 2, 3, 4
+    """
+
+
+def bucket_ranges(start: float, end: float) -> list[tuple[str, int, int]]:
+    """
+    Cobrir um período com o menor número de buckets
+
+    Dias completos vêm da tabela diária; as pontas, da tabela por hora. O
+    início é arredondado para baixo até a hora cheia.
+
+    Args:
+        start: Início do período (timestamp)
+        end: Fim do período (timestamp, exclusivo)
+
+    Returns:
+        Lista de (tabela, primeiro bucket, limite exclusivo)
+    """
+    start_hour = int(start // HOUR) * HOUR
+    end = int(math.ceil(end))
+    first_day = int(math.ceil(start_hour / DAY)) * DAY
+    last_day = int(end // DAY) * DAY
+    if first_day >= last_day:
+        return [("antispam_rollup_hourly", start_hour, end)]
+
+    ranges = [("antispam_rollup_daily", first_day, last_day)]
+    if start_hour < first_day:
+        ranges.insert(0, ("antispam_rollup_hourly", start_hour, first_day))
+    if last_day < end:
+        ranges.append(("antispam_rollup_hourly", last_day, end))
+    return ranges
+
+
+async def record_detection(
+    db: aiosqlite.Connection, guild_id: str, user_id: str, action_type: str, when: float
+) -> None:
+    """
+    Somar uma detecção nos rollups (dentro da transação que grava o log)
+
+    Args:
+        db: Conexão de escrita
+        guild_id: ID do servidor
+        user_id: ID do usuário
+        action_type: Ação aplicada
+        when: Momento da detecção (timestamp)
+    """
+    for table, size in ROLLUP_TABLES.items():
+        bucket = int(when // size) * size
+        await db.executemany(
+            _upsert_query(table),
+            (
+                (guild_id, user_id, bucket, action_type),
+                (guild_id, GUILD_TOTAL, bucket, action_type),
+            ),
+        )
+
+
+async def rebuild_rollups(db: aiosqlite.Connection, guild_id: str | None = None) -> None:
+    """
+    Recalcular os rollups a partir de antispam_logs (backfill)
+
+    Args:
+        db: Conexão de escrita (dentro de uma transação)
+        guild_id: Servidor a recalcular (None = todos)
+    """
+    where, params = ("WHERE guild_id = ?", (guild_id,)) if guild_id else ("", ())
+    for table, size in ROLLUP_TABLES.items():
+        await db.execute(f"DELETE FROM {table} {where}", params)
+        for per_user in (True, False):
+            await db.execute(_rebuild_query(table, size, per_user, where), params)
+
+
+def _union(ranges: list[tuple[str, int, int]], columns: str, condition: str) -> str:
+    """SELECT de cada faixa de buckets unidos com UNION ALL"""
+    return " UNION ALL ".join(
+        f"SELECT {columns} FROM {table} WHERE guild_id = ? AND {condition} "
+        "AND bucket >= ? AND bucket < ?"
+        for table, _, _ in ranges
+    )
+
+
+async def query_stats(
+    database: Database,
+    guild_id: str,
+    start: float,
+    end: float | None = None,
+    user_id: str | None = None,
+    top: int = 5,
+) -> dict[str, Any]:
+    """
+    Estatísticas de um período servidas pelos rollups
+
+    Args:
+        database: Banco principal
+        guild_id: ID do servidor
+        start: Início do período (timestamp)
+        end: Fim do período (padrão: agora)
+        user_id: Restringir a um usuário
+        top: Quantidade de maiores infratores (ignorado com ``user_id``)
+
+    Returns:
+        ``actions`` (ação -> total), ``unique_users`` e ``top`` [(user_id, total)]
+    """
+    ranges = bucket_ranges(start, time.time() if end is None else end)
+    params: list[Any] = []
+    for _, first, last in ranges:
+        params += [guild_id, user_id or GUILD_TOTAL, first, last]
+
+    rows = await database.get_all(
+        "SELECT action_type, SUM(count) AS count FROM ("
+        + _union(ranges, "action_type, count", "user_id = ?")
+        + ") GROUP BY action_type",
+        params,
+    )
+    stats: dict[str, Any] = {
+        "actions": {row["action_type"]: row["count"] for row in rows},
+        "unique_users": 1 if user_id and rows else 0,
+        "top": [],
+    }
+    if user_id:
+        return stats
+
+    user_params: list[Any] = []
+    for _, first, last in ranges:
+        user_params += [guild_id, GUILD_TOTAL, first, last]
+    offenders = await database.get_all(
+        "SELECT user_id, SUM(count) AS violations FROM ("
+        + _union(ranges, "user_id, count", "user_id != ?")
+        + ") GROUP BY user_id ORDER BY violations DESC",
+        user_params,
+    )
+    stats["unique_users"] = len(offenders)
+    stats["top"] = [(row["user_id"], row["violations"]) for row in offenders[:top]]
+    return stats
@@ -0,0 +1,301 @@
+"""
+Arquivo de Anexos dos Tickets
+Baixa os anexos das mensagens de tickets em paralelo para um armazenamento
+local endereçado pelo conteúdo (SHA-256), antes que as URLs do Discord expirem
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, MutableMapping
+
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(slots=True, frozen=True)
+class ArchivedFile:
+    """Um anexo guardado no armazenamento local"""
+
+    sha256: str
+    # Caminho relativo à raiz do armazenamento (ex.: ``ab/abcdef....png``)
+    path: str
+    size: int
+    content_type: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Referência gravada no transcript"""
+        return {"sha256": self.sha256, "path": self.path, "size": self.size}
+
+
+def url_key(url: str) -> str:
+    """URL sem a query string (as assinaturas do CDN mudam, o arquivo não)"""
+    parts = urlsplit(url)
+    return f"{parts.netloc}{parts.path}"
+
+
+def blob_path(sha256: str, filename: str | None = None) -> str:
+    """Caminho relativo de um conteúdo: dois níveis pelo hash e a extensão original"""
+    suffix = PurePosixPath(filename or "").suffix.lower()
+    if not suffix[1:].isalnum() or len(suffix) > 10:
+        suffix = ""
+    return f"{sha256[:2]}/{sha256}{suffix}"
+
+
+class ArchiveBudget:
+    """Limite de bytes de uma chamada de ``archive`` (compartilhado pelos downloads)"""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.remaining = max_bytes
+
+    def take(self, size: int) -> bool:
+        """Reservar ``size`` bytes; False se o limite seria ultrapassado"""
+        if size > self.remaining:
+            return False
+        self.remaining -= size
+        return True
+
+    def refund(self, size: int) -> None:
+        """Devolver bytes reservados e não usados (anexo pulado, com erro ou menor)"""
+        self.remaining += max(0, size)
+
+
+class AttachmentArchiver:
+    """
+    Arquivo local dos anexos de tickets.
+
+    Todos os downloads usam uma única ``aiohttp.ClientSession`` (com pool de
+    conexões), no máximo ``max_concurrency`` ao mesmo tempo. Cada arquivo é
+    gravado por streaming em um temporário enquanto o SHA-256 é calculado e
+    depois movido para ``<raiz>/<2 primeiros>/<hash><ext>``: o mesmo conteúdo
+    (reenviado ou citado em outro ticket) é guardado uma vez só. As URLs já
+    arquivadas ficam em um mapa LRU para não baixar de novo.
+
+    Cada chamada de ``archive`` tem um limite total de bytes e cada arquivo
+    um limite próprio; anexos acima deles são pulados e continuam só com a URL.
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        *,
+        max_concurrency: int = 4,
+        max_file_size: int = 25 * 1024 * 1024,
+        max_total_bytes: int = 200 * 1024 * 1024,
+        timeout: float = 60.0,
+        max_known_urls: int = 10_000,
+    ) -> None:
+        """
+        Inicializa o arquivo
+
+        Args:
+            root: Diretório do armazenamento (definido pelo Database se None)
+            max_concurrency: Downloads simultâneos
+            max_file_size: Tamanho máximo (bytes) de um anexo
+            max_total_bytes: Bytes máximos baixados por chamada de ``archive``
+            timeout: Tempo máximo (s) de um download
+            max_known_urls: URLs arquivadas lembradas em memória
+        """
+        self.root = Path(root) if root else None
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_file_size = max_file_size
+        self.max_total_bytes = max_total_bytes
+        self.timeout = timeout
+        self.max_known_urls = max_known_urls
+
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # url_key -> arquivo já guardado
+        self._known: OrderedDict[str, ArchivedFile] = OrderedDict()
+        # url_key -> download em andamento (pedidos repetidos esperam o mesmo)
+        self._inflight: dict[str, asyncio.Future[ArchivedFile | None]] = {}
+
+        self.downloaded: int = 0
+        self.deduplicated: int = 0
+        self.bytes_downloaded: int = 0
+        self.skipped: int = 0
+        self.failed: int = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Sessão HTTP compartilhada (criada sob demanda)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def resolve(self, archived: ArchivedFile | dict[str, Any]) -> Path:
+        """Caminho absoluto de um arquivo guardado"""
+        path = archived.path if isinstance(archived, ArchivedFile) else archived["path"]
+        return self._root() / path
+
+    def _root(self) -> Path:
+        if self.root is None:
+            msg = "Diretório do arquivo de anexos não definido"
+            raise RuntimeError(msg)
+        return self.root
+
+    async def archive(
+        self, attachments: Iterable[MutableMapping[str, Any]], *, max_total_bytes: int | None = None
+    ) -> int:
+        """
+        Baixar anexos em paralelo e anotar cada um com a cópia local
+
+        Cada dicionário precisa de ``url`` (e de preferência ``filename`` e
+        ``size``); os arquivados ganham a chave ``archived`` com
+        ``ArchivedFile.to_dict()``.
+
+        Args:
+            attachments: Anexos (alterados no lugar)
+            max_total_bytes: Limite de bytes desta chamada (padrão do arquivo)
+
+        Returns:
+            Quantidade de anexos com cópia local
+        """
+        pending = [att for att in attachments if att.get("url") and "archived" not in att]
+        if not pending:
+            return 0
+        budget = ArchiveBudget(
+            self.max_total_bytes if max_total_bytes is None else max_total_bytes
+        )
+        results = await asyncio.gather(
+            *(self._archive_one(att, budget) for att in pending), return_exceptions=True
+        )
+        archived = 0
+        for att, result in zip(pending, results):
+            if isinstance(result, ArchivedFile):
+                att["archived"] = result.to_dict()
+                archived += 1
+            elif isinstance(result, Exception):
+                self.failed += 1
+                print(f"⚠️ Anexo não arquivado ({att.get('filename')}): {result}")
+        return archived
+
+    async def _archive_one(
+        self, attachment: MutableMapping[str, Any], budget: ArchiveBudget
+    ) -> ArchivedFile | None:
+        """Arquivar um anexo (ou reaproveitar a cópia/download existente)"""
+        key = url_key(attachment["url"])
+        known = self._known.get(key)
+        if known is not None:
+            self._known.move_to_end(key)
+            self.deduplicated += 1
+            return known
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.deduplicated += 1
+            return await asyncio.shield(inflight)
+
+        declared = int(attachment.get("size") or 0)
+        if declared > self.max_file_size:
+            self.skipped += 1
+            return None
+
+        future: asyncio.Future[ArchivedFile | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            async with self._semaphore:
+                result = await self._download(attachment, budget, declared)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Quem espera este download recebe o erro; evitar aviso de exceção não lida
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._inflight[key]
+
+        if result is not None:
+            self._known[key] = result
+            while len(self._known) > self.max_known_urls:
+                self._known.popitem(last=False)
+        return result
+
+    async def _download(
+        self, attachment: MutableMapping[str, Any], budget: ArchiveBudget, declared: int
+    ) -> ArchivedFile | None:
+        """Baixar para um temporário calculando o hash e mover para o armazenamento"""
+        # A reserva é feita só quando o download começa, para que as devoluções
+        # dos anexos pulados ou com erro sirvam aos que ainda estão na fila
+        if not budget.take(declared):
+            self.skipped += 1
+            return None
+        reserved = declared
+        size = 0
+        archived: ArchivedFile | None = None
+        tmp_name: str | None = None
+        try:
+            root = self._root()
+            await asyncio.to_thread(root.mkdir, parents=True, exist_ok=True)
+            digest = hashlib.sha256()
+            fd, tmp_name = tempfile.mkstemp(dir=root, prefix=".download-")
+            with os.fdopen(fd, "wb") as tmp:
+                async with self._get_session().get(attachment["url"]) as response:
+                    response.raise_for_status()
+                    content_type = response.content_type
+                    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > self.max_file_size:
+                            self.skipped += 1
+                            return None
+                        # O tamanho informado pode estar errado: reservar o excedente
+                        if size > reserved:
+                            if not budget.take(size - reserved):
+                                self.skipped += 1
+                                return None
+                            reserved = size
+                        digest.update(chunk)
+                        tmp.write(chunk)
+
+            sha256 = digest.hexdigest()
+            relative = blob_path(sha256, attachment.get("filename"))
+            target = root / relative
+            if await asyncio.to_thread(target.exists):
+                self.deduplicated += 1
+            else:
+                await asyncio.to_thread(target.parent.mkdir, parents=True, exist_ok=True)
+                await asyncio.to_thread(os.replace, tmp_name, target)
+                self.downloaded += 1
+                self.bytes_downloaded += size
+            archived = ArchivedFile(sha256, relative, size, content_type)
+            return archived
+        finally:
+            # Anexo pulado ou com erro devolve toda a reserva; o arquivado, a sobra
+            budget.refund(reserved if archived is None else reserved - size)
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    async def close(self) -> None:
+        """Fechar a sessão HTTP"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do arquivo"""
+        return {
+            "known_urls": len(self._known),
+            "inflight": len(self._inflight),
+            "downloaded": self.downloaded,
+            "deduplicated": self.deduplicated,
+            "bytes_downloaded": self.bytes_downloaded,
+            "skipped": self.skipped,
+            "failed": self.failed,
+        }
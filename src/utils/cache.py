@@ -0,0 +1,167 @@
+"""
+Cache em memória com TTL e despejo LRU
+Usado para dados lidos em todo evento (ex.: configurações do servidor)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+K = TypeVar("K", bound="Hashable")
+V = TypeVar("V")
+
+# Sentinela para diferenciar "não está no cache" de um valor None cacheado
+MISSING: Any = object()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Cache LRU com expiração por tempo.
+
+    - Entradas expiram ``ttl`` segundos após serem gravadas;
+    - Ao passar de ``max_size`` entradas, a menos usada recentemente sai;
+    - ``None`` é um valor cacheável (resultado negativo também evita query);
+    - ``get_or_load`` agrupa cargas concorrentes da mesma chave em uma só.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = 300.0) -> None:
+        """
+        Inicializa o cache
+
+        Args:
+            max_size: Número máximo de entradas
+            ttl: Tempo de vida de cada entrada em segundos
+        """
+        self.max_size: int = max(1, max_size)
+        self.ttl: float = ttl
+
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._loading: dict[K, asyncio.Future[V]] = {}
+
+        # Estatísticas
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, count=False) is not MISSING  # type: ignore[arg-type]
+
+    def get(self, key: K, *, count: bool = True) -> V:
+        """
+        Buscar valor no cache
+
+        Args:
+            key: Chave buscada
+            count: Se deve contabilizar hit/miss
+
+        Returns:
+            Valor cacheado ou ``MISSING``
+        """
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            if count:
+                self.misses += 1
+            return MISSING
+
+        self._data.move_to_end(key)
+        if count:
+            self.hits += 1
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Gravar valor no cache, despejando a entrada LRU se necessário"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        """
+        Remover uma chave do cache
+
+        Cargas em andamento da mesma chave também são descartadas, para que
+        um valor lido antes da escrita não volte a ser gravado depois dela.
+
+        Returns:
+            True se havia algo para invalidar
+        """
+        removed = self._data.pop(key, None) is not None
+        removed = self._loading.pop(key, None) is not None or removed
+        if removed:
+            self.invalidations += 1
+        return removed
+
+    def clear(self) -> None:
+        """Esvaziar o cache"""
+        self._data.clear()
+        self._loading.clear()
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """
+        Buscar valor no cache ou carregá-lo (read-through)
+
+        Args:
+            key: Chave buscada
+            loader: Corrotina que carrega o valor na ausência do cache
+
+        Returns:
+            Valor cacheado ou recém-carregado
+        """
+        value = self.get(key)
+        if value is not MISSING:
+            return value
+
+        pending = self._loading.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[V] = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+            future.cancel()
+            raise
+        except Exception as e:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+            future.set_exception(e)
+            # Evitar "exception was never retrieved" quando ninguém aguardava
+            future.exception()
+            raise
+
+        if self._loading.get(key) is future:
+            del self._loading[key]
+            self.set(key, value)
+        future.set_result(value)
+        return value
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do cache"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -36,6 +36,103 @@ class Config:
     MAX_WORKERS: int = int(os.getenv("MAX_WORKERS", "10"))
     HTTP_TIMEOUT: int = int(os.getenv("HTTP_TIMEOUT", "30"))
 
+    # Database
+    DB_READ_POOL_SIZE: int = int(os.getenv("DB_READ_POOL_SIZE", "4"))
+    DB_HEALTH_CHECK_INTERVAL: float = float(os.getenv("DB_HEALTH_CHECK_INTERVAL", "60"))
+    DB_JOURNAL_MODE: str = os.getenv("DB_JOURNAL_MODE", "WAL").upper()
+    DB_SYNCHRONOUS: str = os.getenv("DB_SYNCHRONOUS", "NORMAL").upper()
+    DB_CACHE_SIZE_KB: int = int(os.getenv("DB_CACHE_SIZE_KB", "16384"))
+    DB_MMAP_SIZE: int = int(os.getenv("DB_MMAP_SIZE", str(128 * 1024 * 1024)))
+    DB_TEMP_STORE: str = os.getenv("DB_TEMP_STORE", "MEMORY").upper()
+    DB_BUSY_TIMEOUT: float = float(os.getenv("DB_BUSY_TIMEOUT", "5"))
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256"))
+    FEATURE_DB_READ_POOL_SIZE: int = int(os.getenv("FEATURE_DB_READ_POOL_SIZE", "2"))
+
+    # Watchdog do event loop
+    LOOP_LAG_THRESHOLD_MS: float = float(os.getenv("LOOP_LAG_THRESHOLD_MS", "250"))
+    LOOP_LAG_CHECK_INTERVAL: float = float(os.getenv("LOOP_LAG_CHECK_INTERVAL", "0.1"))
+
+    # Cache de configurações dos servidores
+    GUILD_SETTINGS_CACHE_SIZE: int = int(os.getenv("GUILD_SETTINGS_CACHE_SIZE", "5000"))
+    GUILD_SETTINGS_CACHE_TTL: float = float(os.getenv("GUILD_SETTINGS_CACHE_TTL", "300"))
+    CONTENT_FILTER_CACHE_SIZE: int = int(os.getenv("CONTENT_FILTER_CACHE_SIZE", "1000"))
+    ANTISPAM_POLICY_CACHE_SIZE: int = int(os.getenv("ANTISPAM_POLICY_CACHE_SIZE", "5000"))
+    ANTISPAM_POLICY_CACHE_TTL: float = float(os.getenv("ANTISPAM_POLICY_CACHE_TTL", "3600"))
+
+    # Rastreador de taxa do antispam
+    RATE_TRACKER_MAX_KEYS: int = int(os.getenv("RATE_TRACKER_MAX_KEYS", "100000"))
+    RATE_TRACKER_CAPACITY: int = int(os.getenv("RATE_TRACKER_CAPACITY", "64"))
+    RATE_TRACKER_IDLE_TTL: float = float(os.getenv("RATE_TRACKER_IDLE_TTL", "600"))
+
+    # Detector de raid por conteúdo repetido
+    RAID_FINGERPRINT_MAX_ENTRIES: int = int(os.getenv("RAID_FINGERPRINT_MAX_ENTRIES", "50000"))
+    RAID_FINGERPRINT_TTL: float = float(os.getenv("RAID_FINGERPRINT_TTL", "120"))
+    RAID_MAX_TRACKED: int = int(os.getenv("RAID_MAX_TRACKED", "25"))
+
+    # Modo raid de entradas (resumos e punições em massa)
+    JOIN_RAID_COOLDOWN: float = float(os.getenv("JOIN_RAID_COOLDOWN", "120"))
+    JOIN_RAID_SUMMARY_INTERVAL: float = float(os.getenv("JOIN_RAID_SUMMARY_INTERVAL", "30"))
+    JOIN_RAID_ACTIONS_PER_SECOND: float = float(os.getenv("JOIN_RAID_ACTIONS_PER_SECOND", "2"))
+    JOIN_RAID_MAX_PENDING: int = int(os.getenv("JOIN_RAID_MAX_PENDING", "5000"))
+
+    # Sticky messages (repost adiado até o canal ficar em silêncio)
+    STICKY_DEBOUNCE: float = float(os.getenv("STICKY_DEBOUNCE", "3"))
+    STICKY_MAX_DELAY: float = float(os.getenv("STICKY_MAX_DELAY", "30"))
+    STICKY_FLUSH_INTERVAL: float = float(os.getenv("STICKY_FLUSH_INTERVAL", "30"))
+
+    # Envio agrupado dos canais de log
+    LOG_BATCH_WINDOW: float = float(os.getenv("LOG_BATCH_WINDOW", "2"))
+    LOG_MAX_PENDING: int = int(os.getenv("LOG_MAX_PENDING", "500"))
+    LOG_USE_WEBHOOKS: bool = os.getenv("LOG_USE_WEBHOOKS", "true").lower() == "true"
+    LOG_WEBHOOK_NAME: str = os.getenv("LOG_WEBHOOK_NAME", "Talios Logs")
+
+    # Logs de eventos (inserção em lote e partições por mês ou dia)
+    LOG_PARTITION: str = os.getenv("LOG_PARTITION", "month")
+    LOG_FLUSH_INTERVAL: float = float(os.getenv("LOG_FLUSH_INTERVAL", "5"))
+    LOG_FLUSH_MAX_PENDING: int = int(os.getenv("LOG_FLUSH_MAX_PENDING", "500"))
+    # Dias de logs mantidos; partições mais antigas são apagadas (0 = nunca apagar)
+    LOG_RETENTION_DAYS: float = float(os.getenv("LOG_RETENTION_DAYS", "0"))
+
+    # Transcripts de tickets (eventos gravados em lote, arquivos gerados em streaming)
+    TRANSCRIPT_FLUSH_INTERVAL: float = float(os.getenv("TRANSCRIPT_FLUSH_INTERVAL", "0.5"))
+    TRANSCRIPT_FLUSH_MAX_PENDING: int = int(os.getenv("TRANSCRIPT_FLUSH_MAX_PENDING", "1000"))
+    TRANSCRIPT_MAX_FILE_SIZE: int = int(os.getenv("TRANSCRIPT_MAX_FILE_SIZE", "10485760"))
+    TRANSCRIPT_SPOOL_SIZE: int = int(os.getenv("TRANSCRIPT_SPOOL_SIZE", "1048576"))
+    TRANSCRIPT_COMPRESS: bool = os.getenv("TRANSCRIPT_COMPRESS", "false").lower() == "true"
+
+    # Arquivo local dos anexos de tickets (endereçado pelo SHA-256)
+    ATTACHMENT_ARCHIVE_ENABLED: bool = (
+        os.getenv("ATTACHMENT_ARCHIVE_ENABLED", "true").lower() == "true"
+    )
+    ATTACHMENT_ARCHIVE_DIR: str = os.getenv("ATTACHMENT_ARCHIVE_DIR", "")
+    ATTACHMENT_ARCHIVE_CONCURRENCY: int = int(os.getenv("ATTACHMENT_ARCHIVE_CONCURRENCY", "4"))
+    ATTACHMENT_ARCHIVE_MAX_FILE_SIZE: int = int(
+        os.getenv("ATTACHMENT_ARCHIVE_MAX_FILE_SIZE", "26214400")
+    )
+    ATTACHMENT_ARCHIVE_MAX_TOTAL: int = int(os.getenv("ATTACHMENT_ARCHIVE_MAX_TOTAL", "209715200"))
+
+    # Leitura de histórico em streaming (mensagens entre checkpoints do cursor)
+    HISTORY_SCAN_CHECKPOINT_EVERY: int = int(os.getenv("HISTORY_SCAN_CHECKPOINT_EVERY", "1000"))
+
+    # Pool de canais de ticket pré-criados (0 = desativado, salvo ticket_config.pool_size)
+    TICKET_POOL_SIZE: int = int(os.getenv("TICKET_POOL_SIZE", "0"))
+    TICKET_POOL_INTERVAL: float = float(os.getenv("TICKET_POOL_INTERVAL", "2"))
+
+    # XP com escrita adiada (write-behind)
+    XP_FLUSH_INTERVAL: float = float(os.getenv("XP_FLUSH_INTERVAL", "10"))
+    XP_FLUSH_MAX_PENDING: int = int(os.getenv("XP_FLUSH_MAX_PENDING", "500"))
+    XP_CACHE_SIZE: int = int(os.getenv("XP_CACHE_SIZE", "50000"))
+
+    # Índice de ranking (leaderboard)
+    RANK_INDEX_MAX_GUILDS: int = int(os.getenv("RANK_INDEX_MAX_GUILDS", "500"))
+    RANK_INDEX_TTL: float = float(os.getenv("RANK_INDEX_TTL", "3600"))
+
+    # Agendador de eventos persistente
+    SCHEDULER_MAX_CONCURRENCY: int = int(os.getenv("SCHEDULER_MAX_CONCURRENCY", "4"))
+    SCHEDULER_MAX_ATTEMPTS: int = int(os.getenv("SCHEDULER_MAX_ATTEMPTS", "5"))
+    SCHEDULER_RETRY_DELAY: float = float(os.getenv("SCHEDULER_RETRY_DELAY", "5"))
+    SCHEDULER_MAX_RETRY_DELAY: float = float(os.getenv("SCHEDULER_MAX_RETRY_DELAY", "900"))
+
     # Bot info
     BOT_NAME: str = os.getenv("BOT_NAME", "Container Bot Python")
     BOT_DESCRIPTION: str = os.getenv("BOT_DESCRIPTION", "Sistema avançado de containers Discord")
@@ -49,6 +146,23 @@ class Config:
 
         return True
 
+    @classmethod
+    def get_sqlite_pragmas(cls) -> dict[str, str | int]:
+        """
+        Obter o perfil de PRAGMAs aplicado a cada conexão SQLite
+
+        Returns:
+            dict[str, str | int]: PRAGMAs na ordem em que devem ser aplicados
+        """
+        return {
+            "journal_mode": cls.DB_JOURNAL_MODE,
+            "synchronous": cls.DB_SYNCHRONOUS,
+            # Valor negativo = tamanho em KiB em vez de número de páginas
+            "cache_size": -abs(cls.DB_CACHE_SIZE_KB),
+            "mmap_size": cls.DB_MMAP_SIZE,
+            "temp_store": cls.DB_TEMP_STORE,
+            "busy_timeout": int(cls.DB_BUSY_TIMEOUT * 1000),
+        }
 
     @classmethod
     def get_log_level(cls) -> str:
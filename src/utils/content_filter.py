@@ -0,0 +1,293 @@
+"""
+Filtro de Conteúdo Compilado
+Palavras proibidas em um autômato Aho-Corasick, compilado uma vez por servidor
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .cache import MISSING, TTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Padrão de links (compilado uma única vez)
+LINK_PATTERN = re.compile(
+    r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
+    re.IGNORECASE,
+)
+
+# Substituições de leetspeak (1 caractere -> 1 caractere, preserva posições);
+# pontuação comum como "!" fica de fora para não quebrar a fronteira de palavra
+LEETSPEAK_TABLE = str.maketrans("0134578@$", "oieastbas")
+
+# Chaves do filtro em guild_settings (colunas ou settings_json)
+FILTER_KEYS: tuple[str, ...] = (
+    "filter_profanity",
+    "profanity_words",
+    "filter_whole_words",
+    "filter_leetspeak",
+    "filter_links",
+)
+
+
+def normalize(text: str, leetspeak: bool = False) -> str:
+    """
+    Normalizar texto para comparação
+
+    Args:
+        text: Texto original
+        leetspeak: Converter leetspeak (``h3ll0`` -> ``hello``)
+
+    Returns:
+        Texto em minúsculas com o mesmo tamanho do original
+    """
+    text = text.lower()
+    return text.translate(LEETSPEAK_TABLE) if leetspeak else text
+
+
+class AhoCorasick:
+    """
+    Autômato Aho-Corasick para busca de várias palavras em uma passada.
+
+    O custo da busca é proporcional ao tamanho do texto (mais as
+    ocorrências encontradas), independente da quantidade de palavras.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        Compila o autômato
+
+        Args:
+            words: Palavras (já normalizadas); vazias são ignoradas
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._length: list[int] = [0]
+        # Próximo estado na cadeia de falhas que termina uma palavra (0 = nenhum)
+        self._output: list[int] = [0]
+
+        for word in words:
+            if word:
+                self._add(word)
+        self._build()
+
+    def __len__(self) -> int:
+        return sum(1 for length in self._length if length)
+
+    def _add(self, word: str) -> None:
+        """Inserir uma palavra na trie"""
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._length.append(0)
+                self._output.append(0)
+            state = next_state
+        self._length[state] = len(word)
+
+    def _build(self) -> None:
+        """Calcular os links de falha e de saída em largura"""
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail
+                self._output[child] = fail if self._length[fail] else self._output[fail]
+
+    def search(self, text: str, whole_words: bool = False) -> tuple[int, int] | None:
+        """
+        Encontrar a primeira ocorrência de qualquer palavra
+
+        Args:
+            text: Texto normalizado
+            whole_words: Exigir que a ocorrência não esteja dentro de outra palavra
+
+        Returns:
+            (início, fim) da ocorrência, ou None
+        """
+        goto, fail, length, output = self._goto, self._fail, self._length, self._output
+        size = len(text)
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            match = state if length[state] else output[state]
+            while match:
+                start = index - length[match] + 1
+                end = index + 1
+                if not whole_words or (
+                    (start == 0 or not text[start - 1].isalnum())
+                    and (end == size or not text[end].isalnum())
+                ):
+                    return start, end
+                match = output[match]
+        return None
+
+
+@dataclass(frozen=True)
+class ContentFilter:
+    """Filtro compilado de um servidor"""
+
+    matcher: AhoCorasick | None = None
+    whole_words: bool = False
+    leetspeak: bool = False
+    block_links: bool = False
+
+    @classmethod
+    def build(
+        cls,
+        words: Iterable[str] = (),
+        *,
+        whole_words: bool = False,
+        leetspeak: bool = False,
+        block_links: bool = False,
+    ) -> ContentFilter:
+        """
+        Compilar um filtro
+
+        Args:
+            words: Palavras proibidas
+            whole_words: Só bloquear palavras inteiras (``classe`` não casa ``ass``)
+            leetspeak: Normalizar leetspeak no texto e nas palavras
+            block_links: Bloquear links
+        """
+        normalized = {normalize(str(word).strip(), leetspeak) for word in words}
+        normalized.discard("")
+        return cls(
+            matcher=AhoCorasick(normalized) if normalized else None,
+            whole_words=whole_words,
+            leetspeak=leetspeak,
+            block_links=block_links,
+        )
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any]) -> ContentFilter:
+        """Compilar o filtro a partir das configurações do servidor"""
+        options = filter_options(settings)
+        words = options.get("profanity_words") or ()
+        if isinstance(words, str):
+            # Lista salva como texto separado por vírgulas
+            words = words.split(",")
+        return cls.build(
+            words if options.get("filter_profanity") else (),
+            whole_words=bool(options.get("filter_whole_words")),
+            leetspeak=bool(options.get("filter_leetspeak")),
+            block_links=bool(options.get("filter_links")),
+        )
+
+    def find_profanity(self, content: str) -> str | None:
+        """
+        Procurar uma palavra proibida
+
+        Returns:
+            Trecho da mensagem que casou, ou None
+        """
+        if self.matcher is None or not content:
+            return None
+        found = self.matcher.search(normalize(content, self.leetspeak), self.whole_words)
+        return content[found[0] : found[1]] if found else None
+
+    def has_link(self, content: str) -> bool:
+        """Verificar se a mensagem contém um link bloqueado"""
+        return self.block_links and LINK_PATTERN.search(content) is not None
+
+
+def filter_options(settings: dict[str, Any]) -> dict[str, Any]:
+    """
+    Opções do filtro em ``settings_json``, sobrepostas pelas chaves de mesmo nome
+
+    Args:
+        settings: Linha de guild_settings (ou dict equivalente)
+
+    Returns:
+        Apenas as chaves de ``FILTER_KEYS`` presentes
+    """
+    options: dict[str, Any] = {}
+    raw = settings.get("settings_json")
+    if isinstance(raw, str) and raw:
+        try:
+            parsed = json.loads(raw)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, dict):
+            options.update((key, parsed[key]) for key in FILTER_KEYS if key in parsed)
+    options.update((key, settings[key]) for key in FILTER_KEYS if key in settings)
+    return options
+
+
+class ContentFilterCache:
+    """
+    Filtros compilados por servidor.
+
+    O filtro é recompilado apenas quando as configurações de origem mudam
+    (comparadas pelo ``settings_json`` e pelas chaves de ``FILTER_KEYS``) ou
+    quando ``invalidate`` é chamado após uma escrita nas configurações.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = 3600.0) -> None:
+        """
+        Inicializa o cache
+
+        Args:
+            max_size: Servidores com filtro compilado em memória
+            ttl: Tempo (s) até recompilar mesmo sem mudanças
+        """
+        self._cache: TTLCache[str, tuple[tuple[Any, ...], ContentFilter]] = TTLCache(
+            max_size=max_size, ttl=ttl
+        )
+        self.builds: int = 0
+
+    @staticmethod
+    def _signature(settings: dict[str, Any]) -> tuple[Any, ...]:
+        """Valores de origem do filtro (settings_json é comparado por identidade primeiro)"""
+        return (settings.get("settings_json"), *(settings.get(key) for key in FILTER_KEYS))
+
+    def get(self, guild_id: str | int, settings: dict[str, Any]) -> ContentFilter:
+        """
+        Obter o filtro compilado de um servidor
+
+        Args:
+            guild_id: ID do servidor
+            settings: Configurações atuais do servidor
+
+        Returns:
+            ContentFilter pronto para uso
+        """
+        key = str(guild_id)
+        signature = self._signature(settings)
+        cached = self._cache.get(key)
+        if cached is not MISSING and cached[0] == signature:
+            return cached[1]
+
+        content_filter = ContentFilter.from_settings(settings)
+        self._cache.set(key, (signature, content_filter))
+        self.builds += 1
+        return content_filter
+
+    def invalidate(self, guild_id: str | int | None = None) -> None:
+        """Descartar o filtro compilado de um servidor (ou de todos)"""
+        if guild_id is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate(str(guild_id))
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do cache de filtros"""
+        return {**self._cache.stats(), "builds": self.builds}
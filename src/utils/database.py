@@ -5,16 +5,42 @@ Gerenciamento completo de todas as tabelas e operações de banco
 
 from __future__ import annotations
 
-import math
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import aiosqlite
 
+from .antispam_policy import MAX_MESSAGES_LIMIT, AntispamPolicyStore
+from .antispam_rollups import query_stats, rebuild_rollups, record_detection
+from .attachment_archiver import AttachmentArchiver
+from .cache import TTLCache
+from .config import Config
+from .content_filter import ContentFilterCache
+from .db_pool import ConnectionPool
+from .feature_db import FeatureDatabase
+from .history_scan import HistoryScanner
+from .join_burst import JoinBurstMonitor, RateLimitedExecutor
+from .legacy_import import import_legacy_databases
+from .log_dispatcher import LogDispatcher
+from .log_store import LogStore
+from .migrations import run_migrations
+from .raid_detector import RaidDetector
+from .rank_index import RankIndex
+from .rate_tracker import RateTracker
+from .scheduler import Scheduler
+from .sticky_registry import StickyRegistry
+from .ticket_pool import TicketChannelPool
+from .ticket_registry import OPEN_STATUSES, TicketRegistry
+from .transcript_recorder import TranscriptRecorder
+from .xp_accumulator import XPAccumulator, calculate_level
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from datetime import datetime
 
+    from .migrations import Migration
+
 
 class Database:
     """Sistema de gerenciamento de banco de dados SQLite."""
@@ -24,6 +50,90 @@ class Database:
     def __init__(self) -> None:
         self.db_path: str | None = None
         self.connection: aiosqlite.Connection | None = None
+        self._pool: ConnectionPool | None = None
+        self._storage: FeatureDatabase | None = None
+        self.guild_settings_cache: TTLCache[str, dict[str, Any] | None] = TTLCache(
+            max_size=Config.GUILD_SETTINGS_CACHE_SIZE, ttl=Config.GUILD_SETTINGS_CACHE_TTL
+        )
+        self.content_filters: ContentFilterCache = ContentFilterCache(
+            max_size=Config.CONTENT_FILTER_CACHE_SIZE
+        )
+        self.antispam_policies: AntispamPolicyStore = AntispamPolicyStore(
+            self,
+            max_size=Config.ANTISPAM_POLICY_CACHE_SIZE,
+            ttl=Config.ANTISPAM_POLICY_CACHE_TTL,
+        )
+        self.rate_tracker: RateTracker = RateTracker(
+            max_keys=Config.RATE_TRACKER_MAX_KEYS,
+            # A contagem satura na capacidade: precisa passar do maior limite
+            capacity=max(Config.RATE_TRACKER_CAPACITY, MAX_MESSAGES_LIMIT + 1),
+            idle_ttl=Config.RATE_TRACKER_IDLE_TTL,
+        )
+        self.raid_detector: RaidDetector = RaidDetector(
+            max_entries=Config.RAID_FINGERPRINT_MAX_ENTRIES,
+            ttl=Config.RAID_FINGERPRINT_TTL,
+            max_tracked=Config.RAID_MAX_TRACKED,
+        )
+        self.join_bursts: JoinBurstMonitor = JoinBurstMonitor(
+            cooldown=Config.JOIN_RAID_COOLDOWN, summary_interval=Config.JOIN_RAID_SUMMARY_INTERVAL
+        )
+        self.bulk_actions: RateLimitedExecutor = RateLimitedExecutor(
+            rate=Config.JOIN_RAID_ACTIONS_PER_SECOND, max_pending=Config.JOIN_RAID_MAX_PENDING
+        )
+        self.log_dispatcher: LogDispatcher = LogDispatcher(
+            window=Config.LOG_BATCH_WINDOW,
+            max_pending=Config.LOG_MAX_PENDING,
+            use_webhooks=Config.LOG_USE_WEBHOOKS,
+            webhook_name=Config.LOG_WEBHOOK_NAME,
+        )
+        self.log_store: LogStore = LogStore(
+            self,
+            granularity=Config.LOG_PARTITION,
+            flush_interval=Config.LOG_FLUSH_INTERVAL,
+            max_pending=Config.LOG_FLUSH_MAX_PENDING,
+            retention_days=Config.LOG_RETENTION_DAYS,
+        )
+        self.stickies: StickyRegistry = StickyRegistry(
+            self,
+            debounce=Config.STICKY_DEBOUNCE,
+            max_delay=Config.STICKY_MAX_DELAY,
+            flush_interval=Config.STICKY_FLUSH_INTERVAL,
+        )
+        self.tickets: TicketRegistry = TicketRegistry(self)
+        self.attachments: AttachmentArchiver = AttachmentArchiver(
+            Config.ATTACHMENT_ARCHIVE_DIR or None,
+            max_concurrency=Config.ATTACHMENT_ARCHIVE_CONCURRENCY,
+            max_file_size=Config.ATTACHMENT_ARCHIVE_MAX_FILE_SIZE,
+            max_total_bytes=Config.ATTACHMENT_ARCHIVE_MAX_TOTAL,
+        )
+        self.history: HistoryScanner = HistoryScanner(
+            self, checkpoint_every=Config.HISTORY_SCAN_CHECKPOINT_EVERY
+        )
+        self.ticket_pool: TicketChannelPool = TicketChannelPool(
+            self, default_size=Config.TICKET_POOL_SIZE, interval=Config.TICKET_POOL_INTERVAL
+        )
+        self.transcripts: TranscriptRecorder = TranscriptRecorder(
+            self,
+            flush_interval=Config.TRANSCRIPT_FLUSH_INTERVAL,
+            max_pending=Config.TRANSCRIPT_FLUSH_MAX_PENDING,
+        )
+        self.xp_accumulator: XPAccumulator = XPAccumulator(
+            self,
+            flush_interval=Config.XP_FLUSH_INTERVAL,
+            max_pending=Config.XP_FLUSH_MAX_PENDING,
+            max_entries=Config.XP_CACHE_SIZE,
+        )
+        self.rank_index: RankIndex = RankIndex(
+            self, max_guilds=Config.RANK_INDEX_MAX_GUILDS, ttl=Config.RANK_INDEX_TTL
+        )
+        self.xp_accumulator.add_listener(self.rank_index.on_award)
+        self.scheduler: Scheduler = Scheduler(
+            self,
+            max_concurrency=Config.SCHEDULER_MAX_CONCURRENCY,
+            max_attempts=Config.SCHEDULER_MAX_ATTEMPTS,
+            retry_delay=Config.SCHEDULER_RETRY_DELAY,
+            max_retry_delay=Config.SCHEDULER_MAX_RETRY_DELAY,
+        )
 
     async def init(self) -> None:
         """Inicializar conexão e criar tabelas necessárias"""
@@ -38,9 +148,12 @@ class Database:
             data_dir.mkdir(parents=True, exist_ok=True)
 
             self.db_path = str(data_dir / "bot.db")
+            if self.attachments.root is None:
+                self.attachments.root = data_dir / "attachments"
 
-            # Criar tabelas
+            # Criar tabelas e trazer os dados dos bancos antigos por funcionalidade
             await self.create_tables()
+            await import_legacy_databases(self.pool, str(Path(__file__).parent.parent / "data"))
             Database._initialized = True
             print("✅ Database SQLite inicializado com sucesso!")
         except Exception as e:
@@ -51,182 +164,92 @@ class Database:
                 raise e
 
     async def get_connection(self) -> aiosqlite.Connection:
-        """Obter conexão com o banco"""
+        """Obter conexão avulsa com o banco (o chamador é responsável por fechá-la)"""
         if not self.db_path:
             msg = "Database não inicializado"
             raise RuntimeError(msg)
         return await aiosqlite.connect(self.db_path)
 
-    async def create_tables(self) -> None:
-        """Criar todas as tabelas necessárias"""
-        async with await self.get_connection() as db:
-            # Sistema de tickets
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS tickets (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    channel_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    closed_at DATETIME,
-                    status TEXT DEFAULT 'open',
-                    reason TEXT,
-                    closed_by TEXT
-                )
-            """)
-
-            # Sistema de leveling
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS user_levels (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    total_xp INTEGER DEFAULT 0,
-                    level INTEGER DEFAULT 0,
-                    messages_sent INTEGER DEFAULT 0,
-                    last_xp_gain DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(guild_id, user_id)
-                )
-            """)
-
-            # Sistema de warnings
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS warnings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    moderator_id TEXT NOT NULL,
-                    reason TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    active INTEGER DEFAULT 1
-                )
-            """)
-
-            # Sistema de casos de moderação
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS moderation_cases (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    case_id INTEGER NOT NULL,
-                    guild_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    moderator_id TEXT NOT NULL,
-                    action TEXT NOT NULL,
-                    reason TEXT,
-                    duration TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(guild_id, case_id)
-                )
-            """)
-
-            # Configurações dos servidores
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS guild_settings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT UNIQUE NOT NULL,
-                    prefix TEXT DEFAULT '!',
-                    welcome_channel TEXT,
-                    log_channel TEXT,
-                    moderation_enabled INTEGER DEFAULT 1,
-                    leveling_enabled INTEGER DEFAULT 1,
-                    settings_json TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Sistema de giveaways
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS giveaways (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    channel_id TEXT NOT NULL,
-                    message_id TEXT NOT NULL,
-                    host_id TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    winners INTEGER DEFAULT 1,
-                    end_time DATETIME NOT NULL,
-                    ended INTEGER DEFAULT 0,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Sistema de roles temporários
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS temp_roles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    role_id TEXT NOT NULL,
-                    expires_at DATETIME NOT NULL,
-                    reason TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Sistema de sticky messages
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS sticky_messages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    channel_id TEXT NOT NULL,
-                    message_content TEXT NOT NULL,
-                    embed_json TEXT,
-                    active INTEGER DEFAULT 1,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Sistema de suggestions
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS suggestions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    suggestion TEXT NOT NULL,
-                    status TEXT DEFAULT 'pending',
-                    votes_up INTEGER DEFAULT 0,
-                    votes_down INTEGER DEFAULT 0,
-                    message_id TEXT,
-                    channel_id TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Sistema de backup
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS backups (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    data_json TEXT NOT NULL,
-                    created_by TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    restored_at DATETIME
-                )
-            """)
-
-            # Sistema de autorole
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS autorole_rules (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    rule_id TEXT NOT NULL,
-                    rule_name TEXT NOT NULL,
-                    rule_data TEXT NOT NULL,
-                    is_active INTEGER DEFAULT 1,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(guild_id, rule_id)
-                )
-            """)
+    @property
+    def pool(self) -> ConnectionPool:
+        """Pool de conexões persistentes (criado sob demanda)"""
+        if not self.db_path:
+            msg = "Database não inicializado"
+            raise RuntimeError(msg)
 
-            await db.commit()
+        if self._pool is None or self._pool.closed or self._pool.db_path != self.db_path:
+            self._pool = ConnectionPool(
+                self.db_path,
+                max_readers=Config.DB_READ_POOL_SIZE,
+                health_check_interval=Config.DB_HEALTH_CHECK_INTERVAL,
+                pragmas=Config.get_sqlite_pragmas(),
+                statement_cache_size=Config.DB_STATEMENT_CACHE_SIZE,
+                busy_timeout=Config.DB_BUSY_TIMEOUT,
+                row_factory=aiosqlite.Row,
+            )
+        return self._pool
+
+    @property
+    def storage(self) -> FeatureDatabase:
+        """
+        Acesso no estilo ``FeatureDatabase`` (linhas ``aiosqlite.Row``) sobre o
+        mesmo pool, usado pelos sistemas que tinham um arquivo ``.db`` próprio
+        """
+        pool = self.pool
+        if self._storage is None or self._storage.pool is not pool:
+            self._storage = FeatureDatabase(self.db_path or "", pool=pool)
+        return self._storage
+
+    async def health_check(self) -> bool:
+        """Verificar se as conexões do pool estão saudáveis"""
+        if not self.db_path:
+            return False
+        return await self.pool.health_check()
+
+    async def close(self) -> None:
+        """Parar o agendador, gravar o estado pendente e fechar as conexões persistentes"""
+        await self.scheduler.close()
+        await self.join_bursts.close()
+        await self.bulk_actions.close()
+        await self.log_dispatcher.close()
+        await self.ticket_pool.close()
+        await self.attachments.close()
+        if self.db_path:
+            try:
+                await self.xp_accumulator.close()
+            except Exception as e:
+                print(f"❌ Erro gravando XP pendente: {e}")
+            try:
+                await self.stickies.close()
+            except Exception as e:
+                print(f"❌ Erro gravando sticky messages: {e}")
+            try:
+                await self.log_store.close()
+            except Exception as e:
+                print(f"❌ Erro gravando logs pendentes: {e}")
+            try:
+                await self.transcripts.close()
+            except Exception as e:
+                print(f"❌ Erro gravando transcripts pendentes: {e}")
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        Database._initialized = False
+
+    async def create_tables(self) -> list[Migration]:
+        """
+        Criar/atualizar todas as tabelas aplicando as migrações pendentes
+
+        Returns:
+            Migrações aplicadas nesta chamada (ver utils/migrations.py)
+        """
+        # A conexão de escrita é aberta primeiro e converte o arquivo para o
+        # journal_mode configurado (WAL persiste no próprio arquivo)
+        return await run_migrations(self.pool)
 
     async def get(self, query: str, params: Sequence[Any] = ()) -> dict[str, Any] | None:
         """Executar query SELECT e retornar um resultado"""
-        async with await self.get_connection() as db, db.execute(query, params) as cursor:
+        async with self.pool.reader() as db, db.execute(query, params) as cursor:
             row = await cursor.fetchone()
             if row:
                 # Converter para dict
@@ -238,7 +261,7 @@ class Database:
         self, query: str, params: Sequence[Any] = ()
     ) -> list[dict[str, Any]]:
         """Executar query SELECT e retornar todos os resultados"""
-        async with await self.get_connection() as db, db.execute(query, params) as cursor:
+        async with self.pool.reader() as db, db.execute(query, params) as cursor:
             rows = await cursor.fetchall()
             if rows:
                 columns = [description[0] for description in cursor.description]
@@ -247,7 +270,7 @@ class Database:
 
     async def run(self, query: str, params: Sequence[Any] = ()) -> aiosqlite.Cursor:
         """Executar query INSERT/UPDATE/DELETE"""
-        async with await self.get_connection() as db:
+        async with self.pool.writer() as db:
             cursor = await db.execute(query, params)
             await db.commit()
             return cursor.lastrowid
@@ -256,7 +279,7 @@ class Database:
         self, query: str, params_list: Sequence[Sequence[Any]]
     ) -> None:
         """Executar múltiplas queries do mesmo tipo"""
-        async with await self.get_connection() as db:
+        async with self.pool.writer() as db:
             await db.executemany(query, params_list)
             await db.commit()
 
@@ -307,8 +330,10 @@ class Database:
         moderator_id: str,
         action: str,
         reason: str | None = None,
+        duration: int | str | None = None,
+        evidence_url: str | None = None,
     ) -> int:
-        """Adicionar caso de moderação"""
+        """Adicionar caso de moderação (duração em segundos; 0/None = permanente)"""
         # Obter próximo case_id
         existing_cases = await self.get_all(
             """SELECT case_id FROM moderation_cases
@@ -319,92 +344,134 @@ class Database:
 
         await self.run(
             """INSERT INTO moderation_cases
-            (case_id, guild_id, user_id, moderator_id, action, reason)
-            VALUES (?, ?, ?, ?, ?, ?)""",
-            (next_case_id, guild_id, user_id, moderator_id, action, reason),
+            (case_id, guild_id, user_id, moderator_id, action, reason, duration)
+            VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (
+                next_case_id,
+                guild_id,
+                user_id,
+                moderator_id,
+                action,
+                reason,
+                str(duration) if duration else None,
+            ),
         )
+        if evidence_url:
+            await self.run(
+                """INSERT INTO case_attachments
+                (case_id, guild_id, attachment_url, uploaded_by) VALUES (?, ?, ?, ?)""",
+                (next_case_id, guild_id, evidence_url, moderator_id),
+            )
 
         return next_case_id
 
+    async def get_user_history(
+        self, guild_id: str, user_id: str, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        Obter o histórico de moderação do usuário em uma única consulta
+
+        Junta casos, avisos, notas e mutes (cada parte usa o índice
+        ``(guild_id, user_id, data)`` da sua tabela) do mais recente para o
+        mais antigo.
+
+        Args:
+            guild_id: ID do servidor
+            user_id: ID do usuário
+            limit: Máximo de registros de cada tipo
+
+        Returns:
+            Linhas com ``kind`` (``case``, ``warning``, ``note`` ou ``mute``),
+            ``ref_id``, ``type``, ``reason``, ``moderator_id``, ``created_at`` e ``active``
+        """
+        return await self.get_all(
+            """SELECT * FROM (
+                SELECT 'case' AS kind, case_id AS ref_id, type, reason,
+                    moderator_id, created_at, is_active AS active
+                FROM mod_cases WHERE guild_id = ? AND user_id = ?
+                ORDER BY created_at DESC LIMIT ?)
+            UNION ALL SELECT * FROM (
+                SELECT 'warning', id, 'warn', reason, moderator_id, created_at, active
+                FROM warnings WHERE guild_id = ? AND user_id = ?
+                ORDER BY created_at DESC LIMIT ?)
+            UNION ALL SELECT * FROM (
+                SELECT 'note', COALESCE(note_id, id), category, COALESCE(content, title),
+                    moderator_id, created_at, active
+                FROM user_notes WHERE guild_id = ? AND user_id = ?
+                ORDER BY created_at DESC LIMIT ?)
+            UNION ALL SELECT * FROM (
+                SELECT 'mute', id, 'mute', reason, moderator_id, applied_at, is_active
+                FROM mute_history WHERE guild_id = ? AND user_id = ?
+                ORDER BY applied_at DESC LIMIT ?)
+            ORDER BY created_at DESC""",
+            (guild_id, user_id, limit) * 4,
+        )
+
     async def get_guild_settings(self, guild_id: str) -> dict[str, Any] | None:
-        """Obter configurações do servidor"""
-        return await self.get(
-            "SELECT * FROM guild_settings WHERE guild_id = ?", (guild_id,)
+        """Obter configurações do servidor (read-through no cache em memória)"""
+        guild_id = str(guild_id)
+        settings = await self.guild_settings_cache.get_or_load(
+            guild_id,
+            lambda: self.get("SELECT * FROM guild_settings WHERE guild_id = ?", (guild_id,)),
         )
+        # Cópia rasa: quem chama pode alterar o dict sem sujar o cache
+        return dict(settings) if settings is not None else None
+
+    def invalidate_guild_settings(self, guild_id: str | None = None) -> None:
+        """Invalidar configurações cacheadas (e o que é compilado delas) de um servidor ou de todos"""
+        if guild_id is None:
+            self.guild_settings_cache.clear()
+        else:
+            self.guild_settings_cache.invalidate(str(guild_id))
+        self.content_filters.invalidate(guild_id)
+        self.antispam_policies.invalidate(guild_id)
 
     async def update_guild_settings(self, guild_id: str, **kwargs: Any) -> None:
         """Atualizar configurações do servidor"""
         if not kwargs:
             return
 
-        # Verificar se existe
-        existing = await self.get_guild_settings(guild_id)
-        if not existing:
-            await self.run(
-                "INSERT INTO guild_settings (guild_id) VALUES (?)", (guild_id,)
-            )
+        # Garantir que a linha existe (sem passar pelo cache)
+        await self.run(
+            "INSERT OR IGNORE INTO guild_settings (guild_id) VALUES (?)", (guild_id,)
+        )
 
         # Atualizar campos
         set_clause = ", ".join([f"{key} = ?" for key in kwargs])
         values = [*list(kwargs.values()), guild_id]
 
-        await self.run(
-            f"""UPDATE guild_settings SET {set_clause},
-            updated_at = CURRENT_TIMESTAMP WHERE guild_id = ?""",
-            tuple(values),
-        )
-
-    async def add_xp(self, guild_id: str, user_id: str, xp_amount: int) -> int | None:
-        """Adicionar XP a um usuário"""
-        # Verificar se usuário já existe
-        user_data = await self.get(
-            "SELECT total_xp FROM user_levels WHERE guild_id = ? AND user_id = ?",
-            (guild_id, user_id),
-        )
-
-        if user_data:
-            new_xp = user_data["total_xp"] + xp_amount
-            level = self._calculate_level(new_xp)
+        try:
             await self.run(
-                """UPDATE user_levels SET total_xp = ?, level = ?,
-                messages_sent = messages_sent + 1,
-                last_xp_gain = CURRENT_TIMESTAMP
-                WHERE guild_id = ? AND user_id = ?""",
-                (new_xp, level, guild_id, user_id),
+                f"""UPDATE guild_settings SET {set_clause},
+                updated_at = CURRENT_TIMESTAMP WHERE guild_id = ?""",
+                tuple(values),
             )
-            return level
+        finally:
+            self.invalidate_guild_settings(guild_id)
 
-        # Criar novo registro
-        level = self._calculate_level(xp_amount)
-        await self.run(
-            """INSERT INTO user_levels
-            (guild_id, user_id, total_xp, level, messages_sent)
-            VALUES (?, ?, ?, ?, 1)""",
-            (guild_id, user_id, xp_amount, level),
-        )
-        return level
+    async def add_xp(self, guild_id: str, user_id: str, xp_amount: int) -> int | None:
+        """Adicionar XP a um usuário (gravado em lote pelo acumulador)"""
+        award = await self.xp_accumulator.add_xp(guild_id, user_id, xp_amount)
+        return award.new_level
 
     def _calculate_level(self, total_xp: int) -> int:
         """Calcular nível baseado no XP total usando fórmula: level = floor(sqrt(xp / 100))"""
-        return int(math.sqrt(total_xp / 100))
+        return calculate_level(total_xp)
 
     async def get_user_level(self, guild_id: str, user_id: str) -> dict[str, Any] | None:
-        """Obter dados de nível do usuário"""
-        return await self.get(
+        """Obter dados de nível do usuário (incluindo XP ainda não gravado)"""
+        row = await self.get(
             """SELECT * FROM user_levels
             WHERE guild_id = ? AND user_id = ?""",
             (guild_id, user_id),
         )
+        return self.xp_accumulator.apply_pending(guild_id, user_id, row)
 
     async def get_leaderboard(
         self, guild_id: str, limit: int = 10
     ) -> list[dict[str, Any]]:
         """Obter ranking de XP do servidor"""
-        return await self.get_all(
-            """SELECT * FROM user_levels
-            WHERE guild_id = ? ORDER BY total_xp DESC LIMIT ?""",
-            (guild_id, limit),
-        )
+        return await self.rank_index.page(guild_id, 1, limit)
 
     async def create_giveaway(
         self,
@@ -432,6 +499,143 @@ class Database:
             (guild_id,),
         )
 
+    async def create_ticket(
+        self,
+        guild_id: str,
+        user_id: str,
+        channel_id: str,
+        reason: str | None = None,
+        ticket_number: int | None = None,
+    ) -> int:
+        """Registrar um ticket aberto (banco e registro em memória)"""
+        ticket_id = await self.run(
+            """INSERT INTO tickets (guild_id, user_id, channel_id, reason, ticket_number, status)
+            VALUES (?, ?, ?, ?, ?, 'open')""",
+            (guild_id, user_id, channel_id, reason, ticket_number),
+        )
+        await self.tickets.track(ticket_id)
+        return ticket_id
+
+    async def get_ticket_by_channel_id(self, channel_id: str) -> dict[str, Any] | None:
+        """Obter o ticket de um canal (abertos vêm do registro em memória)"""
+        ticket = await self.tickets.get(channel_id)
+        if ticket is None:
+            ticket = await self.get(
+                "SELECT * FROM tickets WHERE channel_id = ? ORDER BY id DESC LIMIT 1",
+                (str(channel_id),),
+            )
+        return ticket
+
+    async def get_user_open_ticket(self, guild_id: str, user_id: str) -> dict[str, Any] | None:
+        """Obter o ticket aberto mais recente de um membro (registro em memória)"""
+        tickets = await self.tickets.owner_tickets(guild_id, user_id)
+        return tickets[-1] if tickets else None
+
+    async def update_ticket_status(
+        self,
+        channel_id: str,
+        status: str,
+        closed_by: str | None = None,
+        reason: str | None = None,
+    ) -> None:
+        """
+        Mudar o status do ticket de um canal
+
+        Ao fechar, os eventos de transcript pendentes do canal são gravados.
+
+        Args:
+            channel_id: Canal do ticket
+            status: Novo status (``open``, ``pending``, ``closed``...)
+            closed_by: Quem fechou o ticket
+            reason: Motivo do fechamento (apenas informativo; não há coluna para ele)
+        """
+        if status in OPEN_STATUSES:
+            await self.run(
+                "UPDATE tickets SET status = ? WHERE channel_id = ?", (status, channel_id)
+            )
+        else:
+            await self.run(
+                """UPDATE tickets SET status = ?, closed_at = CURRENT_TIMESTAMP, closed_by = ?
+                WHERE channel_id = ?""",
+                (status, closed_by, channel_id),
+            )
+            await self.transcripts.flush(int(channel_id))
+        if not self.tickets.set_status(channel_id, status):
+            # Ticket reaberto: carregar a linha completa
+            ticket = await self.get(
+                "SELECT id FROM tickets WHERE channel_id = ? ORDER BY id DESC LIMIT 1",
+                (str(channel_id),),
+            )
+            if ticket:
+                await self.tickets.track(ticket["id"])
+
+    async def log_antispam_detection(
+        self,
+        guild_id: str,
+        user_id: str,
+        action_type: str,
+        channel_id: str | None = None,
+        reason: str | None = None,
+        when: float | None = None,
+    ) -> None:
+        """
+        Registrar uma detecção do antispam e somá-la aos rollups
+
+        O log e os quatro contadores (hora/dia, servidor/usuário) são gravados
+        na mesma transação.
+
+        Args:
+            guild_id: ID do servidor
+            user_id: ID do usuário
+            action_type: Ação aplicada (``warn``, ``mute``, ``kick``, ``ban``...)
+            channel_id: ID do canal
+            reason: Motivo da detecção
+            when: Momento da detecção (padrão: agora)
+        """
+        if when is None:
+            when = time.time()
+        async with self.pool.writer() as db:
+            await db.execute(
+                """INSERT INTO antispam_logs
+                (guild_id, user_id, channel_id, action_type, reason, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                (guild_id, user_id, channel_id, action_type, reason, when),
+            )
+            await record_detection(db, guild_id, user_id, action_type, when)
+            await db.commit()
+
+    async def get_antispam_stats(
+        self,
+        guild_id: str,
+        start: float,
+        end: float | None = None,
+        user_id: str | None = None,
+        top: int = 5,
+    ) -> dict[str, Any]:
+        """Estatísticas do antispam em um período (ver ``antispam_rollups.query_stats``)"""
+        return await query_stats(self, guild_id, start, end, user_id, top)
+
+    async def delete_antispam_logs(self, guild_id: str, user_id: str | None = None) -> int:
+        """
+        Apagar logs do antispam e recalcular os rollups do servidor
+
+        Args:
+            guild_id: ID do servidor
+            user_id: Apagar apenas os logs deste usuário
+
+        Returns:
+            Quantidade de logs apagados
+        """
+        query, params = "DELETE FROM antispam_logs WHERE guild_id = ?", [guild_id]
+        if user_id:
+            query += " AND user_id = ?"
+            params.append(user_id)
+        async with self.pool.writer() as db:
+            cursor = await db.execute(query, params)
+            await rebuild_rollups(db, guild_id)
+            await db.commit()
+            return cursor.rowcount
+
 
 # Instância global do banco de dados
 database = Database()
@@ -0,0 +1,288 @@
+"""
+Pool de Conexões SQLite
+Uma conexão de escrita persistente + pool limitado de conexões de leitura
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import aiosqlite
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class ConnectionPool:
+    """
+    Gerenciador de conexões de longa duração para um arquivo SQLite.
+
+    Cada ``aiosqlite.connect`` abre uma thread dedicada; em vez de abrir e
+    fechar uma conexão por query, o pool mantém:
+
+    - uma única conexão de escrita, serializada por um ``asyncio.Lock``
+      (o SQLite só admite um escritor por vez);
+    - até ``max_readers`` conexões de leitura reutilizáveis.
+
+    Conexões ociosas há mais de ``health_check_interval`` segundos são
+    validadas com ``SELECT 1`` antes de serem entregues e reabertas se
+    estiverem quebradas.
+
+    Toda conexão nova recebe o perfil de ``pragmas`` (ex.: WAL, que permite
+    leitores concorrentes enquanto o escritor grava) e um cache de
+    statements preparados de ``statement_cache_size`` entradas.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        max_readers: int = 4,
+        health_check_interval: float = 60.0,
+        pragmas: dict[str, str | int] | None = None,
+        statement_cache_size: int = 128,
+        busy_timeout: float = 5.0,
+        connect_kwargs: dict[str, Any] | None = None,
+        row_factory: Any = None,
+    ) -> None:
+        """
+        Inicializa o pool (as conexões são abertas sob demanda)
+
+        Args:
+            db_path: Caminho para o arquivo do banco de dados
+            max_readers: Número máximo de conexões de leitura simultâneas
+            health_check_interval: Segundos de ociosidade antes de validar a conexão
+            pragmas: PRAGMAs aplicados a cada conexão, na ordem do dicionário
+            statement_cache_size: Statements preparados mantidos por conexão
+            busy_timeout: Segundos de espera quando o banco está travado
+            connect_kwargs: Argumentos extras repassados ao ``sqlite3.connect``
+            row_factory: ``row_factory`` aplicado a cada conexão (ex.: ``aiosqlite.Row``)
+        """
+        self.db_path: str = db_path
+        self.max_readers: int = max(1, max_readers)
+        self.health_check_interval: float = health_check_interval
+        self.pragmas: dict[str, str | int] = dict(pragmas or {})
+        self.connect_kwargs: dict[str, Any] = {
+            "cached_statements": statement_cache_size,
+            "timeout": busy_timeout,
+            **(connect_kwargs or {}),
+        }
+        self.row_factory: Any = row_factory
+
+        self._writer: aiosqlite.Connection | None = None
+        self._writer_last_used: float = 0.0
+        self._write_lock = asyncio.Lock()
+
+        self._idle_readers: list[tuple[aiosqlite.Connection, float]] = []
+        self._reader_slots = asyncio.Semaphore(self.max_readers)
+        self._open_readers: int = 0
+
+        self._closed: bool = False
+
+        # Estatísticas
+        self.connections_opened: int = 0
+        self.health_check_failures: int = 0
+
+    @property
+    def closed(self) -> bool:
+        """Indica se o pool já foi encerrado"""
+        return self._closed
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Abrir uma nova conexão com o banco e aplicar o perfil de PRAGMAs"""
+        connection = await aiosqlite.connect(self.db_path, **self.connect_kwargs)
+        if self.row_factory is not None:
+            connection.row_factory = self.row_factory
+        try:
+            for name, value in self.pragmas.items():
+                if not name.isidentifier():
+                    msg = f"PRAGMA inválido: {name}"
+                    raise ValueError(msg)
+                await connection.execute(f"PRAGMA {name} = {value}")
+        except BaseException:
+            await self._safe_close(connection)
+            raise
+
+        self.connections_opened += 1
+        return connection
+
+    async def get_pragma(self, name: str) -> Any:
+        """
+        Ler o valor efetivo de um PRAGMA na conexão de escrita
+
+        Args:
+            name: Nome do PRAGMA (ex.: ``journal_mode``)
+
+        Returns:
+            Valor retornado pelo SQLite
+        """
+        if not name.isidentifier():
+            msg = f"PRAGMA inválido: {name}"
+            raise ValueError(msg)
+
+        async with self.writer() as connection, connection.execute(f"PRAGMA {name}") as cursor:
+            row = await cursor.fetchone()
+            return row[0] if row else None
+
+    async def _is_healthy(self, connection: aiosqlite.Connection) -> bool:
+        """Verificar se a conexão ainda responde"""
+        try:
+            async with connection.execute("SELECT 1") as cursor:
+                await cursor.fetchone()
+            return True
+        except Exception:
+            self.health_check_failures += 1
+            return False
+
+    async def _safe_close(self, connection: aiosqlite.Connection) -> None:
+        """Fechar conexão ignorando erros (conexão pode já estar quebrada)"""
+        try:
+            await connection.close()
+        except Exception:
+            pass
+
+    async def _ensure_writer(self) -> aiosqlite.Connection:
+        """Obter a conexão de escrita, reabrindo-a se necessário"""
+        if self._writer is not None:
+            idle_for = time.monotonic() - self._writer_last_used
+            if idle_for < self.health_check_interval or await self._is_healthy(self._writer):
+                return self._writer
+
+            await self._safe_close(self._writer)
+            self._writer = None
+
+        self._writer = await self._connect()
+        return self._writer
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Adquirir a conexão de escrita com acesso exclusivo
+
+        Em caso de exceção dentro do bloco é feito rollback da transação
+        pendente, para não vazar escrita parcial para o próximo usuário.
+        """
+        if self._closed:
+            msg = "Pool de conexões encerrado"
+            raise RuntimeError(msg)
+
+        async with self._write_lock:
+            connection = await self._ensure_writer()
+            try:
+                yield connection
+            except BaseException:
+                try:
+                    await connection.rollback()
+                except Exception:
+                    pass
+                raise
+            finally:
+                self._writer_last_used = time.monotonic()
+
+    async def _acquire_reader(self) -> aiosqlite.Connection:
+        """Pegar uma conexão de leitura ociosa ou abrir uma nova"""
+        while self._idle_readers:
+            connection, last_used = self._idle_readers.pop()
+            if time.monotonic() - last_used < self.health_check_interval:
+                return connection
+            if await self._is_healthy(connection):
+                return connection
+
+            await self._safe_close(connection)
+            self._open_readers -= 1
+
+        connection = await self._connect()
+        self._open_readers += 1
+        return connection
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Adquirir uma conexão de leitura do pool"""
+        if self._closed:
+            msg = "Pool de conexões encerrado"
+            raise RuntimeError(msg)
+
+        async with self._reader_slots:
+            connection = await self._acquire_reader()
+            broken = False
+            try:
+                yield connection
+            except ValueError:
+                # aiosqlite levanta ValueError quando a conexão já foi fechada
+                broken = True
+                raise
+            finally:
+                if broken or self._closed:
+                    await self._safe_close(connection)
+                    self._open_readers -= 1
+                else:
+                    self._idle_readers.append((connection, time.monotonic()))
+
+    async def health_check(self) -> bool:
+        """
+        Validar todas as conexões abertas, descartando as quebradas
+
+        Returns:
+            True se a conexão de escrita está saudável
+        """
+        if self._closed:
+            return False
+
+        healthy_readers: list[tuple[aiosqlite.Connection, float]] = []
+        for connection, _last_used in self._idle_readers:
+            if await self._is_healthy(connection):
+                healthy_readers.append((connection, time.monotonic()))
+            else:
+                await self._safe_close(connection)
+                self._open_readers -= 1
+        self._idle_readers = healthy_readers
+
+        async with self._write_lock:
+            if self._writer is not None and not await self._is_healthy(self._writer):
+                await self._safe_close(self._writer)
+                self._writer = None
+            try:
+                await self._ensure_writer()
+            except Exception:
+                return False
+            self._writer_last_used = time.monotonic()
+            return True
+
+    async def close(self) -> None:
+        """Encerrar o pool, aguardando a escrita em andamento terminar"""
+        if self._closed:
+            return
+        self._closed = True
+
+        async with self._write_lock:
+            if self._writer is not None:
+                try:
+                    await self._writer.commit()
+                except Exception:
+                    pass
+                await self._safe_close(self._writer)
+                self._writer = None
+
+        # Leitores em uso são fechados ao serem devolvidos (ver reader())
+        idle, self._idle_readers = self._idle_readers, []
+        for connection, _last_used in idle:
+            await self._safe_close(connection)
+            self._open_readers -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do pool"""
+        return {
+            "db_path": self.db_path,
+            "closed": self._closed,
+            "writer_open": self._writer is not None,
+            "readers_open": self._open_readers,
+            "readers_idle": len(self._idle_readers),
+            "max_readers": self.max_readers,
+            "statement_cache_size": self.connect_kwargs.get("cached_statements"),
+            "pragmas": dict(self.pragmas),
+            "connections_opened": self.connections_opened,
+            "health_check_failures": self.health_check_failures,
+        }
@@ -6,10 +6,13 @@ Funções para criar embeds customizados, leaderboards, etc.
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import discord
 
+if TYPE_CHECKING:
+    from .join_burst import JoinSummary
+
 
 class EmbedBuilder:
     """Classe utilitária para construir embeds de forma fácil"""
@@ -244,6 +247,25 @@ class EmbedBuilder:
         )
         return embed
 
+    @staticmethod
+    def build_join_summary_embed(
+        summary: JoinSummary, title: str, color: int = 0xFF6600
+    ) -> discord.Embed:
+        """Criar resumo das entradas durante o modo raid"""
+        mentions = " ".join(member.mention for member in summary.members)
+        extra = summary.count - len(summary.members)
+        if extra > 0:
+            mentions += f" e mais **{extra}**"
+        embed = discord.Embed(
+            title=title,
+            description=f"🚨 **Modo raid ativo:** {summary.count} entradas desde "
+            f"<t:{int(summary.started)}:T>\n\n{mentions}",
+            color=color,
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.set_footer(text="Mensagens individuais pausadas até o fim do raid")
+        return embed
+
     @staticmethod
     def build_success_embed(success_message: str, title: str = "✅ Sucesso") -> discord.Embed:
         """Criar embed de sucesso padronizado"""
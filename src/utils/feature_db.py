@@ -0,0 +1,117 @@
+"""
+Bancos SQLite por Funcionalidade
+Acesso assíncrono (fora do event loop) com linhas ``aiosqlite.Row``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import aiosqlite
+
+from .config import Config
+from .db_pool import ConnectionPool
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+
+class FeatureDatabase:
+    """
+    Banco SQLite próprio de uma funcionalidade.
+
+    Substitui o ``sqlite3.connect`` síncrono usado dentro de handlers
+    assíncronos: todo o I/O passa por um ``ConnectionPool`` (aiosqlite roda
+    cada conexão em uma thread própria), então o event loop e o heartbeat
+    do gateway nunca ficam parados esperando o disco.
+
+    As linhas são retornadas como ``aiosqlite.Row``, que aceita acesso por
+    índice, por nome de coluna e desempacotamento como tupla.
+    """
+
+    def __init__(self, db_path: str, pool: ConnectionPool | None = None) -> None:
+        """
+        Inicializa o banco (as conexões são abertas sob demanda)
+
+        Args:
+            db_path: Caminho do arquivo ``.db``
+            pool: Pool já existente para compartilhar (ex.: o do banco
+                principal); ele deve usar ``row_factory=aiosqlite.Row`` e não
+                é fechado por ``close()``
+        """
+        self.db_path: str = db_path
+        self.owns_pool: bool = pool is None
+        self.pool: ConnectionPool = pool or ConnectionPool(
+            db_path,
+            max_readers=Config.FEATURE_DB_READ_POOL_SIZE,
+            health_check_interval=Config.DB_HEALTH_CHECK_INTERVAL,
+            pragmas=Config.get_sqlite_pragmas(),
+            statement_cache_size=Config.DB_STATEMENT_CACHE_SIZE,
+            busy_timeout=Config.DB_BUSY_TIMEOUT,
+            row_factory=aiosqlite.Row,
+        )
+        self._schema_lock = asyncio.Lock()
+        self._schemas: set[str] = set()
+
+    async def ensure_schema(self, script: str) -> None:
+        """
+        Executar um script de criação de tabelas uma única vez por processo
+
+        Args:
+            script: Comandos ``CREATE ... IF NOT EXISTS`` separados por ``;``
+        """
+        if script in self._schemas:
+            return
+        async with self._schema_lock:
+            if script in self._schemas:
+                return
+            dirname = os.path.dirname(self.db_path)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            async with self.pool.writer() as db:
+                await db.executescript(script)
+                await db.commit()
+            self._schemas.add(script)
+
+    async def get(self, query: str, params: Sequence[Any] = ()) -> aiosqlite.Row | None:
+        """Executar SELECT e retornar a primeira linha"""
+        async with self.pool.reader() as db, db.execute(query, params) as cursor:
+            return await cursor.fetchone()
+
+    async def get_all(self, query: str, params: Sequence[Any] = ()) -> list[aiosqlite.Row]:
+        """Executar SELECT e retornar todas as linhas"""
+        async with self.pool.reader() as db, db.execute(query, params) as cursor:
+            return list(await cursor.fetchall())
+
+    async def run(self, query: str, params: Sequence[Any] = ()) -> aiosqlite.Cursor:
+        """Executar INSERT/UPDATE/DELETE (``lastrowid``/``rowcount`` ficam no cursor)"""
+        async with self.pool.writer() as db:
+            cursor = await db.execute(query, params)
+            await db.commit()
+            return cursor
+
+    async def run_many(self, query: str, params_seq: Sequence[Sequence[Any]]) -> None:
+        """Executar o mesmo comando para vários conjuntos de parâmetros"""
+        async with self.pool.writer() as db:
+            await db.executemany(query, params_seq)
+            await db.commit()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Executar vários comandos em uma única transação
+
+        Commit ao sair do bloco; rollback se uma exceção escapar dele.
+        """
+        async with self.pool.writer() as db:
+            yield db
+            await db.commit()
+
+    async def close(self) -> None:
+        """Fechar as conexões do banco (se o pool for próprio)"""
+        if self.owns_pool:
+            await self.pool.close()
+
@@ -0,0 +1,257 @@
+"""
+Leitura do Histórico de Canais em Streaming
+Percorre o histórico uma única vez, em memória constante, alimentando vários
+consumidores (contagem, linhas do transcript, participantes) e salvando o
+cursor para retomar uma leitura interrompida
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from .database import Database
+
+    RowFactory = Callable[[discord.Message], "dict[str, Any] | None"]
+
+
+class HistoryConsumer(ABC):
+    """
+    Consumidor de uma leitura do histórico.
+
+    ``feed`` recebe as mensagens em ordem cronológica. ``state``/``restore``
+    convertem o estado em JSON para o checkpoint; o estado precisa ter
+    tamanho limitado (contadores, conjuntos de autores, as primeiras N
+    linhas), nunca a lista de todas as mensagens.
+    """
+
+    name: str = "consumer"
+
+    @abstractmethod
+    def feed(self, message: discord.Message) -> None:
+        """Processar a próxima mensagem"""
+
+    def state(self) -> dict[str, Any]:
+        return {}
+
+    def restore(self, state: dict[str, Any]) -> None:
+        pass
+
+
+class MessageCounter(HistoryConsumer):
+    """Contagem de mensagens, de mensagens de bots e de anexos"""
+
+    name = "count"
+
+    def __init__(self) -> None:
+        self.messages = 0
+        self.bot_messages = 0
+        self.attachments = 0
+
+    def feed(self, message: discord.Message) -> None:
+        self.messages += 1
+        if message.author.bot:
+            self.bot_messages += 1
+        self.attachments += len(message.attachments)
+
+    def state(self) -> dict[str, Any]:
+        return {
+            "messages": self.messages,
+            "bot_messages": self.bot_messages,
+            "attachments": self.attachments,
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        self.messages = state.get("messages", 0)
+        self.bot_messages = state.get("bot_messages", 0)
+        self.attachments = state.get("attachments", 0)
+
+
+class ParticipantCounter(HistoryConsumer):
+    """Autores das mensagens, com o número de mensagens de cada um"""
+
+    name = "participants"
+
+    def __init__(self, *, include_bots: bool = False) -> None:
+        self.include_bots = include_bots
+        # author_id -> mensagens / nome exibido
+        self.counts: dict[int, int] = {}
+        self.names: dict[int, str] = {}
+
+    def feed(self, message: discord.Message) -> None:
+        author = message.author
+        if author.bot and not self.include_bots:
+            return
+        self.counts[author.id] = self.counts.get(author.id, 0) + 1
+        self.names[author.id] = str(author)
+
+    def top(self, limit: int = 10) -> list[tuple[int, int]]:
+        """Autores que mais enviaram mensagens (author_id, mensagens)"""
+        return sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def state(self) -> dict[str, Any]:
+        return {"counts": {str(k): v for k, v in self.counts.items()}, "names": self.names}
+
+    def restore(self, state: dict[str, Any]) -> None:
+        self.counts = {int(k): v for k, v in state.get("counts", {}).items()}
+        self.names = {int(k): v for k, v in state.get("names", {}).items()}
+
+
+class TranscriptRows(HistoryConsumer):
+    """As primeiras ``limit`` linhas de transcript (``None`` = sem limite)"""
+
+    name = "rows"
+
+    def __init__(self, row_factory: RowFactory, *, limit: int | None = 100) -> None:
+        self.row_factory = row_factory
+        self.limit = limit
+        self.rows: list[dict[str, Any]] = []
+        # Linhas geradas, inclusive as que passaram do limite
+        self.total = 0
+
+    def feed(self, message: discord.Message) -> None:
+        row = self.row_factory(message)
+        if row is None:
+            return
+        self.total += 1
+        if self.limit is None or len(self.rows) < self.limit:
+            self.rows.append(row)
+
+    def state(self) -> dict[str, Any]:
+        return {"rows": self.rows, "total": self.total}
+
+    def restore(self, state: dict[str, Any]) -> None:
+        self.rows = list(state.get("rows", []))
+        self.total = state.get("total", 0)
+
+
+class HistoryScanner:
+    """
+    Leitura do histórico de um canal ou thread em uma única passada.
+
+    As mensagens vêm do iterador do discord.py (páginas de 100, do mais
+    antigo para o mais novo) e são entregues a todos os consumidores sem
+    guardar a lista. Com ``key``, o cursor (ID da última mensagem lida) e o
+    estado dos consumidores são gravados a cada ``checkpoint_every``
+    mensagens em ``history_scan_checkpoints``; se a leitura for
+    interrompida, a próxima com a mesma chave continua de onde parou. O
+    checkpoint é apagado quando a leitura termina.
+    """
+
+    def __init__(self, database: Database | None = None, *, checkpoint_every: int = 1000) -> None:
+        """
+        Inicializa o leitor
+
+        Args:
+            database: Banco onde ficam os checkpoints (None = sem checkpoints)
+            checkpoint_every: Mensagens entre checkpoints
+        """
+        self.database = database
+        self.checkpoint_every = max(1, checkpoint_every)
+
+        self.scans: int = 0
+        self.resumed: int = 0
+        self.messages_read: int = 0
+
+    async def iterate(
+        self, channel: discord.abc.Messageable, *, after: int | None = None
+    ) -> AsyncIterator[discord.Message]:
+        """
+        Mensagens do canal em ordem cronológica, sem materializar o histórico
+
+        Args:
+            channel: Canal ou thread
+            after: Começar depois desta mensagem
+        """
+        start = discord.Object(id=after) if after else None
+        async for message in channel.history(limit=None, after=start, oldest_first=True):
+            self.messages_read += 1
+            yield message
+
+    async def scan(
+        self, channel: discord.abc.Messageable, *consumers: HistoryConsumer, key: str | None = None
+    ) -> int:
+        """
+        Ler o histórico alimentando os consumidores
+
+        Args:
+            channel: Canal ou thread
+            *consumers: Consumidores (nomes distintos)
+            key: Chave do checkpoint (ex.: ``"thread_closure:123"``); None desativa
+
+        Returns:
+            Mensagens lidas nesta chamada (sem contar as de uma leitura retomada)
+        """
+        self.scans += 1
+        after = await self._restore(key, consumers) if key else None
+        read = 0
+        last_id = after
+        async for message in self.iterate(channel, after=after):
+            for consumer in consumers:
+                consumer.feed(message)
+            read += 1
+            last_id = message.id
+            if key and read % self.checkpoint_every == 0:
+                await self._save(key, channel, last_id, consumers)
+        if key:
+            await self.clear(key)
+        return read
+
+    async def _restore(self, key: str, consumers: tuple[HistoryConsumer, ...]) -> int | None:
+        """Carregar o checkpoint de uma leitura interrompida"""
+        if self.database is None:
+            return None
+        row = await self.database.get(
+            "SELECT last_message_id, state FROM history_scan_checkpoints WHERE scan_key = ?",
+            (key,),
+        )
+        if not row:
+            return None
+        states = json.loads(row["state"] or "{}")
+        for consumer in consumers:
+            consumer.restore(states.get(consumer.name, {}))
+        self.resumed += 1
+        return int(row["last_message_id"])
+
+    async def _save(
+        self,
+        key: str,
+        channel: discord.abc.Messageable,
+        last_id: int,
+        consumers: tuple[HistoryConsumer, ...],
+    ) -> None:
+        """Gravar o cursor e o estado dos consumidores"""
+        if self.database is None:
+            return
+        state = json.dumps({consumer.name: consumer.state() for consumer in consumers})
+        await self.database.run(
+            """INSERT INTO history_scan_checkpoints
+                (scan_key, channel_id, last_message_id, state, updated_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(scan_key) DO UPDATE SET
+                last_message_id = excluded.last_message_id,
+                state = excluded.state,
+                updated_at = excluded.updated_at""",
+            (key, str(getattr(channel, "id", "")), str(last_id), state),
+        )
+
+    async def clear(self, key: str) -> None:
+        """Apagar o checkpoint de uma leitura"""
+        if self.database is not None:
+            await self.database.run(
+                "DELETE FROM history_scan_checkpoints WHERE scan_key = ?", (key,)
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do leitor"""
+        return {
+            "scans": self.scans,
+            "resumed": self.resumed,
+            "messages_read": self.messages_read,
+        }
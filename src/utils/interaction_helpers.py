@@ -5,13 +5,16 @@ Funções auxiliares para comandos slash, botões, modals
 
 from __future__ import annotations
 
+import inspect
 from typing import TYPE_CHECKING, Any
 
 import discord
 from discord.ext import commands
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Awaitable, Callable
+
+    from .page_provider import PageProvider
 
 
 class InteractionHelpers:
@@ -27,16 +30,20 @@ class InteractionHelpers:
         file: discord.File | None = None,
     ) -> bool:
         """Responder interação de forma segura"""
+        # O discord.py não aceita None em view/file/embed: omitir os ausentes
+        extras: dict[str, Any] = {
+            key: value
+            for key, value in (("embed", embed), ("view", view), ("file", file))
+            if value is not None
+        }
         try:
             if interaction.response.is_done():
                 # Usar followup se já foi respondida
-                await interaction.followup.send(
-                    content=content, embed=embed, view=view, ephemeral=ephemeral, file=file
-                )
+                await interaction.followup.send(content=content, ephemeral=ephemeral, **extras)
             else:
                 # Responder normalmente
                 await interaction.response.send_message(
-                    content=content, embed=embed, view=view, ephemeral=ephemeral, file=file
+                    content=content, ephemeral=ephemeral, **extras
                 )
             return True
 
@@ -44,11 +51,7 @@ class InteractionHelpers:
             # Tentar followup
             try:
                 await interaction.followup.send(
-                    content=content or "Operação concluída.",
-                    embed=embed,
-                    view=view,
-                    ephemeral=ephemeral,
-                    file=file,
+                    content=content or "Operação concluída.", ephemeral=ephemeral, **extras
                 )
                 return True
             except Exception:
@@ -205,6 +208,122 @@ class InteractionHelpers:
         view = PaginationView(embeds)
         await InteractionHelpers.safe_response(interaction, embed=embeds[0], view=view)
 
+    @staticmethod
+    async def paginate_pages(
+        interaction: discord.Interaction,
+        provider: PageProvider,
+        build_embed: Callable[[list[Any], int], discord.Embed | Awaitable[discord.Embed]],
+        *,
+        empty_message: str = "❌ Nenhum conteúdo para paginar.",
+        ephemeral: bool = False,
+        timeout: int = 300,
+    ) -> None:
+        """
+        Paginação sob demanda: cada página é lida do provedor e montada ao ser aberta
+
+        Args:
+            interaction: Interação do comando
+            provider: Provedor das páginas (ver ``page_provider``)
+            build_embed: Recebe os itens e o índice da página e retorna o embed
+            empty_message: Resposta quando a lista está vazia
+            ephemeral: Responder só para quem usou o comando
+            timeout: Tempo (s) até os botões pararem de responder
+        """
+
+        async def render(index: int) -> discord.Embed | None:
+            items = await provider.page(index)
+            if not items:
+                return None
+            if provider.total is None:
+                # Dar um instante para a contagem (rodando em paralelo) completar o rótulo
+                await provider.wait_total()
+            embed = build_embed(items, index)
+            if inspect.isawaitable(embed):
+                embed = await embed
+            footer = embed.footer.text if embed.footer and embed.footer.text else None
+            label = provider.page_label(index)
+            embed.set_footer(
+                text=f"{footer} • {label}" if footer else label,
+                icon_url=embed.footer.icon_url if embed.footer else None,
+            )
+            return embed
+
+        class LazyPaginationView(discord.ui.View):
+            def __init__(self) -> None:
+                super().__init__(timeout=timeout)
+                self.current_page: int = 0
+                self.update_buttons()
+
+            def update_buttons(self) -> None:
+                """Atualizar estado dos botões"""
+                has_next = provider.has_next(self.current_page)
+                self.first_page.disabled = self.current_page == 0
+                self.prev_page.disabled = self.current_page == 0
+                self.next_page.disabled = not has_next
+                # A última página depende do total, contado em segundo plano
+                self.last_page.disabled = not has_next or provider.page_count is None
+
+            async def show(self, button_interaction: discord.Interaction, index: int) -> None:
+                embed = await render(index)
+                if embed is None:
+                    # A lista diminuiu desde a contagem: voltar para o início
+                    provider.reset()
+                    index = 0
+                    embed = await render(0)
+                self.current_page = index
+                self.update_buttons()
+                if embed is None:
+                    await button_interaction.response.edit_message(
+                        content=empty_message, embed=None, view=None
+                    )
+                    self.stop()
+                    return
+                await button_interaction.response.edit_message(embed=embed, view=self)
+
+            @discord.ui.button(emoji="⏪", style=discord.ButtonStyle.secondary)
+            async def first_page(
+                self, button_interaction: discord.Interaction, button: discord.ui.Button
+            ) -> None:
+                await self.show(button_interaction, 0)
+
+            @discord.ui.button(emoji="◀️", style=discord.ButtonStyle.primary)
+            async def prev_page(
+                self, button_interaction: discord.Interaction, button: discord.ui.Button
+            ) -> None:
+                await self.show(button_interaction, max(0, self.current_page - 1))
+
+            @discord.ui.button(emoji="🗑️", style=discord.ButtonStyle.danger)
+            async def delete_message(
+                self, button_interaction: discord.Interaction, button: discord.ui.Button
+            ) -> None:
+                await button_interaction.response.edit_message(
+                    content="🗑️ Mensagem deletada.", embed=None, view=None
+                )
+                self.stop()
+
+            @discord.ui.button(emoji="▶️", style=discord.ButtonStyle.primary)
+            async def next_page(
+                self, button_interaction: discord.Interaction, button: discord.ui.Button
+            ) -> None:
+                await self.show(button_interaction, self.current_page + 1)
+
+            @discord.ui.button(emoji="⏩", style=discord.ButtonStyle.secondary)
+            async def last_page(
+                self, button_interaction: discord.Interaction, button: discord.ui.Button
+            ) -> None:
+                page_count = provider.page_count
+                await self.show(button_interaction, (page_count or 1) - 1)
+
+        embed = await render(0)
+        if embed is None:
+            await InteractionHelpers.safe_response(interaction, empty_message, ephemeral=True)
+            return
+
+        view = LazyPaginationView() if provider.has_next(0) else None
+        await InteractionHelpers.safe_response(
+            interaction, embed=embed, view=view, ephemeral=ephemeral
+        )
+
     @staticmethod
     async def create_modal_input(title: str, fields: list[dict[str, Any]]) -> discord.ui.Modal:
         """Criar modal dinâmico com campos"""
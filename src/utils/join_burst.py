@@ -0,0 +1,332 @@
+"""
+Modo Raid de Entradas
+Estimativa da taxa de entradas por servidor, resumos periódicos das
+boas-vindas/logs durante um raid e execução de punições em ritmo controlado
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+    SummaryHandler = Callable[["JoinSummary"], Awaitable[Any]]
+
+# Ações aceitas para punir contas que entraram durante um raid
+JOIN_RAID_ACTIONS: tuple[str, ...] = ("none", "timeout", "kick")
+
+
+@dataclass(slots=True)
+class JoinBurst:
+    """Estado das entradas recentes de um servidor"""
+
+    # Entradas estimadas na janela (contador com decaimento exponencial)
+    rate: float = 0.0
+    updated: float = 0.0
+    raid_since: float | None = None
+    # Último momento em que a taxa estava acima do limite
+    last_peak: float = 0.0
+    raid_joins: int = 0
+    # member_id -> (entrou durante o raid, momento); todos os listeners da mesma
+    # entrada recebem a mesma resposta
+    decisions: OrderedDict[int, tuple[bool, float]] = field(default_factory=OrderedDict)
+
+
+@dataclass(slots=True)
+class JoinSummary:
+    """Entradas acumuladas para um resumo"""
+
+    guild_id: int
+    key: Hashable
+    count: int = 0
+    # Primeiros membros do período (no máximo ``max_listed``)
+    members: list[Any] = field(default_factory=list)
+    started: float = 0.0
+
+
+class JoinBurstMonitor:
+    """
+    Detecta rajadas de entradas e agrupa a saída enquanto durarem.
+
+    A taxa de cada servidor é um contador com decaimento exponencial (constante
+    de tempo = ``window``): cada entrada soma 1 e o valor cai pela metade a
+    cada ~0,7 janela, então ele aproxima as entradas da última janela em O(1)
+    de memória. Acima de ``threshold`` o servidor entra em modo raid; o modo
+    só termina quando a taxa fica abaixo da metade do limite por ``cooldown``
+    segundos, para não oscilar no fim do raid.
+
+    Em modo raid, ``summarize`` acumula os membros por destino (ex.: canal de
+    boas-vindas) e entrega um único resumo a cada ``summary_interval``.
+    """
+
+    def __init__(
+        self,
+        *,
+        cooldown: float = 120.0,
+        summary_interval: float = 30.0,
+        max_listed: int = 20,
+        max_decisions: int = 512,
+    ) -> None:
+        """
+        Inicializa o monitor
+
+        Args:
+            cooldown: Tempo (s) abaixo do limite até sair do modo raid
+            summary_interval: Intervalo (s) entre resumos
+            max_listed: Membros citados por resumo
+            max_decisions: Decisões por membro guardadas por servidor
+        """
+        self.cooldown = cooldown
+        self.summary_interval = summary_interval
+        self.max_listed = max(1, max_listed)
+        self.max_decisions = max(1, max_decisions)
+        self._bursts: dict[int, JoinBurst] = {}
+        self._summaries: dict[tuple[int, Hashable], JoinSummary] = {}
+        self._tasks: dict[tuple[int, Hashable], asyncio.Task[None]] = {}
+
+        self.raids: int = 0
+        self.summaries_sent: int = 0
+
+    def _decay(self, burst: JoinBurst, window: float, now: float) -> None:
+        """Aplicar o decaimento desde a última atualização"""
+        if now > burst.updated:
+            burst.rate *= math.exp(-(now - burst.updated) / window)
+            burst.updated = now
+
+    def _update_mode(self, burst: JoinBurst, threshold: float, now: float) -> None:
+        """Entrar ou sair do modo raid (com histerese)"""
+        if burst.rate >= threshold:
+            burst.last_peak = now
+            if burst.raid_since is None:
+                burst.raid_since = now
+                burst.raid_joins = 0
+                self.raids += 1
+        elif (
+            burst.raid_since is not None
+            and burst.rate < threshold / 2
+            and now - burst.last_peak >= self.cooldown
+        ):
+            burst.raid_since = None
+
+    def observe(
+        self,
+        guild_id: int,
+        member_id: int,
+        *,
+        threshold: float = 10,
+        window: float = 10.0,
+        now: float | None = None,
+    ) -> bool:
+        """
+        Registrar uma entrada e dizer se ela faz parte de um raid
+
+        Vários listeners recebem o mesmo ``on_member_join``; a entrada só é
+        contada na primeira chamada e as demais recebem a mesma resposta. A
+        decisão vale por ``window`` segundos: um membro que sai e volta depois
+        disso é avaliado de novo.
+
+        Args:
+            guild_id: ID do servidor
+            member_id: ID do membro que entrou
+            threshold: Entradas na janela para entrar em modo raid
+            window: Janela (s) da estimativa
+            now: Momento da entrada (padrão: ``time.time()``)
+
+        Returns:
+            True se o servidor está em modo raid nesta entrada
+        """
+        burst = self._bursts.get(guild_id)
+        if burst is None:
+            burst = self._bursts[guild_id] = JoinBurst()
+        if now is None:
+            now = time.time()
+        cached = burst.decisions.get(member_id)
+        if cached is not None and now - cached[1] <= window:
+            return cached[0]
+
+        self._decay(burst, window, now)
+        burst.rate += 1
+        self._update_mode(burst, threshold, now)
+
+        decision = burst.raid_since is not None
+        if decision:
+            burst.raid_joins += 1
+        burst.decisions[member_id] = (decision, now)
+        burst.decisions.move_to_end(member_id)
+        if len(burst.decisions) > self.max_decisions:
+            burst.decisions.popitem(last=False)
+        return decision
+
+    def in_raid(
+        self,
+        guild_id: int,
+        *,
+        threshold: float = 10,
+        window: float = 10.0,
+        now: float | None = None,
+    ) -> bool:
+        """Verificar o modo raid sem registrar uma entrada"""
+        burst = self._bursts.get(guild_id)
+        if burst is None:
+            return False
+        self._decay(burst, window, time.time() if now is None else now)
+        self._update_mode(burst, threshold, burst.updated)
+        return burst.raid_since is not None
+
+    def summarize(
+        self, guild_id: int, key: Hashable, member: Any, handler: SummaryHandler
+    ) -> None:
+        """
+        Acumular um membro no resumo de um destino
+
+        O primeiro membro agenda a entrega; ``handler`` recebe o resumo a cada
+        ``summary_interval`` enquanto chegarem membros novos.
+
+        Args:
+            guild_id: ID do servidor
+            key: Destino do resumo (ex.: ID do canal)
+            member: Membro que entrou
+            handler: Corrotina que envia o resumo
+        """
+        slot = (guild_id, key)
+        summary = self._summaries.get(slot)
+        if summary is None:
+            summary = self._summaries[slot] = JoinSummary(guild_id, key, started=time.time())
+        summary.count += 1
+        if len(summary.members) < self.max_listed:
+            summary.members.append(member)
+
+        task = self._tasks.get(slot)
+        if task is None or task.done():
+            self._tasks[slot] = asyncio.create_task(self._deliver(slot, handler))
+
+    async def _deliver(self, slot: tuple[int, Hashable], handler: SummaryHandler) -> None:
+        """Entregar os resumos de um destino até não chegarem mais membros"""
+        while True:
+            await asyncio.sleep(self.summary_interval)
+            summary = self._summaries.pop(slot, None)
+            if summary is None:
+                self._tasks.pop(slot, None)
+                return
+            try:
+                await handler(summary)
+                self.summaries_sent += 1
+            except Exception as e:
+                print(f"❌ Erro enviando resumo de entradas: {e}")
+
+    def reset(self, guild_id: int | None = None) -> None:
+        """Esquecer o estado de um servidor (ou de todos)"""
+        if guild_id is None:
+            self._bursts.clear()
+        else:
+            self._bursts.pop(guild_id, None)
+
+    async def close(self) -> None:
+        """Cancelar as entregas pendentes"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._summaries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do monitor"""
+        return {
+            "guilds": len(self._bursts),
+            "in_raid": sum(1 for burst in self._bursts.values() if burst.raid_since is not None),
+            "raids": self.raids,
+            "pending_summaries": len(self._summaries),
+            "summaries_sent": self.summaries_sent,
+        }
+
+
+class RateLimitedExecutor:
+    """
+    Fila de ações em massa (timeouts, expulsões) executadas em ritmo fixo.
+
+    Um único worker consome a fila a no máximo ``rate`` ações por segundo,
+    para que uma punição em massa não esgote os limites da API do Discord
+    enquanto o resto do bot continua respondendo. Ações repetidas para a
+    mesma chave são ignoradas enquanto estiverem na fila.
+    """
+
+    def __init__(self, *, rate: float = 2.0, max_pending: int = 5000) -> None:
+        """
+        Inicializa o executor
+
+        Args:
+            rate: Ações por segundo
+            max_pending: Tamanho máximo da fila
+        """
+        self.interval = 1.0 / max(rate, 0.01)
+        self.max_pending = max(1, max_pending)
+        self._queue: deque[tuple[Hashable, Callable[[], Awaitable[Any]]]] = deque()
+        self._pending: set[Hashable] = set()
+        self._worker: asyncio.Task[None] | None = None
+
+        self.executed: int = 0
+        self.failed: int = 0
+        self.dropped: int = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def submit(self, key: Hashable, action: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Enfileirar uma ação
+
+        Args:
+            key: Identificador da ação (ex.: ``(guild_id, user_id)``)
+            action: Função que cria a corrotina da ação
+
+        Returns:
+            False se a ação já estava na fila ou a fila está cheia
+        """
+        if key in self._pending:
+            return False
+        if len(self._queue) >= self.max_pending:
+            self.dropped += 1
+            return False
+        self._queue.append((key, action))
+        self._pending.add(key)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return True
+
+    async def _run(self) -> None:
+        """Executar a fila no ritmo configurado"""
+        while self._queue:
+            key, action = self._queue.popleft()
+            self._pending.discard(key)
+            try:
+                await action()
+                self.executed += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"⚠️ Ação em massa falhou ({key}): {e}")
+            await asyncio.sleep(self.interval)
+
+    async def close(self) -> None:
+        """Descartar a fila e parar o worker"""
+        self._queue.clear()
+        self._pending.clear()
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do executor"""
+        return {
+            "pending": len(self._queue),
+            "executed": self.executed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+        }
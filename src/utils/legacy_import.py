@@ -0,0 +1,132 @@
+"""
+Importação dos Bancos Antigos
+Copia, uma única vez, os arquivos .db por funcionalidade para data/bot.db
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from .migrations import column_mapping, table_columns
+from .schema import TABLES
+
+if TYPE_CHECKING:
+    from .db_pool import ConnectionPool
+
+# Arquivo antigo (em src/data) -> tabelas renomeadas no esquema canônico
+LEGACY_DATABASES: dict[str, dict[str, str]] = {
+    "advanced_permissions.db": {},
+    "sticky.db": {},
+    "cases.db": {},
+    "mutes.db": {},
+    "voice.db": {},
+    "music.db": {},
+    "containers.db": {},
+    "8ball.db": {"predictions": "eightball_predictions", "user_stats": "eightball_stats"},
+}
+
+
+async def _import_file(
+    pool: ConnectionPool, source: str, path: str, renames: dict[str, str]
+) -> tuple[int, int]:
+    """
+    Copiar as tabelas de um arquivo antigo para o banco principal
+
+    Returns:
+        Linhas importadas e linhas descartadas (duplicadas ou inválidas)
+    """
+    imported = skipped = 0
+    async with pool.writer() as db:
+        await db.execute("ATTACH DATABASE ? AS legacy", (path,))
+        try:
+            await db.execute("BEGIN IMMEDIATE")
+            async with db.execute(
+                "SELECT name FROM legacy.sqlite_master "
+                "WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            ) as cursor:
+                tables = [row[0] for row in await cursor.fetchall()]
+
+            for table in tables:
+                target = renames.get(table, table)
+                if target not in TABLES:
+                    print(f"⚠️ Tabela {table} de {source} não existe no esquema atual; ignorada")
+                    continue
+
+                target_columns = await table_columns(db, target)
+                async with db.execute(f'SELECT EXISTS (SELECT 1 FROM main."{target}")') as cursor:
+                    has_rows = (await cursor.fetchone())[0]
+                if has_rows:
+                    # Os IDs antigos colidiriam com os já existentes
+                    target_columns.pop("id", None)
+
+                columns, expressions = column_mapping(
+                    target, target_columns, await table_columns(db, table, "legacy")
+                )
+                async with db.execute(f'SELECT COUNT(*) FROM legacy."{table}"') as cursor:
+                    total = (await cursor.fetchone())[0]
+                if not columns or not total:
+                    continue
+
+                cursor = await db.execute(
+                    f'INSERT OR IGNORE INTO main."{target}" ({", ".join(columns)}) '
+                    f'SELECT {", ".join(expressions)} FROM legacy."{table}" ORDER BY rowid'
+                )
+                imported += cursor.rowcount
+                skipped += total - cursor.rowcount
+
+            await db.execute(
+                "INSERT INTO legacy_imports (source, rows_imported, rows_skipped) VALUES (?, ?, ?)",
+                (source, imported, skipped),
+            )
+            await db.commit()
+        except BaseException:
+            # DETACH não é permitido com a transação aberta
+            await db.rollback()
+            raise
+        finally:
+            await db.execute("DETACH DATABASE legacy")
+    return imported, skipped
+
+
+async def import_legacy_databases(
+    pool: ConnectionPool, data_dir: str, sources: dict[str, dict[str, str]] | None = None
+) -> dict[str, int]:
+    """
+    Importar os bancos antigos ainda não importados
+
+    Cada arquivo é importado em uma transação e registrado em
+    ``legacy_imports``, então a cópia acontece uma única vez mesmo que o
+    arquivo continue no disco (ele não é apagado, servindo de backup).
+
+    Args:
+        pool: Pool do banco principal (esquema já migrado)
+        data_dir: Diretório dos arquivos antigos
+        sources: Arquivos e renomeações de tabela (padrão: ``LEGACY_DATABASES``)
+
+    Returns:
+        Arquivo -> linhas importadas, apenas dos arquivos importados agora
+    """
+    results: dict[str, int] = {}
+    for source, renames in (sources or LEGACY_DATABASES).items():
+        path = os.path.join(data_dir, source)
+        if not os.path.isfile(path):
+            continue
+
+        async with pool.reader() as db, db.execute(
+            "SELECT 1 FROM legacy_imports WHERE source = ?", (source,)
+        ) as cursor:
+            if await cursor.fetchone():
+                continue
+
+        try:
+            imported, skipped = await _import_file(pool, source, path, renames)
+        except Exception as e:
+            print(f"❌ Erro importando {source}: {e}")
+            continue
+
+        results[source] = imported
+        print(f"📦 {source} importado para o banco principal ({imported} linhas)")
+        if skipped:
+            print(f"⚠️ {skipped} linhas de {source} já existiam ou violavam o esquema")
+    return results
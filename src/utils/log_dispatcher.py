@@ -0,0 +1,271 @@
+"""
+Envio Agrupado de Logs
+Fila de saída por canal de log que junta até 10 embeds por mensagem, usa
+webhook quando possível e espera quando o Discord responde 429
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Limites do Discord para uma única mensagem
+MAX_EMBEDS_PER_MESSAGE: int = 10
+MAX_EMBED_CHARS_PER_MESSAGE: int = 6000
+
+
+def pack_embeds(embeds: Sequence[discord.Embed]) -> list[list[discord.Embed]]:
+    """
+    Dividir embeds em mensagens respeitando os limites do Discord
+
+    Args:
+        embeds: Embeds na ordem de chegada
+
+    Returns:
+        Lotes com no máximo 10 embeds e 6000 caracteres cada
+    """
+    batches: list[list[discord.Embed]] = []
+    current: list[discord.Embed] = []
+    chars = 0
+    for embed in embeds:
+        size = len(embed)
+        if current and (
+            len(current) >= MAX_EMBEDS_PER_MESSAGE or chars + size > MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            batches.append(current)
+            current, chars = [], 0
+        current.append(embed)
+        chars += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+class LogDispatcher:
+    """
+    Fila de saída para os canais de log.
+
+    ``send`` só enfileira o embed. Cada canal tem um worker que espera
+    ``window`` segundos (ou até juntar 10 embeds) e entrega a fila em
+    mensagens de até 10 embeds, então uma rajada de eventos custa poucas
+    mensagens em vez de uma por evento. Se o bot pode gerenciar webhooks, a
+    entrega usa um webhook do canal. Em um 429 o lote volta para a fila e o
+    canal espera o ``retry_after`` (ou um atraso exponencial). Com a fila
+    cheia os embeds mais antigos são descartados e contados em ``dropped``.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = 2.0,
+        max_pending: int = 500,
+        use_webhooks: bool = True,
+        webhook_name: str = "Logs",
+        max_backoff: float = 60.0,
+    ) -> None:
+        """
+        Inicializa o dispatcher
+
+        Args:
+            window: Espera (s) para juntar embeds antes de enviar
+            max_pending: Embeds na fila de cada canal
+            use_webhooks: Preferir webhooks ao envio pelo bot
+            webhook_name: Nome do webhook criado nos canais de log
+            max_backoff: Espera máxima (s) depois de um 429
+        """
+        self.window = window
+        self.max_pending = max(1, max_pending)
+        self.use_webhooks = use_webhooks
+        self.webhook_name = webhook_name
+        self.max_backoff = max_backoff
+
+        self._queues: dict[int, deque[discord.Embed]] = {}
+        self._channels: dict[int, discord.abc.Messageable] = {}
+        self._full: dict[int, asyncio.Event] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+        # channel_id -> webhook do canal (None = enviar pelo bot)
+        self._webhooks: dict[int, discord.Webhook | None] = {}
+        self._backoff: dict[int, float] = {}
+
+        self.sent_messages: int = 0
+        self.sent_embeds: int = 0
+        self.dropped: int = 0
+        self.rate_limited: int = 0
+        self.failed: int = 0
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def depth(self, channel_id: int) -> int:
+        """Embeds aguardando envio em um canal"""
+        queue = self._queues.get(channel_id)
+        return len(queue) if queue else 0
+
+    def send(self, channel: discord.abc.Messageable, embed: discord.Embed) -> bool:
+        """
+        Enfileirar um embed para o canal de log
+
+        Args:
+            channel: Canal de log
+            embed: Embed do evento
+
+        Returns:
+            False se a fila estava cheia e um embed antigo foi descartado
+        """
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            queue = self._queues[channel.id] = deque()
+            self._full[channel.id] = asyncio.Event()
+        self._channels[channel.id] = channel
+
+        accepted = True
+        if len(queue) >= self.max_pending:
+            queue.popleft()
+            self.dropped += 1
+            accepted = False
+        queue.append(embed)
+        if len(queue) >= MAX_EMBEDS_PER_MESSAGE:
+            self._full[channel.id].set()
+
+        worker = self._workers.get(channel.id)
+        if worker is None or worker.done():
+            self._workers[channel.id] = asyncio.create_task(self._run(channel.id))
+        return accepted
+
+    async def _run(self, channel_id: int) -> None:
+        """Worker de um canal: espera a janela e entrega a fila"""
+        try:
+            while self._queues.get(channel_id):
+                full = self._full[channel_id]
+                try:
+                    await asyncio.wait_for(full.wait(), self.window)
+                except asyncio.TimeoutError:
+                    pass
+                full.clear()
+                await self._drain(channel_id)
+        except Exception as e:
+            print(f"❌ Erro enviando logs para {channel_id}: {e}")
+        finally:
+            if self._workers.get(channel_id) is asyncio.current_task():
+                del self._workers[channel_id]
+
+    async def _drain(self, channel_id: int) -> None:
+        """Entregar tudo o que está na fila de um canal"""
+        queue = self._queues.get(channel_id)
+        while queue:
+            embeds = [queue.popleft() for _ in range(min(len(queue), MAX_EMBEDS_PER_MESSAGE))]
+            batches = pack_embeds(embeds)
+            for index, batch in enumerate(batches):
+                retry_after = await self._deliver(channel_id, batch)
+                if retry_after is None:
+                    continue
+                # 429: devolver o que não foi enviado para o início da fila
+                unsent = [embed for rest in batches[index:] for embed in rest]
+                queue.extendleft(reversed(unsent))
+                while len(queue) > self.max_pending:
+                    queue.pop()
+                    self.dropped += 1
+                await asyncio.sleep(retry_after)
+                break
+
+    async def _deliver(self, channel_id: int, embeds: list[discord.Embed]) -> float | None:
+        """
+        Enviar um lote
+
+        Returns:
+            None se o lote foi entregue (ou descartado por erro), ou quanto
+            esperar antes de tentar de novo após um 429
+        """
+        channel = self._channels[channel_id]
+        webhook = await self._get_webhook(channel)
+        try:
+            if webhook is not None:
+                await webhook.send(embeds=embeds)
+            else:
+                await channel.send(embeds=embeds)
+        except discord.RateLimited as e:
+            return self._rate_limited(channel_id, e.retry_after)
+        except discord.HTTPException as e:
+            if e.status == 429:
+                return self._rate_limited(channel_id, None)
+            if webhook is not None and isinstance(e, (discord.NotFound, discord.Forbidden)):
+                # Webhook apagado ou sem permissão: voltar a enviar pelo bot
+                self._webhooks[channel_id] = None
+                return 0.0
+            self.failed += 1
+            print(f"⚠️ Lote de logs descartado ({channel_id}): {e}")
+            return None
+
+        self._backoff.pop(channel_id, None)
+        self.sent_messages += 1
+        self.sent_embeds += len(embeds)
+        return None
+
+    def _rate_limited(self, channel_id: int, retry_after: float | None) -> float:
+        """Registrar um 429 e calcular a espera do canal"""
+        self.rate_limited += 1
+        backoff = min(self._backoff.get(channel_id, 0.5) * 2, self.max_backoff)
+        self._backoff[channel_id] = backoff
+        return min(retry_after, self.max_backoff) if retry_after else backoff
+
+    async def _get_webhook(self, channel: discord.abc.Messageable) -> discord.Webhook | None:
+        """Webhook do bot no canal (buscado ou criado uma vez)"""
+        if not self.use_webhooks or not isinstance(channel, discord.TextChannel):
+            return None
+        if channel.id in self._webhooks:
+            return self._webhooks[channel.id]
+
+        webhook = None
+        try:
+            if channel.permissions_for(channel.guild.me).manage_webhooks:
+                for existing in await channel.webhooks():
+                    if existing.name == self.webhook_name and existing.token:
+                        webhook = existing
+                        break
+                else:
+                    webhook = await channel.create_webhook(name=self.webhook_name)
+        except discord.HTTPException as e:
+            print(f"⚠️ Webhook de logs indisponível em #{channel.name}: {e}")
+        self._webhooks[channel.id] = webhook
+        return webhook
+
+    async def flush(self) -> None:
+        """Entregar agora todas as filas"""
+        for channel_id in list(self._queues):
+            await self._drain(channel_id)
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Parar os workers e tentar entregar o que restou (até ``timeout`` s)"""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except Exception as e:
+            print(f"⚠️ Logs pendentes descartados ao encerrar: {e}")
+        self.dropped += len(self)
+        self._queues.clear()
+        self._full.clear()
+        self._channels.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do dispatcher"""
+        return {
+            "channels": len(self._queues),
+            "queued": len(self),
+            "max_depth": max((len(queue) for queue in self._queues.values()), default=0),
+            "sent_messages": self.sent_messages,
+            "sent_embeds": self.sent_embeds,
+            "dropped": self.dropped,
+            "rate_limited": self.rate_limited,
+            "failed": self.failed,
+            "webhooks": sum(1 for webhook in self._webhooks.values() if webhook is not None),
+        }
@@ -0,0 +1,459 @@
+"""
+Armazenamento de Logs de Eventos
+Inserções em lote (write-behind) em tabelas particionadas por dia ou mês,
+com retenção por partição inteira
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import aiosqlite
+
+    from .database import Database
+
+# Prefixo das partições: logs_AAAAMM (mês) ou logs_AAAAMMDD (dia)
+PARTITION_PREFIX = "logs_"
+PARTITION_PATTERN = re.compile(r"^logs_(\d{6}|\d{8})$")
+PARTITION_GRANULARITIES: tuple[str, ...] = ("month", "day")
+
+# Colunas da tabela ``logs`` original, na ordem usada nas inserções
+LOG_COLUMNS: tuple[str, ...] = (
+    "id",
+    "guild_id",
+    "event_type",
+    "user_id",
+    "target_id",
+    "channel_id",
+    "message_id",
+    "data",
+    "timestamp",
+)
+
+PARTITION_TABLE = """
+    CREATE TABLE IF NOT EXISTS "{name}" (
+        id INTEGER PRIMARY KEY,
+        guild_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        user_id TEXT,
+        target_id TEXT,
+        channel_id TEXT,
+        message_id TEXT,
+        data TEXT,
+        timestamp TEXT NOT NULL
+    )
+"""
+
+PARTITION_INDEX = (
+    'CREATE INDEX IF NOT EXISTS "idx_{name}_guild" ON "{name}" (guild_id, timestamp)'
+)
+
+INSERT_QUERY = (
+    'INSERT OR IGNORE INTO "{name}" '
+    f"({', '.join(LOG_COLUMNS)}) VALUES ({', '.join('?' for _ in LOG_COLUMNS)})"
+)
+
+# Partições por SELECT composto em ``select``; o SQLite aceita no máximo 500
+# termos por UNION ALL, então grupos maiores são aninhados em subconsultas
+MAX_COMPOUND_ARMS = 250
+
+# Formato de ``CURRENT_TIMESTAMP`` (UTC), comparável como texto
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def format_timestamp(when: datetime | float | None = None) -> str:
+    """
+    Converter um momento para o formato gravado em ``timestamp``
+
+    Args:
+        when: datetime (sem fuso = UTC), timestamp Unix ou None (agora)
+
+    Returns:
+        Texto ``AAAA-MM-DD HH:MM:SS`` em UTC
+    """
+    if when is None:
+        when = time.time()
+    if isinstance(when, datetime):
+        if when.tzinfo is not None:
+            when = when.astimezone(timezone.utc)
+        return when.strftime(TIMESTAMP_FORMAT)
+    return datetime.fromtimestamp(when, timezone.utc).strftime(TIMESTAMP_FORMAT)
+
+
+def partition_for(timestamp: str, granularity: str = "month") -> str:
+    """
+    Nome da partição de um ``timestamp`` gravado
+
+    Args:
+        timestamp: Texto ``AAAA-MM-DD...`` (também aceita ISO 8601)
+        granularity: ``month`` ou ``day``
+
+    Returns:
+        Nome da tabela (ex.: ``logs_202610``)
+    """
+    digits = timestamp[:10].replace("-", "")
+    return PARTITION_PREFIX + (digits[:6] if granularity == "month" else digits[:8])
+
+
+def partition_range(name: str) -> tuple[str, str]:
+    """
+    Intervalo ``[início, fim)`` coberto por uma partição
+
+    Returns:
+        Timestamps (texto) do início e do fim da partição
+    """
+    key = PARTITION_PATTERN.match(name).group(1)
+    if len(key) == 6:
+        start = datetime(int(key[:4]), int(key[4:]), 1)
+        end = datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+    else:
+        start = datetime(int(key[:4]), int(key[4:6]), int(key[6:]))
+        end = start + timedelta(days=1)
+    return start.strftime(TIMESTAMP_FORMAT), end.strftime(TIMESTAMP_FORMAT)
+
+
+async def list_partitions(db: aiosqlite.Connection) -> list[str]:
+    """Partições existentes, da mais antiga para a mais nova"""
+    async with db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'logs\\_%' ESCAPE '\\'"
+    ) as cursor:
+        names = [row[0] for row in await cursor.fetchall()]
+    return sorted(name for name in names if PARTITION_PATTERN.match(name))
+
+
+async def create_partition(db: aiosqlite.Connection, name: str) -> None:
+    """Criar uma partição e seu índice (idempotente)"""
+    await db.execute(PARTITION_TABLE.format(name=name))
+    await db.execute(PARTITION_INDEX.format(name=name))
+
+
+async def migrate_legacy_logs(db: aiosqlite.Connection, granularity: str = "month") -> int:
+    """
+    Mover as linhas da tabela ``logs`` original para as partições
+
+    Args:
+        db: Conexão de escrita (dentro de uma transação)
+        granularity: ``month`` ou ``day``
+
+    Returns:
+        Número de linhas movidas
+    """
+    async with db.execute(
+        f"SELECT {', '.join(LOG_COLUMNS[1:])} FROM logs ORDER BY timestamp, id"
+    ) as cursor:
+        rows = await cursor.fetchall()
+    if not rows:
+        return 0
+
+    by_partition: dict[str, list[tuple[Any, ...]]] = {}
+    last_id = 0
+    for row in rows:
+        timestamp = str(row[-1] or format_timestamp()).replace("T", " ")[:19]
+        log_id = max(_id_for(timestamp), last_id + 1)
+        last_id = log_id
+        by_partition.setdefault(partition_for(timestamp, granularity), []).append(
+            (log_id, *row[:-1], timestamp)
+        )
+    for name, params in by_partition.items():
+        await create_partition(db, name)
+        await db.executemany(INSERT_QUERY.format(name=name), params)
+    await db.execute("DELETE FROM logs")
+    return len(rows)
+
+
+def _id_for(timestamp: str) -> int:
+    """Menor ID possível para um ``timestamp`` (ms << 10)"""
+    try:
+        when = datetime.strptime(timestamp, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return 0
+    return int(when.timestamp() * 1000) << 10
+
+
+class LogStore:
+    """
+    Logs de eventos em tabelas particionadas, com escrita em lote.
+
+    ``append`` só guarda a linha em memória; o buffer é gravado com um único
+    ``executemany`` por partição, em uma transação, a cada
+    ``flush_interval`` segundos ou quando passa de ``max_pending`` linhas.
+    Cada partição cobre um mês (ou um dia) e a retenção apaga partições
+    inteiras com ``DROP TABLE``, sem reescrever a tabela. As consultas
+    (``select``) juntam só as partições do período pedido com ``UNION ALL``.
+
+    Os IDs são gerados em memória (milissegundos << 10 + sequência), então
+    são únicos entre partições e crescem com o tempo.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        *,
+        granularity: str = "month",
+        flush_interval: float = 5.0,
+        max_pending: int = 500,
+        retention_days: float = 0,
+    ) -> None:
+        """
+        Inicializa o armazenamento
+
+        Args:
+            database: Banco principal
+            granularity: Tamanho da partição (``month`` ou ``day``)
+            flush_interval: Segundos entre gravações do buffer
+            max_pending: Linhas no buffer que forçam a gravação
+            retention_days: Dias de logs mantidos (0 = sem limite)
+        """
+        if granularity not in PARTITION_GRANULARITIES:
+            msg = f"Granularidade de partição inválida: {granularity}"
+            raise ValueError(msg)
+        self.database = database
+        self.granularity = granularity
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+        self.retention_days = retention_days
+
+        self._buffer: list[tuple[Any, ...]] = []
+        self._partitions: set[str] | None = None
+        self._last_id = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._retention_checked = 0.0
+
+        self.appended: int = 0
+        self.flushes: int = 0
+        self.dropped_partitions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def _next_id(self, timestamp: float) -> int:
+        """ID único e crescente para uma linha"""
+        self._last_id = max(int(timestamp * 1000) << 10, self._last_id + 1)
+        return self._last_id
+
+    async def append(
+        self,
+        guild_id: str,
+        event_type: str,
+        *,
+        user_id: str | None = None,
+        target_id: str | None = None,
+        channel_id: str | None = None,
+        message_id: str | None = None,
+        data: str | None = None,
+        when: float | None = None,
+    ) -> int:
+        """
+        Acrescentar uma linha ao buffer
+
+        Args:
+            guild_id: ID do servidor
+            event_type: Tipo do evento
+            user_id: Autor do evento
+            target_id: Alvo do evento
+            channel_id: Canal do evento
+            message_id: Mensagem do evento
+            data: Dados extras (JSON)
+            when: Momento do evento (padrão: agora)
+
+        Returns:
+            ID da linha
+        """
+        when = time.time() if when is None else when
+        log_id = self._next_id(when)
+        self._buffer.append(
+            (
+                log_id,
+                guild_id,
+                event_type,
+                user_id,
+                target_id,
+                channel_id,
+                message_id,
+                data,
+                format_timestamp(when),
+            )
+        )
+        self.appended += 1
+        self._ensure_flush_task()
+        if len(self._buffer) >= self.max_pending and not self._flush_lock.locked():
+            await self.flush()
+        return log_id
+
+    def _ensure_flush_task(self) -> None:
+        """Iniciar o flush periódico no primeiro uso"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Gravar o buffer a cada ``flush_interval`` s e aplicar a retenção a cada hora"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+                if self.retention_days and time.time() - self._retention_checked >= 3600:
+                    self._retention_checked = time.time()
+                    await self.drop_before(
+                        format_timestamp(time.time() - self.retention_days * 86400)
+                    )
+            except Exception as e:
+                print(f"❌ Erro no flush periódico de logs: {e}")
+
+    async def partitions(self, start: str | None = None, end: str | None = None) -> list[str]:
+        """
+        Partições que podem ter linhas em ``[start, end]``
+
+        Args:
+            start: Timestamp inicial (texto), ou None
+            end: Timestamp final (texto), ou None
+
+        Returns:
+            Nomes das partições, da mais antiga para a mais nova
+        """
+        if self._partitions is None:
+            async with self.database.pool.reader() as db:
+                self._partitions = set(await list_partitions(db))
+        names = sorted(self._partitions)
+        if start is None and end is None:
+            return names
+        selected = []
+        for name in names:
+            first, after = partition_range(name)
+            if (start is None or after > start) and (end is None or first <= end):
+                selected.append(name)
+        return selected
+
+    async def flush(self) -> int:
+        """
+        Gravar o buffer em uma única transação
+
+        Returns:
+            Número de linhas gravadas
+        """
+        async with self._flush_lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+
+            by_partition: dict[str, list[tuple[Any, ...]]] = {}
+            for row in batch:
+                by_partition.setdefault(partition_for(row[-1], self.granularity), []).append(row)
+            known = await self.partitions()
+            try:
+                async with self.database.pool.writer() as db:
+                    for name, rows in by_partition.items():
+                        if name not in known:
+                            await create_partition(db, name)
+                        await db.executemany(INSERT_QUERY.format(name=name), rows)
+                    await db.commit()
+            except Exception:
+                # Devolver as linhas para a próxima tentativa
+                self._buffer[:0] = batch
+                raise
+
+            self._partitions.update(by_partition)
+            self.flushes += 1
+            return len(batch)
+
+    async def select(
+        self,
+        where: str,
+        params: Sequence[Any],
+        *,
+        start: str | None = None,
+        end: str | None = None,
+        columns: str = "*",
+        newest: int | None = None,
+    ) -> tuple[str, list[Any]]:
+        """
+        Montar uma subconsulta sobre as partições do período
+
+        O buffer é gravado antes, então a consulta enxerga todas as linhas
+        já registradas. Use o resultado como tabela:
+        ``SELECT ... FROM ({sql}) ORDER BY ...``.
+
+        Args:
+            where: Condição aplicada em cada partição
+            params: Parâmetros da condição
+            start: Timestamp inicial (limita as partições consultadas)
+            end: Timestamp final (limita as partições consultadas)
+            columns: Colunas selecionadas em cada partição
+            newest: Ler só as N linhas mais recentes de cada partição
+                (para consultas com ``ORDER BY timestamp DESC LIMIT N``)
+
+        Returns:
+            SQL e parâmetros da subconsulta
+        """
+        await self.flush()
+        names = await self.partitions(start, end)
+        if not names:
+            # A tabela ``logs`` original tem as mesmas colunas (e fica vazia)
+            return f"SELECT {columns} FROM logs WHERE 0", []
+
+        arms = []
+        for name in names:
+            arm = f'SELECT {columns} FROM "{name}" WHERE {where}'
+            if newest is not None:
+                arm = f"SELECT * FROM ({arm} ORDER BY timestamp DESC, id DESC LIMIT {int(newest)})"
+            arms.append(arm)
+        if len(arms) > MAX_COMPOUND_ARMS:
+            arms = [
+                f"SELECT * FROM ({' UNION ALL '.join(arms[i : i + MAX_COMPOUND_ARMS])})"
+                for i in range(0, len(arms), MAX_COMPOUND_ARMS)
+            ]
+        return " UNION ALL ".join(arms), list(params) * len(names)
+
+    async def drop_before(self, cutoff: str) -> int:
+        """
+        Apagar as partições que terminam antes de ``cutoff``
+
+        A partição que contém o corte é mantida inteira, então a retenção
+        efetiva é arredondada para cima até o fim da partição.
+
+        Args:
+            cutoff: Timestamp (texto) mais antigo a manter
+
+        Returns:
+            Número de partições apagadas
+        """
+        await self.flush()
+        expired = [name for name in await self.partitions() if partition_range(name)[1] <= cutoff]
+        if not expired:
+            return 0
+        async with self.database.pool.writer() as db:
+            for name in expired:
+                await db.execute(f'DROP TABLE IF EXISTS "{name}"')
+            await db.commit()
+        self._partitions.difference_update(expired)
+        self.dropped_partitions += len(expired)
+        return len(expired)
+
+    async def close(self) -> None:
+        """Parar o flush periódico e gravar o buffer"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do armazenamento"""
+        return {
+            "pending": len(self._buffer),
+            "appended": self.appended,
+            "flushes": self.flushes,
+            "partitions": len(self._partitions or ()),
+            "dropped_partitions": self.dropped_partitions,
+            "granularity": self.granularity,
+        }
@@ -0,0 +1,117 @@
+"""
+Watchdog do Event Loop
+Detecta callbacks que seguram o loop (e o heartbeat do gateway) por tempo demais
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+
+class LoopLagWatchdog:
+    """
+    Monitor de bloqueio do event loop.
+
+    Uma tarefa no loop registra um "tick" a cada ``interval`` segundos; uma
+    thread separada confere esse tick. Se o loop passar mais de
+    ``threshold_ms`` sem registrar um tick, algum callback está bloqueando
+    (ex.: ``sqlite3.connect`` ou ``time.sleep`` dentro de um handler) e a
+    thread imprime a pilha atual da thread do loop — ou seja, exatamente o
+    código culpado — uma vez por bloqueio.
+    """
+
+    def __init__(self, threshold_ms: float = 250.0, interval: float = 0.1) -> None:
+        """
+        Inicializa o watchdog
+
+        Args:
+            threshold_ms: Bloqueio mínimo (ms) para gerar um relatório
+            interval: Intervalo (s) entre os ticks do loop
+        """
+        self.threshold: float = threshold_ms / 1000
+        self.interval: float = interval
+
+        self._last_tick: float = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+        # Estatísticas
+        self.stalls: int = 0
+        self.max_lag_ms: float = 0.0
+        self.last_stack: str | None = None
+
+    @property
+    def running(self) -> bool:
+        """Indica se o watchdog está ativo"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Iniciar o monitoramento (deve ser chamado de dentro do loop)"""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._tick_loop())
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Parar o monitoramento"""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    async def _tick_loop(self) -> None:
+        """Registrar que o loop está respondendo e medir o atraso de cada tick"""
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.max_lag_ms = max(self.max_lag_ms, (now - expected) * 1000)
+            self._last_tick = now
+
+    def _watch(self) -> None:
+        """Thread de vigilância: relatar bloqueios com a pilha do loop"""
+        reported_tick = None
+        while not self._stop.wait(self.interval):
+            last_tick = self._last_tick
+            blocked_for = time.monotonic() - last_tick
+            if blocked_for < self.threshold or reported_tick == last_tick:
+                continue
+
+            reported_tick = last_tick
+            self.stalls += 1
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            stack = "".join(traceback.format_stack(frame)[-8:]) if frame else "<indisponível>"
+            self.last_stack = stack
+            print(
+                f"⚠️ Event loop bloqueado há {blocked_for * 1000:.0f}ms "
+                f"(limite {self.threshold * 1000:.0f}ms). Pilha atual:\n{stack}"
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do watchdog"""
+        return {
+            "running": self.running,
+            "threshold_ms": self.threshold * 1000,
+            "stalls": self.stalls,
+            "max_lag_ms": round(self.max_lag_ms, 1),
+        }
@@ -0,0 +1,275 @@
+"""
+Pipeline de Processamento de Mensagens
+Um único listener on_message executa todos os estágios registrados pelos cogs
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+from .database import database
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from discord.ext import commands
+
+    StageHandler = Callable[["MessageContext"], Awaitable[Any]]
+    TicketResolver = Callable[[int], Awaitable[bool]]
+
+# Chave de ``MessageContext.data``: violações encontradas pelo estágio antispam_system
+ANTISPAM_VIOLATIONS = "antispam_violations"
+
+
+async def _query_ticket_channel(channel_id: int) -> bool:
+    """Resolver padrão: registro em memória dos canais de ticket abertos"""
+    return await database.tickets.is_ticket_channel(channel_id)
+
+
+class MessageContext:
+    """
+    Contexto compartilhado por todos os estágios de uma mensagem.
+
+    Configurações do servidor e permissões do autor são resolvidas uma vez
+    antes do primeiro estágio; a flag de canal de ticket é resolvida no
+    primeiro acesso e reaproveitada pelos demais estágios.
+    """
+
+    def __init__(
+        self,
+        message: discord.Message,
+        settings: dict[str, Any] | None,
+        ticket_resolver: TicketResolver,
+    ) -> None:
+        self.message: discord.Message = message
+        self.guild: discord.Guild = message.guild  # type: ignore[assignment]
+        self.guild_id: str = str(message.guild.id)  # type: ignore[union-attr]
+        self.channel_id: str = str(message.channel.id)
+        self.author_id: str = str(message.author.id)
+        self.settings: dict[str, Any] | None = settings
+        self.permissions: discord.Permissions = getattr(
+            message.author, "guild_permissions", discord.Permissions.none()
+        )
+        # Dados livres que um estágio pode deixar para os dependentes
+        self.data: dict[str, Any] = {}
+        self.halted_by: str | None = None
+
+        self._ticket_resolver = ticket_resolver
+        self._ticket_task: asyncio.Task[bool] | None = None
+
+    @property
+    def halted(self) -> bool:
+        """Indica se algum estágio interrompeu o processamento"""
+        return self.halted_by is not None
+
+    def halt(self, stage: str) -> None:
+        """Interromper os próximos níveis do pipeline (ex.: mensagem deletada)"""
+        if self.halted_by is None:
+            self.halted_by = stage
+
+    async def is_ticket_channel(self) -> bool:
+        """Verificar (uma única vez por mensagem) se o canal é de ticket"""
+        if self._ticket_task is None:
+            self._ticket_task = asyncio.ensure_future(
+                self._ticket_resolver(self.message.channel.id)
+            )
+        try:
+            return await asyncio.shield(self._ticket_task)
+        except Exception:
+            return False
+
+
+@dataclass
+class StageStats:
+    """Métricas de tempo de um estágio"""
+
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+
+    def record(self, elapsed_ms: float, *, failed: bool = False) -> None:
+        """Registrar uma execução"""
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if failed:
+            self.errors += 1
+
+    @property
+    def avg_ms(self) -> float:
+        """Tempo médio por execução"""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+@dataclass
+class PipelineStage:
+    """Estágio registrado no pipeline"""
+
+    name: str
+    handler: StageHandler
+    depends_on: tuple[str, ...] = ()
+    stats: StageStats = field(default_factory=StageStats)
+
+
+class MessagePipeline:
+    """
+    Pipeline de mensagens com estágios ordenados por dependência.
+
+    Os estágios são agrupados em níveis (ordenação topológica): estágios do
+    mesmo nível são independentes e rodam juntos com ``asyncio.gather``;
+    cada nível só começa quando todos os estágios de que depende terminaram.
+    Se um estágio chama ``ctx.halt()``, os níveis seguintes não rodam.
+    """
+
+    def __init__(self) -> None:
+        self._stages: dict[str, PipelineStage] = {}
+        self._levels: list[list[PipelineStage]] | None = None
+        self.ticket_resolver: TicketResolver = _query_ticket_channel
+
+        # Estatísticas
+        self.messages_processed: int = 0
+        self.total_ms: float = 0.0
+
+    def register(
+        self, name: str, handler: StageHandler, *, depends_on: tuple[str, ...] = ()
+    ) -> None:
+        """
+        Registrar (ou substituir) um estágio
+
+        Args:
+            name: Nome único do estágio
+            handler: Corrotina que recebe o ``MessageContext``
+            depends_on: Estágios que precisam terminar antes deste
+        """
+        self._stages[name] = PipelineStage(name, handler, tuple(depends_on))
+        self._levels = None
+
+    def unregister(self, name: str) -> None:
+        """Remover um estágio (ex.: no cog_unload)"""
+        if self._stages.pop(name, None) is not None:
+            self._levels = None
+
+    @property
+    def stage_names(self) -> list[str]:
+        """Nomes dos estágios registrados"""
+        return list(self._stages)
+
+    def _build_levels(self) -> list[list[PipelineStage]]:
+        """Agrupar estágios em níveis respeitando as dependências"""
+        remaining = dict(self._stages)
+        done: set[str] = set()
+        levels: list[list[PipelineStage]] = []
+
+        while remaining:
+            # Dependências de estágios não registrados são ignoradas
+            ready = [
+                stage
+                for stage in remaining.values()
+                if all(dep in done or dep not in self._stages for dep in stage.depends_on)
+            ]
+            if not ready:
+                cycle = ", ".join(sorted(remaining))
+                msg = f"Dependência circular entre estágios: {cycle}"
+                raise RuntimeError(msg)
+
+            levels.append(ready)
+            for stage in ready:
+                done.add(stage.name)
+                del remaining[stage.name]
+
+        return levels
+
+    @property
+    def levels(self) -> list[list[PipelineStage]]:
+        """Níveis de execução (recalculados apenas quando o registro muda)"""
+        if self._levels is None:
+            self._levels = self._build_levels()
+        return self._levels
+
+    async def _run_stage(self, stage: PipelineStage, ctx: MessageContext) -> None:
+        """Executar um estágio isolando erros e medindo o tempo"""
+        start = time.perf_counter()
+        failed = False
+        try:
+            await stage.handler(ctx)
+        except Exception as e:
+            failed = True
+            print(f"❌ Erro no estágio '{stage.name}' do pipeline: {e}")
+        finally:
+            stage.stats.record((time.perf_counter() - start) * 1000, failed=failed)
+
+    async def build_context(self, message: discord.Message) -> MessageContext:
+        """Resolver os dados compartilhados da mensagem"""
+        settings = await database.get_guild_settings(str(message.guild.id))  # type: ignore[union-attr]
+        return MessageContext(message, settings, self.ticket_resolver)
+
+    async def process(self, message: discord.Message) -> MessageContext | None:
+        """
+        Processar uma mensagem por todos os estágios
+
+        Returns:
+            Contexto usado no processamento ou None se a mensagem foi ignorada
+        """
+        if message.author.bot or not message.guild or not self._stages:
+            return None
+
+        start = time.perf_counter()
+        try:
+            ctx = await self.build_context(message)
+        except Exception as e:
+            print(f"❌ Erro montando contexto da mensagem: {e}")
+            return None
+
+        for level in self.levels:
+            if ctx.halted:
+                break
+            if len(level) == 1:
+                await self._run_stage(level[0], ctx)
+            else:
+                await asyncio.gather(*(self._run_stage(stage, ctx) for stage in level))
+
+        self.messages_processed += 1
+        self.total_ms += (time.perf_counter() - start) * 1000
+        return ctx
+
+    def stats(self) -> dict[str, Any]:
+        """Obter métricas do pipeline, estágios mais lentos primeiro"""
+        stages = sorted(self._stages.values(), key=lambda s: s.stats.total_ms, reverse=True)
+        return {
+            "messages_processed": self.messages_processed,
+            "avg_ms": self.total_ms / self.messages_processed if self.messages_processed else 0.0,
+            "levels": [[stage.name for stage in level] for level in self.levels],
+            "stages": {
+                stage.name: {
+                    "calls": stage.stats.calls,
+                    "errors": stage.stats.errors,
+                    "avg_ms": round(stage.stats.avg_ms, 3),
+                    "max_ms": round(stage.stats.max_ms, 3),
+                    "total_ms": round(stage.stats.total_ms, 3),
+                }
+                for stage in stages
+            },
+        }
+
+
+def get_message_pipeline(bot: commands.Bot) -> MessagePipeline:
+    """
+    Obter o pipeline de mensagens do bot, criando-o no primeiro uso
+
+    O pipeline instala um único listener ``on_message`` no bot; os cogs
+    apenas registram estágios (no ``cog_load``) e os removem no ``cog_unload``.
+    """
+    pipeline = getattr(bot, "message_pipeline", None)
+    if pipeline is None:
+        pipeline = MessagePipeline()
+        bot.message_pipeline = pipeline  # type: ignore[attr-defined]
+        bot.add_listener(pipeline.process, "on_message")
+    return pipeline
@@ -0,0 +1,323 @@
+"""
+Migrações do Esquema do Banco de Dados
+Aplica, em ordem e uma única vez, as versões do esquema de data/bot.db
+"""
+
+from __future__ import annotations
+
+import re
+from functools import partial
+from typing import TYPE_CHECKING, NamedTuple
+
+from .antispam_rollups import rebuild_rollups
+from .log_store import migrate_legacy_logs
+from .schema import (
+    ANTISPAM_CONFIG_TABLES,
+    ANTISPAM_ROLLUP_INDEXES,
+    ANTISPAM_ROLLUP_TABLES,
+    BASE_INDEXES,
+    BASE_TABLES,
+    HISTORY_SCAN_TABLES,
+    LEGACY_COLUMNS,
+    LIST_PAGINATION_INDEXES,
+    SCHEDULER_INDEXES,
+    SCHEDULER_TABLES,
+    STICKY_COUNTER_TABLES,
+    SUGGESTION_EXPIRY_TABLES,
+    TICKET_POOL_TABLES,
+    TRANSCRIPT_INDEXES,
+    TRANSCRIPT_TABLES,
+)
+from .xp_accumulator import calculate_level
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Mapping
+
+    import aiosqlite
+
+    from .db_pool import ConnectionPool
+
+
+class Migration(NamedTuple):
+    """Uma versão do esquema"""
+
+    version: int
+    description: str
+    apply: Callable[[aiosqlite.Connection], Awaitable[None]]
+
+
+SCHEMA_MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        description TEXT NOT NULL,
+        applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+async def table_columns(
+    db: aiosqlite.Connection, table: str, schema: str = "main"
+) -> dict[str, bool]:
+    """
+    Colunas de uma tabela
+
+    Args:
+        db: Conexão
+        table: Nome da tabela
+        schema: Banco (``main`` ou o nome de um ``ATTACH``)
+
+    Returns:
+        Nome da coluna -> se ela é NOT NULL (vazio se a tabela não existe)
+    """
+    async with db.execute(f'PRAGMA "{schema}".table_info("{table}")') as cursor:
+        return {row[1]: bool(row[3]) for row in await cursor.fetchall()}
+
+
+def column_mapping(
+    table: str, target_columns: Iterable[str], source_columns: Iterable[str]
+) -> tuple[list[str], list[str]]:
+    """
+    Casar as colunas de uma tabela antiga com as da tabela canônica
+
+    Colunas de mesmo nome são copiadas direto; colunas renomeadas (ver
+    ``LEGACY_COLUMNS``) preenchem a coluna nova quando ela não existe ou
+    está vazia na origem.
+
+    Args:
+        table: Nome canônico da tabela
+        target_columns: Colunas de destino
+        source_columns: Colunas disponíveis na origem
+
+    Returns:
+        Colunas de destino e as expressões SELECT correspondentes
+    """
+    source = set(source_columns)
+    legacy = LEGACY_COLUMNS.get(table, {})
+    targets: list[str] = []
+    expressions: list[str] = []
+    for column in target_columns:
+        sources = [column] if column in source else []
+        sources += [old for old, new in legacy.items() if new == column and old in source]
+        if not sources:
+            continue
+        targets.append(column)
+        quoted = [f'"{name}"' for name in sources]
+        expressions.append(quoted[0] if len(quoted) == 1 else f"COALESCE({', '.join(quoted)})")
+    return targets, expressions
+
+
+def _create_sql_as(create_sql: str, name: str) -> str:
+    """Reescrever um ``CREATE TABLE`` para criar a tabela com outro nome"""
+    return re.sub(
+        r"CREATE TABLE IF NOT EXISTS \w+", f"CREATE TABLE {name}", create_sql, count=1
+    )
+
+
+async def reconcile_table(db: aiosqlite.Connection, table: str, create_sql: str) -> bool:
+    """
+    Reconstruir uma tabela existente no formato canônico, se ela divergir
+
+    Segue o procedimento recomendado pelo SQLite para mudanças que
+    ``ALTER TABLE`` não suporta (remover NOT NULL, trocar UNIQUE...): cria a
+    tabela canônica com outro nome, copia os dados, apaga a antiga e
+    renomeia a nova. Linhas que violam as restrições canônicas são
+    descartadas e contadas.
+
+    Args:
+        db: Conexão de escrita (dentro de uma transação)
+        table: Nome da tabela
+        create_sql: ``CREATE TABLE`` da definição canônica
+
+    Returns:
+        True se a tabela foi reconstruída
+    """
+    current = await table_columns(db, table)
+    if not current:
+        await db.execute(create_sql)
+        return False
+
+    staging = f"_canonical_{table}"
+    await db.execute(f'DROP TABLE IF EXISTS "{staging}"')
+    await db.execute(_create_sql_as(create_sql, staging))
+    canonical = await table_columns(db, staging)
+    if canonical == current:
+        await db.execute(f'DROP TABLE "{staging}"')
+        return False
+
+    targets, expressions = column_mapping(table, canonical, current)
+    async with db.execute(f'SELECT COUNT(*) FROM "{table}"') as cursor:
+        total = (await cursor.fetchone())[0]
+    # DROP TABLE leva os índices junto; eles são recriados na tabela nova
+    async with db.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table,),
+    ) as cursor:
+        index_sql = [row[0] for row in await cursor.fetchall()]
+    if targets:
+        cursor = await db.execute(
+            f'INSERT OR IGNORE INTO "{staging}" ({", ".join(targets)}) '
+            f'SELECT {", ".join(expressions)} FROM "{table}" ORDER BY rowid'
+        )
+        copied = cursor.rowcount
+    else:
+        copied = 0
+    await db.execute(f'DROP TABLE "{table}"')
+    await db.execute(f'ALTER TABLE "{staging}" RENAME TO "{table}"')
+    for sql in index_sql:
+        await db.execute(sql)
+
+    if total:
+        print(f"🔧 Tabela {table} convertida para o esquema canônico ({copied}/{total} linhas)")
+    if copied < total:
+        print(f"⚠️ {total - copied} linhas de {table} violavam o esquema e foram descartadas")
+    return True
+
+
+async def _create_tables(
+    db: aiosqlite.Connection, tables: Mapping[str, str], indexes: Iterable[str] = ()
+) -> None:
+    """Criar tabelas e índices de uma versão (idempotente)"""
+    for create_sql in tables.values():
+        await db.execute(create_sql)
+    for index_sql in indexes:
+        await db.execute(index_sql)
+
+
+async def _reconcile_tables(db: aiosqlite.Connection, tables: Mapping[str, str]) -> None:
+    """Reconstruir as tabelas cuja definição mudou nesta versão"""
+    for table, create_sql in tables.items():
+        await reconcile_table(db, table, create_sql)
+
+
+async def _reconcile_base_tables(db: aiosqlite.Connection) -> None:
+    """v2: converter tabelas criadas pelas definições antigas e conflitantes"""
+    for table, create_sql in BASE_TABLES.items():
+        rebuilt = await reconcile_table(db, table, create_sql)
+        if rebuilt and table == "user_levels":
+            # As fórmulas antigas de level eram diferentes da atual
+            async with db.execute("SELECT id, total_xp FROM user_levels") as cursor:
+                rows = await cursor.fetchall()
+            await db.executemany(
+                "UPDATE user_levels SET level = ? WHERE id = ?",
+                [(calculate_level(total_xp or 0), row_id) for row_id, total_xp in rows],
+            )
+
+
+async def _create_antispam_rollups(db: aiosqlite.Connection) -> None:
+    """v6: logs e rollups do antispam, com backfill dos logs já existentes"""
+    await _create_tables(db, ANTISPAM_ROLLUP_TABLES, ANTISPAM_ROLLUP_INDEXES)
+    await rebuild_rollups(db)
+
+
+async def _partition_logs(db: aiosqlite.Connection) -> None:
+    """v8: mover a tabela ``logs`` para as partições mensais"""
+    moved = await migrate_legacy_logs(db)
+    if moved:
+        print(f"🔧 {moved} logs movidos para as partições mensais")
+
+
+# Versões do esquema, em ordem. Cada uma usa só o DDL congelado do seu bloco em
+# schema.py; para mudar o esquema, acrescente um bloco e uma versão nova (ex.:
+# ``partial(_reconcile_tables, tables=NOVO_BLOCO)`` reconstrói as tabelas
+# alteradas). Nunca altere uma versão já publicada nem o DDL que ela usa.
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "Esquema base unificado", partial(_create_tables, tables=BASE_TABLES)),
+    Migration(2, "Reconciliar tabelas com colunas conflitantes", _reconcile_base_tables),
+    Migration(
+        3,
+        "Índices das consultas frequentes",
+        partial(_create_tables, tables={}, indexes=BASE_INDEXES),
+    ),
+    Migration(
+        4,
+        "Agendador persistente e enquetes",
+        partial(_create_tables, tables=SCHEDULER_TABLES, indexes=SCHEDULER_INDEXES),
+    ),
+    Migration(
+        5,
+        "Política de antispam unificada (antispam_config)",
+        partial(_reconcile_tables, tables=ANTISPAM_CONFIG_TABLES),
+    ),
+    Migration(6, "Rollups das estatísticas de antispam", _create_antispam_rollups),
+    Migration(
+        7,
+        "Contador persistente das sticky messages",
+        partial(_reconcile_tables, tables=STICKY_COUNTER_TABLES),
+    ),
+    Migration(8, "Logs de eventos particionados", _partition_logs),
+    Migration(
+        9,
+        "Mensagens dos transcripts de tickets",
+        partial(_create_tables, tables=TRANSCRIPT_TABLES, indexes=TRANSCRIPT_INDEXES),
+    ),
+    Migration(
+        10,
+        "Pool de canais de ticket (ticket_config.pool_size)",
+        partial(_reconcile_tables, tables=TICKET_POOL_TABLES),
+    ),
+    Migration(
+        11,
+        "Checkpoints da leitura de histórico",
+        partial(_create_tables, tables=HISTORY_SCAN_TABLES),
+    ),
+    Migration(
+        12,
+        "Índices da paginação por chave das listas",
+        partial(_create_tables, tables={}, indexes=LIST_PAGINATION_INDEXES),
+    ),
+    Migration(
+        13,
+        "Prazo de votação das sugestões (suggestions.expires_at)",
+        partial(_reconcile_tables, tables=SUGGESTION_EXPIRY_TABLES),
+    ),
+)
+
+LATEST_VERSION: int = MIGRATIONS[-1].version
+
+
+async def get_schema_version(db: aiosqlite.Connection) -> int:
+    """Versão do esquema gravada no cabeçalho do arquivo (``PRAGMA user_version``)"""
+    async with db.execute("PRAGMA user_version") as cursor:
+        row = await cursor.fetchone()
+        return row[0] if row else 0
+
+
+async def run_migrations(
+    pool: ConnectionPool, migrations: Iterable[Migration] = MIGRATIONS
+) -> list[Migration]:
+    """
+    Aplicar as migrações pendentes
+
+    Cada versão roda em uma transação própria junto com a atualização de
+    ``user_version``: se falhar, o banco permanece na versão anterior e a
+    migração é tentada de novo na próxima inicialização.
+
+    Args:
+        pool: Pool do banco principal
+        migrations: Versões disponíveis
+
+    Returns:
+        Migrações aplicadas nesta chamada
+    """
+    applied: list[Migration] = []
+    async with pool.writer() as db:
+        await db.execute(SCHEMA_MIGRATIONS_TABLE)
+        await db.commit()
+        current = await get_schema_version(db)
+
+        for migration in sorted(migrations, key=lambda m: m.version):
+            if migration.version <= current:
+                continue
+            await db.execute("BEGIN IMMEDIATE")
+            await migration.apply(db)
+            await db.execute(
+                "INSERT OR REPLACE INTO schema_migrations (version, description) VALUES (?, ?)",
+                (migration.version, migration.description),
+            )
+            await db.execute(f"PRAGMA user_version = {int(migration.version)}")
+            await db.commit()
+
+            current = migration.version
+            applied.append(migration)
+            print(f"🔧 Migração v{migration.version} aplicada: {migration.description}")
+    return applied
@@ -0,0 +1,387 @@
+"""
+Páginas Sob Demanda para Listas
+Provedores que buscam uma página por vez (paginação por chave, sem OFFSET),
+guardam só as páginas visitadas e contam o total em segundo plano
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from .database import Database
+
+# Ordem padrão das listas: mais recentes primeiro, ``id`` desempata
+NEWEST_FIRST: tuple[tuple[str, str], ...] = (("created_at", "DESC"), ("id", "DESC"))
+# Espera máxima (s) pelo total ao montar a primeira página
+COUNT_WAIT = 0.25
+
+
+class PageProvider(ABC):
+    """
+    Páginas de uma lista, buscadas sob demanda.
+
+    Cada página é lida a partir do cursor em que a anterior terminou
+    (``_fetch``), então abrir a primeira página custa uma consulta de
+    ``page_size + 1`` itens, não importa o tamanho da lista. Os cursores de
+    início de página ficam guardados para voltar e pular páginas; as linhas,
+    só das ``max_cached_pages`` páginas visitadas mais recentes. O total é
+    contado por uma tarefa em segundo plano iniciada na primeira página:
+    até ela terminar, ``total`` e ``page_count`` são None.
+
+    Subclasses implementam ``_fetch``, ``_cursor`` e ``_count`` (e, se
+    houver um jeito mais barato, ``_skip``).
+    """
+
+    def __init__(self, page_size: int = 10, *, max_cached_pages: int = 20) -> None:
+        """
+        Inicializa o provedor
+
+        Args:
+            page_size: Itens por página
+            max_cached_pages: Páginas visitadas mantidas em memória
+        """
+        self.page_size = max(1, page_size)
+        self.max_cached_pages = max(1, max_cached_pages)
+
+        # página -> itens (LRU das visitadas)
+        self._pages: OrderedDict[int, list[Any]] = OrderedDict()
+        # página -> cursor do início (None = início da lista)
+        self._starts: dict[int, Any] = {0: None}
+        # Última página, quando já se sabe onde a lista termina
+        self._last: int | None = None
+        self._count_task: asyncio.Task[int] | None = None
+
+        self.fetches: int = 0
+        self.cache_hits: int = 0
+
+    @abstractmethod
+    async def _fetch(self, cursor: Any, limit: int) -> list[Any]:
+        """Até ``limit`` itens depois de ``cursor`` (None = do início)"""
+
+    @abstractmethod
+    def _cursor(self, item: Any) -> Any:
+        """Cursor que aponta para logo depois de ``item``"""
+
+    @abstractmethod
+    async def _count(self) -> int:
+        """Total de itens da lista"""
+
+    async def _skip(self, cursor: Any, offset: int) -> tuple[bool, Any]:
+        """
+        Avançar ``offset`` itens a partir de ``cursor``
+
+        Returns:
+            (False, None) se a lista acaba antes, senão (True, novo cursor)
+        """
+        items = await self._fetch(cursor, offset)
+        if len(items) < offset:
+            return False, None
+        return True, self._cursor(items[-1])
+
+    async def page(self, index: int) -> list[Any]:
+        """
+        Itens de uma página (a partir de 0)
+
+        Args:
+            index: Página
+
+        Returns:
+            Itens da página (vazia se a lista acaba antes dela)
+        """
+        self.start_count()
+        index = max(0, index)
+        cached = self._pages.get(index)
+        if cached is not None:
+            self._pages.move_to_end(index)
+            self.cache_hits += 1
+            return cached
+
+        if self._last is not None and index > self._last:
+            return []
+        known = max(page for page in self._starts if page <= index)
+        cursor = self._starts[known]
+        if known < index:
+            found, cursor = await self._skip(cursor, (index - known) * self.page_size)
+            if not found:
+                return []
+            self._starts[index] = cursor
+
+        items = await self._fetch(cursor, self.page_size + 1)
+        self.fetches += 1
+        if len(items) > self.page_size:
+            items = items[: self.page_size]
+            self._starts[index + 1] = self._cursor(items[-1])
+        else:
+            self._last = index
+
+        self._pages[index] = items
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
+        return items
+
+    def has_next(self, index: int) -> bool:
+        """Verificar se existe uma página depois de ``index`` (após lê-la)"""
+        if self._last is not None:
+            return index < self._last
+        if index + 1 in self._starts:
+            return True
+        page_count = self.page_count
+        return page_count is not None and index + 1 < page_count
+
+    def start_count(self) -> None:
+        """Iniciar a contagem do total em segundo plano"""
+        if self._count_task is None:
+            self._count_task = asyncio.create_task(self._count())
+
+    async def count(self) -> int:
+        """Esperar e retornar o total de itens"""
+        self.start_count()
+        return await asyncio.shield(self._count_task)
+
+    async def wait_total(self, timeout: float = COUNT_WAIT) -> int | None:
+        """
+        Esperar a contagem por no máximo ``timeout`` segundos
+
+        Returns:
+            Total de itens, ou None se a contagem ainda não terminou
+        """
+        self.start_count()
+        await asyncio.wait({self._count_task}, timeout=timeout)
+        return self.total
+
+    @property
+    def total(self) -> int | None:
+        """Total de itens, se a contagem já terminou"""
+        task = self._count_task
+        if task is None or not task.done() or task.cancelled() or task.exception():
+            return None
+        return task.result()
+
+    @property
+    def page_count(self) -> int | None:
+        """Quantidade de páginas, se já conhecida"""
+        total = self.total
+        if total is not None:
+            return max(1, -(-total // self.page_size))
+        if self._last is not None:
+            return self._last + 1
+        return None
+
+    def page_label(self, index: int) -> str:
+        """Texto ``Página X/Y`` (``Y`` é ``?`` enquanto o total não foi contado)"""
+        page_count = self.page_count
+        return f"Página {index + 1}/{page_count if page_count is not None else '?'}"
+
+    def reset(self) -> None:
+        """Descartar páginas, cursores e total (para recarregar a lista)"""
+        if self._count_task is not None and not self._count_task.done():
+            self._count_task.cancel()
+        self._count_task = None
+        self._pages.clear()
+        self._starts = {0: None}
+        self._last = None
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do provedor"""
+        return {
+            "cached_pages": len(self._pages),
+            "known_pages": len(self._starts),
+            "fetches": self.fetches,
+            "cache_hits": self.cache_hits,
+            "total": self.total,
+        }
+
+
+class KeysetPageProvider(PageProvider):
+    """
+    Páginas de uma tabela com paginação por chave (seek).
+
+    Em vez de ``LIMIT/OFFSET``, cada página continua a partir dos valores
+    das colunas de ordenação da última linha da anterior
+    (``WHERE (created_at, id) < (?, ?)`` para ``NEWEST_FIRST``), o que usa o
+    índice e custa o mesmo na primeira e na milésima página. As colunas de
+    ordenação precisam identificar a linha (termine com ``id``) e não podem
+    ser NULL. Tabela, colunas e filtro são trechos de SQL do próprio código;
+    os valores vão em ``params``.
+
+    Com ``group_by``, a contagem em segundo plano também separa o total por
+    valor dessa coluna (``groups``), na mesma consulta.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        table: str,
+        *,
+        where: str = "",
+        params: Sequence[Any] = (),
+        order: Sequence[tuple[str, str]] = NEWEST_FIRST,
+        columns: str = "*",
+        group_by: str | None = None,
+        page_size: int = 10,
+        max_cached_pages: int = 20,
+    ) -> None:
+        """
+        Inicializa o provedor
+
+        Args:
+            database: Banco principal
+            table: Tabela consultada
+            where: Filtro (sem ``WHERE``), com ``?`` para os parâmetros
+            params: Parâmetros do filtro
+            order: Colunas de ordenação e direção (``ASC``/``DESC``)
+            columns: Colunas retornadas (as de ordenação são acrescentadas)
+            group_by: Coluna para separar o total (ex.: ``status``)
+            page_size: Linhas por página
+            max_cached_pages: Páginas visitadas mantidas em memória
+        """
+        super().__init__(page_size, max_cached_pages=max_cached_pages)
+        self.database = database
+        self.table = table
+        self.where = where
+        self.params = tuple(params)
+        self.order = tuple((column, direction.upper()) for column, direction in order)
+        self.keys = tuple(column for column, _ in self.order)
+        if columns.strip() != "*":
+            selected = [column.strip() for column in columns.split(",")]
+            columns = ", ".join(selected + [key for key in self.keys if key not in selected])
+        self.columns = columns
+        self.group_by = group_by
+        # valor de ``group_by`` -> linhas (preenchido pela contagem)
+        self.groups: dict[Any, int] | None = None
+
+    def _seek(self, cursor: tuple[Any, ...] | None) -> tuple[str, tuple[Any, ...]]:
+        """Filtro completo (``WHERE``) e parâmetros a partir do cursor"""
+        clauses = [f"({self.where})"] if self.where else []
+        params = list(self.params)
+        if cursor is not None:
+            directions = {direction for _, direction in self.order}
+            if len(directions) == 1:
+                # Comparação de row values: o SQLite faz range seek no índice
+                operator = "<" if directions == {"DESC"} else ">"
+                marks = ", ".join("?" for _ in self.keys)
+                clauses.append(f"({', '.join(self.keys)}) {operator} ({marks})")
+                params.extend(cursor)
+            else:
+                # Direções mistas: a > x OR (a = x AND b < y) ..., com um limite na
+                # primeira coluna (a >= x) para o índice ainda delimitar a busca
+                column, direction = self.order[0]
+                clauses.append(f"{column} {'<=' if direction == 'DESC' else '>='} ?")
+                params.append(cursor[0])
+                options = []
+                for position, (column, direction) in enumerate(self.order):
+                    terms = [f"{key} = ?" for key in self.keys[:position]]
+                    terms.append(f"{column} {'<' if direction == 'DESC' else '>'} ?")
+                    options.append("(" + " AND ".join(terms) + ")")
+                    params.extend(cursor[: position + 1])
+                clauses.append("(" + " OR ".join(options) + ")")
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
+
+    def _order_sql(self) -> str:
+        return ", ".join(f"{column} {direction}" for column, direction in self.order)
+
+    async def _fetch(self, cursor: tuple[Any, ...] | None, limit: int) -> list[dict[str, Any]]:
+        where, params = self._seek(cursor)
+        return await self.database.get_all(
+            f"SELECT {self.columns} FROM {self.table}{where} "
+            f"ORDER BY {self._order_sql()} LIMIT ?",
+            (*params, limit),
+        )
+
+    def _cursor(self, item: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple(item[key] for key in self.keys)
+
+    async def _skip(self, cursor: tuple[Any, ...] | None, offset: int) -> tuple[bool, Any]:
+        # Só as colunas de ordenação, direto do índice
+        where, params = self._seek(cursor)
+        row = await self.database.get(
+            f"SELECT {', '.join(self.keys)} FROM {self.table}{where} "
+            f"ORDER BY {self._order_sql()} LIMIT 1 OFFSET ?",
+            (*params, offset - 1),
+        )
+        if row is None:
+            return False, None
+        return True, self._cursor(row)
+
+    async def _count(self) -> int:
+        where, params = self._seek(None)
+        if self.group_by is None:
+            row = await self.database.get(
+                f"SELECT COUNT(*) AS total FROM {self.table}{where}", params
+            )
+            return row["total"] if row else 0
+        rows = await self.database.get_all(
+            f"SELECT {self.group_by} AS value, COUNT(*) AS total FROM {self.table}{where} "
+            f"GROUP BY {self.group_by}",
+            params,
+        )
+        self.groups = {row["value"]: row["total"] for row in rows}
+        return sum(self.groups.values())
+
+    def reset(self) -> None:
+        super().reset()
+        self.groups = None
+
+
+class BanPageProvider(PageProvider):
+    """
+    Páginas da lista de banidos de um servidor.
+
+    A API devolve os banimentos em ordem crescente de ID do usuário, em
+    blocos de até 1000; cada página pede só o necessário a partir do último
+    usuário da anterior (``after``). Com ``predicate`` (busca por nome), a
+    leitura continua até encher a página com banimentos que passam no filtro.
+    """
+
+    def __init__(
+        self,
+        guild: discord.Guild,
+        *,
+        predicate: Callable[[discord.BanEntry], bool] | None = None,
+        page_size: int = 10,
+        max_cached_pages: int = 20,
+    ) -> None:
+        """
+        Inicializa o provedor
+
+        Args:
+            guild: Servidor
+            predicate: Filtro dos banimentos (None = todos)
+            page_size: Banimentos por página
+            max_cached_pages: Páginas visitadas mantidas em memória
+        """
+        super().__init__(page_size, max_cached_pages=max_cached_pages)
+        self.guild = guild
+        self.predicate = predicate
+
+    async def _fetch(self, cursor: int | None, limit: int) -> list[discord.BanEntry]:
+        after = discord.Object(id=cursor) if cursor else discord.utils.MISSING
+        if self.predicate is None:
+            return [entry async for entry in self.guild.bans(limit=limit, after=after)]
+        entries: list[discord.BanEntry] = []
+        async for entry in self.guild.bans(limit=None, after=after):
+            if self.predicate(entry):
+                entries.append(entry)
+                if len(entries) >= limit:
+                    break
+        return entries
+
+    def _cursor(self, item: discord.BanEntry) -> int:
+        return item.user.id
+
+    async def _count(self) -> int:
+        # Percorre a lista contando, sem guardar os banimentos
+        total = 0
+        async for entry in self.guild.bans(limit=None):
+            if self.predicate is None or self.predicate(entry):
+                total += 1
+        return total
@@ -7,12 +7,10 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from functools import wraps
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import aiosqlite
-
 from . import json_utils
+from .database import database
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable
@@ -24,67 +22,13 @@ class AdvancedPermissionSystem:
     """Sistema avançado de permissões com suporte a dashboard"""
 
     def __init__(self) -> None:
-        data_dir = Path(__file__).parent.parent / "data"
-        self.db_path: str = str(data_dir / "advanced_permissions.db")
         self._cache: dict[str, Any] = {}
         self._initialized: bool = False
 
     async def initialize(self) -> None:
         """Inicializar sistema de permissões"""
-        if self._initialized:
-            return
-
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        async with aiosqlite.connect(self.db_path) as db:
-            # Configurações do servidor
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS guild_config (
-                    guild_id TEXT PRIMARY KEY,
-                    admin_role_ids TEXT,
-                    mod_role_ids TEXT,
-                    dj_role_ids TEXT,
-                    support_role_ids TEXT,
-                    dashboard_enabled BOOLEAN DEFAULT 1,
-                    require_roles_for_moderation BOOLEAN DEFAULT 1,
-                    require_roles_for_music BOOLEAN DEFAULT 0,
-                    custom_config JSON,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Permissões por comando
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS command_overrides (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    command_name TEXT NOT NULL,
-                    allowed_roles TEXT,
-                    denied_roles TEXT,
-                    allowed_users TEXT,
-                    denied_users TEXT,
-                    admin_only BOOLEAN DEFAULT 0,
-                    mod_only BOOLEAN DEFAULT 0,
-                    enabled BOOLEAN DEFAULT 1,
-                    UNIQUE(guild_id, command_name)
-                )
-            """)
-
-            # Estatísticas para dashboard
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS command_analytics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    command_name TEXT NOT NULL,
-                    category TEXT,
-                    success BOOLEAN DEFAULT 1,
-                    execution_time REAL,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            await db.commit()
-
+        # As tabelas (guild_config, command_overrides, command_analytics)
+        # ficam no banco principal e são criadas pelas migrações
         self._initialized = True
 
     async def get_guild_config(self, guild_id: str) -> dict:
@@ -92,64 +36,55 @@ class AdvancedPermissionSystem:
         if guild_id in self._cache:
             return self._cache[guild_id]
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM guild_config WHERE guild_id = ?", (guild_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-
-                if row:
-                    config = dict(row)
-                    # Parse JSON fields
-                    if config.get("custom_config"):
-                        config["custom_config"] = json_utils.loads(config["custom_config"])
-                    else:
-                        config["custom_config"] = {}
-                else:
-                    # Criar config padrão
-                    config = {
-                        "guild_id": guild_id,
-                        "admin_role_ids": "",
-                        "mod_role_ids": "",
-                        "dj_role_ids": "",
-                        "support_role_ids": "",
-                        "dashboard_enabled": True,
-                        "require_roles_for_moderation": True,
-                        "require_roles_for_music": False,
-                        "custom_config": {},
-                    }
-
-                    await db.execute(
-                        """
-                        INSERT INTO guild_config (guild_id) VALUES (?)
-                    """,
-                        (guild_id,),
-                    )
-                    await db.commit()
-
-                self._cache[guild_id] = config
-                return config
+        row = await database.storage.get(
+            "SELECT * FROM guild_config WHERE guild_id = ?", (guild_id,)
+        )
+
+        if row:
+            config = dict(row)
+            # Parse JSON fields
+            if config.get("custom_config"):
+                config["custom_config"] = json_utils.loads(config["custom_config"])
+            else:
+                config["custom_config"] = {}
+        else:
+            # Criar config padrão
+            config = {
+                "guild_id": guild_id,
+                "admin_role_ids": "",
+                "mod_role_ids": "",
+                "dj_role_ids": "",
+                "support_role_ids": "",
+                "dashboard_enabled": True,
+                "require_roles_for_moderation": True,
+                "require_roles_for_music": False,
+                "custom_config": {},
+            }
+
+            await database.storage.run(
+                "INSERT OR IGNORE INTO guild_config (guild_id) VALUES (?)", (guild_id,)
+            )
+
+        self._cache[guild_id] = config
+        return config
 
     async def update_config(self, guild_id: str, **kwargs: Any) -> None:
         """Atualizar configuração do servidor"""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Converter custom_config para JSON se presente
-            if "custom_config" in kwargs:
-                kwargs["custom_config"] = json_utils.dumps(kwargs["custom_config"])
-
-            fields = ", ".join([f"{k} = ?" for k in kwargs])
-            values = list(kwargs.values()) + [guild_id]
-
-            await db.execute(
-                f"""
-                UPDATE guild_config
-                SET {fields}, updated_at = CURRENT_TIMESTAMP
-                WHERE guild_id = ?
-            """,
-                values,
-            )
-            await db.commit()
+        # Converter custom_config para JSON se presente
+        if "custom_config" in kwargs:
+            kwargs["custom_config"] = json_utils.dumps(kwargs["custom_config"])
+
+        fields = ", ".join([f"{k} = ?" for k in kwargs])
+        values = list(kwargs.values()) + [guild_id]
+
+        await database.storage.run(
+            f"""
+            UPDATE guild_config
+            SET {fields}, updated_at = CURRENT_TIMESTAMP
+            WHERE guild_id = ?
+        """,
+            values,
+        )
 
         # Limpar cache
         if guild_id in self._cache:
@@ -182,51 +117,48 @@ class AdvancedPermissionSystem:
         config = await self.get_guild_config(guild_id)
 
         # Verificar override específico do comando
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                """
-                SELECT * FROM command_overrides
-                WHERE guild_id = ? AND command_name = ?
-            """,
-                (guild_id, command_name),
-            ) as cursor:
-                override = await cursor.fetchone()
-
-                if override:
-                    # Comando desabilitado
-                    if not override["enabled"]:
-                        return False, "Comando desabilitado neste servidor"
-
-                    # Usuários negados
-                    if override["denied_users"]:
-                        if str(user.id) in override["denied_users"].split(","):
-                            return False, "Você está na lista de negados"
-
-                    # Usuários permitidos (whitelist)
-                    if override["allowed_users"]:
-                        if str(user.id) in override["allowed_users"].split(","):
-                            return True, "Usuário permitido"
-
-                    # Cargos negados
-                    if override["denied_roles"]:
-                        denied = set(override["denied_roles"].split(","))
-                        user_roles = {str(r.id) for r in user.roles}
-                        if denied & user_roles:
-                            return False, "Seu cargo está na lista de negados"
-
-                    # Verificar requerimentos do override
-                    if override["admin_only"]:
-                        require_admin = True
-                    if override["mod_only"]:
-                        require_mod = True
-
-                    # Cargos permitidos
-                    if override["allowed_roles"]:
-                        allowed = set(override["allowed_roles"].split(","))
-                        user_roles = {str(r.id) for r in user.roles}
-                        if allowed & user_roles:
-                            return True, "Cargo permitido"
+        override = await database.storage.get(
+            """
+            SELECT * FROM command_overrides
+            WHERE guild_id = ? AND command_name = ?
+        """,
+            (guild_id, command_name),
+        )
+
+        if override:
+            # Comando desabilitado
+            if not override["enabled"]:
+                return False, "Comando desabilitado neste servidor"
+
+            # Usuários negados
+            if override["denied_users"]:
+                if str(user.id) in override["denied_users"].split(","):
+                    return False, "Você está na lista de negados"
+
+            # Usuários permitidos (whitelist)
+            if override["allowed_users"]:
+                if str(user.id) in override["allowed_users"].split(","):
+                    return True, "Usuário permitido"
+
+            # Cargos negados
+            if override["denied_roles"]:
+                denied = set(override["denied_roles"].split(","))
+                user_roles = {str(r.id) for r in user.roles}
+                if denied & user_roles:
+                    return False, "Seu cargo está na lista de negados"
+
+            # Verificar requerimentos do override
+            if override["admin_only"]:
+                require_admin = True
+            if override["mod_only"]:
+                require_mod = True
+
+            # Cargos permitidos
+            if override["allowed_roles"]:
+                allowed = set(override["allowed_roles"].split(","))
+                user_roles = {str(r.id) for r in user.roles}
+                if allowed & user_roles:
+                    return True, "Cargo permitido"
 
         # Verificar requisito de admin
         if require_admin:
@@ -280,26 +212,23 @@ class AdvancedPermissionSystem:
         execution_time: float = 0.0,
     ) -> None:
         """Registrar uso de comando para analytics"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO command_analytics
-                (guild_id, user_id, command_name, category, success, execution_time)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (guild_id, user_id, command_name, category, success, execution_time),
-            )
-            await db.commit()
+        await database.storage.run(
+            """
+            INSERT INTO command_analytics
+            (guild_id, user_id, command_name, category, success, execution_time)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            (guild_id, user_id, command_name, category, success, execution_time),
+        )
 
     async def get_analytics(
         self, guild_id: str, days: int = 7
     ) -> dict[str, Any]:
         """Obter analytics para dashboard"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-
-            # Comandos mais usados
-            async with db.execute(
+        # Comandos mais usados
+        top_commands = [
+            dict(row)
+            for row in await database.storage.get_all(
                 """
                 SELECT command_name, category, COUNT(*) as count
                 FROM command_analytics
@@ -310,11 +239,12 @@ class AdvancedPermissionSystem:
                 LIMIT 10
             """,
                 (guild_id, days),
-            ) as cursor:
-                top_commands = [dict(row) async for row in cursor]
+            )
+        ]
 
-            # Taxa de sucesso
-            async with db.execute(
+        # Taxa de sucesso
+        stats = dict(
+            await database.storage.get(
                 """
                 SELECT 
                     COUNT(*) as total,
@@ -324,19 +254,15 @@ class AdvancedPermissionSystem:
                 AND datetime(timestamp) > datetime('now', '-' || ? || ' days')
             """,
                 (guild_id, days),
-            ) as cursor:
-                stats = await cursor.fetchone()
-                success_rate = (
-                    (dict(stats)["successful"] / dict(stats)["total"] * 100)
-                    if dict(stats)["total"] > 0
-                    else 0
-                )
-
-            return {
-                "top_commands": top_commands,
-                "success_rate": round(success_rate, 2),
-                "total_commands": dict(stats)["total"],
-            }
+            )
+        )
+        success_rate = (stats["successful"] / stats["total"] * 100) if stats["total"] > 0 else 0
+
+        return {
+            "top_commands": top_commands,
+            "success_rate": round(success_rate, 2),
+            "total_commands": stats["total"],
+        }
 
 
 # Singleton global
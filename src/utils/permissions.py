@@ -5,17 +5,12 @@ Funções para verificar permissões, roles, hierarquia
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from typing import Any
 
 import discord
 from discord.ext import commands
 
-# Adicionar o diretório src ao path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.database import database
+from .database import database
 
 
 class PermissionChecker:
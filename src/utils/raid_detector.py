@@ -0,0 +1,191 @@
+"""
+Detector de Raid por Conteúdo Repetido
+Impressões digitais do conteúdo normalizado por servidor, com autores e
+canais distintos, em uma tabela com TTL e limite rígido de memória
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from .content_filter import LINK_PATTERN
+
+# Menções variam por mensagem (<@id>, <@&id>, <#id>) e não fazem parte do texto copiado
+MENTION_PATTERN = re.compile(r"<(?:@[!&]?|#)\d+>")
+NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+
+def fingerprint(content: str, min_length: int = 12) -> int | None:
+    """
+    Calcular a impressão digital de uma mensagem
+
+    Args:
+        content: Conteúdo original
+        min_length: Tamanho mínimo do texto normalizado (mensagens com link
+            sempre entram, por menores que sejam)
+
+    Returns:
+        Hash do texto normalizado, ou None se a mensagem for curta demais
+    """
+    if not content:
+        return None
+    text = NON_WORD_PATTERN.sub(" ", MENTION_PATTERN.sub(" ", content).lower()).strip()
+    if not text or (len(text) < min_length and not LINK_PATTERN.search(content)):
+        return None
+    return hash(text)
+
+
+@dataclass(slots=True)
+class FingerprintEntry:
+    """Ocorrências recentes de um mesmo conteúdo em um servidor"""
+
+    first_seen: float
+    last_seen: float
+    authors: set[int] = field(default_factory=set)
+    channels: set[int] = field(default_factory=set)
+    # Mensagens guardadas até o disparo, para a ação em lote
+    messages: list[Any] = field(default_factory=list)
+    tripped: bool = False
+
+
+class RaidDetector:
+    """
+    Detecta o mesmo conteúdo enviado por vários autores ou em vários canais.
+
+    Cada mensagem custa O(1): um hash do texto normalizado e uma consulta na
+    tabela ``(guild_id, impressão) -> FingerprintEntry``. A tabela é uma LRU
+    com no máximo ``max_entries`` entradas; como a ordem de uso é também a
+    ordem de inatividade, entradas sem ocorrências há mais de ``ttl`` segundos
+    saem pela frente. Autores, canais e mensagens guardadas por entrada são
+    limitados a ``max_tracked``.
+    """
+
+    def __init__(
+        self, *, max_entries: int = 50_000, ttl: float = 120.0, max_tracked: int = 25
+    ) -> None:
+        """
+        Inicializa o detector
+
+        Args:
+            max_entries: Máximo de impressões em memória (limite rígido)
+            ttl: Tempo (s) sem ocorrências até a impressão ser descartada
+            max_tracked: Autores, canais e mensagens guardados por impressão
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.max_tracked = max(1, max_tracked)
+        self._entries: OrderedDict[tuple[int, int], FingerprintEntry] = OrderedDict()
+
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self.trips: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self, now: float) -> None:
+        """Descartar impressões inativas (as mais antigas ficam na frente)"""
+        entries = self._entries
+        cutoff = now - self.ttl
+        while entries:
+            key = next(iter(entries))
+            if entries[key].last_seen > cutoff:
+                break
+            del entries[key]
+            self.expirations += 1
+
+    def observe(
+        self,
+        guild_id: int,
+        content: str,
+        author_id: int,
+        channel_id: int,
+        message: Any = None,
+        *,
+        min_authors: int = 4,
+        min_channels: int = 3,
+        window: float = 60.0,
+        now: float | None = None,
+    ) -> list[Any]:
+        """
+        Registrar uma mensagem e verificar os limites
+
+        Args:
+            guild_id: ID do servidor
+            content: Conteúdo da mensagem
+            author_id: ID do autor
+            channel_id: ID do canal
+            message: Objeto devolvido quando o limite dispara (ex.: discord.Message)
+            min_authors: Autores distintos com o mesmo conteúdo para disparar
+            min_channels: Canais distintos com o mesmo conteúdo para disparar
+            window: Tempo (s) desde a primeira ocorrência em que as contagens valem
+            now: Momento da mensagem (padrão: ``time.time()``)
+
+        Returns:
+            Mensagens a punir: todas as guardadas no disparo, depois apenas a
+            atual enquanto a impressão continuar ativa; lista vazia caso contrário
+        """
+        fp = fingerprint(content)
+        if fp is None:
+            return []
+        if now is None:
+            now = time.time()
+
+        entries = self._entries
+        if entries and entries[next(iter(entries))].last_seen <= now - self.ttl:
+            self._expire(now)
+
+        key = (guild_id, fp)
+        entry = entries.get(key)
+        if entry is None or (not entry.tripped and now - entry.first_seen > window):
+            if entry is None and len(entries) >= self.max_entries:
+                entries.popitem(last=False)
+                self.evictions += 1
+            entry = FingerprintEntry(first_seen=now, last_seen=now)
+            entries[key] = entry
+        else:
+            entry.last_seen = max(entry.last_seen, now)
+        entries.move_to_end(key)
+
+        if entry.tripped:
+            return [message]
+
+        limit = self.max_tracked
+        if len(entry.authors) < limit:
+            entry.authors.add(author_id)
+        if len(entry.channels) < limit:
+            entry.channels.add(channel_id)
+        held = len(entry.messages) < limit
+        if held:
+            entry.messages.append(message)
+
+        if len(entry.authors) >= min_authors or len(entry.channels) >= min_channels:
+            entry.tripped = True
+            self.trips += 1
+            messages, entry.messages = entry.messages, []
+            if not held:
+                messages.append(message)
+            return messages
+        return []
+
+    def reset(self, guild_id: int | None = None) -> None:
+        """Esquecer as impressões de um servidor (ou de todos)"""
+        if guild_id is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == guild_id]:
+            del self._entries[key]
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do detector"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "trips": self.trips,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
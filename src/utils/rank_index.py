@@ -0,0 +1,225 @@
+"""
+Índice de Ranking em Memória
+Responde posição e páginas do leaderboard sem varrer ``user_levels``
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .cache import MISSING, TTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .database import Database
+    from .xp_accumulator import XPEntry
+
+    SortKey = tuple[Any, ...]
+
+
+class RankStats(NamedTuple):
+    """Valores usados na ordenação de um usuário"""
+
+    total_xp: int
+    level: int
+    messages_sent: int
+
+
+# Chaves de ordenação (ascendentes) de cada tipo de ranking; o user_id no
+# fim desempata e torna cada chave única, então bisect acha a posição exata
+ORDERINGS: dict[str, Callable[[str, RankStats], SortKey]] = {
+    "xp": lambda user_id, s: (-s.total_xp, user_id),
+    "level": lambda user_id, s: (-s.level, -s.total_xp, user_id),
+    "messages": lambda user_id, s: (-s.messages_sent, user_id),
+}
+
+
+class GuildRanking:
+    """
+    Rankings de um servidor mantidos como arrays ordenados.
+
+    Posição e página saem de uma busca binária (O(log n)); a carga inicial
+    ordena tudo de uma vez (``build``) e cada atualização depois disso
+    remove e reinsere a chave do usuário em cada ordenação.
+    """
+
+    def __init__(self) -> None:
+        self.stats: dict[str, RankStats] = {}
+        self._sorted: dict[str, list[SortKey]] = {name: [] for name in ORDERINGS}
+
+    def __len__(self) -> int:
+        return len(self.stats)
+
+    @classmethod
+    def build(cls, stats: dict[str, RankStats]) -> GuildRanking:
+        """Montar o ranking de uma vez (um ``sorted`` por ordenação, O(n log n))"""
+        ranking = cls()
+        ranking.stats = dict(stats)
+        for name, key_func in ORDERINGS.items():
+            ranking._sorted[name] = sorted(
+                key_func(user_id, user_stats) for user_id, user_stats in ranking.stats.items()
+            )
+        return ranking
+
+    def update(self, user_id: str, stats: RankStats) -> None:
+        """Inserir ou atualizar um usuário em todas as ordenações"""
+        old = self.stats.get(user_id)
+        if old == stats:
+            return
+        for name, key_func in ORDERINGS.items():
+            keys = self._sorted[name]
+            if old is not None:
+                index = bisect_left(keys, key_func(user_id, old))
+                del keys[index]
+            insort(keys, key_func(user_id, stats))
+        self.stats[user_id] = stats
+
+    def remove(self, user_id: str) -> None:
+        """Remover um usuário do ranking"""
+        old = self.stats.pop(user_id, None)
+        if old is None:
+            return
+        for name, key_func in ORDERINGS.items():
+            keys = self._sorted[name]
+            del keys[bisect_left(keys, key_func(user_id, old))]
+
+    def rank(self, user_id: str, ordering: str = "xp") -> int | None:
+        """Posição (1-based) do usuário ou None se ele não está no ranking"""
+        stats = self.stats.get(user_id)
+        if stats is None:
+            return None
+        return bisect_left(self._sorted[ordering], ORDERINGS[ordering](user_id, stats)) + 1
+
+    def page(self, offset: int, limit: int, ordering: str = "xp") -> list[dict[str, Any]]:
+        """Fatia do ranking a partir de ``offset``"""
+        rows = []
+        for position, key in enumerate(
+            self._sorted[ordering][offset : offset + limit], start=offset + 1
+        ):
+            user_id = key[-1]
+            stats = self.stats[user_id]
+            rows.append(
+                {
+                    "position": position,
+                    "user_id": user_id,
+                    "total_xp": stats.total_xp,
+                    "level": stats.level,
+                    "messages_sent": stats.messages_sent,
+                }
+            )
+        return rows
+
+
+class RankIndex:
+    """
+    Índice de ranking por servidor, atualizado incrementalmente.
+
+    O ranking de um servidor é carregado uma vez do banco (varredura do
+    índice de cobertura ``idx_user_levels_xp``) no primeiro uso; a partir daí
+    cada concessão de XP do ``XPAccumulator`` atualiza o índice na hora. Os
+    servidores menos usados saem da memória (LRU) e o TTL serve de rede de
+    segurança para escritas feitas fora do acumulador.
+    """
+
+    def __init__(self, database: Database, *, max_guilds: int = 500, ttl: float = 3600.0) -> None:
+        """
+        Inicializa o índice
+
+        Args:
+            database: Banco com a tabela ``user_levels``
+            max_guilds: Servidores mantidos em memória
+            ttl: Segundos até um ranking ser recarregado do banco
+        """
+        self.database = database
+        self._guilds: TTLCache[str, GuildRanking] = TTLCache(max_size=max_guilds, ttl=ttl)
+
+    async def _load(self, guild_id: str) -> GuildRanking:
+        """Montar o ranking do servidor a partir do banco"""
+        rows = await self.database.get_all(
+            """SELECT user_id, total_xp, level, messages_sent FROM user_levels
+            WHERE guild_id = ?""",
+            (guild_id,),
+        )
+        stats = {
+            row["user_id"]: RankStats(
+                row["total_xp"] or 0, row["level"] or 0, row["messages_sent"] or 0
+            )
+            for row in rows
+        }
+
+        # XP ainda não gravado pelo acumulador é mais recente que o banco
+        for user_id, entry in self.database.xp_accumulator.guild_entries(guild_id):
+            stats[user_id] = RankStats(entry.total_xp, entry.level, entry.messages_sent)
+        return GuildRanking.build(stats)
+
+    async def get_ranking(self, guild_id: str) -> GuildRanking:
+        """Obter o ranking do servidor, carregando-o se necessário"""
+        guild_id = str(guild_id)
+        return await self._guilds.get_or_load(guild_id, lambda: self._load(guild_id))
+
+    def on_award(self, guild_id: str, user_id: str, entry: XPEntry) -> None:
+        """Listener do acumulador: refletir XP concedido em um ranking carregado"""
+        ranking = self._guilds.get(guild_id, count=False)
+        if ranking is not MISSING:
+            ranking.update(user_id, RankStats(entry.total_xp, entry.level, entry.messages_sent))
+
+    def remove(self, guild_id: str, user_id: str) -> None:
+        """Remover um usuário (ex.: reset de level)"""
+        ranking = self._guilds.get(str(guild_id), count=False)
+        if ranking is not MISSING:
+            ranking.remove(str(user_id))
+
+    def invalidate(self, guild_id: str | None = None) -> None:
+        """Descartar o ranking de um servidor (ou de todos) para recarga"""
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.invalidate(str(guild_id))
+
+    async def rank(self, guild_id: str, user_id: str, ordering: str = "xp") -> int | None:
+        """
+        Posição do usuário no ranking
+
+        Args:
+            guild_id: ID do servidor
+            user_id: ID do usuário
+            ordering: ``xp``, ``level`` ou ``messages``
+
+        Returns:
+            Posição (1-based) ou None se o usuário não tem XP
+        """
+        ranking = await self.get_ranking(guild_id)
+        return ranking.rank(str(user_id), _ordering(ordering))
+
+    async def page(
+        self, guild_id: str, page: int = 1, per_page: int = 10, ordering: str = "xp"
+    ) -> list[dict[str, Any]]:
+        """
+        Página do ranking
+
+        Args:
+            guild_id: ID do servidor
+            page: Página (1-based)
+            per_page: Usuários por página
+            ordering: ``xp``, ``level`` ou ``messages``
+
+        Returns:
+            Linhas com ``position``, ``user_id``, ``total_xp``, ``level`` e ``messages_sent``
+        """
+        ranking = await self.get_ranking(guild_id)
+        return ranking.page((max(page, 1) - 1) * per_page, per_page, _ordering(ordering))
+
+    async def count(self, guild_id: str) -> int:
+        """Número de usuários no ranking do servidor"""
+        return len(await self.get_ranking(guild_id))
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do índice"""
+        return self._guilds.stats()
+
+
+def _ordering(ordering: str) -> str:
+    """Normalizar o tipo de ranking (desconhecidos caem em XP)"""
+    return ordering if ordering in ORDERINGS else "xp"
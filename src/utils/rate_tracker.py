@@ -0,0 +1,223 @@
+"""
+Rastreador de Taxa em Janela Deslizante
+Timestamps recentes por (servidor, usuário) em buffers circulares compactos,
+com limite rígido de memória
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+class RateTracker:
+    """
+    Contador de eventos por chave em janela deslizante.
+
+    Cada chave ocupa um slot de ``capacity`` timestamps dentro de um único
+    ``array('d')`` usado como buffer circular: registrar um evento sobrescreve
+    o mais antigo, então a inserção é O(1) e a memória por chave é fixa. A
+    contagem percorre o buffer do mais novo para o mais antigo e para no
+    primeiro timestamp fora da janela, ou seja, custa no máximo ``capacity``.
+
+    A ordem de uso das chaves (LRU) também é a ordem de inatividade: chaves
+    sem eventos há mais de ``idle_ttl`` segundos saem pela frente a cada
+    registro, e ao atingir ``max_keys`` a menos recente é descartada.
+
+    Contagens saturam em ``capacity``; limites de antispam devem ficar abaixo
+    desse valor (o Database reserva ``MAX_MESSAGES_LIMIT + 1``).
+    """
+
+    def __init__(
+        self, *, max_keys: int = 100_000, capacity: int = 64, idle_ttl: float = 600.0
+    ) -> None:
+        """
+        Inicializa o rastreador
+
+        Args:
+            max_keys: Máximo de chaves em memória (limite rígido)
+            capacity: Timestamps guardados por chave
+            idle_ttl: Tempo (s) sem eventos até a chave ser descartada
+        """
+        if not 1 <= capacity <= 0xFFFF:
+            msg = "capacity deve estar entre 1 e 65535"
+            raise ValueError(msg)
+        self.max_keys = max(1, max_keys)
+        self.capacity = capacity
+        self.idle_ttl = idle_ttl
+
+        self._slots: OrderedDict[Hashable, int] = OrderedDict()
+        self._free: list[int] = []
+        # Memória por slot: capacity timestamps + cabeça/tamanho + último evento
+        self._times = array("d")
+        self._blank = array("d", bytes(8 * capacity))
+        self._head = array("H")
+        self._size = array("H")
+        self._last_seen = array("d")
+        self._last_event = array("Q")
+
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def _allocate(self, key: Hashable) -> int:
+        """Reservar um slot para uma chave nova"""
+        if len(self._slots) >= self.max_keys:
+            _, slot = self._slots.popitem(last=False)
+            self._free.append(slot)
+            self.evictions += 1
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._head)
+            self._times.extend(self._blank)
+            self._head.append(0)
+            self._size.append(0)
+            self._last_seen.append(0.0)
+            self._last_event.append(0)
+
+        self._head[slot] = 0
+        self._size[slot] = 0
+        self._last_event[slot] = 0
+        self._slots[key] = slot
+        return slot
+
+    def _expire(self, now: float) -> None:
+        """Descartar chaves inativas (as mais antigas ficam na frente da LRU)"""
+        cutoff = now - self.idle_ttl
+        slots, last_seen = self._slots, self._last_seen
+        while slots:
+            key = next(iter(slots))
+            slot = slots[key]
+            if last_seen[slot] > cutoff:
+                break
+            del slots[key]
+            self._free.append(slot)
+            self.expirations += 1
+
+    def _count(self, slot: int, cutoff: float) -> int:
+        """Contar timestamps mais novos que ``cutoff``, do mais recente para trás"""
+        capacity, times = self.capacity, self._times
+        base = slot * capacity
+        size = self._size[slot]
+        index = (self._head[slot] + size - 1) % capacity
+        count = 0
+        while count < size and times[base + index] > cutoff:
+            count += 1
+            index = (index - 1) % capacity
+        return count
+
+    def hit(
+        self,
+        key: Hashable,
+        window: float,
+        now: float | None = None,
+        event_id: int | None = None,
+    ) -> int:
+        """
+        Registrar um evento e contar os eventos da janela
+
+        Args:
+            key: Chave rastreada, normalmente ``(guild_id, user_id)``
+            window: Tamanho da janela em segundos
+            now: Momento do evento (padrão: ``time.time()``)
+            event_id: ID do evento (ex.: ID da mensagem); um evento já
+                registrado para a chave não é contado de novo, o que permite
+                que vários sistemas compartilhem o mesmo rastreador
+
+        Returns:
+            Eventos dentro da janela, incluindo este (no máximo ``capacity``)
+        """
+        if now is None:
+            now = time.time()
+        slots = self._slots
+        if slots and self._last_seen[slots[next(iter(slots))]] <= now - self.idle_ttl:
+            self._expire(now)
+
+        slot = slots.get(key)
+        if slot is None:
+            slot = self._allocate(key)
+        else:
+            slots.move_to_end(key)
+
+        capacity, times, sizes = self.capacity, self._times, self._size
+        base = slot * capacity
+        size = sizes[slot]
+        if event_id is None or event_id != self._last_event[slot]:
+            head = self._head[slot]
+            if size < capacity:
+                times[base + (head + size) % capacity] = now
+                size += 1
+                sizes[slot] = size
+            else:
+                # Buffer cheio: sobrescreve o mais antigo
+                times[base + head] = now
+                self._head[slot] = (head + 1) % capacity
+            if event_id is not None:
+                self._last_event[slot] = event_id
+            if now > self._last_seen[slot]:
+                self._last_seen[slot] = now
+
+        return self._count(slot, now - window)
+
+    def count(self, key: Hashable, window: float, now: float | None = None) -> int:
+        """
+        Contar eventos da janela sem registrar um novo
+
+        Args:
+            key: Chave rastreada
+            window: Tamanho da janela em segundos
+            now: Momento de referência (padrão: ``time.time()``)
+
+        Returns:
+            Eventos dentro da janela (no máximo ``capacity``)
+        """
+        slot = self._slots.get(key)
+        if slot is None:
+            return 0
+        if now is None:
+            now = time.time()
+        return self._count(slot, now - window)
+
+    def reset(self, key: Hashable) -> None:
+        """Esquecer os eventos de uma chave"""
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self._free.append(slot)
+
+    def clear(self) -> None:
+        """Esquecer todas as chaves (a memória já alocada é reaproveitada)"""
+        self._free.extend(self._slots.values())
+        self._slots.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do rastreador"""
+        return {
+            "keys": len(self._slots),
+            "max_keys": self.max_keys,
+            "capacity": self.capacity,
+            "allocated_slots": len(self._head),
+            "array_bytes": sum(
+                len(data) * data.itemsize
+                for data in (
+                    self._times,
+                    self._head,
+                    self._size,
+                    self._last_seen,
+                    self._last_event,
+                )
+            ),
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,438 @@
+"""
+Agendador de Eventos Persistente
+Executa eventos agendados (desmute, fim de sorteio, lembretes...) no horário exato
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .database import Database
+
+    EventHandler = Callable[["ScheduledEvent"], Awaitable[bool | None]]
+
+
+@dataclass
+class ScheduledEvent:
+    """Evento agendado carregado em memória"""
+
+    id: int
+    event_type: str
+    due: float
+    data: dict[str, Any] = field(default_factory=dict)
+    key: str | None = None
+    guild_id: str | None = None
+    attempts: int = 0
+
+
+def to_timestamp(when: datetime | float) -> float:
+    """
+    Converter um horário para timestamp Unix
+
+    Args:
+        when: ``datetime`` (sem fuso = horário local, como ``datetime.now()``)
+            ou timestamp Unix
+
+    Returns:
+        Timestamp Unix em segundos
+    """
+    if isinstance(when, datetime):
+        return when.timestamp()
+    return float(when)
+
+
+class Scheduler:
+    """
+    Agendador em processo com heap de prazos e persistência em ``scheduled_events``.
+
+    Cada evento é gravado no banco ao ser agendado e mantido em um min-heap
+    ordenado pelo horário de execução. Uma única tarefa dorme exatamente até
+    o próximo prazo (ou até um evento mais próximo ser agendado) e dispara os
+    eventos vencidos, no máximo ``max_concurrency`` ao mesmo tempo.
+
+    Resultado do handler:
+
+    - retorno ``None``/``True``: evento concluído (``completed``);
+    - retorno ``False``: falha definitiva, sem nova tentativa (``failed``);
+    - exceção: nova tentativa com espera exponencial até ``max_attempts``.
+
+    Eventos cujo tipo ainda não tem handler ficam estacionados em memória e
+    voltam ao heap quando o handler é registrado. Após um restart,
+    ``start()`` recarrega do banco todos os eventos pendentes (inclusive os
+    que estavam em execução quando o processo caiu).
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        *,
+        max_concurrency: int = 4,
+        max_attempts: int = 5,
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 900.0,
+        max_sleep: float = 3600.0,
+    ) -> None:
+        """
+        Inicializa o agendador
+
+        Args:
+            database: Banco onde os eventos são persistidos
+            max_concurrency: Eventos executados simultaneamente
+            max_attempts: Tentativas antes de marcar o evento como falho
+            retry_delay: Espera (s) antes da primeira nova tentativa (dobra a cada falha)
+            max_retry_delay: Espera máxima (s) entre tentativas
+            max_sleep: Tempo máximo (s) dormindo sem reavaliar o relógio
+        """
+        self.database = database
+        self.max_concurrency: int = max(1, max_concurrency)
+        self.max_attempts: int = max(1, max_attempts)
+        self.retry_delay: float = retry_delay
+        self.max_retry_delay: float = max_retry_delay
+        self.max_sleep: float = max_sleep
+
+        self._handlers: dict[str, EventHandler] = {}
+        self._heap: list[tuple[float, int]] = []
+        self._events: dict[int, ScheduledEvent] = {}
+        self._keys: dict[tuple[str, str], int] = {}
+        self._parked: defaultdict[str, list[ScheduledEvent]] = defaultdict(list)
+        self._running_ids: set[int] = set()
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._task: asyncio.Task[None] | None = None
+        self._workers: set[asyncio.Task[None]] = set()
+
+        # Estatísticas
+        self.executed: int = 0
+        self.failed: int = 0
+        self.retries: int = 0
+
+    @property
+    def running(self) -> bool:
+        """Indica se o loop do agendador está ativo"""
+        return self._task is not None and not self._task.done()
+
+    def register(self, event_type: str, handler: EventHandler) -> None:
+        """
+        Registrar o handler de um tipo de evento
+
+        Args:
+            event_type: Tipo do evento (ex.: ``unmute``)
+            handler: Corrotina que recebe o ``ScheduledEvent``
+        """
+        self._handlers[event_type] = handler
+        for event in self._parked.pop(event_type, []):
+            if event.id in self._events:
+                self._push(event)
+
+    def unregister(self, event_type: str) -> None:
+        """Remover o handler de um tipo (eventos pendentes continuam no banco)"""
+        self._handlers.pop(event_type, None)
+
+    def _push(self, event: ScheduledEvent) -> None:
+        """Colocar um evento no heap e acordar o loop se ele for o próximo"""
+        self._events[event.id] = event
+        if event.key is not None:
+            self._keys[(event.event_type, event.key)] = event.id
+        heapq.heappush(self._heap, (event.due, event.id))
+        if self._heap[0][1] == event.id:
+            self._wakeup.set()
+
+    def _forget(self, event: ScheduledEvent) -> None:
+        """Remover um evento da memória (entradas antigas no heap são ignoradas)"""
+        self._events.pop(event.id, None)
+        if event.key is not None and self._keys.get((event.event_type, event.key)) == event.id:
+            del self._keys[(event.event_type, event.key)]
+
+    async def load(self) -> int:
+        """
+        Carregar do banco os eventos pendentes
+
+        Returns:
+            Número de eventos armados
+        """
+        rows = await self.database.get_all(
+            """SELECT id, event_type, event_key, execute_at, event_data, guild_id, attempts
+            FROM scheduled_events WHERE status IN ('pending', 'executing')"""
+        )
+        loaded = 0
+        for row in rows:
+            if row["id"] in self._events or row["id"] in self._running_ids:
+                continue
+            try:
+                data = json.loads(row["event_data"]) if row["event_data"] else {}
+            except (TypeError, ValueError):
+                data = {}
+            self._push(
+                ScheduledEvent(
+                    id=row["id"],
+                    event_type=row["event_type"],
+                    due=row["execute_at"],
+                    data=data,
+                    key=row["event_key"],
+                    guild_id=row["guild_id"],
+                    attempts=row["attempts"] or 0,
+                )
+            )
+            loaded += 1
+        return loaded
+
+    async def start(self) -> int:
+        """
+        Recarregar os eventos pendentes e iniciar o loop (idempotente)
+
+        Returns:
+            Número de eventos armados a partir do banco
+        """
+        loaded = await self.load()
+        if not self.running:
+            self._task = asyncio.create_task(self._run_loop())
+        return loaded
+
+    async def schedule(
+        self,
+        event_type: str,
+        when: datetime | float,
+        data: dict[str, Any] | None = None,
+        *,
+        key: str | None = None,
+        guild_id: str | int | None = None,
+        created_by: str | int | None = None,
+    ) -> int:
+        """
+        Agendar um evento
+
+        Args:
+            event_type: Tipo do evento (precisa de um handler registrado)
+            when: Horário de execução (``datetime`` ou timestamp Unix)
+            data: Dados serializáveis em JSON passados ao handler
+            key: Identificador único entre os pendentes do mesmo tipo; agendar
+                de novo com a mesma chave substitui o evento anterior
+            guild_id: ID do servidor (opcional)
+            created_by: ID de quem agendou (opcional)
+
+        Returns:
+            ID do evento agendado
+        """
+        due = to_timestamp(when)
+        async with self.database.pool.writer() as db:
+            if key is not None:
+                await db.execute(
+                    """UPDATE scheduled_events
+                    SET status = 'cancelled', cancelled_at = CURRENT_TIMESTAMP
+                    WHERE event_type = ? AND event_key = ? AND status = 'pending'""",
+                    (event_type, key),
+                )
+            cursor = await db.execute(
+                """INSERT INTO scheduled_events
+                (event_type, event_key, execute_at, event_data, guild_id, created_by)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                (
+                    event_type,
+                    key,
+                    due,
+                    json.dumps(data or {}),
+                    str(guild_id) if guild_id else None,
+                    str(created_by) if created_by else None,
+                ),
+            )
+            await db.commit()
+            event_id = cursor.lastrowid
+
+        if key is not None:
+            previous = self._keys.get((event_type, key))
+            if previous is not None and previous in self._events:
+                self._forget(self._events[previous])
+        self._push(
+            ScheduledEvent(
+                id=event_id,
+                event_type=event_type,
+                due=due,
+                data=data or {},
+                key=key,
+                guild_id=str(guild_id) if guild_id else None,
+            )
+        )
+        return event_id
+
+    async def _cancel_where(self, condition: str, params: tuple[Any, ...]) -> bool:
+        """Marcar como cancelados os eventos pendentes que atendem à condição"""
+        async with self.database.pool.writer() as db:
+            cursor = await db.execute(
+                "UPDATE scheduled_events SET status = 'cancelled', cancelled_at = CURRENT_TIMESTAMP "
+                f"WHERE {condition} AND status = 'pending'",
+                params,
+            )
+            await db.commit()
+            return cursor.rowcount > 0
+
+    async def cancel(self, event_id: int) -> bool:
+        """
+        Cancelar um evento pendente
+
+        Returns:
+            True se havia um evento pendente com esse ID
+        """
+        cancelled = await self._cancel_where("id = ?", (event_id,))
+        event = self._events.get(event_id)
+        if event is not None:
+            self._forget(event)
+        return cancelled
+
+    async def cancel_key(self, event_type: str, key: str) -> bool:
+        """
+        Cancelar o evento pendente de um tipo com a chave informada
+
+        Returns:
+            True se havia um evento pendente com essa chave
+        """
+        event_id = self._keys.get((event_type, key))
+        cancelled = await self._cancel_where("event_type = ? AND event_key = ?", (event_type, key))
+        if event_id is not None and event_id in self._events:
+            self._forget(self._events[event_id])
+        return cancelled
+
+    def next_due(self) -> float | None:
+        """Timestamp do próximo evento armado (None se não há nenhum)"""
+        while self._heap:
+            due, event_id = self._heap[0]
+            event = self._events.get(event_id)
+            if event is not None and event.due == due:
+                return due
+            heapq.heappop(self._heap)
+        return None
+
+    async def _run_loop(self) -> None:
+        """Dormir até o próximo prazo e disparar os eventos vencidos"""
+        while True:
+            self._wakeup.clear()
+            due = self.next_due()
+            while due is not None and due <= time.time():
+                _, event_id = heapq.heappop(self._heap)
+                event = self._events.pop(event_id)
+                if event.event_type not in self._handlers:
+                    # Handler ainda não registrado (cog não carregado)
+                    self._events[event.id] = event
+                    self._parked[event.event_type].append(event)
+                else:
+                    await self._semaphore.acquire()
+                    self._running_ids.add(event.id)
+                    worker = asyncio.create_task(self._execute(event))
+                    self._workers.add(worker)
+                    worker.add_done_callback(self._workers.discard)
+                due = self.next_due()
+
+            timeout = None if due is None else min(max(due - time.time(), 0), self.max_sleep)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _retry_delay(self, attempts: int) -> float:
+        """Espera exponencial antes da próxima tentativa"""
+        return min(self.max_retry_delay, self.retry_delay * 2 ** max(attempts - 1, 0))
+
+    async def _execute(self, event: ScheduledEvent) -> None:
+        """Executar um evento e registrar o resultado no banco"""
+        try:
+            event.attempts += 1
+            await self.database.run(
+                """UPDATE scheduled_events
+                SET status = 'executing', attempts = ?, executed_at = CURRENT_TIMESTAMP
+                WHERE id = ?""",
+                (event.attempts, event.id),
+            )
+            try:
+                result = await self._handlers[event.event_type](event)
+            except Exception as e:
+                await self._handle_failure(event, e)
+                return
+
+            status = "failed" if result is False else "completed"
+            if result is False:
+                self.failed += 1
+            else:
+                self.executed += 1
+            await self.database.run(
+                """UPDATE scheduled_events SET status = ?, completed_at = CURRENT_TIMESTAMP
+                WHERE id = ?""",
+                (status, event.id),
+            )
+            self._forget(event)
+        except Exception as e:
+            # Falha ao gravar o status: o evento é recarregado no próximo start()
+            print(f"❌ Erro registrando evento agendado {event.id}: {e}")
+        finally:
+            self._running_ids.discard(event.id)
+            self._semaphore.release()
+
+    async def _handle_failure(self, event: ScheduledEvent, error: Exception) -> None:
+        """Reagendar com espera exponencial ou marcar como falho"""
+        superseded = (
+            event.key is not None
+            and self._keys.get((event.event_type, event.key), event.id) != event.id
+        )
+        if event.attempts >= self.max_attempts or superseded:
+            print(
+                f"❌ Evento agendado {event.id} ({event.event_type}) falhou "
+                f"após {event.attempts} tentativas: {error}"
+            )
+            self.failed += 1
+            await self.database.run(
+                "UPDATE scheduled_events SET status = 'failed', error = ? WHERE id = ?",
+                (str(error), event.id),
+            )
+            self._forget(event)
+            return
+
+        delay = self._retry_delay(event.attempts)
+        print(
+            f"⚠️ Evento agendado {event.id} ({event.event_type}) falhou "
+            f"(tentativa {event.attempts}/{self.max_attempts}), nova tentativa em {delay:.0f}s: {error}"
+        )
+        self.retries += 1
+        event.due = time.time() + delay
+        await self.database.run(
+            """UPDATE scheduled_events SET status = 'pending', execute_at = ?, error = ?
+            WHERE id = ?""",
+            (event.due, str(error), event.id),
+        )
+        self._push(event)
+
+    async def close(self) -> None:
+        """Parar o loop e aguardar os eventos em execução"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._heap.clear()
+        self._events.clear()
+        self._keys.clear()
+        self._parked.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do agendador"""
+        return {
+            "armed": len(self._events),
+            "running": len(self._running_ids),
+            "parked": sum(len(events) for events in self._parked.values()),
+            "next_due": self.next_due(),
+            "executed": self.executed,
+            "failed": self.failed,
+            "retries": self.retries,
+            "max_concurrency": self.max_concurrency,
+        }
@@ -0,0 +1,959 @@
+"""
+Esquema Canônico do Banco de Dados
+Definição única de todas as tabelas do bot (data/bot.db), montada a partir
+do DDL congelado de cada versão do esquema
+"""
+
+from __future__ import annotations
+
+# Cada tabela tem uma única definição. Onde módulos antigos criavam a mesma
+# tabela com colunas diferentes (user_levels, giveaways, tickets,
+# sticky_messages, suggestions...), a definição canônica traz as colunas
+# usadas pelo código atual; os nomes antigos ficam em LEGACY_COLUMNS e são
+# copiados para as colunas novas quando a tabela é reconstruída.
+#
+# Cada versão publicada tem seu próprio DDL, usado pela migração dela; os
+# blocos abaixo nunca são editados. Para mudar uma tabela, acrescente um
+# bloco com a definição nova (e uma versão em migrations.MIGRATIONS).
+
+# v1: esquema base unificado
+BASE_TABLES: dict[str, str] = {
+    # Núcleo
+    "bot_version": """
+        CREATE TABLE IF NOT EXISTS bot_version (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            version TEXT NOT NULL,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            changelog TEXT
+        )
+    """,
+    "legacy_imports": """
+        CREATE TABLE IF NOT EXISTS legacy_imports (
+            source TEXT PRIMARY KEY,
+            rows_imported INTEGER DEFAULT 0,
+            rows_skipped INTEGER DEFAULT 0,
+            imported_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "guild_settings": """
+        CREATE TABLE IF NOT EXISTS guild_settings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT UNIQUE NOT NULL,
+            prefix TEXT DEFAULT '!',
+            welcome_channel TEXT,
+            log_channel TEXT,
+            autorole_id TEXT,
+            moderation_enabled INTEGER DEFAULT 1,
+            leveling_enabled INTEGER DEFAULT 1,
+            antispam_enabled INTEGER DEFAULT 0,
+            settings_json TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "guild_config": """
+        CREATE TABLE IF NOT EXISTS guild_config (
+            guild_id TEXT PRIMARY KEY,
+            admin_role_ids TEXT,
+            mod_role_ids TEXT,
+            dj_role_ids TEXT,
+            support_role_ids TEXT,
+            dashboard_enabled BOOLEAN DEFAULT 1,
+            require_roles_for_moderation BOOLEAN DEFAULT 1,
+            require_roles_for_music BOOLEAN DEFAULT 0,
+            custom_config JSON,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "command_overrides": """
+        CREATE TABLE IF NOT EXISTS command_overrides (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            command_name TEXT NOT NULL,
+            allowed_roles TEXT,
+            denied_roles TEXT,
+            allowed_users TEXT,
+            denied_users TEXT,
+            admin_only BOOLEAN DEFAULT 0,
+            mod_only BOOLEAN DEFAULT 0,
+            enabled BOOLEAN DEFAULT 1,
+            UNIQUE(guild_id, command_name)
+        )
+    """,
+    "command_analytics": """
+        CREATE TABLE IF NOT EXISTS command_analytics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            command_name TEXT NOT NULL,
+            category TEXT,
+            success BOOLEAN DEFAULT 1,
+            execution_time REAL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    # Leveling
+    "user_levels": """
+        CREATE TABLE IF NOT EXISTS user_levels (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            total_xp INTEGER DEFAULT 0,
+            level INTEGER DEFAULT 0,
+            messages_sent INTEGER DEFAULT 0,
+            last_xp_gain DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(guild_id, user_id)
+        )
+    """,
+    "leveling_config": """
+        CREATE TABLE IF NOT EXISTS leveling_config (
+            guild_id TEXT PRIMARY KEY,
+            enabled BOOLEAN DEFAULT 1,
+            xp_per_message INTEGER DEFAULT 15,
+            xp_cooldown INTEGER DEFAULT 60,
+            level_up_channel_id TEXT,
+            level_up_message TEXT DEFAULT 'Parabéns {user}! Você subiu para o level {level}!',
+            announce_level_up BOOLEAN DEFAULT 1,
+            ignore_bots BOOLEAN DEFAULT 1,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "level_rewards": """
+        CREATE TABLE IF NOT EXISTS level_rewards (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            role_id TEXT,
+            role_name TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(guild_id, level)
+        )
+    """,
+    # Moderação
+    "warnings": """
+        CREATE TABLE IF NOT EXISTS warnings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            moderator_id TEXT NOT NULL,
+            reason TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            active INTEGER DEFAULT 1
+        )
+    """,
+    "mod_cases": """
+        CREATE TABLE IF NOT EXISTS mod_cases (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            case_id INTEGER,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            moderator_id TEXT NOT NULL,
+            type TEXT NOT NULL,
+            reason TEXT,
+            evidence TEXT,
+            duration TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_active BOOLEAN DEFAULT 1,
+            UNIQUE(guild_id, case_id)
+        )
+    """,
+    "moderation_cases": """
+        CREATE TABLE IF NOT EXISTS moderation_cases (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            case_id INTEGER NOT NULL,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            moderator_id TEXT NOT NULL,
+            action TEXT NOT NULL,
+            reason TEXT,
+            duration TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(guild_id, case_id)
+        )
+    """,
+    "case_attachments": """
+        CREATE TABLE IF NOT EXISTS case_attachments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            case_id INTEGER NOT NULL,
+            guild_id TEXT NOT NULL,
+            attachment_url TEXT NOT NULL,
+            attachment_name TEXT,
+            uploaded_by TEXT NOT NULL,
+            uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "auto_warn_actions": """
+        CREATE TABLE IF NOT EXISTS auto_warn_actions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT,
+            warn_count INTEGER,
+            action_type TEXT,
+            duration INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "user_notes": """
+        CREATE TABLE IF NOT EXISTS user_notes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            note_id TEXT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            moderator_id TEXT,
+            title TEXT,
+            content TEXT,
+            category TEXT,
+            severity TEXT,
+            active INTEGER DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP,
+            updated_by TEXT,
+            deleted_at TIMESTAMP,
+            deleted_by TEXT
+        )
+    """,
+    "mute_history": """
+        CREATE TABLE IF NOT EXISTS mute_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            moderator_id TEXT NOT NULL,
+            reason TEXT,
+            duration_minutes INTEGER,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            expires_at TIMESTAMP,
+            is_active BOOLEAN DEFAULT 1
+        )
+    """,
+    "mute_settings": """
+        CREATE TABLE IF NOT EXISTS mute_settings (
+            guild_id TEXT PRIMARY KEY,
+            max_mute_duration INTEGER DEFAULT 10080,
+            default_reason TEXT DEFAULT 'Violação das regras',
+            log_channel_id TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "voice_actions": """
+        CREATE TABLE IF NOT EXISTS voice_actions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            moderator_id TEXT NOT NULL,
+            action_type TEXT NOT NULL,
+            channel_id TEXT,
+            reason TEXT,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "voice_settings": """
+        CREATE TABLE IF NOT EXISTS voice_settings (
+            guild_id TEXT PRIMARY KEY,
+            log_voice_actions BOOLEAN DEFAULT 1,
+            auto_move_timeout INTEGER DEFAULT 300,
+            max_voice_actions_per_hour INTEGER DEFAULT 20
+        )
+    """,
+    "temp_roles": """
+        CREATE TABLE IF NOT EXISTS temp_roles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            role_id TEXT NOT NULL,
+            expires_at DATETIME NOT NULL,
+            reason TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "antispam_config": """
+        CREATE TABLE IF NOT EXISTS antispam_config (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT,
+            enabled INTEGER DEFAULT 1,
+            limite INTEGER DEFAULT 5,
+            intervalo INTEGER DEFAULT 10
+        )
+    """,
+    # Tickets
+    "tickets": """
+        CREATE TABLE IF NOT EXISTS tickets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            channel_id TEXT NOT NULL,
+            user_id TEXT,
+            ticket_number INTEGER,
+            category TEXT,
+            type TEXT,
+            status TEXT DEFAULT 'open',
+            reason TEXT,
+            initial_message_id TEXT,
+            assigned_to TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            closed_at DATETIME,
+            closed_by TEXT,
+            transcript_url TEXT
+        )
+    """,
+    "ticket_config": """
+        CREATE TABLE IF NOT EXISTS ticket_config (
+            guild_id TEXT PRIMARY KEY,
+            enabled BOOLEAN DEFAULT 1,
+            category_id TEXT,
+            support_role_id TEXT,
+            log_channel_id TEXT,
+            max_tickets INTEGER DEFAULT 3,
+            ticket_name_format TEXT DEFAULT 'ticket-{user}-{number}',
+            welcome_message TEXT,
+            close_message TEXT,
+            auto_close_hours INTEGER DEFAULT 0,
+            transcript_enabled BOOLEAN DEFAULT 1,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "ticket_categories": """
+        CREATE TABLE IF NOT EXISTS ticket_categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            emoji TEXT,
+            role_id TEXT,
+            auto_close_hours INTEGER DEFAULT 0,
+            welcome_message TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(guild_id, name)
+        )
+    """,
+    "ticket_transcripts": """
+        CREATE TABLE IF NOT EXISTS ticket_transcripts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticket_id INTEGER NOT NULL,
+            message_id TEXT NOT NULL,
+            author_id TEXT NOT NULL,
+            author_name TEXT NOT NULL,
+            content TEXT,
+            attachments TEXT,
+            embeds TEXT,
+            timestamp DATETIME NOT NULL,
+            FOREIGN KEY (ticket_id) REFERENCES tickets (id) ON DELETE CASCADE
+        )
+    """,
+    # Giveaways
+    "giveaways": """
+        CREATE TABLE IF NOT EXISTS giveaways (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            channel_id TEXT NOT NULL,
+            message_id TEXT UNIQUE,
+            host_id TEXT,
+            creator_id TEXT,
+            title TEXT,
+            prize TEXT,
+            description TEXT,
+            requirements TEXT,
+            winners INTEGER DEFAULT 1,
+            end_time DATETIME NOT NULL,
+            ended INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'active',
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "giveaway_entries": """
+        CREATE TABLE IF NOT EXISTS giveaway_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            giveaway_id INTEGER NOT NULL,
+            user_id TEXT NOT NULL,
+            joined_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (giveaway_id) REFERENCES giveaways (id) ON DELETE CASCADE,
+            UNIQUE(giveaway_id, user_id)
+        )
+    """,
+    # Sticky messages
+    "sticky_messages": """
+        CREATE TABLE IF NOT EXISTS sticky_messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT,
+            channel_id TEXT NOT NULL UNIQUE,
+            message_content TEXT,
+            content TEXT,
+            embed_data TEXT,
+            frequency INTEGER DEFAULT 5,
+            message_threshold INTEGER,
+            last_message_id TEXT,
+            current_message_id TEXT,
+            last_posted TIMESTAMP,
+            auto_repost INTEGER DEFAULT 0,
+            repost_interval INTEGER,
+            is_active BOOLEAN DEFAULT 1,
+            enabled BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "sticky_stats": """
+        CREATE TABLE IF NOT EXISTS sticky_stats (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            channel_id TEXT NOT NULL,
+            reposts_count INTEGER DEFAULT 0,
+            last_repost TIMESTAMP,
+            total_views INTEGER DEFAULT 0
+        )
+    """,
+    "sticky_history": """
+        CREATE TABLE IF NOT EXISTS sticky_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sticky_id INTEGER NOT NULL,
+            old_message_id TEXT,
+            new_message_id TEXT,
+            trigger_user_id TEXT,
+            trigger_message_id TEXT,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (sticky_id) REFERENCES sticky_messages (id) ON DELETE CASCADE
+        )
+    """,
+    # Sugestões
+    "suggestions": """
+        CREATE TABLE IF NOT EXISTS suggestions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            channel_id TEXT,
+            message_id TEXT,
+            user_id TEXT,
+            title TEXT,
+            description TEXT,
+            content TEXT,
+            suggestion TEXT,
+            category TEXT,
+            status TEXT DEFAULT 'pending',
+            upvotes INTEGER DEFAULT 0,
+            downvotes INTEGER DEFAULT 0,
+            votes_up INTEGER DEFAULT 0,
+            votes_down INTEGER DEFAULT 0,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            reviewed_at DATETIME,
+            reviewed_by TEXT,
+            review_reason TEXT,
+            decided_at DATETIME,
+            decided_by TEXT,
+            decision_reason TEXT
+        )
+    """,
+    "suggestion_votes": """
+        CREATE TABLE IF NOT EXISTS suggestion_votes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            suggestion_id INTEGER NOT NULL,
+            user_id TEXT NOT NULL,
+            vote_type TEXT NOT NULL CHECK(vote_type IN ('up', 'down')),
+            voted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (suggestion_id) REFERENCES suggestions (id) ON DELETE CASCADE,
+            UNIQUE(suggestion_id, user_id)
+        )
+    """,
+    "suggestion_config": """
+        CREATE TABLE IF NOT EXISTS suggestion_config (
+            guild_id TEXT PRIMARY KEY,
+            enabled BOOLEAN DEFAULT 1,
+            suggestion_channel_id TEXT,
+            review_channel_id TEXT,
+            auto_react BOOLEAN DEFAULT 1,
+            up_emoji TEXT DEFAULT '👍',
+            down_emoji TEXT DEFAULT '👎',
+            dm_user BOOLEAN DEFAULT 1,
+            anonymous_suggestions BOOLEAN DEFAULT 0,
+            cooldown_minutes INTEGER DEFAULT 5,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    # Backups
+    "backups": """
+        CREATE TABLE IF NOT EXISTS backups (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            backup_name TEXT,
+            name TEXT,
+            backup_data TEXT,
+            data_json TEXT,
+            backup_size INTEGER DEFAULT 0,
+            description TEXT,
+            created_by TEXT NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            restored_at DATETIME,
+            UNIQUE(guild_id, backup_name)
+        )
+    """,
+    "backup_restore_history": """
+        CREATE TABLE IF NOT EXISTS backup_restore_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            backup_id INTEGER NOT NULL,
+            restored_by TEXT NOT NULL,
+            restored_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            success BOOLEAN DEFAULT 0,
+            error_message TEXT,
+            FOREIGN KEY (backup_id) REFERENCES backups (id) ON DELETE CASCADE
+        )
+    """,
+    "guild_backups": """
+        CREATE TABLE IF NOT EXISTS guild_backups (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT,
+            backup_data TEXT,
+            backup_type TEXT,
+            created_by TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    # Autorole, logs e boas-vindas
+    "autorole_rules": """
+        CREATE TABLE IF NOT EXISTS autorole_rules (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            rule_id TEXT NOT NULL,
+            rule_name TEXT NOT NULL,
+            rule_data TEXT NOT NULL,
+            is_active INTEGER DEFAULT 1,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(guild_id, rule_id)
+        )
+    """,
+    "logs": """
+        CREATE TABLE IF NOT EXISTS logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            user_id TEXT,
+            target_id TEXT,
+            channel_id TEXT,
+            message_id TEXT,
+            data TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "log_config": """
+        CREATE TABLE IF NOT EXISTS log_config (
+            guild_id TEXT PRIMARY KEY,
+            enabled BOOLEAN DEFAULT 1,
+            log_channel_id TEXT,
+            events_enabled TEXT DEFAULT '[]',
+            ignore_bots BOOLEAN DEFAULT 1,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "welcome_config": """
+        CREATE TABLE IF NOT EXISTS welcome_config (
+            guild_id TEXT PRIMARY KEY,
+            enabled BOOLEAN DEFAULT 1,
+            welcome_channel_id TEXT,
+            welcome_message TEXT DEFAULT 'Bem-vindo(a) ao servidor, {user}!',
+            welcome_embed BOOLEAN DEFAULT 0,
+            welcome_embed_data TEXT,
+            goodbye_enabled BOOLEAN DEFAULT 0,
+            goodbye_channel_id TEXT,
+            goodbye_message TEXT DEFAULT 'Tchau, {user}! Esperamos te ver novamente.',
+            dm_welcome BOOLEAN DEFAULT 0,
+            dm_message TEXT DEFAULT 'Bem-vindo(a) ao {server}!',
+            auto_role_enabled BOOLEAN DEFAULT 0,
+            auto_roles TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "welcome_history": """
+        CREATE TABLE IF NOT EXISTS welcome_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            event_type TEXT NOT NULL CHECK(event_type IN ('join', 'leave')),
+            message_sent BOOLEAN DEFAULT 0,
+            dm_sent BOOLEAN DEFAULT 0,
+            roles_assigned BOOLEAN DEFAULT 0,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    # Containers, música e diversão
+    "containers": """
+        CREATE TABLE IF NOT EXISTS containers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            template_data TEXT NOT NULL,
+            creator_id TEXT NOT NULL,
+            is_public BOOLEAN DEFAULT 0,
+            usage_count INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(guild_id, name)
+        )
+    """,
+    "container_usage": """
+        CREATE TABLE IF NOT EXISTS container_usage (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            container_id INTEGER NOT NULL,
+            user_id TEXT NOT NULL,
+            channel_id TEXT NOT NULL,
+            used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (container_id) REFERENCES containers (id)
+        )
+    """,
+    "music_history": """
+        CREATE TABLE IF NOT EXISTS music_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            song_title TEXT NOT NULL,
+            song_url TEXT NOT NULL,
+            duration TEXT,
+            played_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "music_settings": """
+        CREATE TABLE IF NOT EXISTS music_settings (
+            guild_id TEXT PRIMARY KEY,
+            default_volume INTEGER DEFAULT 50,
+            auto_leave BOOLEAN DEFAULT 1,
+            dj_role_id TEXT,
+            max_queue_length INTEGER DEFAULT 50
+        )
+    """,
+    "eightball_predictions": """
+        CREATE TABLE IF NOT EXISTS eightball_predictions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            guild_id TEXT NOT NULL,
+            question TEXT NOT NULL,
+            answer TEXT NOT NULL,
+            category TEXT NOT NULL,
+            sentiment TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "eightball_stats": """
+        CREATE TABLE IF NOT EXISTS eightball_stats (
+            user_id TEXT PRIMARY KEY,
+            total_questions INTEGER DEFAULT 0,
+            positive_answers INTEGER DEFAULT 0,
+            neutral_answers INTEGER DEFAULT 0,
+            negative_answers INTEGER DEFAULT 0,
+            favorite_category TEXT
+        )
+    """,
+}
+
+# Colunas antigas -> coluna canônica (por tabela), usadas ao reconstruir
+# tabelas criadas pelas definições conflitantes
+LEGACY_COLUMNS: dict[str, dict[str, str]] = {
+    "user_levels": {
+        "xp": "total_xp",
+        "messages": "messages_sent",
+        "total_messages": "messages_sent",
+        "last_xp_time": "last_xp_gain",
+        "last_message": "last_xp_gain",
+    },
+    "tickets": {"creator_id": "user_id"},
+    "giveaways": {"winners_count": "winners"},
+    "sticky_messages": {"active": "is_active", "embed_json": "embed_data"},
+    "suggestions": {"author_id": "user_id"},
+    "user_notes": {"note": "content"},
+}
+
+# v3: índices das consultas frequentes
+BASE_INDEXES: tuple[str, ...] = (
+    # Leveling: membro (ON CONFLICT do acumulador) e índices de cobertura do ranking
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_user_levels_member ON user_levels (guild_id, user_id)",
+    """CREATE INDEX IF NOT EXISTS idx_user_levels_xp
+        ON user_levels (guild_id, total_xp DESC, user_id, level, messages_sent)""",
+    """CREATE INDEX IF NOT EXISTS idx_user_levels_level
+        ON user_levels (guild_id, level DESC, total_xp DESC, user_id)""",
+    """CREATE INDEX IF NOT EXISTS idx_user_levels_messages
+        ON user_levels (guild_id, messages_sent DESC, user_id)""",
+    # Histórico do usuário (casos, avisos, notas, mutes)
+    "CREATE INDEX IF NOT EXISTS idx_warnings_user ON warnings (guild_id, user_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_mod_cases_user ON mod_cases (guild_id, user_id, created_at)",
+    """CREATE INDEX IF NOT EXISTS idx_moderation_cases_user
+        ON moderation_cases (guild_id, user_id, created_at)""",
+    "CREATE INDEX IF NOT EXISTS idx_user_notes_user ON user_notes (guild_id, user_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_user_notes_note ON user_notes (note_id)",
+    "CREATE INDEX IF NOT EXISTS idx_mute_history_user ON mute_history (guild_id, user_id, applied_at)",
+    "CREATE INDEX IF NOT EXISTS idx_mute_history_expiry ON mute_history (is_active, expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_voice_actions_user ON voice_actions (guild_id, user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_case_attachments_case ON case_attachments (guild_id, case_id)",
+    # Tickets (pipeline de mensagens consulta o canal a cada mensagem)
+    "CREATE INDEX IF NOT EXISTS idx_tickets_channel ON tickets (channel_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_tickets_user ON tickets (guild_id, user_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_tickets_guild ON tickets (guild_id, status, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_ticket_transcripts_ticket ON ticket_transcripts (ticket_id)",
+    # Giveaways (varredura periódica dos que terminaram)
+    "CREATE INDEX IF NOT EXISTS idx_giveaways_guild ON giveaways (guild_id, ended)",
+    "CREATE INDEX IF NOT EXISTS idx_giveaways_due ON giveaways (ended, end_time)",
+    "CREATE INDEX IF NOT EXISTS idx_giveaways_status_due ON giveaways (status, end_time)",
+    # Demais sistemas
+    "CREATE INDEX IF NOT EXISTS idx_temp_roles_expiry ON temp_roles (expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_suggestions_guild ON suggestions (guild_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_suggestions_message ON suggestions (message_id)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_guild ON logs (guild_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_sticky_history_sticky ON sticky_history (sticky_id)",
+    "CREATE INDEX IF NOT EXISTS idx_container_usage_container ON container_usage (container_id)",
+    "CREATE INDEX IF NOT EXISTS idx_music_history_guild ON music_history (guild_id, played_at)",
+    """CREATE INDEX IF NOT EXISTS idx_command_analytics_guild
+        ON command_analytics (guild_id, timestamp)""",
+    "CREATE INDEX IF NOT EXISTS idx_eightball_predictions_user ON eightball_predictions (user_id)",
+)
+
+# v4: agendador persistente e enquetes
+SCHEDULER_TABLES: dict[str, str] = {
+    "scheduled_events": """
+        CREATE TABLE IF NOT EXISTS scheduled_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_type TEXT NOT NULL,
+            event_key TEXT,
+            execute_at REAL NOT NULL,
+            event_data TEXT,
+            guild_id TEXT,
+            created_by TEXT,
+            status TEXT DEFAULT 'pending',
+            attempts INTEGER DEFAULT 0,
+            error TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            executed_at DATETIME,
+            completed_at DATETIME,
+            cancelled_at DATETIME
+        )
+    """,
+    "polls": """
+        CREATE TABLE IF NOT EXISTS polls (
+            id TEXT PRIMARY KEY,
+            guild_id TEXT NOT NULL,
+            channel_id TEXT NOT NULL,
+            message_id TEXT,
+            user_id TEXT NOT NULL,
+            question TEXT NOT NULL,
+            description TEXT,
+            options TEXT NOT NULL,
+            status TEXT DEFAULT 'active',
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            end_time DATETIME
+        )
+    """,
+    "poll_votes": """
+        CREATE TABLE IF NOT EXISTS poll_votes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            poll_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            option_index INTEGER NOT NULL,
+            voted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(poll_id, user_id)
+        )
+    """,
+}
+SCHEDULER_INDEXES: tuple[str, ...] = (
+    # Carga dos pendentes e um evento pendente por chave
+    "CREATE INDEX IF NOT EXISTS idx_scheduled_events_due ON scheduled_events (status, execute_at)",
+    """CREATE UNIQUE INDEX IF NOT EXISTS idx_scheduled_events_key
+        ON scheduled_events (event_type, event_key) WHERE status = 'pending'""",
+    "CREATE INDEX IF NOT EXISTS idx_polls_guild ON polls (guild_id, status)",
+)
+
+# v5: política de antispam unificada (uma linha por servidor)
+ANTISPAM_CONFIG_TABLES: dict[str, str] = {
+    "antispam_config": """
+        CREATE TABLE IF NOT EXISTS antispam_config (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT UNIQUE NOT NULL,
+            enabled INTEGER DEFAULT 1,
+            limite INTEGER DEFAULT 5,
+            intervalo INTEGER DEFAULT 10,
+            acao TEXT DEFAULT 'delete',
+            warn_threshold INTEGER,
+            mute_threshold INTEGER,
+            kick_threshold INTEGER,
+            ban_threshold INTEGER,
+            config_data TEXT,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+}
+
+# v6: detecções do antispam (created_at em timestamp) e contagens
+# pré-agregadas por hora e por dia; user_id '' guarda o total do servidor
+ANTISPAM_ROLLUP_TABLES: dict[str, str] = {
+    "antispam_logs": """
+        CREATE TABLE IF NOT EXISTS antispam_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            channel_id TEXT,
+            action_type TEXT NOT NULL,
+            reason TEXT,
+            created_at REAL NOT NULL
+        )
+    """,
+    "antispam_rollup_hourly": """
+        CREATE TABLE IF NOT EXISTS antispam_rollup_hourly (
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL DEFAULT '',
+            bucket INTEGER NOT NULL,
+            action_type TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, user_id, bucket, action_type)
+        ) WITHOUT ROWID
+    """,
+    "antispam_rollup_daily": """
+        CREATE TABLE IF NOT EXISTS antispam_rollup_daily (
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL DEFAULT '',
+            bucket INTEGER NOT NULL,
+            action_type TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, user_id, bucket, action_type)
+        ) WITHOUT ROWID
+    """,
+}
+ANTISPAM_ROLLUP_INDEXES: tuple[str, ...] = (
+    # Logs por usuário e maiores infratores do período nos rollups
+    "CREATE INDEX IF NOT EXISTS idx_antispam_logs_user ON antispam_logs (guild_id, user_id)",
+    """CREATE INDEX IF NOT EXISTS idx_antispam_rollup_hourly_bucket
+        ON antispam_rollup_hourly (guild_id, bucket)""",
+    """CREATE INDEX IF NOT EXISTS idx_antispam_rollup_daily_bucket
+        ON antispam_rollup_daily (guild_id, bucket)""",
+)
+
+# v7: contador persistente das sticky messages
+STICKY_COUNTER_TABLES: dict[str, str] = {
+    "sticky_messages": """
+        CREATE TABLE IF NOT EXISTS sticky_messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT,
+            channel_id TEXT NOT NULL UNIQUE,
+            message_content TEXT,
+            content TEXT,
+            embed_data TEXT,
+            frequency INTEGER DEFAULT 5,
+            message_threshold INTEGER,
+            message_count INTEGER DEFAULT 0,
+            last_message_id TEXT,
+            current_message_id TEXT,
+            last_posted TIMESTAMP,
+            auto_repost INTEGER DEFAULT 0,
+            repost_interval INTEGER,
+            is_active BOOLEAN DEFAULT 1,
+            enabled BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+}
+
+# v9: mensagens dos transcripts de tickets
+TRANSCRIPT_TABLES: dict[str, str] = {
+    "transcript_messages": """
+        CREATE TABLE IF NOT EXISTS transcript_messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channel_id TEXT NOT NULL,
+            message_id TEXT,
+            author_id TEXT,
+            content TEXT,
+            message_data TEXT,
+            timestamp TEXT,
+            action_type TEXT DEFAULT 'new'
+        )
+    """,
+}
+TRANSCRIPT_INDEXES: tuple[str, ...] = (
+    """CREATE INDEX IF NOT EXISTS idx_transcript_messages_channel
+        ON transcript_messages (channel_id, timestamp)""",
+)
+
+# v10: pool de canais de ticket
+TICKET_POOL_TABLES: dict[str, str] = {
+    "ticket_config": """
+        CREATE TABLE IF NOT EXISTS ticket_config (
+            guild_id TEXT PRIMARY KEY,
+            enabled BOOLEAN DEFAULT 1,
+            category_id TEXT,
+            support_role_id TEXT,
+            log_channel_id TEXT,
+            max_tickets INTEGER DEFAULT 3,
+            ticket_name_format TEXT DEFAULT 'ticket-{user}-{number}',
+            welcome_message TEXT,
+            close_message TEXT,
+            auto_close_hours INTEGER DEFAULT 0,
+            transcript_enabled BOOLEAN DEFAULT 1,
+            pool_size INTEGER,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+}
+
+# v11: checkpoints da leitura de histórico
+HISTORY_SCAN_TABLES: dict[str, str] = {
+    "history_scan_checkpoints": """
+        CREATE TABLE IF NOT EXISTS history_scan_checkpoints (
+            scan_key TEXT PRIMARY KEY,
+            channel_id TEXT,
+            last_message_id TEXT NOT NULL,
+            state TEXT,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+}
+
+# v12: paginação por chave das listas (mais recentes primeiro)
+LIST_PAGINATION_INDEXES: tuple[str, ...] = (
+    "CREATE INDEX IF NOT EXISTS idx_tickets_recent ON tickets (guild_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_polls_recent ON polls (guild_id, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_suggestions_recent ON suggestions (guild_id, created_at)",
+)
+
+# v13: prazo de votação das sugestões
+SUGGESTION_EXPIRY_TABLES: dict[str, str] = {
+    "suggestions": """
+        CREATE TABLE IF NOT EXISTS suggestions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id TEXT NOT NULL,
+            channel_id TEXT,
+            message_id TEXT,
+            user_id TEXT,
+            title TEXT,
+            description TEXT,
+            content TEXT,
+            suggestion TEXT,
+            category TEXT,
+            status TEXT DEFAULT 'pending',
+            upvotes INTEGER DEFAULT 0,
+            downvotes INTEGER DEFAULT 0,
+            votes_up INTEGER DEFAULT 0,
+            votes_down INTEGER DEFAULT 0,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            reviewed_at DATETIME,
+            reviewed_by TEXT,
+            review_reason TEXT,
+            decided_at DATETIME,
+            decided_by TEXT,
+            decision_reason TEXT,
+            expires_at DATETIME
+        )
+    """,
+}
+
+# Esquema atual: a definição mais recente de cada tabela e todos os índices
+TABLES: dict[str, str] = {
+    **BASE_TABLES,
+    **SCHEDULER_TABLES,
+    **ANTISPAM_CONFIG_TABLES,
+    **ANTISPAM_ROLLUP_TABLES,
+    **STICKY_COUNTER_TABLES,
+    **TRANSCRIPT_TABLES,
+    **TICKET_POOL_TABLES,
+    **HISTORY_SCAN_TABLES,
+    **SUGGESTION_EXPIRY_TABLES,
+}
+INDEXES: tuple[str, ...] = (
+    BASE_INDEXES
+    + SCHEDULER_INDEXES
+    + ANTISPAM_ROLLUP_INDEXES
+    + TRANSCRIPT_INDEXES
+    + LIST_PAGINATION_INDEXES
+)
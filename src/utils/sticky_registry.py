@@ -0,0 +1,381 @@
+"""
+Registro de Sticky Messages em Memória
+Contadores e ID da mensagem atual por canal, com repostagem adiada até o
+canal ficar em silêncio e gravação periódica no banco
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+if TYPE_CHECKING:
+    from .database import Database
+
+UPDATE_QUERY = """
+    UPDATE sticky_messages
+    SET message_count = ?, last_message_id = ?, current_message_id = ?,
+        last_posted = COALESCE(?, last_posted)
+    WHERE channel_id = ?
+"""
+
+STATS_UPDATE_QUERY = """
+    UPDATE sticky_stats SET reposts_count = reposts_count + ?, last_repost = ?
+    WHERE guild_id = ? AND channel_id = ?
+"""
+
+
+def _iso(timestamp: float | None) -> str | None:
+    """Timestamp -> ISO 8601 (formato usado em last_posted/last_repost)"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
+class StickyState:
+    """Sticky de um canal, em memória"""
+
+    channel_id: int
+    guild_id: str | None
+    content: str
+    embed_data: dict[str, Any] | None = None
+    # Mensagens de usuários até repostar
+    threshold: int = 5
+    message_id: int | None = None
+    counter: int = 0
+    posted_at: float | None = None
+    # Reposts ainda não somados em sticky_stats
+    pending_reposts: int = 0
+    dirty: bool = False
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> StickyState | None:
+        """
+        Montar o estado a partir de uma linha de sticky_messages
+
+        Aceita as duas famílias de colunas usadas pelos comandos
+        (``content``/``message_content``, ``message_threshold``/``frequency``,
+        ``last_message_id``/``current_message_id``).
+
+        Returns:
+            StickyState, ou None se a sticky estiver desativada
+        """
+        if row.get("is_active") in (0, False) or row.get("enabled") in (0, False):
+            return None
+        embed_data = row.get("embed_data")
+        if isinstance(embed_data, str):
+            try:
+                embed_data = json.loads(embed_data)
+            except ValueError:
+                embed_data = None
+        message_id = row.get("last_message_id") or row.get("current_message_id")
+        return cls(
+            channel_id=int(row["channel_id"]),
+            guild_id=str(row["guild_id"]) if row.get("guild_id") else None,
+            content=row.get("content") or row.get("message_content") or "",
+            embed_data=embed_data if isinstance(embed_data, dict) and embed_data else None,
+            threshold=max(1, int(row.get("message_threshold") or row.get("frequency") or 5)),
+            message_id=int(message_id) if message_id else None,
+            counter=int(row.get("message_count") or 0),
+        )
+
+
+class StickyRegistry:
+    """
+    Sticky messages ativas em memória.
+
+    Todas as stickies ativas são lidas uma vez (``load``); a partir daí cada
+    mensagem custa uma consulta a um dict. Ao atingir o limite de mensagens a
+    repostagem é adiada até o canal ficar ``debounce`` segundos em silêncio
+    (no máximo ``max_delay`` depois do limite), então uma rajada de mensagens
+    gera um único repost. A mensagem anterior é apagada pelo ID guardado, sem
+    buscá-la antes. Contadores, IDs e reposts vão para o banco a cada
+    ``flush_interval`` segundos.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        *,
+        debounce: float = 3.0,
+        max_delay: float = 30.0,
+        flush_interval: float = 30.0,
+    ) -> None:
+        """
+        Inicializa o registro
+
+        Args:
+            database: Banco principal
+            debounce: Silêncio (s) no canal antes de repostar
+            max_delay: Atraso máximo (s) de um repost em canais sem pausa
+            flush_interval: Segundos entre gravações do estado
+        """
+        self.database = database
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.flush_interval = flush_interval
+
+        self._states: dict[int, StickyState] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        # channel_id -> (prazo do repost, limite do prazo)
+        self._deadlines: dict[int, tuple[float, float]] = {}
+        self._reposts: dict[int, asyncio.Task[None]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+        self.reposts: int = 0
+        self.coalesced: int = 0
+        self.flushes: int = 0
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    async def load(self) -> int:
+        """
+        Ler as stickies ativas do banco (uma única vez por processo)
+
+        Returns:
+            Quantidade de stickies ativas
+        """
+        if self._loaded:
+            return len(self._states)
+        async with self._load_lock:
+            if not self._loaded:
+                rows = await self.database.get_all("SELECT * FROM sticky_messages")
+                for row in rows:
+                    state = StickyState.from_row(row)
+                    if state is not None:
+                        self._states.setdefault(state.channel_id, state)
+                self._loaded = True
+        return len(self._states)
+
+    def get(self, channel_id: int) -> StickyState | None:
+        """Sticky ativa de um canal (sem acessar o banco)"""
+        return self._states.get(int(channel_id))
+
+    async def reload(self, channel_id: int) -> StickyState | None:
+        """
+        Reler a sticky de um canal após uma gravação pelos comandos
+
+        Returns:
+            Novo estado, ou None se o canal não tem sticky ativa
+        """
+        channel_id = int(channel_id)
+        row = await self.database.get(
+            "SELECT * FROM sticky_messages WHERE channel_id = ?", (str(channel_id),)
+        )
+        state = StickyState.from_row(row) if row else None
+        if state is None:
+            self.remove(channel_id)
+            return None
+        old = self._states.get(channel_id)
+        if old is not None:
+            state.counter = 0
+            state.pending_reposts = old.pending_reposts
+            state.dirty = old.pending_reposts > 0
+        self._states[channel_id] = state
+        return state
+
+    def remove(self, channel_id: int) -> None:
+        """Esquecer a sticky de um canal e cancelar o repost pendente"""
+        channel_id = int(channel_id)
+        self._states.pop(channel_id, None)
+        self._deadlines.pop(channel_id, None)
+        task = self._reposts.pop(channel_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def record_message(
+        self, channel: discord.abc.Messageable, now: float | None = None
+    ) -> bool:
+        """
+        Contar uma mensagem de usuário e agendar o repost se preciso
+
+        Args:
+            channel: Canal da mensagem
+            now: Momento da mensagem (padrão: ``time.monotonic()``)
+
+        Returns:
+            True se há um repost agendado para o canal
+        """
+        if not self._loaded:
+            await self.load()
+        state = self._states.get(channel.id)
+        if state is None:
+            return False
+
+        state.counter += 1
+        state.dirty = True
+        self._ensure_flush_task()
+        if state.counter < state.threshold:
+            return False
+
+        now = time.monotonic() if now is None else now
+        deadline = self._deadlines.get(channel.id)
+        if deadline is None:
+            self._deadlines[channel.id] = (now + self.debounce, now + self.max_delay)
+        else:
+            # Mais uma mensagem na rajada: empurra o prazo (até o limite)
+            self._deadlines[channel.id] = (min(now + self.debounce, deadline[1]), deadline[1])
+            self.coalesced += 1
+
+        task = self._reposts.get(channel.id)
+        if task is None or task.done():
+            self._reposts[channel.id] = asyncio.create_task(self._debounced_repost(channel))
+        return True
+
+    async def _debounced_repost(self, channel: discord.abc.Messageable) -> None:
+        """Esperar o canal ficar em silêncio e repostar"""
+        try:
+            while True:
+                deadline = self._deadlines.get(channel.id)
+                if deadline is None:
+                    return
+                delay = deadline[0] - time.monotonic()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            self._deadlines.pop(channel.id, None)
+            await self.repost(channel)
+        except Exception as e:
+            print(f"❌ Erro repostando sticky: {e}")
+        finally:
+            if self._reposts.get(channel.id) is asyncio.current_task():
+                del self._reposts[channel.id]
+
+    async def repost(self, channel: discord.abc.Messageable) -> discord.Message | None:
+        """
+        Apagar a sticky anterior (pelo ID) e enviar a nova
+
+        Args:
+            channel: Canal da sticky
+
+        Returns:
+            Mensagem enviada, ou None se o canal não tem sticky
+        """
+        state = self._states.get(channel.id)
+        if state is None:
+            return None
+
+        # Mensagens que chegarem durante o envio contam para o próximo repost
+        state.counter = 0
+        if state.message_id:
+            try:
+                await channel.get_partial_message(state.message_id).delete()
+            except (discord.NotFound, discord.Forbidden):
+                pass
+
+        embed = discord.Embed.from_dict(state.embed_data) if state.embed_data else None
+        if not state.content and embed is None:
+            return None
+        message = await channel.send(content=state.content or None, embed=embed)
+
+        state.message_id = message.id
+        state.posted_at = time.time()
+        state.pending_reposts += 1
+        state.dirty = True
+        self.reposts += 1
+        self._ensure_flush_task()
+        return message
+
+    def _ensure_flush_task(self) -> None:
+        """Iniciar a gravação periódica no primeiro uso"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Gravar o estado a cada ``flush_interval`` segundos"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"❌ Erro gravando sticky messages: {e}")
+
+    async def flush(self) -> int:
+        """
+        Gravar contadores, IDs e reposts pendentes em uma única transação
+
+        Returns:
+            Número de stickies gravadas
+        """
+        dirty = [state for state in self._states.values() if state.dirty]
+        if not dirty:
+            return 0
+        for state in dirty:
+            state.dirty = False
+        reposts = {state.channel_id: state.pending_reposts for state in dirty}
+
+        try:
+            async with self.database.pool.writer() as db:
+                await db.executemany(
+                    UPDATE_QUERY,
+                    [
+                        (
+                            state.counter,
+                            str(state.message_id) if state.message_id else None,
+                            str(state.message_id) if state.message_id else None,
+                            _iso(state.posted_at),
+                            str(state.channel_id),
+                        )
+                        for state in dirty
+                    ],
+                )
+                for state in dirty:
+                    if not reposts[state.channel_id]:
+                        continue
+                    params = (str(state.guild_id), str(state.channel_id))
+                    cursor = await db.execute(
+                        STATS_UPDATE_QUERY,
+                        (reposts[state.channel_id], _iso(state.posted_at), *params),
+                    )
+                    if cursor.rowcount == 0:
+                        await db.execute(
+                            """INSERT INTO sticky_stats
+                            (guild_id, channel_id, reposts_count, last_repost)
+                            VALUES (?, ?, ?, ?)""",
+                            (*params, reposts[state.channel_id], _iso(state.posted_at)),
+                        )
+                await db.commit()
+        except Exception:
+            for state in dirty:
+                state.dirty = True
+            raise
+
+        for state in dirty:
+            state.pending_reposts -= reposts[state.channel_id]
+        self.flushes += 1
+        return len(dirty)
+
+    async def close(self) -> None:
+        """Cancelar reposts pendentes, parar o flush periódico e gravar o estado"""
+        for task in [*self._reposts.values(), self._flush_task]:
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(
+            *self._reposts.values(),
+            *([self._flush_task] if self._flush_task else []),
+            return_exceptions=True,
+        )
+        self._reposts.clear()
+        self._deadlines.clear()
+        self._flush_task = None
+        if self._loaded:
+            await self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do registro"""
+        return {
+            "stickies": len(self._states),
+            "pending_reposts": len(self._reposts),
+            "reposts": self.reposts,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+        }
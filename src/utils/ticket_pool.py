@@ -0,0 +1,298 @@
+"""
+Pool de Canais de Ticket
+Canais ocultos criados com antecedência por servidor, para que abrir um ticket
+seja só renomear o canal e liberar o acesso do membro
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .database import Database
+
+# Nome dos canais que aguardam um ticket (usado para reencontrá-los após reiniciar)
+POOL_CHANNEL_PREFIX = "ticket-livre"
+# Categoria usada pelos handlers quando o servidor não configurou uma
+DEFAULT_CATEGORY_NAME = "🎫 Tickets"
+
+
+class TicketChannelPool:
+    """
+    Pool de canais de ticket pré-criados, por servidor.
+
+    Cada servidor com ``pool_size`` > 0 em ``ticket_config`` (ou com o padrão
+    ``default_size``) mantém até esse número de canais ocultos na categoria
+    de tickets. ``acquire`` pega um deles e aplica nome, tópico e permissões
+    em uma única edição, em vez de criar o canal enquanto a interação espera.
+    Uma tarefa em segundo plano repõe o pool um canal por vez, com
+    ``interval`` segundos entre criações e espera crescente após um 429.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        *,
+        default_size: int = 0,
+        interval: float = 2.0,
+        max_backoff: float = 300.0,
+    ) -> None:
+        """
+        Inicializa o pool
+
+        Args:
+            database: Banco principal
+            default_size: Canais por servidor quando ``pool_size`` não foi configurado
+            interval: Tempo (s) entre criações de canal
+            max_backoff: Espera máxima (s) depois de um 429
+        """
+        self.database = database
+        self.default_size = max(0, default_size)
+        self.interval = interval
+        self.max_backoff = max_backoff
+
+        # guild_id -> tamanho configurado / categoria configurada
+        self._targets: dict[int, int] = {}
+        self._categories: dict[int, int | None] = {}
+        # guild_id -> canais livres, na ordem de criação
+        self._channels: dict[int, deque[int]] = {}
+        self._guilds: dict[int, discord.Guild] = {}
+        # Servidores em que a criação falhou (sem categoria, permissão ou espaço)
+        self._stalled: set[int] = set()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._backoff = 0.0
+
+        self.acquired: int = 0
+        self.misses: int = 0
+        self.created: int = 0
+        self.rate_limited: int = 0
+
+    def __len__(self) -> int:
+        return sum(len(channels) for channels in self._channels.values())
+
+    async def load(self) -> int:
+        """
+        Ler tamanho e categoria do pool de cada servidor
+
+        Returns:
+            Quantidade de servidores com pool configurado
+        """
+        rows = await self.database.get_all(
+            "SELECT guild_id, category_id, pool_size FROM ticket_config"
+        )
+        for row in rows:
+            self.configure(row["guild_id"], row["category_id"], row["pool_size"])
+        return sum(1 for size in self._targets.values() if size > 0)
+
+    def configure(
+        self, guild_id: int | str, category_id: int | str | None, pool_size: int | None
+    ) -> None:
+        """
+        Aplicar a configuração de tickets gravada no banco
+
+        Args:
+            guild_id: Servidor
+            category_id: Categoria de tickets configurada
+            pool_size: Canais livres a manter (None usa ``default_size``)
+        """
+        guild_id = int(guild_id)
+        self._categories[guild_id] = int(category_id) if category_id else None
+        if pool_size is None:
+            self._targets.pop(guild_id, None)
+        else:
+            self._targets[guild_id] = max(0, int(pool_size))
+        self._stalled.discard(guild_id)
+        self._wake.set()
+
+    def target(self, guild_id: int) -> int:
+        """Tamanho desejado do pool de um servidor"""
+        return self._targets.get(int(guild_id), self.default_size)
+
+    def category_for(self, guild: discord.Guild) -> discord.CategoryChannel | None:
+        """Categoria de tickets do servidor (configurada ou a padrão)"""
+        category_id = self._categories.get(guild.id)
+        if category_id:
+            category = guild.get_channel(category_id)
+            if isinstance(category, discord.CategoryChannel):
+                return category
+        return discord.utils.get(guild.categories, name=DEFAULT_CATEGORY_NAME)
+
+    async def warm(self, guild: discord.Guild) -> int:
+        """
+        Reencontrar os canais livres de um servidor e iniciar a reposição
+
+        Args:
+            guild: Servidor
+
+        Returns:
+            Canais livres encontrados
+        """
+        self._guilds[guild.id] = guild
+        self._stalled.discard(guild.id)
+        channels = self._channels.setdefault(guild.id, deque())
+        known = set(channels)
+        category = self.category_for(guild)
+        if category is not None:
+            for channel in category.text_channels:
+                if (
+                    channel.name.startswith(POOL_CHANNEL_PREFIX)
+                    and channel.id not in known
+                    and not await self.database.tickets.is_ticket_channel(channel.id)
+                ):
+                    channels.append(channel.id)
+        self._ensure_task()
+        return len(channels)
+
+    async def acquire(
+        self,
+        guild: discord.Guild,
+        *,
+        name: str,
+        overwrites: Mapping[discord.abc.Snowflake, discord.PermissionOverwrite],
+        category: discord.CategoryChannel | None = None,
+        topic: str | None = None,
+    ) -> discord.TextChannel | None:
+        """
+        Pegar um canal livre e transformá-lo no canal do ticket
+
+        Args:
+            guild: Servidor
+            name: Nome do canal do ticket
+            overwrites: Permissões finais do canal (substituem as do pool)
+            category: Só usar canais desta categoria
+            topic: Tópico do canal
+
+        Returns:
+            O canal pronto, ou None se o pool está vazio (o chamador cria o canal)
+        """
+        self._guilds[guild.id] = guild
+        channels = self._channels.get(guild.id)
+        skipped: list[int] = []
+        try:
+            while channels:
+                channel = guild.get_channel(channels.popleft())
+                if channel is None:
+                    continue
+                if category is not None and channel.category_id != category.id:
+                    skipped.append(channel.id)
+                    continue
+                try:
+                    await channel.edit(
+                        name=name, topic=topic, overwrites=dict(overwrites), reason="Ticket aberto"
+                    )
+                except discord.NotFound:
+                    continue
+                self.acquired += 1
+                return channel
+        finally:
+            if skipped:
+                channels.extendleft(reversed(skipped))
+            if self.target(guild.id) > 0:
+                self._ensure_task()
+                self._wake.set()
+
+        self.misses += 1
+        return None
+
+    def _ensure_task(self) -> None:
+        """Iniciar a reposição em segundo plano (uma tarefa para todos os servidores)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._replenish_loop())
+
+    def _next_guild(self) -> discord.Guild | None:
+        """Servidor com menos canais livres que o tamanho desejado"""
+        for guild_id, guild in self._guilds.items():
+            if guild_id in self._stalled:
+                continue
+            if len(self._channels.get(guild_id, ())) < self.target(guild_id):
+                return guild
+        return None
+
+    async def _replenish_loop(self) -> None:
+        """Criar canais, um por vez, até todos os pools estarem cheios"""
+        while True:
+            guild = self._next_guild()
+            if guild is None:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+            try:
+                await self._provision(guild)
+            except discord.RateLimited as e:
+                await asyncio.sleep(self._rate_limited(e.retry_after))
+                continue
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    await asyncio.sleep(self._rate_limited(None))
+                    continue
+                # Sem permissão, limite de canais da categoria etc.
+                self._stalled.add(guild.id)
+                print(f"⚠️ Pool de tickets pausado em {guild.id}: {e}")
+            except Exception as e:
+                self._stalled.add(guild.id)
+                print(f"❌ Erro repondo pool de tickets ({guild.id}): {e}")
+            else:
+                self._backoff = 0.0
+            await asyncio.sleep(self.interval)
+
+    def _rate_limited(self, retry_after: float | None) -> float:
+        """Registrar um 429 e calcular a espera"""
+        self.rate_limited += 1
+        self._backoff = min(max(self._backoff * 2, self.interval, 1.0), self.max_backoff)
+        return min(retry_after, self.max_backoff) if retry_after else self._backoff
+
+    async def _provision(self, guild: discord.Guild) -> None:
+        """Criar um canal oculto no pool do servidor"""
+        category = self.category_for(guild)
+        if category is None:
+            self._stalled.add(guild.id)
+            print(f"⚠️ Pool de tickets sem categoria em {guild.id}")
+            return
+        overwrites = {
+            guild.default_role: discord.PermissionOverwrite(view_channel=False),
+            guild.me: discord.PermissionOverwrite(
+                view_channel=True, send_messages=True, manage_channels=True, manage_messages=True
+            ),
+        }
+        channel = await guild.create_text_channel(
+            f"{POOL_CHANNEL_PREFIX}-{self.created + 1}",
+            category=category,
+            overwrites=overwrites,
+            reason="Pool de canais de ticket",
+        )
+        self._channels.setdefault(guild.id, deque()).append(channel.id)
+        self.created += 1
+
+    def discard(self, channel_id: int) -> None:
+        """Esquecer um canal livre apagado"""
+        for channels in self._channels.values():
+            if channel_id in channels:
+                channels.remove(channel_id)
+                self._wake.set()
+                return
+
+    async def close(self) -> None:
+        """Parar a reposição"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do pool"""
+        return {
+            "free_channels": len(self),
+            "guilds": sum(1 for guild_id in self._guilds if self.target(guild_id) > 0),
+            "stalled": len(self._stalled),
+            "acquired": self.acquired,
+            "misses": self.misses,
+            "created": self.created,
+            "rate_limited": self.rate_limited,
+        }
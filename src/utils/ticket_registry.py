@@ -0,0 +1,184 @@
+"""
+Registro de Tickets em Memória
+Tickets abertos indexados por canal e por dono, carregados uma vez e
+atualizados na abertura e no fechamento dos tickets
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .database import Database
+
+# Status em que o canal ainda é um ticket ativo
+OPEN_STATUSES: tuple[str, ...] = ("open", "pending")
+
+
+class TicketRegistry:
+    """
+    Tickets abertos, em memória.
+
+    Os tickets são lidos do banco uma vez (``load``) e mantidos em dois
+    índices: canal -> ticket e (servidor, dono) -> canais. Depois disso
+    ``is_ticket_channel``, ``get`` e ``owner_tickets`` são consultas a
+    dicionários, sem acessar o banco a cada mensagem, saída de membro ou
+    atualização de thread. Quem abre um ticket chama ``track`` (ou ``opened``
+    com a linha) logo depois de gravar no banco; quem fecha chama ``closed``
+    ou ``set_status``.
+    """
+
+    def __init__(self, database: Database) -> None:
+        """
+        Inicializa o registro
+
+        Args:
+            database: Banco principal
+        """
+        self.database = database
+        # channel_id -> linha do ticket
+        self._by_channel: dict[int, dict[str, Any]] = {}
+        # (guild_id, user_id) -> canais dos tickets abertos
+        self._by_owner: dict[tuple[int, int], set[int]] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+        self.lookups: int = 0
+
+    def __len__(self) -> int:
+        return len(self._by_channel)
+
+    async def load(self) -> int:
+        """
+        Ler os tickets abertos do banco (uma única vez por processo)
+
+        Returns:
+            Quantidade de tickets abertos
+        """
+        if self._loaded:
+            return len(self._by_channel)
+        async with self._load_lock:
+            if not self._loaded:
+                placeholders = ", ".join("?" for _ in OPEN_STATUSES)
+                rows = await self.database.get_all(
+                    f"SELECT * FROM tickets WHERE status IN ({placeholders})", OPEN_STATUSES
+                )
+                for row in rows:
+                    self.opened(row)
+                self._loaded = True
+        return len(self._by_channel)
+
+    async def is_ticket_channel(self, channel_id: int) -> bool:
+        """Verificar se o canal tem um ticket aberto (sem acessar o banco)"""
+        if not self._loaded:
+            await self.load()
+        self.lookups += 1
+        return int(channel_id) in self._by_channel
+
+    async def get(self, channel_id: int | str) -> dict[str, Any] | None:
+        """
+        Ticket aberto do canal
+
+        Args:
+            channel_id: Canal do ticket
+
+        Returns:
+            Cópia da linha do ticket, ou None se o canal não tem ticket aberto
+        """
+        if not self._loaded:
+            await self.load()
+        self.lookups += 1
+        ticket = self._by_channel.get(int(channel_id))
+        return dict(ticket) if ticket else None
+
+    async def owner_tickets(self, guild_id: int | str, user_id: int | str) -> list[dict[str, Any]]:
+        """
+        Tickets abertos de um membro
+
+        Args:
+            guild_id: Servidor
+            user_id: Dono dos tickets
+
+        Returns:
+            Cópias das linhas, na ordem de abertura
+        """
+        if not self._loaded:
+            await self.load()
+        self.lookups += 1
+        channels = self._by_owner.get((int(guild_id), int(user_id)), ())
+        tickets = [dict(self._by_channel[channel_id]) for channel_id in channels]
+        return sorted(tickets, key=lambda ticket: ticket.get("id") or 0)
+
+    def opened(self, ticket: Mapping[str, Any]) -> None:
+        """Indexar a linha de um ticket (ignorada se o status não for aberto)"""
+        if not ticket.get("channel_id"):
+            return
+        if ticket.get("status", "open") not in OPEN_STATUSES:
+            self.closed(ticket["channel_id"])
+            return
+        channel_id = int(ticket["channel_id"])
+        self.closed(channel_id)
+        self._by_channel[channel_id] = dict(ticket)
+        if ticket.get("guild_id") and ticket.get("user_id"):
+            owner = (int(ticket["guild_id"]), int(ticket["user_id"]))
+            self._by_owner.setdefault(owner, set()).add(channel_id)
+
+    async def track(self, ticket_id: int) -> dict[str, Any] | None:
+        """
+        Ler um ticket recém-criado do banco e indexá-lo
+
+        Args:
+            ticket_id: ID do ticket
+
+        Returns:
+            Linha do ticket, ou None se não existir
+        """
+        ticket = await self.database.get("SELECT * FROM tickets WHERE id = ?", (ticket_id,))
+        if ticket:
+            self.opened(ticket)
+        return ticket
+
+    def closed(self, channel_id: int | str) -> None:
+        """Registrar o fechamento (ou exclusão) do ticket do canal"""
+        ticket = self._by_channel.pop(int(channel_id), None)
+        if ticket and ticket.get("guild_id") and ticket.get("user_id"):
+            owner = (int(ticket["guild_id"]), int(ticket["user_id"]))
+            channels = self._by_owner.get(owner)
+            if channels is not None:
+                channels.discard(int(channel_id))
+                if not channels:
+                    del self._by_owner[owner]
+
+    def update(self, channel_id: int | str, **fields: Any) -> None:
+        """Aplicar campos gravados no banco à linha em memória"""
+        ticket = self._by_channel.get(int(channel_id))
+        if ticket is None:
+            return
+        if "status" in fields and fields["status"] not in OPEN_STATUSES:
+            self.closed(channel_id)
+            return
+        ticket.update(fields)
+
+    def set_status(self, channel_id: int | str, status: str) -> bool:
+        """
+        Aplicar uma mudança de status gravada no banco
+
+        Returns:
+            False se o ticket foi reaberto mas não está no registro (use ``track``)
+        """
+        if status not in OPEN_STATUSES:
+            self.closed(channel_id)
+            return True
+        self.update(channel_id, status=status)
+        return int(channel_id) in self._by_channel
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do registro"""
+        return {
+            "open_channels": len(self._by_channel),
+            "owners": len(self._by_owner),
+            "lookups": self.lookups,
+        }
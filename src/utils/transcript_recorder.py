@@ -0,0 +1,176 @@
+"""
+Gravação de Transcripts em Lote
+Eventos das mensagens de tickets acumulados por canal e gravados em
+transações periódicas
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .database import Database
+
+INSERT_QUERY = """
+    INSERT INTO transcript_messages
+    (channel_id, message_id, author_id, content, message_data, timestamp, action_type)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class TranscriptRecorder:
+    """
+    Buffer dos eventos de transcript (mensagens novas, editadas, apagadas).
+
+    ``record`` só guarda o evento na fila do canal. A cada ``flush_interval``
+    segundos, ou antes se a fila passar de ``max_pending`` eventos, tudo o
+    que está pendente é gravado com um único ``executemany`` em uma
+    transação, então uma categoria de tickets movimentada custa poucas
+    transações por segundo em vez de uma por mensagem. ``flush(channel_id)``
+    grava só um canal, antes de gerar o transcript dele.
+    """
+
+    def __init__(
+        self, database: Database, *, flush_interval: float = 0.5, max_pending: int = 1000
+    ) -> None:
+        """
+        Inicializa o gravador
+
+        Args:
+            database: Banco principal
+            flush_interval: Segundos entre gravações
+            max_pending: Eventos pendentes que antecipam a gravação
+        """
+        self.database = database
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+
+        # channel_id -> eventos na ordem de chegada
+        self._buffers: dict[int, list[tuple[Any, ...]]] = {}
+        self._pending = 0
+        self._full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+
+        self.recorded: int = 0
+        self.flushes: int = 0
+        self.rows_flushed: int = 0
+        self.flush_failures: int = 0
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def record(
+        self,
+        channel_id: int,
+        message_id: int | str,
+        author_id: int | str,
+        content: str | None,
+        message_data: dict[str, Any],
+        timestamp: str,
+        action_type: str = "new",
+    ) -> None:
+        """
+        Acrescentar um evento ao buffer do canal
+
+        Args:
+            channel_id: Canal do ticket
+            message_id: Mensagem do evento
+            author_id: Autor da mensagem
+            content: Texto registrado
+            message_data: Dados completos (serializados só na gravação)
+            timestamp: Momento do evento (ISO 8601)
+            action_type: ``new``, ``edited`` ou ``deleted``
+        """
+        self._buffers.setdefault(int(channel_id), []).append(
+            (
+                str(channel_id),
+                str(message_id),
+                str(author_id),
+                content,
+                message_data,
+                timestamp,
+                action_type,
+            )
+        )
+        self._pending += 1
+        self.recorded += 1
+        if self._pending >= self.max_pending:
+            self._full.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Gravar o buffer periodicamente enquanto houver eventos"""
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"❌ Erro gravando transcripts: {e}")
+                await asyncio.sleep(self.flush_interval)
+
+    async def flush(self, channel_id: int | None = None) -> int:
+        """
+        Gravar os eventos pendentes em uma única transação
+
+        Args:
+            channel_id: Gravar só este canal (padrão: todos)
+
+        Returns:
+            Número de eventos gravados
+        """
+        async with self._flush_lock:
+            if channel_id is None:
+                buffers, self._buffers = self._buffers, {}
+            else:
+                events = self._buffers.pop(int(channel_id), None)
+                buffers = {int(channel_id): events} if events else {}
+            rows = [row for events in buffers.values() for row in events]
+            if not rows:
+                return 0
+            self._pending -= len(rows)
+
+            try:
+                async with self.database.pool.writer() as db:
+                    await db.executemany(
+                        INSERT_QUERY,
+                        [(*row[:4], json.dumps(row[4]), *row[5:]) for row in rows],
+                    )
+                    await db.commit()
+            except Exception:
+                # Devolver os eventos (antes dos que chegaram depois)
+                for key, events in buffers.items():
+                    self._buffers[key] = events + self._buffers.get(key, [])
+                self._pending += len(rows)
+                self.flush_failures += 1
+                raise
+
+            self.flushes += 1
+            self.rows_flushed += len(rows)
+            return len(rows)
+
+    async def close(self) -> None:
+        """Parar a gravação periódica e gravar o pendente"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do gravador"""
+        return {
+            "pending": self._pending,
+            "channels": len(self._buffers),
+            "recorded": self.recorded,
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+            "flush_failures": self.flush_failures,
+        }
@@ -0,0 +1,353 @@
+"""
+Renderização de Transcripts em Streaming
+Lê as mensagens do ticket com um cursor e escreve HTML/TXT/JSON em pedaços
+em arquivos temporários, fora do event loop
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import sqlite3
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from html import escape
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from .database import Database
+
+TRANSCRIPT_FORMATS: tuple[str, ...] = ("html", "txt", "json")
+
+# Campos do message_data lidos pelo próprio SQLite (sem json.loads por linha)
+ROWS_QUERY = """
+    SELECT message_id, author_id, content, timestamp, action_type,
+        CASE WHEN json_valid(message_data)
+            THEN json_extract(message_data, '$.author_name') END AS author_name,
+        CASE WHEN json_valid(message_data)
+            THEN json_extract(message_data, '$.timestamp') END AS original_timestamp,
+        CASE WHEN json_valid(message_data)
+            THEN json_extract(message_data, '$.attachments') END AS attachments
+        {extra}
+    FROM transcript_messages WHERE channel_id = ? ORDER BY timestamp, id
+"""
+
+HTML_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Transcript - Ticket #{id}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
+        .header {{ background-color: #7289da; color: white; padding: 20px; border-radius: 5px; }}
+        .message {{ margin: 10px 0; padding: 10px; background-color: white; border-radius: 5px; }}
+        .message.deleted {{ background-color: #ffebee; border-left: 4px solid #f44336; }}
+        .message.edited {{ background-color: #fff3e0; border-left: 4px solid #ff9800; }}
+        .author {{ font-weight: bold; color: #7289da; }}
+        .timestamp {{ font-size: 0.8em; color: #666; }}
+        .content {{ margin: 5px 0; white-space: pre-wrap; }}
+        .attachment {{ background-color: #e8f5e8; padding: 5px; margin: 5px 0;
+            border-radius: 3px; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Transcript - Ticket #{id}</h1>
+        <p>Servidor: {guild}</p>
+        <p>Criador: &lt;@{creator}&gt;</p>
+        <p>Criado em: {created_at}</p>
+        <p>Status: {status}</p>
+    </div>
+"""
+
+HTML_FOOTER = """</body>
+</html>
+"""
+
+TEXT_HEADER = """===== TRANSCRIPT - TICKET #{id} =====
+Servidor: {guild}
+Criador: {creator}
+Criado em: {created_at}
+Status: {status}
+================================================
+
+"""
+
+UNKNOWN_AUTHOR = "Usuário Desconhecido"
+
+
+@dataclass(slots=True)
+class TranscriptPart:
+    """Um arquivo do transcript (parte de no máximo ``max_part_size`` bytes)"""
+
+    filename: str
+    file: IO[bytes]
+    size: int
+
+
+def _attachments(row: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """Anexos da linha (JSON só é decodificado quando há anexos)"""
+    raw = row["attachments"]
+    if not raw or raw == "[]":
+        return []
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return []
+
+
+def _archived_html(attachment: Mapping[str, Any]) -> str:
+    """Referência à cópia local do anexo (ver ``AttachmentArchiver``)"""
+    archived = attachment.get("archived")
+    if not archived:
+        return ""
+    return f' · arquivo: <code>{escape(str(archived.get("path")))}</code>'
+
+
+def _header_fields(ticket: Mapping[str, Any], guild_name: str) -> dict[str, Any]:
+    """Campos do cabeçalho"""
+    return {
+        "id": ticket.get("id"),
+        "guild": guild_name,
+        "creator": ticket.get("user_id") or ticket.get("creator_id"),
+        "created_at": ticket.get("created_at"),
+        "status": ticket.get("status"),
+    }
+
+
+def render_chunks(
+    ticket: Mapping[str, Any],
+    rows: Iterable[Mapping[str, Any]],
+    format_type: str = "html",
+    guild_name: str = "Servidor Desconhecido",
+) -> Iterator[str]:
+    """
+    Gerar o transcript em pedaços (um por mensagem)
+
+    Args:
+        ticket: Linha do ticket
+        rows: Linhas de ``ROWS_QUERY`` (com ``message_data`` no formato JSON)
+        format_type: ``html``, ``txt`` ou ``json``
+        guild_name: Nome do servidor
+
+    Yields:
+        Pedaços de texto do documento, na ordem
+    """
+    header = _header_fields(ticket, guild_name)
+
+    if format_type == "json":
+        yield '{"ticket": ' + json.dumps(dict(ticket), ensure_ascii=False, default=str)
+        yield ', "generated_at": ' + json.dumps(datetime.now(timezone.utc).isoformat())
+        yield ', "messages": ['
+        count = 0
+        for row in rows:
+            message = json.dumps(
+                {
+                    "id": row["message_id"],
+                    "author_id": row["author_id"],
+                    "content": row["content"],
+                    "timestamp": row["timestamp"],
+                    "action_type": row["action_type"],
+                },
+                ensure_ascii=False,
+            )
+            # message_data já está em JSON: copiado sem decodificar
+            data = row["message_data"] if row["message_data"] else "{}"
+            yield ("" if count == 0 else ", ") + message[:-1] + ', "data": ' + data + "}"
+            count += 1
+        yield f'], "message_count": {count}}}\n'
+        return
+
+    if format_type == "html":
+        yield HTML_HEADER.format(**{key: escape(str(value)) for key, value in header.items()})
+        for row in rows:
+            css_class = row["action_type"] if row["action_type"] in ("deleted", "edited") else ""
+            author = escape(row["author_name"] or UNKNOWN_AUTHOR)
+            parts = [
+                f'    <div class="message {css_class}">\n'
+                f'        <div class="author">{author}</div>\n'
+                f'        <div class="timestamp">'
+                f"{escape(str(row['original_timestamp'] or row['timestamp']))}</div>\n"
+                f'        <div class="content">{escape(row["content"] or "")}</div>\n'
+            ]
+            for att in _attachments(row):
+                parts.append(
+                    f'        <div class="attachment">📎 {escape(str(att.get("filename")))} '
+                    f'({att.get("size")} bytes){_archived_html(att)}</div>\n'
+                )
+            parts.append("    </div>\n")
+            yield "".join(parts)
+        yield HTML_FOOTER
+        return
+
+    yield TEXT_HEADER.format(**header)
+    prefixes = {"deleted": "[DELETADA] ", "edited": "[EDITADA] "}
+    for row in rows:
+        line = (
+            f"[{row['original_timestamp'] or row['timestamp']}] "
+            f"{prefixes.get(row['action_type'], '')}"
+            f"{row['author_name'] or UNKNOWN_AUTHOR}: {row['content'] or ''}\n"
+        )
+        for att in _attachments(row):
+            archived = att.get("archived")
+            copy = f" [arquivo: {archived['path']}]" if archived else ""
+            line += f"    📎 Anexo: {att.get('filename')}{copy}\n"
+        yield line
+
+
+class _PartWriter:
+    """Escreve pedaços em arquivos temporários, abrindo uma nova parte no limite"""
+
+    # Bytes de cabeçalho/rodapé do gzip e do bloco deflate final
+    GZIP_OVERHEAD = 64
+
+    def __init__(
+        self, base_name: str, extension: str, *, compress: bool, max_size: int, spool_size: int
+    ) -> None:
+        self.base_name = base_name
+        self.extension = extension + (".gz" if compress else "")
+        self.compress = compress
+        self.max_size = max_size
+        self.spool_size = spool_size
+        self.parts: list[TranscriptPart] = []
+        self._raw: IO[bytes] | None = None
+        self._stream: IO[bytes] | None = None
+        self._written = 0
+        # Bytes entregues ao compressor e ainda não escritos no arquivo
+        self._unflushed = 0
+
+    def _size(self) -> int:
+        """Tamanho máximo que a parte atual pode ter no arquivo"""
+        if not self.compress:
+            return self._written
+        # Deflate no pior caso: tamanho original mais ~5 bytes a cada bloco de 16 KiB
+        return self._raw.tell() + self._unflushed + self._unflushed // 1000 + self.GZIP_OVERHEAD
+
+    def _fits(self, size: int) -> bool:
+        """Verificar se ``size`` bytes ainda cabem na parte atual"""
+        if self._size() + size <= self.max_size:
+            return True
+        if self.compress and self._unflushed:
+            # Estimativa pessimista: descarregar o compressor e medir de novo
+            self._stream.flush()
+            self._unflushed = 0
+            return self._size() + size <= self.max_size
+        return False
+
+    def _open_part(self) -> None:
+        self._close_part()
+        self._raw = tempfile.SpooledTemporaryFile(max_size=self.spool_size)
+        self._stream = (
+            gzip.GzipFile(fileobj=self._raw, mode="wb") if self.compress else self._raw
+        )
+        self._written = 0
+        self._unflushed = 0
+
+    def _close_part(self) -> None:
+        if self._raw is None:
+            return
+        if self.compress:
+            self._stream.close()
+        size = self._raw.tell()
+        self._raw.seek(0)
+        self.parts.append(TranscriptPart("", self._raw, size))
+        self._raw = self._stream = None
+
+    def write(self, chunk: str) -> None:
+        data = chunk.encode("utf-8")
+        if self._raw is None or (self._written and not self._fits(len(data))):
+            self._open_part()
+        self._stream.write(data)
+        self._written += len(data)
+        self._unflushed += len(data)
+
+    def finish(self) -> list[TranscriptPart]:
+        self._close_part()
+        for index, part in enumerate(self.parts, 1):
+            suffix = f"_parte{index}" if len(self.parts) > 1 else ""
+            part.filename = f"{self.base_name}{suffix}.{self.extension}"
+        return self.parts
+
+
+def render_transcript(
+    db_path: str,
+    ticket: Mapping[str, Any],
+    format_type: str = "html",
+    *,
+    guild_name: str = "Servidor Desconhecido",
+    compress: bool = False,
+    max_part_size: int = 10 * 1024 * 1024,
+    spool_size: int = 1024 * 1024,
+) -> list[TranscriptPart]:
+    """
+    Renderizar o transcript de um ticket em arquivos temporários (bloqueante)
+
+    As linhas são lidas com um cursor em uma conexão somente leitura e cada
+    pedaço vai direto para um ``SpooledTemporaryFile`` (em memória até
+    ``spool_size`` bytes, depois em disco). Quando a parte atual passaria de
+    ``max_part_size`` uma nova é aberta, sempre entre mensagens: as partes,
+    concatenadas na ordem, formam o documento completo.
+
+    Args:
+        db_path: Caminho do banco
+        ticket: Linha do ticket
+        format_type: ``html``, ``txt`` ou ``json``
+        guild_name: Nome do servidor
+        compress: Comprimir cada parte com gzip
+        max_part_size: Tamanho máximo (bytes) de cada arquivo
+        spool_size: Bytes mantidos em memória por arquivo
+
+    Returns:
+        Partes do transcript, posicionadas no início
+    """
+    if format_type not in TRANSCRIPT_FORMATS:
+        msg = f"Formato de transcript inválido: {format_type}"
+        raise ValueError(msg)
+
+    writer = _PartWriter(
+        f"ticket_{ticket.get('id')}_transcript",
+        format_type,
+        compress=compress,
+        max_size=max_part_size,
+        spool_size=spool_size,
+    )
+    db = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        db.row_factory = sqlite3.Row
+        extra = ", message_data" if format_type == "json" else ""
+        cursor = db.execute(ROWS_QUERY.format(extra=extra), (str(ticket["channel_id"]),))
+        cursor.arraysize = 500
+        for chunk in render_chunks(ticket, cursor, format_type, guild_name):
+            writer.write(chunk)
+    except BaseException:
+        for part in writer.finish():
+            part.file.close()
+        raise
+    finally:
+        db.close()
+    return writer.finish()
+
+
+async def render_ticket_transcript(
+    database: Database, ticket: Mapping[str, Any], format_type: str = "html", **kwargs: Any
+) -> list[TranscriptPart]:
+    """
+    Gravar os eventos pendentes do canal e renderizar o transcript em uma thread
+
+    Args:
+        database: Banco principal
+        ticket: Linha do ticket
+        format_type: ``html``, ``txt`` ou ``json``
+        **kwargs: Opções de ``render_transcript``
+
+    Returns:
+        Partes do transcript
+    """
+    await database.transcripts.flush(int(ticket["channel_id"]))
+    return await asyncio.to_thread(
+        render_transcript, database.db_path, dict(ticket), format_type, **kwargs
+    )
@@ -0,0 +1,359 @@
+"""
+Acumulador de XP com escrita adiada (write-behind)
+Concede XP em memória e grava em lote no banco
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from .database import Database
+
+    AwardListener = Callable[[str, str, "XPEntry"], None]
+
+UPSERT_QUERY = """
+    INSERT INTO user_levels
+    (guild_id, user_id, total_xp, level, messages_sent, last_xp_gain)
+    VALUES (?, ?, ?, ?, ?, datetime(?, 'unixepoch'))
+    ON CONFLICT(guild_id, user_id) DO UPDATE SET
+        total_xp = total_xp + excluded.total_xp,
+        level = excluded.level,
+        messages_sent = messages_sent + excluded.messages_sent,
+        last_xp_gain = excluded.last_xp_gain
+"""
+
+
+def calculate_level(total_xp: int) -> int:
+    """Calcular nível pelo XP total: level = floor(sqrt(xp / 100))"""
+    return int(math.sqrt(max(total_xp, 0) / 100))
+
+
+def xp_for_level(level: int) -> int:
+    """XP total necessário para atingir um nível (inverso de calculate_level)"""
+    return 100 * max(level, 0) ** 2
+
+
+@dataclass
+class XPEntry:
+    """Estado em memória do XP de um usuário em um servidor"""
+
+    total_xp: int
+    level: int
+    messages_sent: int
+    pending_xp: int = 0
+    pending_messages: int = 0
+    last_gain: float = 0.0
+
+    @property
+    def dirty(self) -> bool:
+        """Indica se há XP ainda não gravado"""
+        return self.pending_messages > 0
+
+
+@dataclass(frozen=True)
+class XPAward:
+    """Resultado de uma concessão de XP"""
+
+    total_xp: int
+    old_level: int
+    new_level: int
+
+    @property
+    def leveled_up(self) -> bool:
+        """Indica se o usuário subiu de nível"""
+        return self.new_level > self.old_level
+
+
+class XPAccumulator:
+    """
+    Acumulador de XP keyed por (guild_id, user_id).
+
+    O XP total é carregado do banco uma vez por usuário; a partir daí cada
+    mensagem só altera a memória e o level up é calculado na hora. O XP
+    pendente é gravado com upserts ``INSERT ... ON CONFLICT DO UPDATE`` em
+    uma única transação quando:
+
+    - passam ``flush_interval`` segundos desde o último flush; ou
+    - ``max_pending`` concessões estão pendentes; ou
+    - o bot é encerrado (``close``).
+
+    Ao atingir ``max_pending``, ``add_xp`` aguarda o flush (inclusive um que
+    já esteja em andamento) antes de retornar. Em caso de crash, perdem-se no
+    máximo ``max_pending`` concessões ou ``flush_interval`` segundos de XP, o
+    que ocorrer primeiro; enquanto o banco recusar gravações, o pendente fica
+    em memória (e sem esse limite) até o próximo flush que funcionar.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        *,
+        flush_interval: float = 10.0,
+        max_pending: int = 500,
+        max_entries: int = 50_000,
+    ) -> None:
+        """
+        Inicializa o acumulador
+
+        Args:
+            database: Banco onde o XP é persistido
+            flush_interval: Segundos máximos entre flushes
+            max_pending: Concessões pendentes que disparam um flush imediato
+            max_entries: Usuários mantidos em memória (entradas limpas saem primeiro)
+        """
+        self.database = database
+        self.flush_interval: float = flush_interval
+        self.max_pending: int = max(1, max_pending)
+        self.max_entries: int = max(1, max_entries)
+
+        self._entries: OrderedDict[tuple[str, str], XPEntry] = OrderedDict()
+        self._loading: dict[tuple[str, str], asyncio.Future[XPEntry]] = {}
+        self._dirty: set[tuple[str, str]] = set()
+        self._pending_awards: int = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._listeners: list[AwardListener] = []
+
+        # Estatísticas
+        self.awards: int = 0
+        self.flushes: int = 0
+        self.rows_flushed: int = 0
+        self.flush_failures: int = 0
+
+    async def _load_entry(self, key: tuple[str, str]) -> XPEntry:
+        """Carregar (uma única vez) o XP atual do usuário"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+
+        pending = self._loading.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[XPEntry] = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            row = await self.database.get(
+                """SELECT total_xp, level, messages_sent FROM user_levels
+                WHERE guild_id = ? AND user_id = ?""",
+                key,
+            )
+            total_xp = (row or {}).get("total_xp") or 0
+            entry = XPEntry(
+                total_xp=total_xp,
+                level=calculate_level(total_xp),
+                messages_sent=(row or {}).get("messages_sent") or 0,
+            )
+            self._entries[key] = entry
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Evitar "exception was never retrieved" quando ninguém aguardava
+            future.exception()
+            raise
+        finally:
+            self._loading.pop(key, None)
+
+    def _evict_clean_entries(self) -> None:
+        """Despejar entradas já gravadas mais antigas quando passar do limite"""
+        if len(self._entries) <= self.max_entries:
+            return
+        for key in list(self._entries):
+            if len(self._entries) <= self.max_entries:
+                break
+            if not self._entries[key].dirty:
+                del self._entries[key]
+
+    def add_listener(self, listener: AwardListener) -> None:
+        """Registrar callback síncrono chamado a cada concessão de XP"""
+        self._listeners.append(listener)
+
+    def _ensure_flush_task(self) -> None:
+        """Iniciar o flush periódico no primeiro uso"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Gravar o XP pendente a cada ``flush_interval`` segundos"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"❌ Erro no flush periódico de XP: {e}")
+
+    async def add_xp(self, guild_id: str, user_id: str, amount: int) -> XPAward:
+        """
+        Conceder XP a um usuário (apenas em memória)
+
+        Args:
+            guild_id: ID do servidor
+            user_id: ID do usuário
+            amount: Quantidade de XP
+
+        Returns:
+            XPAward com o XP total e os níveis antes/depois
+        """
+        key = (str(guild_id), str(user_id))
+        entry = await self._load_entry(key)
+
+        old_level = entry.level
+        entry.total_xp += amount
+        entry.level = calculate_level(entry.total_xp)
+        entry.messages_sent += 1
+        entry.pending_xp += amount
+        entry.pending_messages += 1
+        entry.last_gain = time.time()
+
+        self.awards += 1
+        self._pending_awards += 1
+        self._dirty.add(key)
+        self._evict_clean_entries()
+        self._ensure_flush_task()
+
+        for listener in self._listeners:
+            try:
+                listener(key[0], key[1], entry)
+            except Exception as e:
+                print(f"❌ Erro em listener de XP: {e}")
+
+        if self._pending_awards >= self.max_pending:
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"❌ Erro no flush de XP por limite de pendências: {e}")
+
+        return XPAward(entry.total_xp, old_level, entry.level)
+
+    async def flush(self) -> int:
+        """
+        Gravar todo o XP pendente em uma única transação
+
+        Returns:
+            Número de usuários gravados
+        """
+        async with self._flush_lock:
+            batch: list[tuple[tuple[str, str], XPEntry, int, int]] = []
+            dirty, self._dirty = self._dirty, set()
+            for key in dirty:
+                entry = self._entries.get(key)
+                if entry is not None and entry.dirty:
+                    batch.append((key, entry, entry.pending_xp, entry.pending_messages))
+                    entry.pending_xp = 0
+                    entry.pending_messages = 0
+
+            if not batch:
+                return 0
+            self._pending_awards = 0
+
+            params = [
+                (guild_id, user_id, xp, entry.level, messages, entry.last_gain)
+                for (guild_id, user_id), entry, xp, messages in batch
+            ]
+            try:
+                await self.database.run_many(UPSERT_QUERY, params)
+            except Exception:
+                # Devolver o pendente para a próxima tentativa
+                for key, entry, xp, messages in batch:
+                    entry.pending_xp += xp
+                    entry.pending_messages += messages
+                    self._pending_awards += messages
+                    self._dirty.add(key)
+                self.flush_failures += 1
+                raise
+
+            self.flushes += 1
+            self.rows_flushed += len(batch)
+            return len(batch)
+
+    def peek(self, guild_id: str, user_id: str) -> XPEntry | None:
+        """Obter o estado em memória de um usuário, se carregado"""
+        return self._entries.get((str(guild_id), str(user_id)))
+
+    def guild_entries(self, guild_id: str) -> Iterator[tuple[str, XPEntry]]:
+        """Iterar os usuários de um servidor carregados em memória"""
+        guild_id = str(guild_id)
+        for (entry_guild, user_id), entry in list(self._entries.items()):
+            if entry_guild == guild_id:
+                yield user_id, entry
+
+    def apply_pending(
+        self, guild_id: str, user_id: str, row: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """
+        Sobrepor o XP ainda não gravado a uma linha lida de ``user_levels``
+
+        Garante que /level e /levelcard vejam XP concedido antes do próximo flush.
+
+        Args:
+            guild_id: ID do servidor
+            user_id: ID do usuário
+            row: Linha lida do banco (None se o usuário ainda não foi gravado)
+
+        Returns:
+            Linha com os valores em memória, ou ``row`` se não há pendências
+        """
+        entry = self.peek(guild_id, user_id)
+        if entry is None or not entry.dirty:
+            return row
+        return {
+            **(row or {"guild_id": str(guild_id), "user_id": str(user_id)}),
+            "total_xp": entry.total_xp,
+            "level": entry.level,
+            "messages_sent": entry.messages_sent,
+        }
+
+    def forget(self, guild_id: str | None = None, user_id: str | None = None) -> None:
+        """
+        Descartar o estado em memória (após resets feitos direto no banco)
+
+        Args:
+            guild_id: Servidor a descartar (None = todos)
+            user_id: Usuário a descartar (None = todos do servidor)
+        """
+        if guild_id is None:
+            self._entries.clear()
+            self._dirty.clear()
+            self._pending_awards = 0
+            return
+        for key in [k for k in self._entries if k[0] == str(guild_id)]:
+            if user_id is None or key[1] == str(user_id):
+                self._pending_awards -= self._entries.pop(key).pending_messages
+        self._pending_awards = max(self._pending_awards, 0)
+
+    async def close(self) -> None:
+        """Parar o flush periódico e gravar o XP pendente"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        """Obter estatísticas do acumulador"""
+        return {
+            "entries": len(self._entries),
+            "pending_awards": self._pending_awards,
+            "awards": self.awards,
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+            "flush_failures": self.flush_failures,
+            "flush_interval": self.flush_interval,
+            "max_pending": self.max_pending,
+        }
@@ -8,11 +8,16 @@ para todos os testes do bot.
 
 import asyncio
 from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import discord
 import pytest
 from discord.ext import commands
 
+if TYPE_CHECKING:
+    from src.utils.database import Database
+
 
 # ============================================================================
 # CONFIGURAÇÃO DE ASYNCIO
@@ -121,11 +126,32 @@ async def test_database() -> AsyncGenerator[str, None]:
     yield str(db_path)
 
     # Cleanup
+    await db.close()
     if db_path.exists():
         db_path.unlink()
     temp_dir.rmdir()
 
 
+@pytest.fixture
+async def bot_db(tmp_path: Path) -> AsyncGenerator["Database", None]:
+    """Criar Database isolado com as tabelas criadas.
+
+    Cada arquivo de teste insere os próprios dados sobre ele.
+
+    Yields:
+        Database apontando para um arquivo em ``tmp_path``
+    """
+    from src.utils.database import Database
+
+    db = Database()
+    db.db_path = str(tmp_path / "bot.db")
+    await db.create_tables()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
 # ============================================================================
 # CONFIGURAÇÃO
 # ============================================================================
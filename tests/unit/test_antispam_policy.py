@@ -0,0 +1,140 @@
+"""
+🧪 Testes Unitários - Política de Antispam
+==========================================
+
+Testes para src/utils/antispam_policy.py
+"""
+
+import json
+from types import SimpleNamespace
+
+from src.utils.antispam_policy import CHECKS, DEFAULT_ESCALATION, AntispamPolicy
+
+
+def member(user_id: int, roles=(), manage_messages: bool = False) -> SimpleNamespace:
+    """Autor falso com roles e permissões."""
+    return SimpleNamespace(
+        id=user_id,
+        roles=[SimpleNamespace(id=role) for role in roles],
+        guild_permissions=SimpleNamespace(manage_messages=manage_messages),
+    )
+
+
+class TestAntispamPolicy:
+    """Testes para a compilação da política."""
+
+    def test_sources_precedence(self) -> None:
+        """Testar guild_settings < colunas < config_data < rules."""
+        settings = {
+            "antispam_enabled": 1,
+            "settings_json": json.dumps(
+                {"antispam_config": {"message_limit": 8, "raid_window": 30}}
+            ),
+        }
+        assert AntispamPolicy.compile(None, settings).max_messages == 8
+        assert AntispamPolicy.compile(None, settings).enabled
+
+        row = {"enabled": 0, "limite": 6, "intervalo": 15, "acao": "warn"}
+        policy = AntispamPolicy.compile(row, settings)
+        assert (policy.enabled, policy.max_messages, policy.time_window) == (False, 6, 15.0)
+        assert policy.raid_window == 30
+
+        row["config_data"] = json.dumps(
+            {
+                "enabled": True,
+                "max_messages": 4,
+                "check_order": ["suspicious_links"],
+                "rules": {
+                    "spam_messages": {"max_messages": 3},
+                    "excessive_caps": {"enabled": False},
+                },
+                "whitelist_users": ["10"],
+                "ignored_roles": ["20"],
+                "ignored_channels": [30, "x"],
+            }
+        )
+        policy = AntispamPolicy.compile(row, settings)
+        assert policy.enabled and policy.max_messages == 3
+        assert policy.checks[0] == "suspicious_links"
+        assert "excessive_caps" not in policy.checks
+        assert len(policy.checks) == len(CHECKS) - 1
+
+        assert policy.is_exempt(member(10), 1)
+        assert policy.is_exempt(member(11, roles=[20]), 1)
+        assert policy.is_exempt(member(11), 30)
+        assert policy.is_exempt(member(11, manage_messages=True), 1)
+        assert not policy.is_exempt(member(11, roles=[21]), 1)
+
+    def test_escalation_ladder(self) -> None:
+        """Testar escada padrão, por colunas e pelo config_data."""
+        assert [AntispamPolicy().action_for(n) for n in (1, 2, 3, 9)] == [
+            "warn",
+            "mute",
+            "kick",
+            "ban",
+        ]
+
+        row = {"acao": "delete", "warn_threshold": 3, "mute_threshold": 5, "ban_threshold": 10}
+        policy = AntispamPolicy.compile(row)
+        assert [policy.action_for(n) for n in (1, 3, 4, 5, 10)] == [
+            "delete",
+            "warn",
+            "warn",
+            "mute",
+            "ban",
+        ]
+
+        row["config_data"] = json.dumps({"actions": {"first_violation": "mute"}})
+        assert AntispamPolicy.compile(row).escalation == ((1, "mute"),)
+
+    def test_malformed_escalation_steps_skipped(self) -> None:
+        """Testar que degraus inválidos no config_data são ignorados."""
+        steps = [[2, "kick"], ["x", "ban"], [3], None, {"limite": 4}, 5]
+        row = {"config_data": json.dumps({"escalation": steps})}
+        assert AntispamPolicy.compile(row).escalation == ((2, "kick"),)
+
+        row["config_data"] = json.dumps({"escalation": [["x"], None]})
+        assert AntispamPolicy.compile(row).escalation == DEFAULT_ESCALATION
+
+
+class TestAntispamPolicyStore:
+    """Testes para o cache e a troca a quente das políticas."""
+
+    async def test_cached_and_hot_swapped_on_save(self, bot_db) -> None:
+        """Testar que o caminho quente não lê o banco e que save troca a política."""
+        store = bot_db.antispam_policies
+        disabled = await store.get(1)
+        assert not disabled.enabled
+        assert await store.get("1") is disabled
+        assert store.compilations == 1
+
+        saved = await store.save(1, {"enabled": True, "max_messages": 7})
+        assert await store.get(1) is saved
+        assert saved.enabled and saved.max_messages == 7
+        assert await store.load_config(1) == {"enabled": True, "max_messages": 7}
+
+        row = await bot_db.get(
+            "SELECT limite, enabled FROM antispam_config WHERE guild_id = '1'"
+        )
+        assert row == {"limite": 7, "enabled": 1}
+
+        await store.save(1, {"enabled": False})
+        assert not (await store.get(1)).enabled
+        assert len(await bot_db.get_all("SELECT id FROM antispam_config")) == 1
+
+        bot_db.invalidate_guild_settings("1")
+        assert not (await store.get(1)).enabled
+        assert store.compilations == 4
+
+    async def test_high_message_limit_still_detected(self, bot_db) -> None:
+        """Testar que limites acima da capacidade padrão antiga ainda disparam."""
+        policy = await bot_db.antispam_policies.save(1, {"enabled": True, "max_messages": 20})
+        counts = [
+            bot_db.rate_tracker.hit((1, 5), policy.time_window, 1000.0 + i * 0.1, 100 + i)
+            for i in range(policy.max_messages + 1)
+        ]
+        assert counts[-2] == policy.max_messages
+        assert counts[-1] > policy.max_messages
+
+        clamped = AntispamPolicy.compile({"enabled": 1, "limite": 500})
+        assert clamped.max_messages < bot_db.rate_tracker.capacity
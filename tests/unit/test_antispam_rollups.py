@@ -0,0 +1,81 @@
+"""
+🧪 Testes Unitários - Rollups de Antispam
+=========================================
+
+Testes para src/utils/antispam_rollups.py
+"""
+
+
+from src.utils.antispam_rollups import DAY, HOUR, bucket_ranges, rebuild_rollups
+from src.utils.database import Database
+
+# 2026-01-05 00:00 UTC
+MONDAY = 1_767_571_200
+
+
+async def raw_counts(db: Database, guild_id: str, start: float, end: float) -> dict[str, int]:
+    """Contagem direta em antispam_logs (referência dos rollups)."""
+    rows = await db.get_all(
+        """SELECT action_type, COUNT(*) AS count FROM antispam_logs
+        WHERE guild_id = ? AND created_at >= ? AND created_at < ? GROUP BY action_type""",
+        (guild_id, start, end),
+    )
+    return {row["action_type"]: row["count"] for row in rows}
+
+
+class TestAntispamRollups:
+    """Testes para os rollups por hora e por dia."""
+
+    def test_bucket_ranges(self) -> None:
+        """Testar dias completos na tabela diária e pontas na tabela por hora."""
+        assert bucket_ranges(MONDAY + 600, MONDAY + 3 * HOUR) == [
+            ("antispam_rollup_hourly", MONDAY, MONDAY + 3 * HOUR)
+        ]
+        ranges = bucket_ranges(MONDAY - 2 * HOUR, MONDAY + 7 * DAY + 5 * HOUR + 30)
+        assert ranges == [
+            ("antispam_rollup_hourly", MONDAY - 2 * HOUR, MONDAY),
+            ("antispam_rollup_daily", MONDAY, MONDAY + 7 * DAY),
+            ("antispam_rollup_hourly", MONDAY + 7 * DAY, MONDAY + 7 * DAY + 5 * HOUR + 30),
+        ]
+
+    async def test_incremental_matches_raw(self, bot_db: Database) -> None:
+        """Testar que os rollups incrementais batem com a contagem bruta."""
+        for index in range(60):
+            await bot_db.log_antispam_detection(
+                "1",
+                str(index % 4),
+                ("warn", "mute", "kick")[index % 3],
+                "10",
+                when=MONDAY + index * 2 * HOUR,
+            )
+        await bot_db.log_antispam_detection("2", "9", "ban", when=MONDAY)
+
+        start, end = MONDAY + 5 * HOUR, MONDAY + 4 * DAY + 3 * HOUR
+        stats = await bot_db.get_antispam_stats("1", start, end)
+        assert stats["actions"] == await raw_counts(bot_db, "1", start, end)
+        assert stats["unique_users"] == 4
+        assert sum(count for _, count in stats["top"]) == sum(stats["actions"].values())
+
+        user = await bot_db.get_antispam_stats("1", start, end, user_id="0")
+        assert sum(user["actions"].values()) == dict(stats["top"])["0"]
+
+    async def test_backfill_and_reset(self, bot_db: Database) -> None:
+        """Testar o backfill a partir dos logs e o reset por usuário."""
+        await bot_db.run_many(
+            """INSERT INTO antispam_logs (guild_id, user_id, action_type, created_at)
+            VALUES (?, ?, ?, ?)""",
+            [("1", str(index % 3), "warn", MONDAY + index * 600) for index in range(30)],
+        )
+        empty = await bot_db.get_antispam_stats("1", MONDAY, MONDAY + DAY)
+        assert empty["actions"] == {}
+
+        async with bot_db.pool.writer() as db:
+            await rebuild_rollups(db)
+            await db.commit()
+        stats = await bot_db.get_antispam_stats("1", MONDAY, MONDAY + DAY)
+        assert stats["actions"] == {"warn": 30}
+
+        assert await bot_db.delete_antispam_logs("1", "0") == 10
+        stats = await bot_db.get_antispam_stats("1", MONDAY, MONDAY + DAY)
+        assert stats["actions"] == {"warn": 20}
+        assert stats["unique_users"] == 2
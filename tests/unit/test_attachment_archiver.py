@@ -0,0 +1,100 @@
+"""
+🧪 Testes Unitários - Arquivo de Anexos
+=======================================
+
+Testes para src/utils/attachment_archiver.py
+"""
+
+import asyncio
+import hashlib
+
+import pytest
+from aiohttp import web
+
+from src.utils.attachment_archiver import AttachmentArchiver, blob_path, url_key
+
+FILES = {"a.png": b"a" * 5000, "b.png": b"b" * 3000, "copia.png": b"a" * 5000}
+
+
+@pytest.fixture
+async def cdn():
+    """Servidor HTTP local que conta os downloads e a concorrência máxima."""
+    state = {"requests": 0, "active": 0, "peak": 0}
+
+    async def handler(request: web.Request) -> web.Response:
+        state["requests"] += 1
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        body = FILES.get(request.match_info["name"])
+        if body is None:
+            raise web.HTTPNotFound()
+        return web.Response(body=body, content_type="image/png")
+
+    app = web.Application()
+    app.router.add_get("/attachments/{name}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    state["base"] = f"http://127.0.0.1:{port}/attachments"
+    try:
+        yield state
+    finally:
+        await runner.cleanup()
+
+
+def attachment(cdn: dict, name: str, query: str = "ex=1") -> dict:
+    """Anexo no formato gravado pelos transcripts."""
+    return {"filename": name, "url": f"{cdn['base']}/{name}?{query}", "size": len(FILES[name])}
+
+
+class TestAttachmentArchiver:
+    """Testes para os downloads paralelos e o armazenamento por hash."""
+
+    def test_keys_and_paths(self) -> None:
+        """Testar a chave sem query string e o caminho por hash."""
+        assert url_key("https://cdn.x/a/1/f.png?ex=1&hm=2") == "cdn.x/a/1/f.png"
+        assert blob_path("abcdef", "Foto.PNG") == "ab/abcdef.png"
+        assert blob_path("abcdef", "sem_extensao") == "ab/abcdef"
+
+    async def test_concurrent_archive_deduplicates_content(self, cdn, tmp_path) -> None:
+        """Testar o limite de concorrência e a deduplicação por URL e por conteúdo."""
+        archiver = AttachmentArchiver(tmp_path, max_concurrency=2)
+        attachments = [attachment(cdn, name) for name in ("a.png", "b.png", "copia.png")]
+        attachments.append(attachment(cdn, "a.png", query="ex=2"))
+
+        assert await archiver.archive(attachments) == 4
+        assert cdn["requests"] == 3 and cdn["peak"] <= 2
+
+        digest = hashlib.sha256(FILES["a.png"]).hexdigest()
+        assert attachments[0]["archived"] == attachments[2]["archived"]
+        assert attachments[0]["archived"]["path"] == f"{digest[:2]}/{digest}.png"
+        assert archiver.resolve(attachments[0]["archived"]).read_bytes() == FILES["a.png"]
+        assert len([path for path in tmp_path.rglob("*") if path.is_file()]) == 2
+        await archiver.close()
+
+    async def test_limits_and_failures_keep_url(self, cdn, tmp_path) -> None:
+        """Testar os limites de bytes e o anexo que não existe mais."""
+        archiver = AttachmentArchiver(tmp_path, max_file_size=4000)
+        big, small = attachment(cdn, "a.png"), attachment(cdn, "b.png")
+        gone = {"filename": "x.png", "url": f"{cdn['base']}/x.png", "size": 10}
+
+        assert await archiver.archive([big, small, gone]) == 1
+        assert "archived" not in big and "archived" not in gone and "archived" in small
+        assert archiver.stats()["skipped"] == 1 and archiver.stats()["failed"] == 1
+
+        fresh = AttachmentArchiver(tmp_path)
+        assert await fresh.archive([attachment(cdn, "copia.png")], max_total_bytes=1000) == 0
+        assert fresh.stats()["skipped"] == 1
+
+        # A reserva de um download que falhou volta para os próximos da fila
+        serial = AttachmentArchiver(tmp_path, max_concurrency=1)
+        lost = {"filename": "y.png", "url": f"{cdn['base']}/y.png", "size": 4000}
+        assert await serial.archive([lost, attachment(cdn, "b.png")], max_total_bytes=5000) == 1
+        assert serial.stats()["failed"] == 1 and serial.stats()["skipped"] == 0
+        await serial.close()
+        await archiver.close()
+        await fresh.close()
@@ -0,0 +1,84 @@
+"""
+🧪 Testes Unitários - Cache TTL/LRU
+===================================
+
+Testes para src/utils/cache.py e o cache de configurações do Database
+"""
+
+import asyncio
+
+from src.utils.cache import MISSING, TTLCache
+
+
+class TestTTLCache:
+    """Testes para a classe TTLCache."""
+
+    def test_lru_eviction(self) -> None:
+        """Testar que a entrada menos usada sai primeiro."""
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self) -> None:
+        """Testar que entradas expiram após o TTL."""
+        cache: TTLCache[str, int] = TTLCache(ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is MISSING
+
+    def test_none_is_cacheable(self) -> None:
+        """Testar que None conta como hit."""
+        cache: TTLCache[str, None] = TTLCache()
+        cache.set("a", None)
+        assert cache.get("a") is None
+        assert cache.hits == 1
+
+    async def test_concurrent_loads_are_coalesced(self) -> None:
+        """Testar que cargas concorrentes da mesma chave viram uma só."""
+        cache: TTLCache[str, int] = TTLCache()
+        calls = 0
+
+        async def loader() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+        assert results == [42] * 5
+        assert calls == 1
+
+    async def test_invalidate_discards_inflight_load(self) -> None:
+        """Testar que invalidação durante a carga não grava valor velho."""
+        cache: TTLCache[str, int] = TTLCache()
+
+        async def loader() -> int:
+            cache.invalidate("k")
+            return 1
+
+        assert await cache.get_or_load("k", loader) == 1
+        assert cache.get("k") is MISSING
+
+
+class TestGuildSettingsCache:
+    """Testes do cache de configurações do Database."""
+
+    async def test_update_invalidates_cached_settings(self, bot_db) -> None:
+        """Testar read-through e invalidação precisa por servidor."""
+        await bot_db.update_guild_settings("1", prefix="?")
+        await bot_db.update_guild_settings("2", prefix="$")
+
+        assert (await bot_db.get_guild_settings("1"))["prefix"] == "?"
+        assert (await bot_db.get_guild_settings("2"))["prefix"] == "$"
+        assert (await bot_db.get_guild_settings("1"))["prefix"] == "?"
+        assert bot_db.guild_settings_cache.hits == 1
+
+        await bot_db.update_guild_settings("1", prefix="!")
+        assert "2" in bot_db.guild_settings_cache
+        assert "1" not in bot_db.guild_settings_cache
+        assert (await bot_db.get_guild_settings("1"))["prefix"] == "!"
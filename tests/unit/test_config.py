@@ -29,6 +29,13 @@ class TestConfig:
         assert Config.MAX_CONTAINERS_PER_USER == 5
         assert Config.LOG_LEVEL == "INFO"
 
+    def test_sqlite_pragma_profile(self) -> None:
+        """Testar perfil de PRAGMAs padrão do SQLite."""
+        pragmas = Config.get_sqlite_pragmas()
+        assert pragmas["journal_mode"] == "WAL"
+        assert pragmas["synchronous"] == "NORMAL"
+        assert pragmas["cache_size"] < 0  # tamanho em KiB
+
     @patch.dict(os.environ, {"DISCORD_TOKEN": ""}, clear=True)
     def test_config_validation_fails_without_token(self) -> None:
         """Testar que validação falha sem token."""
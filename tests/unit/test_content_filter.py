@@ -0,0 +1,70 @@
+"""
+🧪 Testes Unitários - Filtro de Conteúdo
+========================================
+
+Testes para src/utils/content_filter.py
+"""
+
+import json
+
+from src.utils.content_filter import AhoCorasick, ContentFilter, ContentFilterCache
+
+
+class TestAhoCorasick:
+    """Testes para o autômato de busca."""
+
+    def test_matches_overlapping_words(self) -> None:
+        """Testar palavras que são sufixo/prefixo umas das outras."""
+        matcher = AhoCorasick(["he", "she", "hers", "his"])
+        assert matcher.search("ushers") == (1, 4)
+        assert matcher.search("ahishers") == (1, 4)
+        assert matcher.search("nada aqui") is None
+        assert len(matcher) == 4
+
+    def test_whole_words_checks_every_suffix_match(self) -> None:
+        """Testar que a fronteira de palavra considera todas as palavras terminando ali."""
+        matcher = AhoCorasick(["ass", "bass"])
+        assert matcher.search("classe", whole_words=True) is None
+        assert matcher.search("grave bass!", whole_words=True) == (6, 10)
+        assert matcher.search("a ass", whole_words=True) == (2, 5)
+
+
+class TestContentFilter:
+    """Testes para o filtro compilado e o cache por servidor."""
+
+    def test_options(self) -> None:
+        """Testar leetspeak, palavras inteiras e links."""
+        content_filter = ContentFilter.build(
+            ["Idiota"], whole_words=True, leetspeak=True, block_links=True
+        )
+        assert content_filter.find_profanity("seu 1D10T4!") == "1D10T4"
+        assert content_filter.find_profanity("idiotas") is None
+        assert content_filter.has_link("veja HTTPS://exemplo.com")
+        assert not ContentFilter.build(["idiota"]).has_link("https://exemplo.com")
+        assert ContentFilter.build(["idiota"]).find_profanity("idiotas") == "idiota"
+
+    def test_cache_rebuilds_only_when_settings_change(self) -> None:
+        """Testar compilação única por servidor e recompilação após mudança."""
+        cache = ContentFilterCache()
+        settings = {
+            "guild_id": "1",
+            "settings_json": json.dumps({"filter_profanity": True, "profanity_words": ["feio"]}),
+        }
+
+        first = cache.get("1", settings)
+        assert cache.get("1", dict(settings)) is first
+        assert cache.builds == 1
+        assert first.find_profanity("que feio")
+
+        settings["settings_json"] = json.dumps(
+            {"filter_profanity": True, "profanity_words": "chato, ruim"}
+        )
+        second = cache.get("1", settings)
+        assert second is not first
+        assert second.find_profanity("muito RUIM") == "RUIM"
+        assert not second.find_profanity("que feio")
+
+        cache.invalidate("1")
+        assert cache.get("1", settings) is not second
+        assert cache.builds == 3
+        assert cache.get("2", {"filter_profanity": False, "profanity_words": ["x"]}).matcher is None
@@ -0,0 +1,135 @@
+"""
+🧪 Testes Unitários - Pool de Conexões
+======================================
+
+Testes para src/utils/db_pool.py e sua integração com Database
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from src.utils.db_pool import ConnectionPool
+
+
+class TestConnectionPool:
+    """Testes para a classe ConnectionPool."""
+
+    async def test_writer_connection_is_reused(self, tmp_path) -> None:
+        """Testar que a conexão de escrita é aberta uma única vez."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"))
+        try:
+            async with pool.writer() as db:
+                await db.execute("CREATE TABLE t (x INTEGER)")
+                await db.commit()
+            for i in range(5):
+                async with pool.writer() as db:
+                    await db.execute("INSERT INTO t VALUES (?)", (i,))
+                    await db.commit()
+
+            assert pool.connections_opened == 1
+        finally:
+            await pool.close()
+
+    async def test_readers_are_bounded(self, tmp_path) -> None:
+        """Testar que o número de leitores nunca passa do limite."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"), max_readers=2)
+        in_use = 0
+        peak = 0
+
+        async def read() -> None:
+            nonlocal in_use, peak
+            async with pool.reader() as db, db.execute("SELECT 1") as cursor:
+                in_use += 1
+                peak = max(peak, in_use)
+                await cursor.fetchone()
+                await asyncio.sleep(0.01)
+                in_use -= 1
+
+        try:
+            await asyncio.gather(*(read() for _ in range(10)))
+            assert peak <= 2
+            assert pool.stats()["readers_open"] <= 2
+        finally:
+            await pool.close()
+
+    async def test_writer_rolls_back_on_error(self, tmp_path) -> None:
+        """Testar rollback quando o bloco de escrita falha."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"))
+        try:
+            async with pool.writer() as db:
+                await db.execute("CREATE TABLE t (x INTEGER)")
+                await db.commit()
+
+            with pytest.raises(RuntimeError):
+                async with pool.writer() as db:
+                    await db.execute("INSERT INTO t VALUES (1)")
+                    raise RuntimeError("falha")
+
+            async with pool.reader() as db, db.execute("SELECT COUNT(*) FROM t") as cursor:
+                assert (await cursor.fetchone())[0] == 0
+        finally:
+            await pool.close()
+
+    async def test_closed_pool_rejects_usage(self, tmp_path) -> None:
+        """Testar que o pool fechado não entrega conexões."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"))
+        assert await pool.health_check() is True
+        await pool.close()
+
+        assert await pool.health_check() is False
+        with pytest.raises(RuntimeError):
+            async with pool.reader():
+                pass
+
+    async def test_pragma_profile_applied(self, tmp_path) -> None:
+        """Testar que o perfil de PRAGMAs é aplicado às conexões."""
+        pool = ConnectionPool(
+            str(tmp_path / "pool.db"),
+            pragmas={"journal_mode": "WAL", "synchronous": "NORMAL"},
+            statement_cache_size=64,
+        )
+        try:
+            assert await pool.get_pragma("journal_mode") == "wal"
+            assert await pool.get_pragma("synchronous") == 1
+            assert pool.stats()["statement_cache_size"] == 64
+        finally:
+            await pool.close()
+
+    async def test_invalid_pragma_name_rejected(self, tmp_path) -> None:
+        """Testar que nomes de PRAGMA inválidos são rejeitados."""
+        pool = ConnectionPool(str(tmp_path / "pool.db"), pragmas={"x; DROP": 1})
+        try:
+            with pytest.raises(ValueError, match="PRAGMA"):
+                async with pool.writer():
+                    pass
+        finally:
+            await pool.close()
+
+
+class TestDatabasePooling:
+    """Testes da API Database usando o pool."""
+
+    async def test_database_api_unchanged(self, bot_db) -> None:
+        """Testar run/get/get_all/run_many sobre conexões persistentes."""
+        warning_id = await bot_db.add_warning("1", "2", "3", "spam")
+        await bot_db.run_many(
+            "INSERT INTO warnings (guild_id, user_id, moderator_id) VALUES (?, ?, ?)",
+            [("1", "2", "3"), ("1", "2", "4")],
+        )
+
+        assert warning_id == 1
+        assert len(await bot_db.get_user_warnings("1", "2")) == 3
+        assert (await bot_db.get("SELECT reason FROM warnings WHERE id = ?", (1,)))["reason"] == "spam"
+        assert bot_db.pool.connections_opened <= 1 + bot_db.pool.max_readers
+
+    def test_single_module_identity(self) -> None:
+        """Testar que cogs e módulos de dados usam a mesma instância (um pool)."""
+        from src.data import tickets
+        from src.events import message_create
+        from src.utils import database
+
+        assert message_create.database is database.database
+        assert tickets.database is database.database
+        assert "utils.database" not in sys.modules
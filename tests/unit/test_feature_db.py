@@ -0,0 +1,84 @@
+"""
+🧪 Testes Unitários - Bancos por Funcionalidade e Watchdog
+==========================================================
+
+Testes para src/utils/feature_db.py e src/utils/loop_watchdog.py
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.feature_db import FeatureDatabase
+from src.utils.loop_watchdog import LoopLagWatchdog
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS notes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        guild_id TEXT NOT NULL,
+        content TEXT NOT NULL
+    );
+"""
+
+
+class TestFeatureDatabase:
+    """Testes para a classe FeatureDatabase."""
+
+    async def test_schema_and_rows(self, tmp_path) -> None:
+        """Testar criação do esquema uma única vez e linhas por índice/nome."""
+        db = FeatureDatabase(str(tmp_path / "data" / "notes.db"))
+        try:
+            await db.ensure_schema(SCHEMA)
+            await db.ensure_schema(SCHEMA)
+            cursor = await db.run(
+                "INSERT INTO notes (guild_id, content) VALUES (?, ?)", ("1", "olá")
+            )
+            assert cursor.lastrowid == 1
+
+            row = await db.get("SELECT id, content FROM notes WHERE guild_id = ?", ("1",))
+            note_id, content = row
+            assert (note_id, content) == (1, "olá")
+            assert row["content"] == "olá"
+        finally:
+            await db.close()
+
+        assert db.pool.closed
+
+    async def test_transaction_rolls_back(self, tmp_path) -> None:
+        """Testar que erro dentro da transação desfaz as escritas."""
+        db = FeatureDatabase(str(tmp_path / "notes.db"))
+        try:
+            await db.ensure_schema(SCHEMA)
+            with pytest.raises(RuntimeError):
+                async with db.transaction() as conn:
+                    await conn.execute("INSERT INTO notes (guild_id, content) VALUES ('1', 'a')")
+                    raise RuntimeError("falha")
+
+            async with db.transaction() as conn:
+                await conn.execute("INSERT INTO notes (guild_id, content) VALUES ('1', 'b')")
+
+            rows = await db.get_all("SELECT content FROM notes")
+            assert [row["content"] for row in rows] == ["b"]
+        finally:
+            await db.close()
+
+
+class TestLoopLagWatchdog:
+    """Testes para a classe LoopLagWatchdog."""
+
+    async def test_reports_blocking_callback(self) -> None:
+        """Testar que um bloqueio síncrono é detectado com a pilha culpada."""
+        watchdog = LoopLagWatchdog(threshold_ms=100, interval=0.02)
+        watchdog.start()
+        try:
+            await asyncio.sleep(0.05)
+            time.sleep(0.3)  # Bloqueia o loop de propósito
+            await asyncio.sleep(0.05)
+        finally:
+            await watchdog.stop()
+
+        assert watchdog.stalls == 1
+        assert "test_reports_blocking_callback" in (watchdog.last_stack or "")
+        assert watchdog.stats()["max_lag_ms"] >= 200
+        assert not watchdog.running
@@ -0,0 +1,97 @@
+"""
+🧪 Testes Unitários - Leitura de Histórico em Streaming
+=======================================================
+
+Testes para src/utils/history_scan.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.database import Database
+from src.utils.history_scan import (
+    HistoryScanner,
+    MessageCounter,
+    ParticipantCounter,
+    TranscriptRows,
+)
+
+
+class FakeHistoryChannel:
+    """Canal com N mensagens que pode falhar depois de entregar ``fail_after``."""
+
+    def __init__(self, total: int, fail_after: int | None = None) -> None:
+        self.id = 42
+        self.messages = [
+            SimpleNamespace(
+                id=1000 + i,
+                content=f"msg {i}",
+                author=SimpleNamespace(id=i % 3, bot=i % 3 == 2, name=f"user{i % 3}"),
+                attachments=[object()] if i % 10 == 0 else [],
+            )
+            for i in range(total)
+        ]
+        self.fail_after = fail_after
+        self.calls: list[int | None] = []
+
+    async def history(self, limit=None, after=None, oldest_first=None):
+        assert oldest_first is True
+        self.calls.append(after.id if after else None)
+        delivered = 0
+        for message in self.messages:
+            if after is not None and message.id <= after.id:
+                continue
+            if self.fail_after is not None and delivered == self.fail_after:
+                raise ConnectionError("conexão perdida")
+            delivered += 1
+            yield message
+
+
+def row(message) -> dict | None:
+    """Linha do transcript (mensagens de bots ficam de fora)."""
+    return None if message.author.bot else {"id": message.id, "content": message.content}
+
+
+class TestHistoryScanner:
+    """Testes para a leitura única, os consumidores e a retomada."""
+
+    async def test_single_pass_feeds_all_consumers(self) -> None:
+        """Testar que uma passada alimenta contagem, participantes e linhas."""
+        channel = FakeHistoryChannel(300)
+        counter, participants = MessageCounter(), ParticipantCounter()
+        rows = TranscriptRows(row, limit=50)
+
+        assert await HistoryScanner().scan(channel, counter, participants, rows) == 300
+        assert channel.calls == [None]
+        assert (counter.messages, counter.bot_messages, counter.attachments) == (300, 100, 30)
+        assert participants.counts == {0: 100, 1: 100}
+        assert len(rows.rows) == 50 and rows.total == 200
+        assert rows.rows[0]["id"] == 1000 and rows.rows[-1]["id"] == 1073
+
+    async def test_interrupted_scan_resumes_from_checkpoint(self, bot_db: Database) -> None:
+        """Testar a retomada do cursor e do estado após uma falha."""
+        scanner = HistoryScanner(bot_db, checkpoint_every=100)
+        channel = FakeHistoryChannel(1000, fail_after=450)
+        counter, participants = MessageCounter(), ParticipantCounter()
+        with pytest.raises(ConnectionError):
+            await scanner.scan(channel, counter, participants, key="teste:42")
+
+        checkpoint = await bot_db.get("SELECT * FROM history_scan_checkpoints")
+        assert checkpoint["last_message_id"] == "1399"
+
+        channel.fail_after = None
+        counter, participants = MessageCounter(), ParticipantCounter()
+        assert await scanner.scan(channel, counter, participants, key="teste:42") == 600
+        assert channel.calls == [None, 1399]
+        assert counter.messages == 1000 and sum(participants.counts.values()) == 667
+        assert scanner.stats()["resumed"] == 1
+        assert await bot_db.get("SELECT * FROM history_scan_checkpoints") is None
+
+    async def test_scan_without_key_keeps_no_state(self, bot_db: Database) -> None:
+        """Testar que leituras sem chave não gravam checkpoints."""
+        scanner = HistoryScanner(bot_db, checkpoint_every=10)
+        counter = MessageCounter()
+        assert await scanner.scan(FakeHistoryChannel(55), counter) == 55
+        assert await bot_db.get_all("SELECT * FROM history_scan_checkpoints") == []
+        assert scanner.stats()["messages_read"] == 55
@@ -0,0 +1,81 @@
+"""
+🧪 Testes Unitários - Modo Raid de Entradas
+===========================================
+
+Testes para src/utils/join_burst.py
+"""
+
+import asyncio
+import time
+
+from src.utils.join_burst import JoinBurstMonitor, RateLimitedExecutor
+
+
+class TestJoinBurstMonitor:
+    """Testes para a estimativa de entradas e os resumos."""
+
+    def test_raid_mode_hysteresis(self) -> None:
+        """Testar entrada no modo raid, permanência no cooldown e saída."""
+        monitor = JoinBurstMonitor(cooldown=60)
+        # Uma entrada a cada 5s fica longe do limite
+        assert not any(
+            monitor.observe(1, member, threshold=10, window=10, now=member * 5.0)
+            for member in range(20)
+        )
+
+        decisions = [
+            monitor.observe(1, 100 + i, threshold=10, window=10, now=200 + i * 0.1)
+            for i in range(30)
+        ]
+        assert decisions.index(True) <= 11
+        assert all(decisions[decisions.index(True) :])
+        assert monitor.stats()["raids"] == 1
+
+        # Abaixo do limite, mas ainda dentro do cooldown
+        assert monitor.observe(1, 500, threshold=10, window=10, now=240)
+        assert not monitor.observe(1, 501, threshold=10, window=10, now=300)
+        # Outro servidor não é afetado
+        assert not monitor.in_raid(2)
+
+    def test_decision_shared_by_listeners(self) -> None:
+        """Testar que a mesma entrada é contada uma vez e recebe a mesma resposta."""
+        monitor = JoinBurstMonitor()
+        for _ in range(5):
+            assert monitor.observe(1, 42, threshold=2, window=10, now=0) is False
+        assert monitor.observe(1, 43, threshold=2, window=10, now=0) is True
+        assert monitor.observe(1, 43, threshold=2, window=10, now=0) is True
+
+    def test_rejoin_after_raid_is_judged_again(self) -> None:
+        """Testar que quem volta depois do raid não é tratado como raider de novo."""
+        monitor = JoinBurstMonitor()
+        monitor.observe(1, 10, threshold=2, window=10, now=0)
+        assert monitor.observe(1, 11, threshold=2, window=10, now=0) is True
+        assert not monitor.in_raid(1, threshold=2, window=10, now=86400)
+        assert monitor.observe(1, 11, threshold=2, window=10, now=86400) is False
+
+    async def test_summaries_and_rate_limited_actions(self) -> None:
+        """Testar o resumo periódico e o ritmo das ações em massa."""
+        monitor = JoinBurstMonitor(summary_interval=0.05, max_listed=3)
+        sent = []
+
+        async def handler(summary):
+            sent.append((summary.count, list(summary.members)))
+
+        for member in range(10):
+            monitor.summarize(1, "welcome", member, handler)
+        await asyncio.sleep(0.12)
+        assert sent == [(10, [0, 1, 2])]
+        await monitor.close()
+
+        executor = RateLimitedExecutor(rate=50)
+        done = []
+
+        async def action(member):
+            done.append((member, time.perf_counter()))
+
+        for member in (1, 2, 3, 3):
+            executor.submit(member, lambda m=member: action(m))
+        await asyncio.sleep(0.15)
+        assert [member for member, _ in done] == [1, 2, 3]
+        assert done[-1][1] - done[0][1] >= 2 / 50 * 0.9
+        await executor.close()
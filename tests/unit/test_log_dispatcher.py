@@ -0,0 +1,77 @@
+"""
+🧪 Testes Unitários - Envio Agrupado de Logs
+============================================
+
+Testes para src/utils/log_dispatcher.py
+"""
+
+import asyncio
+
+import discord
+
+from src.utils.log_dispatcher import LogDispatcher, pack_embeds
+
+
+class FakeResponse:
+    """Resposta HTTP mínima para montar um HTTPException."""
+
+    status = 429
+    reason = "Too Many Requests"
+
+
+class FakeLogChannel:
+    """Canal de log que registra os lotes enviados."""
+
+    def __init__(self, channel_id: int = 1, rate_limits: int = 0) -> None:
+        self.id = channel_id
+        self.batches: list[list[str]] = []
+        self.rate_limits = rate_limits
+
+    async def send(self, embeds=None) -> None:
+        if self.rate_limits:
+            self.rate_limits -= 1
+            raise discord.HTTPException(FakeResponse(), "rate limited")
+        self.batches.append([embed.title for embed in embeds])
+
+
+def make_embeds(count: int, size: int = 10) -> list[discord.Embed]:
+    """Embeds numerados com descrição de ``size`` caracteres."""
+    return [discord.Embed(title=str(i), description="x" * size) for i in range(count)]
+
+
+class TestLogDispatcher:
+    """Testes para a fila de saída dos canais de log."""
+
+    def test_pack_embeds_limits(self) -> None:
+        """Testar os limites de 10 embeds e 6000 caracteres por mensagem."""
+        assert [len(batch) for batch in pack_embeds(make_embeds(23))] == [10, 10, 3]
+        assert [len(batch) for batch in pack_embeds(make_embeds(5, size=2500))] == [2, 2, 1]
+
+    async def test_burst_is_packed(self) -> None:
+        """Testar que uma rajada de 25 eventos vira 3 mensagens em ordem."""
+        dispatcher = LogDispatcher(window=0.05)
+        channel = FakeLogChannel()
+        for embed in make_embeds(25):
+            dispatcher.send(channel, embed)
+        assert dispatcher.depth(channel.id) == 25
+
+        await asyncio.sleep(0.15)
+        assert [len(batch) for batch in channel.batches] == [10, 10, 5]
+        assert [title for batch in channel.batches for title in batch] == [
+            str(i) for i in range(25)
+        ]
+        assert dispatcher.stats()["queued"] == 0
+        await dispatcher.close()
+
+    async def test_rate_limit_backoff_and_drops(self) -> None:
+        """Testar a nova tentativa após um 429 e o descarte com a fila cheia."""
+        dispatcher = LogDispatcher(window=0.01, max_pending=5, max_backoff=0.02)
+        channel = FakeLogChannel(rate_limits=1)
+        results = [dispatcher.send(channel, embed) for embed in make_embeds(7)]
+        assert results == [True] * 5 + [False] * 2
+
+        await asyncio.sleep(0.2)
+        assert channel.batches == [["2", "3", "4", "5", "6"]]
+        stats = dispatcher.stats()
+        assert (stats["dropped"], stats["rate_limited"], stats["sent_embeds"]) == (2, 1, 5)
+        await dispatcher.close()
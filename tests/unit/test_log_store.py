@@ -0,0 +1,80 @@
+"""
+🧪 Testes Unitários - Logs Particionados
+========================================
+
+Testes para src/utils/log_store.py
+"""
+
+from datetime import datetime, timezone
+
+from src.utils.database import Database
+from src.utils.log_store import LogStore, migrate_legacy_logs, partition_for, partition_range
+
+
+def unix(year: int, month: int, day: int) -> float:
+    """Timestamp Unix (UTC) de uma data."""
+    return datetime(year, month, day, 12, tzinfo=timezone.utc).timestamp()
+
+
+class TestLogStore:
+    """Testes para a escrita em lote e as partições de logs."""
+
+    def test_partition_names_and_ranges(self) -> None:
+        """Testar nomes e intervalos das partições mensais e diárias."""
+        assert partition_for("2026-12-31 23:59:59") == "logs_202612"
+        assert partition_for("2026-12-31T23:59:59", "day") == "logs_20261231"
+        assert partition_range("logs_202612") == ("2026-12-01 00:00:00", "2027-01-01 00:00:00")
+        assert partition_range("logs_20260228") == ("2026-02-28 00:00:00", "2026-03-01 00:00:00")
+
+    async def test_batched_appends_across_partitions(self, bot_db: Database) -> None:
+        """Testar a gravação em lote e a leitura entre partições."""
+        store = LogStore(bot_db, flush_interval=60, max_pending=1000)
+        ids = [
+            await store.append("1", "message_delete", user_id=str(i % 3), when=unix(2026, month, 5))
+            for month in (8, 9, 10)
+            for i in range(10)
+        ]
+        assert ids == sorted(ids) and len(set(ids)) == 30
+        assert len(store) == 30
+
+        sql, params = await store.select("guild_id = ? AND user_id = ?", ("1", "0"), newest=5)
+        rows = await bot_db.get_all(
+            f"SELECT * FROM ({sql}) ORDER BY timestamp DESC, id DESC LIMIT 5", params
+        )
+        assert len(store) == 0 and store.stats()["flushes"] == 1
+        assert await store.partitions() == ["logs_202608", "logs_202609", "logs_202610"]
+        assert [row["timestamp"][:7] for row in rows] == ["2026-10"] * 4 + ["2026-09"]
+        assert await store.partitions(start="2026-09-15 00:00:00") == [
+            "logs_202609",
+            "logs_202610",
+        ]
+        await store.close()
+
+        # Mais partições que o limite de termos de um SELECT composto do SQLite
+        daily = LogStore(bot_db, granularity="day", flush_interval=60, max_pending=1000)
+        for day in range(520):
+            await daily.append("2", "member_join", when=unix(2024, 1, 1) + day * 86400)
+        sql, params = await daily.select("guild_id = ?", ("2",))
+        row = await bot_db.get(f"SELECT COUNT(*) AS total FROM ({sql})", params)
+        assert len(await daily.partitions()) > 500 and row["total"] == 520
+        await daily.close()
+
+    async def test_retention_and_legacy_migration(self, bot_db: Database) -> None:
+        """Testar a retenção por partição e a migração da tabela antiga."""
+        await bot_db.run_many(
+            "INSERT INTO logs (guild_id, event_type, timestamp) VALUES (?, ?, ?)",
+            [("1", "member_join", "2026-06-01 10:00:00")] * 3
+            + [("1", "member_join", "2026-07-20T10:00:00")],
+        )
+        async with bot_db.pool.writer() as db:
+            assert await migrate_legacy_logs(db) == 4
+            await db.commit()
+        assert await bot_db.get_all("SELECT * FROM logs") == []
+
+        store = LogStore(bot_db)
+        assert await store.partitions() == ["logs_202606", "logs_202607"]
+        assert await store.drop_before("2026-07-15 00:00:00") == 1
+        assert await store.partitions() == ["logs_202607"]
+        row = await bot_db.get("SELECT COUNT(*) AS total FROM logs_202607")
+        assert row["total"] == 1
+        await store.close()
@@ -0,0 +1,136 @@
+"""
+🧪 Testes Unitários - Pipeline de Mensagens
+===========================================
+
+Testes para src/utils/message_pipeline.py
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import message_pipeline
+from src.utils.message_pipeline import MessagePipeline
+
+
+def make_message(guild_id: int = 1, channel_id: int = 10, bot: bool = False):
+    """Criar mensagem falsa com os atributos usados pelo pipeline."""
+    author = SimpleNamespace(id=99, bot=bot, guild_permissions=None)
+    return SimpleNamespace(
+        author=author,
+        guild=SimpleNamespace(id=guild_id),
+        channel=SimpleNamespace(id=channel_id),
+    )
+
+
+@pytest.fixture
+def settings_calls(monkeypatch):
+    """Substituir a leitura de configurações por um contador."""
+    calls: list[str] = []
+
+    async def fake_get_guild_settings(guild_id: str):
+        calls.append(guild_id)
+        return {"leveling_enabled": 1}
+
+    monkeypatch.setattr(
+        message_pipeline.database, "get_guild_settings", fake_get_guild_settings
+    )
+    return calls
+
+
+class TestMessagePipeline:
+    """Testes para a classe MessagePipeline."""
+
+    def test_levels_follow_dependencies(self) -> None:
+        """Testar agrupamento topológico dos estágios."""
+
+        async def noop(ctx) -> None:
+            pass
+
+        pipeline = MessagePipeline()
+        pipeline.register("leveling", noop, depends_on=("filters", "antispam"))
+        pipeline.register("filters", noop)
+        pipeline.register("antispam", noop)
+        pipeline.register("logging", noop, depends_on=("filters", "missing"))
+
+        levels = [sorted(stage.name for stage in level) for level in pipeline.levels]
+        assert levels == [["antispam", "filters"], ["leveling", "logging"]]
+
+    def test_cycle_is_reported(self) -> None:
+        """Testar que dependência circular gera erro."""
+
+        async def noop(ctx) -> None:
+            pass
+
+        pipeline = MessagePipeline()
+        pipeline.register("a", noop, depends_on=("b",))
+        pipeline.register("b", noop, depends_on=("a",))
+        with pytest.raises(RuntimeError, match="circular"):
+            _ = pipeline.levels
+
+    async def test_shared_context_and_concurrency(self, settings_calls) -> None:
+        """Testar que contexto é resolvido uma vez e estágios rodam juntos."""
+        pipeline = MessagePipeline()
+        ticket_lookups: list[int] = []
+        running = 0
+        peak = 0
+
+        async def resolver(channel_id: int) -> bool:
+            ticket_lookups.append(channel_id)
+            return True
+
+        async def stage(ctx) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            assert ctx.settings == {"leveling_enabled": 1}
+            assert await ctx.is_ticket_channel() is True
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        pipeline.ticket_resolver = resolver
+        for name in ("a", "b", "c"):
+            pipeline.register(name, stage)
+
+        await pipeline.process(make_message())
+
+        assert settings_calls == ["1"]
+        assert ticket_lookups == [10]
+        assert peak == 3
+        assert pipeline.stats()["stages"]["a"]["calls"] == 1
+
+    async def test_halt_and_error_isolation(self, settings_calls) -> None:
+        """Testar interrupção do pipeline e isolamento de erros."""
+        pipeline = MessagePipeline()
+        ran: list[str] = []
+
+        async def filters(ctx) -> None:
+            ctx.halt("filters")
+
+        async def broken(ctx) -> None:
+            raise ValueError("boom")
+
+        async def leveling(ctx) -> None:
+            ran.append("leveling")
+
+        pipeline.register("filters", filters)
+        pipeline.register("broken", broken)
+        pipeline.register("leveling", leveling, depends_on=("filters",))
+
+        ctx = await pipeline.process(make_message())
+
+        assert ctx.halted_by == "filters"
+        assert ran == []
+        assert pipeline.stats()["stages"]["broken"]["errors"] == 1
+
+    async def test_bot_messages_ignored(self, settings_calls) -> None:
+        """Testar que mensagens de bots não passam pelo pipeline."""
+        pipeline = MessagePipeline()
+
+        async def noop(ctx) -> None:
+            pass
+
+        pipeline.register("a", noop)
+        assert await pipeline.process(make_message(bot=True)) is None
+        assert settings_calls == []
@@ -0,0 +1,179 @@
+"""
+🧪 Testes Unitários - Migrações e Importação de Bancos Antigos
+==============================================================
+
+Testes para src/utils/migrations.py e src/utils/legacy_import.py
+"""
+
+import sqlite3
+
+import pytest
+
+from src.utils.database import Database
+from src.utils.legacy_import import import_legacy_databases
+from src.utils.migrations import LATEST_VERSION, table_columns
+from src.utils.schema import INDEXES, TABLES
+
+
+@pytest.fixture
+async def empty_db(tmp_path):
+    """Database isolado sem tabelas (criadas por cada teste)."""
+    db = Database()
+    db.db_path = str(tmp_path / "bot.db")
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def create_legacy_file(path, script: str) -> None:
+    """Criar um arquivo .db no formato antigo."""
+    with sqlite3.connect(path) as conn:
+        conn.executescript(script)
+
+
+class TestMigrations:
+    """Testes do executor de migrações."""
+
+    async def test_fresh_database_runs_once(self, empty_db) -> None:
+        """Testar que cada versão é aplicada uma única vez."""
+        applied = await empty_db.create_tables()
+        assert [m.version for m in applied] == list(range(1, LATEST_VERSION + 1))
+        assert await empty_db.create_tables() == []
+
+        row = await empty_db.get("SELECT MAX(version) AS version FROM schema_migrations")
+        assert row["version"] == LATEST_VERSION
+        assert await empty_db.pool.get_pragma("user_version") == LATEST_VERSION
+
+        plan = await empty_db.get_all(
+            "EXPLAIN QUERY PLAN SELECT id FROM tickets WHERE channel_id = ? AND status = 'open'",
+            ("1",),
+        )
+        assert "idx_tickets_channel" in plan[0]["detail"]
+
+        # As versões, aplicadas em ordem, chegam exatamente ao esquema atual
+        canonical = sqlite3.connect(":memory:")
+        for create_sql in TABLES.values():
+            canonical.execute(create_sql)
+        for index_sql in INDEXES:
+            canonical.execute(index_sql)
+        expected = canonical.execute(
+            "SELECT type, name FROM sqlite_master WHERE name NOT LIKE 'sqlite_%' ORDER BY name"
+        ).fetchall()
+        created = await empty_db.get_all(
+            """SELECT type, name FROM sqlite_master WHERE name NOT LIKE 'sqlite_%'
+            AND name NOT LIKE 'logs_%' AND name != 'schema_migrations' ORDER BY name"""
+        )
+        assert [(row["type"], row["name"]) for row in created] == expected
+        for table in TABLES:
+            columns = await empty_db.get_all(f"PRAGMA table_info({table})")
+            assert [(c["name"], c["notnull"]) for c in columns] == [
+                (c[1], c[3]) for c in canonical.execute(f"PRAGMA table_info({table})")
+            ]
+        canonical.close()
+
+    async def test_conflicting_tables_are_reconciled(self, empty_db) -> None:
+        """Testar conversão das definições antigas de user_levels e sticky_messages."""
+        create_legacy_file(
+            empty_db.db_path,
+            """
+            CREATE TABLE user_levels (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, guild_id INTEGER, user_id INTEGER,
+                xp INTEGER DEFAULT 0, level INTEGER DEFAULT 0, messages INTEGER DEFAULT 0,
+                last_xp_time TIMESTAMP, UNIQUE(guild_id, user_id)
+            );
+            INSERT INTO user_levels (guild_id, user_id, xp, level, messages)
+            VALUES (1, 10, 2500, 99, 42);
+            CREATE TABLE sticky_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, guild_id TEXT NOT NULL,
+                channel_id TEXT NOT NULL, message_content TEXT NOT NULL, embed_json TEXT,
+                active INTEGER DEFAULT 1, created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+            INSERT INTO sticky_messages (guild_id, channel_id, message_content, active)
+            VALUES ('1', '5', 'fixa', 0);
+            """,
+        )
+
+        await empty_db.create_tables()
+
+        columns = await empty_db.get_all("PRAGMA table_info(user_levels)")
+        assert {c["name"] for c in columns} >= {"total_xp", "messages_sent", "last_xp_gain"}
+        row = await empty_db.get_user_level("1", "10")
+        assert (row["total_xp"], row["level"], row["messages_sent"]) == (2500, 5, 42)
+
+        # O acumulador usa ON CONFLICT(guild_id, user_id) na tabela convertida
+        await empty_db.add_xp("1", "10", 10)
+        await empty_db.xp_accumulator.flush()
+        row = await empty_db.get("SELECT total_xp FROM user_levels WHERE user_id = '10'")
+        assert row["total_xp"] == 2510
+
+        sticky = await empty_db.get("SELECT * FROM sticky_messages WHERE channel_id = '5'")
+        assert (sticky["message_content"], sticky["is_active"]) == ("fixa", 0)
+        # Colunas antes NOT NULL agora aceitam as escritas dos outros módulos
+        await empty_db.run("INSERT INTO sticky_messages (channel_id, content) VALUES ('6', 'x')")
+
+
+class TestLegacyImport:
+    """Testes do importador dos bancos por funcionalidade."""
+
+    async def test_import_once_and_join_history(self, empty_db, tmp_path) -> None:
+        """Testar importação única e histórico unificado em uma consulta."""
+        await empty_db.create_tables()
+        legacy_dir = tmp_path / "legacy"
+        legacy_dir.mkdir()
+        create_legacy_file(
+            legacy_dir / "cases.db",
+            """
+            CREATE TABLE mod_cases (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, case_id INTEGER NOT NULL,
+                guild_id TEXT NOT NULL, user_id TEXT NOT NULL, moderator_id TEXT NOT NULL,
+                type TEXT NOT NULL, reason TEXT, evidence TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, UNIQUE(guild_id, case_id)
+            );
+            INSERT INTO mod_cases (case_id, guild_id, user_id, moderator_id, type, reason, created_at)
+            VALUES (1, '1', '10', '99', 'ban', 'spam', '2024-01-01 10:00:00'),
+                   (2, '1', '10', '99', 'kick', 'flood', '2024-01-02 10:00:00');
+            """,
+        )
+        create_legacy_file(
+            legacy_dir / "8ball.db",
+            """
+            CREATE TABLE user_stats (user_id TEXT PRIMARY KEY, total_questions INTEGER);
+            INSERT INTO user_stats VALUES ('10', 3);
+            """,
+        )
+        # Caso já existente no banco principal colide com o case_id 2 antigo
+        await empty_db.run(
+            """INSERT INTO mod_cases (case_id, guild_id, user_id, moderator_id, type, created_at)
+            VALUES (2, '1', '10', '99', 'warn', '2024-01-03 10:00:00')"""
+        )
+
+        results = await import_legacy_databases(empty_db.pool, str(legacy_dir))
+        assert results == {"cases.db": 1, "8ball.db": 1}
+        assert await import_legacy_databases(empty_db.pool, str(legacy_dir)) == {}
+        assert (await empty_db.get("SELECT total_questions FROM eightball_stats"))[
+            "total_questions"
+        ] == 3
+
+        await empty_db.add_warning("1", "10", "99", "aviso")
+        await empty_db.run(
+            """INSERT INTO user_notes (guild_id, user_id, content, created_at)
+            VALUES ('1', '10', 'nota', '2000-01-01 00:00:00')"""
+        )
+        history = await empty_db.get_user_history("1", "10", limit=2)
+        assert [row["kind"] for row in history] == ["warning", "case", "case", "note"]
+        assert [row["type"] for row in history[1:3]] == ["warn", "ban"]
+
+    async def test_storage_shares_main_pool(self, empty_db) -> None:
+        """Testar que o acesso dos cogs usa o mesmo pool do banco principal."""
+        await empty_db.create_tables()
+        await empty_db.storage.run(
+            "INSERT INTO voice_settings (guild_id, auto_move_timeout) VALUES ('1', 60)"
+        )
+        guild_id, timeout = await empty_db.storage.get(
+            "SELECT guild_id, auto_move_timeout FROM voice_settings"
+        )
+        assert (guild_id, timeout) == ("1", 60)
+        assert empty_db.storage.pool is empty_db.pool
+        async with empty_db.pool.writer() as conn:
+            assert "log_voice_actions" in await table_columns(conn, "voice_settings")
@@ -0,0 +1,140 @@
+"""
+🧪 Testes Unitários - Páginas Sob Demanda
+=========================================
+
+Testes para src/utils/page_provider.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.database import Database
+from src.utils.page_provider import BanPageProvider, KeysetPageProvider
+
+
+@pytest.fixture
+async def list_db(bot_db):
+    """23 tickets, vários criados no mesmo instante."""
+    await bot_db.run_many(
+        """INSERT INTO tickets (guild_id, channel_id, user_id, status, created_at)
+        VALUES (?, ?, ?, ?, ?)""",
+        [
+            ("1", str(100 + i), "5", "closed" if i % 3 else "open", f"2024-01-{1 + i // 4:02d}")
+            for i in range(23)
+        ]
+        + [("2", "999", "5", "open", "2024-01-01")],
+    )
+    return bot_db
+
+
+class FakeGuild:
+    """Servidor com banimentos paginados como na API (ID crescente, ``after``)."""
+
+    def __init__(self, user_ids: list[int]) -> None:
+        self.user_ids = sorted(user_ids)
+
+    async def bans(self, *, limit=1000, after=None):
+        start = after.id if after else 0
+        served = 0
+        for user_id in self.user_ids:
+            if user_id <= start:
+                continue
+            if limit is not None and served >= limit:
+                return
+            served += 1
+            user = SimpleNamespace(id=user_id, name=f"user{user_id}", global_name=None)
+            yield SimpleNamespace(user=user, reason=None)
+
+
+class TestKeysetPageProvider:
+    """Testes para a paginação por chave sobre o banco."""
+
+    async def test_pages_follow_order_without_gaps(self, list_db: Database) -> None:
+        """Testar que as páginas cobrem todas as linhas, na ordem, mesmo com empates."""
+        pages = KeysetPageProvider(
+            list_db, "tickets", where="guild_id = ?", params=("1",), page_size=5
+        )
+        expected = await list_db.get_all(
+            "SELECT id FROM tickets WHERE guild_id = '1' ORDER BY created_at DESC, id DESC"
+        )
+
+        seen = []
+        index = 0
+        while True:
+            seen.extend(row["id"] for row in await pages.page(index))
+            if not pages.has_next(index):
+                break
+            index += 1
+
+        assert seen == [row["id"] for row in expected]
+        assert index == 4 and pages.page_count == 5
+        # Voltar para uma página visitada não consulta o banco
+        fetches = pages.fetches
+        assert [row["id"] for row in await pages.page(1)] == seen[5:10]
+        assert pages.fetches == fetches and pages.cache_hits == 1
+
+        # Direções mistas (empates do mais recente em ordem crescente de id)
+        mixed = KeysetPageProvider(
+            list_db,
+            "tickets",
+            where="guild_id = ?",
+            params=("1",),
+            order=(("created_at", "DESC"), ("id", "ASC")),
+            page_size=4,
+        )
+        expected = await list_db.get_all(
+            "SELECT id FROM tickets WHERE guild_id = '1' ORDER BY created_at DESC, id ASC"
+        )
+        seen = []
+        for index in range(6):
+            seen.extend(row["id"] for row in await mixed.page(index))
+        assert seen == [row["id"] for row in expected]
+
+    async def test_jump_and_background_count(self, list_db: Database) -> None:
+        """Testar o salto direto para uma página e a contagem separada por status."""
+        pages = KeysetPageProvider(
+            list_db,
+            "tickets",
+            where="guild_id = ?",
+            params=("1",),
+            columns="channel_id",
+            group_by="status",
+            page_size=5,
+            max_cached_pages=2,
+        )
+        last = await pages.page(4)
+        assert [row["channel_id"] for row in last] == ["102", "101", "100"]
+        assert not pages.has_next(4)
+
+        assert await pages.count() == 23
+        assert pages.groups == {"open": 8, "closed": 15}
+        assert pages.page_label(0) == "Página 1/5"
+
+        await pages.page(0)
+        await pages.page(1)
+        assert pages.stats()["cached_pages"] == 2
+        assert await pages.page(9) == []
+
+        pages.reset()
+        assert pages.total is None and pages.groups is None
+
+
+class TestBanPageProvider:
+    """Testes para as páginas da lista de banidos."""
+
+    async def test_pages_and_filter(self) -> None:
+        """Testar páginas a partir do último usuário e o filtro de busca."""
+        guild = FakeGuild(list(range(1, 26)))
+        pages = BanPageProvider(guild, page_size=10)
+        assert [entry.user.id for entry in await pages.page(1)] == list(range(11, 21))
+        assert [entry.user.id for entry in await pages.page(2)] == list(range(21, 26))
+        assert not pages.has_next(2)
+        assert await pages.count() == 25
+
+        only_ones = BanPageProvider(
+            guild, predicate=lambda entry: "1" in entry.user.name, page_size=3
+        )
+        assert [entry.user.id for entry in await only_ones.page(0)] == [1, 10, 11]
+        assert [entry.user.id for entry in await only_ones.page(1)] == [12, 13, 14]
+        assert await only_ones.count() == 12
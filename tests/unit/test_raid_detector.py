@@ -0,0 +1,95 @@
+"""
+🧪 Testes Unitários - Detector de Raid
+======================================
+
+Testes para src/utils/raid_detector.py
+"""
+
+from types import SimpleNamespace
+
+from src.utils.raid_detector import RaidDetector, fingerprint
+
+RAID_TEXT = "Nitro grátis aqui: https://exemplo.gift/abc"
+
+
+class TestFingerprint:
+    """Testes para a normalização do conteúdo."""
+
+    def test_normalization(self) -> None:
+        """Testar que caixa, pontuação e menções não mudam a impressão."""
+        base = fingerprint("Entrem no servidor novo agora!!")
+        assert base == fingerprint("<@123> entrem   no SERVIDOR novo, agora")
+        assert base != fingerprint("Entrem no servidor antigo agora")
+        assert fingerprint("oi") is None
+        assert fingerprint("https://x.io") is not None
+
+
+class TestRaidDetector:
+    """Testes para a classe RaidDetector."""
+
+    def test_trips_on_distinct_authors_and_returns_held_messages(self) -> None:
+        """Testar disparo por autores distintos com ação em lote."""
+        detector = RaidDetector()
+        for author in range(3):
+            assert detector.observe(1, RAID_TEXT, author, 10, f"m{author}", now=author) == []
+        # O mesmo autor repetindo no mesmo canal não conta como outro autor
+        assert detector.observe(1, RAID_TEXT, 2, 10, "m2b", now=3) == []
+        # Outro servidor tem a própria tabela
+        assert detector.observe(2, RAID_TEXT, 3, 10, "x", now=3) == []
+
+        assert detector.observe(1, RAID_TEXT, 3, 10, "m3", now=4) == ["m0", "m1", "m2", "m2b", "m3"]
+        assert detector.observe(1, RAID_TEXT, 4, 10, "m4", now=5) == ["m4"]
+        assert detector.stats()["trips"] == 1
+
+    def test_cross_channel_window_and_memory_ceiling(self) -> None:
+        """Testar disparo por canais, janela, TTL e limite de entradas."""
+        detector = RaidDetector(max_entries=2, ttl=30)
+        assert detector.observe(1, RAID_TEXT, 7, 10, "a", min_channels=2, window=5, now=0) == []
+        # Fora da janela: a contagem recomeça
+        assert detector.observe(1, RAID_TEXT, 7, 11, "b", min_channels=2, window=5, now=6) == []
+        assert detector.observe(1, RAID_TEXT, 7, 12, "c", min_channels=2, window=5, now=7) == [
+            "b",
+            "c",
+        ]
+
+        detector.observe(1, "segunda mensagem repetida", 1, 10, now=8)
+        detector.observe(1, "terceira mensagem repetida", 1, 10, now=9)
+        assert len(detector) == 2
+        assert detector.stats()["evictions"] == 1
+
+        detector.observe(1, "quarta mensagem repetida", 1, 10, now=50)
+        assert len(detector) == 1
+        assert detector.stats()["expirations"] == 2
+
+
+class TestRaidAction:
+    """Testes para a punição aplicada pelo caminho de raid."""
+
+    async def test_action_records_moderation_case(self, bot_db, monkeypatch) -> None:
+        """Testar que cada autor punido gera um caso de moderação."""
+        from src.events import message_create
+        from src.utils.antispam_policy import AntispamPolicy
+
+        monkeypatch.setattr(message_create, "database", bot_db)
+
+        sent = []
+
+        async def send(**kwargs):
+            sent.append(kwargs)
+
+        author = SimpleNamespace(
+            id=5, mention="<@5>", guild_permissions=SimpleNamespace(administrator=False)
+        )
+        message = SimpleNamespace(
+            author=author,
+            guild=SimpleNamespace(id=1),
+            channel=SimpleNamespace(id=10, send=send),
+        )
+        cog = message_create.MessageCreate(SimpleNamespace(user=SimpleNamespace(id=99)))
+        await cog.execute_antispam_action(message, AntispamPolicy(action="warn"))
+        case = await bot_db.get("SELECT * FROM moderation_cases WHERE guild_id = '1'")
+
+        assert len(sent) == 1
+        assert case["case_id"] == 1 and case["user_id"] == "5"
+        assert case["moderator_id"] == "99" and case["action"] == "warn"
+        assert case["duration"] is None
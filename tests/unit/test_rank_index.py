@@ -0,0 +1,86 @@
+"""
+🧪 Testes Unitários - Índice de Ranking
+=======================================
+
+Testes para src/utils/rank_index.py
+"""
+
+import random
+
+from src.utils.rank_index import GuildRanking, RankStats
+
+
+class TestGuildRanking:
+    """Testes para a classe GuildRanking."""
+
+    def test_orderings_match_sorted_scan(self) -> None:
+        """Testar posição e páginas contra uma ordenação completa."""
+        rng = random.Random(42)
+        ranking = GuildRanking()
+        stats: dict[str, RankStats] = {}
+        for i in range(300):
+            user_id = str(1000 + i)
+            xp = rng.randint(0, 5000)
+            stats[user_id] = RankStats(xp, int((xp / 100) ** 0.5), rng.randint(0, 300))
+            ranking.update(user_id, stats[user_id])
+
+        # Atualizações incrementais reordenam corretamente
+        for user_id in rng.sample(sorted(stats), 50):
+            old = stats[user_id]
+            stats[user_id] = RankStats(old.total_xp + 700, old.level + 1, old.messages_sent + 1)
+            ranking.update(user_id, stats[user_id])
+
+        expected = {
+            "xp": sorted(stats, key=lambda u: (-stats[u].total_xp, u)),
+            "level": sorted(stats, key=lambda u: (-stats[u].level, -stats[u].total_xp, u)),
+            "messages": sorted(stats, key=lambda u: (-stats[u].messages_sent, u)),
+        }
+        for ordering, order in expected.items():
+            assert [row["user_id"] for row in ranking.page(0, 300, ordering)] == order
+            for position, user_id in enumerate(order, start=1):
+                assert ranking.rank(user_id, ordering) == position
+
+        page = ranking.page(10, 10, "xp")
+        assert [row["position"] for row in page] == list(range(11, 21))
+
+        # A carga em bloco chega ao mesmo ranking das atualizações uma a uma
+        built = GuildRanking.build(stats)
+        for ordering in expected:
+            assert built.page(0, 300, ordering) == ranking.page(0, 300, ordering)
+
+    def test_remove(self) -> None:
+        """Testar remoção de usuários."""
+        ranking = GuildRanking()
+        ranking.update("a", RankStats(300, 1, 3))
+        ranking.update("b", RankStats(200, 1, 2))
+        ranking.remove("a")
+        ranking.remove("missing")
+
+        assert len(ranking) == 1
+        assert ranking.rank("a") is None
+        assert ranking.rank("b") == 1
+
+
+class TestRankIndex:
+    """Testes do índice de ranking integrado ao Database."""
+
+    async def test_loads_from_db_and_tracks_awards(self, bot_db) -> None:
+        """Testar carga inicial e atualização incremental pelo acumulador."""
+        await bot_db.run_many(
+            "INSERT INTO user_levels (guild_id, user_id, total_xp, level) VALUES ('1', ?, ?, 0)",
+            [("10", 50), ("20", 80), ("30", 20)],
+        )
+        # XP pendente (ainda não gravado) também entra no ranking
+        await bot_db.add_xp("1", "30", 70)
+
+        assert await bot_db.rank_index.count("1") == 3
+        assert await bot_db.rank_index.rank("1", "30") == 1
+        assert await bot_db.rank_index.rank("1", "10") == 3
+
+        await bot_db.add_xp("1", "10", 100)
+        await bot_db.add_xp("1", "40", 5)
+        page = await bot_db.rank_index.page("1", 1, 2)
+        assert [row["user_id"] for row in page] == ["10", "30"]
+        assert await bot_db.rank_index.count("1") == 4
+        assert await bot_db.rank_index.rank("1", "40", "messages") is not None
+        assert bot_db.rank_index.stats()["misses"] == 1
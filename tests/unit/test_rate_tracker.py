@@ -0,0 +1,51 @@
+"""
+🧪 Testes Unitários - Rastreador de Taxa
+========================================
+
+Testes para src/utils/rate_tracker.py
+"""
+
+from src.utils.rate_tracker import RateTracker
+
+
+class TestRateTracker:
+    """Testes para a classe RateTracker."""
+
+    def test_sliding_window_per_guild_and_user(self) -> None:
+        """Testar janela deslizante, chaves separadas e saturação na capacidade."""
+        tracker = RateTracker(capacity=4)
+        assert [tracker.hit((1, 10), 10, now) for now in (0, 1, 2)] == [1, 2, 3]
+        assert tracker.hit((2, 10), 10, 2) == 1
+        assert tracker.count((1, 10), 10, 11.5) == 1
+        assert tracker.hit((1, 10), 10, 11) == 2
+
+        for now in range(13, 20):
+            count = tracker.hit((1, 10), 100, now)
+        assert count == 4
+        assert tracker.count((1, 10), 3, 19) == 3
+        assert tracker.count((9, 9), 10) == 0
+
+    def test_shared_event_counted_once(self) -> None:
+        """Testar que sistemas diferentes registrando a mesma mensagem não duplicam."""
+        tracker = RateTracker()
+        assert tracker.hit((1, 10), 10, 5.0, event_id=111) == 1
+        assert tracker.hit((1, 10), 30, 5.0, event_id=111) == 1
+        assert tracker.hit((1, 10), 10, 6.0, event_id=112) == 2
+
+    def test_memory_cap_and_idle_expiry(self) -> None:
+        """Testar descarte LRU no limite e expiração de chaves inativas."""
+        tracker = RateTracker(max_keys=3, capacity=2, idle_ttl=60)
+        for user in range(3):
+            tracker.hit((1, user), 10, 0)
+        tracker.hit((1, 0), 10, 1)  # (1, 0) volta a ser a mais recente
+        tracker.hit((1, 3), 10, 2)
+
+        assert len(tracker) == 3
+        assert (1, 1) not in tracker and (1, 0) in tracker
+        assert tracker.stats()["allocated_slots"] == 3
+        assert tracker.stats()["evictions"] == 1
+
+        tracker.hit((1, 4), 10, 61.5)
+        assert set(tracker._slots) == {(1, 3), (1, 4)}
+        assert tracker.stats()["expirations"] == 2
+        assert tracker.stats()["allocated_slots"] == 3
@@ -0,0 +1,159 @@
+"""
+🧪 Testes Unitários - Agendador de Eventos
+==========================================
+
+Testes para src/utils/scheduler.py
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from src.utils.database import Database
+from src.utils.scheduler import Scheduler
+
+
+async def event_status(db: Database, event_id: int) -> dict:
+    """Ler o estado persistido de um evento."""
+    return await db.get(
+        "SELECT status, attempts, error FROM scheduled_events WHERE id = ?", (event_id,)
+    )
+
+
+class TestScheduler:
+    """Testes para a classe Scheduler."""
+
+    async def test_runs_in_deadline_order(self, bot_db) -> None:
+        """Testar execução no prazo, em ordem, acordando para eventos mais próximos."""
+        scheduler = Scheduler(bot_db)
+        done = asyncio.Event()
+        executed: list[str] = []
+
+        async def handler(event) -> None:
+            executed.append(event.data["name"])
+            if len(executed) == 3:
+                done.set()
+
+        scheduler.register("test", handler)
+        await scheduler.start()
+
+        now = time.time()
+        late = await scheduler.schedule("test", now + 0.3, {"name": "late"})
+        await scheduler.schedule("test", now + 0.1, {"name": "early"})
+        await scheduler.schedule("test", now - 10, {"name": "overdue"})
+
+        await asyncio.wait_for(done.wait(), 2)
+        assert executed == ["overdue", "early", "late"]
+        assert time.time() >= now + 0.3
+        await scheduler.close()
+        assert (await event_status(bot_db, late))["status"] == "completed"
+
+    async def test_retry_with_backoff_then_fail(self, bot_db) -> None:
+        """Testar novas tentativas com espera exponencial e falha definitiva."""
+        scheduler = Scheduler(bot_db, max_attempts=3, retry_delay=0.01)
+        attempts: list[float] = []
+
+        async def flaky(event) -> None:
+            attempts.append(time.time())
+            raise RuntimeError("indisponível")
+
+        async def refused(event) -> bool:
+            return False
+
+        scheduler.register("flaky", flaky)
+        scheduler.register("refused", refused)
+        await scheduler.start()
+        flaky_id = await scheduler.schedule("flaky", time.time())
+        refused_id = await scheduler.schedule("refused", time.time())
+
+        for _ in range(100):
+            if scheduler.stats()["armed"] == 0 and scheduler.stats()["running"] == 0:
+                break
+            await asyncio.sleep(0.02)
+        await scheduler.close()
+
+        assert len(attempts) == 3
+        assert attempts[2] - attempts[1] >= attempts[1] - attempts[0]
+        row = await event_status(bot_db, flaky_id)
+        assert (row["status"], row["attempts"], row["error"]) == ("failed", 3, "indisponível")
+        row = await event_status(bot_db, refused_id)
+        assert (row["status"], row["attempts"]) == ("failed", 1)
+
+    async def test_rearm_after_restart(self, bot_db) -> None:
+        """Testar rearme do banco, chave única e espera pelo handler."""
+        first = Scheduler(bot_db)
+        old = await first.schedule("unmute", time.time(), {"user_id": "1"}, key="g:1")
+        new = await first.schedule("unmute", time.time(), {"user_id": "1"}, key="g:1")
+        cancelled = await first.schedule("unmute", time.time(), {"user_id": "2"})
+        assert await first.cancel(cancelled)
+        await first.close()
+        assert (await event_status(bot_db, old))["status"] == "cancelled"
+
+        # Processo reiniciado: só o evento pendente volta, e aguarda o handler
+        second = Scheduler(bot_db)
+        assert await second.start() == 1
+        await asyncio.sleep(0.05)
+        assert second.stats()["parked"] == 1
+
+        executed = asyncio.Event()
+
+        async def handler(event) -> None:
+            assert event.id == new
+            executed.set()
+
+        second.register("unmute", handler)
+        await asyncio.wait_for(executed.wait(), 1)
+        await second.close()
+        assert (await event_status(bot_db, new))["status"] == "completed"
+
+
+class TestStartupBackfill:
+    """Testes para o agendamento, ao carregar, dos eventos que antes eram polls."""
+
+    async def test_pending_suggestions_get_expiry(self, bot_db, monkeypatch) -> None:
+        """Testar que sugestões pendentes com expires_at são agendadas uma única vez."""
+        from src.events import suggestion_expired_handler
+
+        monkeypatch.setattr(suggestion_expired_handler, "database", bot_db)
+        await bot_db.run_many(
+            "INSERT INTO suggestions (id, guild_id, status, expires_at) VALUES (?, '1', ?, ?)",
+            [
+                (1, "pending", "2024-01-01T00:00:00+00:00"),
+                (2, "pending", None),
+                (3, "approved", "2024-01-01T00:00:00+00:00"),
+            ],
+        )
+        cog = suggestion_expired_handler.SuggestionExpiredHandler(SimpleNamespace())
+        assert await cog.backfill_expirations() == 1
+        assert await cog.backfill_expirations() == 0
+
+        rows = await bot_db.get_all(
+            "SELECT event_key, execute_at FROM scheduled_events WHERE status = 'pending'"
+        )
+        assert [row["event_key"] for row in rows] == ["1"]
+        assert rows[0]["execute_at"] == 1704067200
+
+    async def test_auto_repost_stickies_get_event(self, bot_db, monkeypatch) -> None:
+        """Testar que stickies com auto repost recebem um evento sem adiar os existentes."""
+        from src.events import sticky_messages_poster
+
+        monkeypatch.setattr(sticky_messages_poster, "database", bot_db)
+        await bot_db.run_many(
+            """INSERT INTO sticky_messages (channel_id, enabled, auto_repost, repost_interval)
+               VALUES (?, ?, ?, ?)""",
+            [("10", 1, 1, 5), ("11", 1, 1, None), ("12", 1, 0, 5), ("13", 0, 1, 5)],
+        )
+        existing = await bot_db.scheduler.schedule(
+            "sticky_repost", time.time() + 30, {"channel_id": "10"}, key="10"
+        )
+        cog = sticky_messages_poster.StickyMessagesPoster(SimpleNamespace())
+        assert await cog.backfill_reposts() == 1
+
+        rows = await bot_db.get_all(
+            """SELECT id, event_key FROM scheduled_events
+               WHERE status = 'pending' ORDER BY event_key"""
+        )
+        assert [(row["id"] == existing, row["event_key"]) for row in rows] == [
+            (True, "10"),
+            (False, "11"),
+        ]
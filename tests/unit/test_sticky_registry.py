@@ -0,0 +1,115 @@
+"""
+🧪 Testes Unitários - Registro de Sticky Messages
+=================================================
+
+Testes para src/utils/sticky_registry.py
+"""
+
+import asyncio
+import itertools
+
+import pytest
+
+from src.utils.database import Database
+from src.utils.sticky_registry import StickyRegistry, StickyState
+
+
+class FakeMessage:
+    """Mensagem mínima (ID e exclusão)."""
+
+    def __init__(self, channel: "FakeChannel", message_id: int) -> None:
+        self.channel = channel
+        self.id = message_id
+
+    async def delete(self) -> None:
+        self.channel.deleted.append(self.id)
+
+
+class FakeChannel:
+    """Canal que registra envios e exclusões (sem fetch)."""
+
+    _ids = itertools.count(1000)
+
+    def __init__(self, channel_id: int) -> None:
+        self.id = channel_id
+        self.sent: list[str | None] = []
+        self.deleted: list[int] = []
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        return FakeMessage(self, message_id)
+
+    async def send(self, content=None, embed=None) -> FakeMessage:
+        self.sent.append(content)
+        return FakeMessage(self, next(self._ids))
+
+
+@pytest.fixture
+async def sticky_db(bot_db):
+    """Uma sticky ativa no canal 10."""
+    await bot_db.run(
+        """INSERT INTO sticky_messages
+        (guild_id, channel_id, content, message_threshold, last_message_id)
+        VALUES ('1', '10', 'Leia as regras', 5, '999')"""
+    )
+    return bot_db
+
+
+class TestStickyRegistry:
+    """Testes para o estado em memória das sticky messages."""
+
+    def test_state_from_both_column_families(self) -> None:
+        """Testar as colunas dos dois sistemas de sticky."""
+        state = StickyState.from_row(
+            {
+                "channel_id": "5",
+                "guild_id": "1",
+                "message_content": "Oi",
+                "frequency": 3,
+                "current_message_id": "77",
+                "embed_data": '{"title": "T"}',
+            }
+        )
+        assert (state.content, state.threshold, state.message_id) == ("Oi", 3, 77)
+        assert state.embed_data == {"title": "T"}
+        assert StickyState.from_row({"channel_id": "5", "content": "x", "is_active": 0}) is None
+        assert StickyState.from_row({"channel_id": "5", "content": "x", "enabled": 0}) is None
+
+    async def test_burst_causes_single_repost(self, sticky_db: Database) -> None:
+        """Testar que uma rajada de 50 mensagens gera um único repost."""
+        registry = StickyRegistry(sticky_db, debounce=0.05, max_delay=1.0, flush_interval=60)
+        channel = FakeChannel(10)
+        assert await registry.load() == 1
+
+        for _ in range(50):
+            await registry.record_message(channel)
+        await asyncio.sleep(0.15)
+
+        assert channel.sent == ["Leia as regras"]
+        assert channel.deleted == [999]
+        assert registry.stats()["coalesced"] == 45
+        assert registry.get(10).counter == 0
+        await registry.close()
+
+    async def test_flush_persists_state(self, sticky_db: Database) -> None:
+        """Testar a gravação de contador, ID atual e reposts."""
+        registry = StickyRegistry(sticky_db, flush_interval=60)
+        channel = FakeChannel(10)
+        await registry.load()
+        message = await registry.repost(channel)
+        await registry.record_message(channel)
+        await registry.record_message(channel)
+
+        assert await registry.flush() == 1
+        assert await registry.flush() == 0
+        row = await sticky_db.get("SELECT * FROM sticky_messages WHERE channel_id = '10'")
+        assert row["message_count"] == 2
+        assert row["last_message_id"] == str(message.id)
+        stats = await sticky_db.get("SELECT * FROM sticky_stats WHERE channel_id = '10'")
+        assert stats["reposts_count"] == 1
+
+        # Um novo registro (reinício do bot) parte do estado gravado
+        restarted = StickyRegistry(sticky_db)
+        await restarted.load()
+        assert (restarted.get(10).counter, restarted.get(10).message_id) == (2, message.id)
+        await registry.close()
+        await restarted.close()
@@ -0,0 +1,120 @@
+"""
+🧪 Testes Unitários - Pool de Canais de Ticket
+==============================================
+
+Testes para src/utils/ticket_pool.py
+"""
+
+import asyncio
+
+import discord
+
+from src.utils.database import Database
+from src.utils.ticket_pool import DEFAULT_CATEGORY_NAME, TicketChannelPool
+
+
+class FakeResponse:
+    """Resposta HTTP mínima para montar um HTTPException."""
+
+    status = 429
+    reason = "Too Many Requests"
+
+
+class FakeChannel:
+    """Canal de texto que registra as edições."""
+
+    def __init__(self, channel_id: int, name: str, category) -> None:
+        self.id = channel_id
+        self.name = name
+        self.category_id = category.id
+        self.edits: list[dict] = []
+
+    async def edit(self, **fields) -> None:
+        self.edits.append(fields)
+        self.name = fields.get("name", self.name)
+
+
+class FakeCategory:
+    """Categoria com os canais criados nela."""
+
+    def __init__(self, category_id: int = 10, name: str = DEFAULT_CATEGORY_NAME) -> None:
+        self.id = category_id
+        self.name = name
+        self.text_channels: list[FakeChannel] = []
+
+
+class FakeGuild:
+    """Servidor que cria canais (com 429s opcionais)."""
+
+    def __init__(self, guild_id: int = 1, rate_limits: int = 0) -> None:
+        self.id = guild_id
+        self.default_role = "everyone"
+        self.me = "bot"
+        self.categories = [FakeCategory()]
+        self.channels: dict[int, FakeChannel] = {}
+        self.rate_limits = rate_limits
+        self.create_calls = 0
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
+
+    async def create_text_channel(self, name, category=None, overwrites=None, reason=None):
+        self.create_calls += 1
+        if self.rate_limits:
+            self.rate_limits -= 1
+            raise discord.HTTPException(FakeResponse(), "rate limited")
+        channel = FakeChannel(100 + len(self.channels), name, category)
+        self.channels[channel.id] = channel
+        category.text_channels.append(channel)
+        return channel
+
+
+class TestTicketChannelPool:
+    """Testes para a reposição e o uso dos canais pré-criados."""
+
+    async def test_replenish_and_acquire(self, bot_db: Database) -> None:
+        """Testar a reposição até o tamanho e a abertura com uma única edição."""
+        pool = TicketChannelPool(bot_db, interval=0.01)
+        pool.configure(1, None, 2)
+        guild = FakeGuild()
+        await pool.warm(guild)
+        await asyncio.sleep(0.1)
+        assert len(pool) == 2 and guild.create_calls == 2
+
+        channel = await pool.acquire(guild, name="ticket-ana", overwrites={"ana": "rw"})
+        assert channel.name == "ticket-ana"
+        assert len(channel.edits) == 1
+        assert channel.edits[0]["overwrites"] == {"ana": "rw"} and channel.edits[0]["topic"] is None
+        await asyncio.sleep(0.1)
+        assert len(pool) == 2 and pool.stats()["acquired"] == 1
+        await pool.close()
+
+    async def test_empty_pool_and_rate_limits(self, bot_db: Database) -> None:
+        """Testar o retorno None sem pool e a espera após 429."""
+        pool = TicketChannelPool(bot_db, interval=0.01, max_backoff=0.02)
+        guild = FakeGuild(rate_limits=2)
+        assert await pool.acquire(guild, name="ticket-ana", overwrites={}) is None
+        assert pool.stats()["misses"] == 1 and guild.create_calls == 0
+
+        pool.configure(1, None, 1)
+        await pool.warm(guild)
+        await asyncio.sleep(0.2)
+        assert len(pool) == 1 and pool.stats()["rate_limited"] == 2
+        await pool.close()
+
+    async def test_restart_rediscovers_free_channels(self, bot_db: Database) -> None:
+        """Testar que canais livres já existentes são reaproveitados após reiniciar."""
+        await bot_db.run(
+            "INSERT INTO ticket_config (guild_id, category_id, pool_size) VALUES ('1', NULL, 2)"
+        )
+        guild = FakeGuild()
+        category = guild.categories[0]
+        for name in ("ticket-livre-1", "ticket-0001"):
+            await guild.create_text_channel(name, category=category)
+        await bot_db.create_ticket("1", "5", "101")
+
+        pool = TicketChannelPool(bot_db, interval=60)
+        assert await pool.load() == 1
+        assert await pool.warm(guild) == 1
+        assert (await pool.acquire(guild, name="novo", overwrites={})).id == 100
+        await pool.close()
@@ -0,0 +1,69 @@
+"""
+🧪 Testes Unitários - Registro de Tickets
+=========================================
+
+Testes para src/utils/ticket_registry.py
+"""
+
+import pytest
+
+from src.utils.database import Database
+
+
+@pytest.fixture
+async def ticket_db(bot_db):
+    """Tickets de dois membros."""
+    await bot_db.run_many(
+        "INSERT INTO tickets (guild_id, channel_id, user_id, type, status) VALUES (?, ?, ?, ?, ?)",
+        [
+            ("1", "100", "5", "channel", "open"),
+            ("1", "101", "5", "thread", "pending"),
+            ("1", "102", "6", "channel", "open"),
+            ("1", "103", "5", "channel", "closed"),
+            ("2", "200", "5", "channel", "open"),
+        ],
+    )
+    return bot_db
+
+
+class TestTicketRegistry:
+    """Testes para os índices por canal e por dono."""
+
+    async def test_indexes_loaded_from_open_tickets(self, ticket_db: Database) -> None:
+        """Testar a carga dos tickets abertos nos dois índices."""
+        registry = ticket_db.tickets
+        assert await registry.load() == 4
+
+        thread = await registry.get(101)
+        assert thread["type"] == "thread" and thread["status"] == "pending"
+        assert await registry.get(103) is None
+
+        owned = await registry.owner_tickets(1, 5)
+        assert [ticket["channel_id"] for ticket in owned] == ["100", "101"]
+        assert await registry.owner_tickets("2", "5") != []
+        assert await registry.owner_tickets(1, 7) == []
+
+    async def test_create_and_close_keep_indexes_consistent(self, ticket_db: Database) -> None:
+        """Testar a criação, a transferência e o fechamento pelo Database."""
+        ticket_id = await ticket_db.create_ticket("1", "6", "300", reason="ajuda")
+        ticket = await ticket_db.get_user_open_ticket("1", "6")
+        assert ticket["id"] == ticket_id and ticket["created_at"] is not None
+
+        ticket_db.tickets.update(300, assigned_to="99")
+        assert (await ticket_db.get_ticket_by_channel_id("300"))["assigned_to"] == "99"
+
+        await ticket_db.update_ticket_status("300", "closed", "5")
+        await ticket_db.update_ticket_status("102", "closed", "5")
+        assert await ticket_db.get_user_open_ticket("1", "6") is None
+        assert ticket_db.tickets.stats()["owners"] == 2
+        closed = await ticket_db.get_ticket_by_channel_id("300")
+        assert closed["status"] == "closed"
+
+    async def test_reopen_reloads_row(self, ticket_db: Database) -> None:
+        """Testar que reabrir um ticket fechado o devolve aos índices."""
+        await ticket_db.tickets.load()
+        await ticket_db.update_ticket_status("103", "open")
+
+        reopened = await ticket_db.tickets.get(103)
+        assert reopened["status"] == "open" and reopened["user_id"] == "5"
+        assert len(await ticket_db.tickets.owner_tickets(1, 5)) == 3
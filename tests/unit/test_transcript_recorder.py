@@ -0,0 +1,77 @@
+"""
+🧪 Testes Unitários - Gravação de Transcripts em Lote
+=====================================================
+
+Testes para src/utils/transcript_recorder.py e src/utils/ticket_registry.py
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.database import Database
+from src.utils.ticket_registry import TicketRegistry
+from src.utils.transcript_recorder import TranscriptRecorder
+
+
+@pytest.fixture
+async def ticket_db(bot_db):
+    """Um ticket aberto e um fechado."""
+    await bot_db.run_many(
+        "INSERT INTO tickets (guild_id, channel_id, user_id, status) VALUES ('1', ?, '5', ?)",
+        [("100", "open"), ("200", "closed")],
+    )
+    return bot_db
+
+
+async def transcript_count(db: Database, channel_id: str) -> int:
+    """Eventos gravados de um canal."""
+    row = await db.get(
+        "SELECT COUNT(*) AS total FROM transcript_messages WHERE channel_id = ?", (channel_id,)
+    )
+    return row["total"]
+
+
+class TestTranscriptRecorder:
+    """Testes para o registro de tickets e a gravação em lote."""
+
+    async def test_ticket_registry_tracks_open_and_close(self, ticket_db: Database) -> None:
+        """Testar a carga inicial e a sincronização na abertura e no fechamento."""
+        registry = TicketRegistry(ticket_db)
+        assert await registry.is_ticket_channel(100)
+        assert not await registry.is_ticket_channel(200)
+
+        registry.opened({"channel_id": "300", "guild_id": "1", "user_id": "5"})
+        registry.set_status(100, "closed")
+        assert await registry.is_ticket_channel(300)
+        assert not await registry.is_ticket_channel(100)
+        assert len(registry) == 1
+
+    async def test_burst_is_written_in_few_transactions(self, ticket_db: Database) -> None:
+        """Testar que 300 mensagens viram uma gravação periódica."""
+        recorder = TranscriptRecorder(ticket_db, flush_interval=0.05)
+        for index in range(300):
+            recorder.record(100 + index % 3, index, 5, f"msg {index}", {"i": index}, "2026", "new")
+        assert await transcript_count(ticket_db, "100") == 0
+
+        await asyncio.sleep(0.15)
+        assert await transcript_count(ticket_db, "100") == 100
+        assert recorder.stats()["flushes"] == 1
+        assert recorder.stats()["pending"] == 0
+        await recorder.close()
+
+    async def test_flush_single_channel_and_ticket_close(self, ticket_db: Database) -> None:
+        """Testar a gravação de um canal só e o flush ao fechar o ticket."""
+        recorder = ticket_db.transcripts
+        recorder.flush_interval = 60
+        for index in range(4):
+            recorder.record(100 if index % 2 else 101, index, 5, "oi", {}, "2026", "new")
+
+        assert await recorder.flush(101) == 2
+        assert len(recorder) == 2
+
+        await ticket_db.update_ticket_status("100", "closed", "5")
+        assert await transcript_count(ticket_db, "100") == 2
+        assert not await ticket_db.tickets.is_ticket_channel(100)
+        row = await ticket_db.get("SELECT status FROM tickets WHERE channel_id = '100'")
+        assert row["status"] == "closed"
@@ -0,0 +1,93 @@
+"""
+🧪 Testes Unitários - Renderização de Transcripts em Streaming
+==============================================================
+
+Testes para src/utils/transcript_renderer.py
+"""
+
+import gzip
+import json
+
+import pytest
+
+from src.utils.database import Database
+from src.utils.transcript_renderer import render_ticket_transcript, render_transcript
+
+
+@pytest.fixture
+async def transcript_db(bot_db):
+    """Um ticket e suas mensagens."""
+    await bot_db.run(
+        "INSERT INTO tickets (guild_id, channel_id, user_id, status) VALUES ('1', '100', '5', 'open')"
+    )
+    for index in range(200):
+        attachments = [{"filename": f"a{index}.png", "size": 10}] if index % 50 == 0 else []
+        if index == 100:
+            attachments[0]["archived"] = {"sha256": "ff00", "path": "ff/ff00.png", "size": 10}
+        bot_db.transcripts.record(
+            100,
+            index,
+            5,
+            f"<b>mensagem {index}</b>",
+            {"author_name": "Ana & Bia", "timestamp": f"t{index:03}", "attachments": attachments},
+            f"2026-10-01T00:00:{index:03}",
+            "deleted" if index == 1 else "new",
+        )
+    return bot_db
+
+
+def read_all(parts) -> bytes:
+    """Conteúdo das partes concatenadas."""
+    data = b""
+    for part in parts:
+        with part.file:
+            data += part.file.read()
+    return data
+
+
+class TestTranscriptRenderer:
+    """Testes para a renderização em pedaços, a divisão e a compressão."""
+
+    async def test_formats_escape_and_order(self, transcript_db: Database) -> None:
+        """Testar HTML escapado, texto e JSON válido com as 200 mensagens."""
+        ticket = await transcript_db.get("SELECT * FROM tickets WHERE channel_id = '100'")
+
+        html = read_all(await render_ticket_transcript(transcript_db, ticket, "html")).decode()
+        assert "&lt;b&gt;mensagem 0&lt;/b&gt;" in html and "<b>" not in html
+        assert "Ana &amp; Bia" in html and html.count('class="attachment"') == 4
+        assert html.index("mensagem 9&lt;") < html.index("mensagem 10&lt;")
+
+        text = read_all(render_transcript(transcript_db.db_path, ticket, "txt")).decode()
+        assert "[t001] [DELETADA] Ana & Bia: <b>mensagem 1</b>\n" in text
+        assert "📎 Anexo: a50.png\n" in text
+        assert "📎 Anexo: a100.png [arquivo: ff/ff00.png]" in text
+
+        data = json.loads(read_all(render_transcript(transcript_db.db_path, ticket, "json")))
+        assert data["message_count"] == 200
+        assert data["messages"][50]["data"]["attachments"][0]["filename"] == "a50.png"
+
+        with pytest.raises(ValueError):
+            render_transcript(transcript_db.db_path, ticket, "pdf")
+
+    async def test_split_at_size_limit(self, transcript_db: Database) -> None:
+        """Testar a divisão em partes menores que o limite, sem perder conteúdo."""
+        ticket = await transcript_db.get("SELECT * FROM tickets WHERE channel_id = '100'")
+        whole = read_all(await render_ticket_transcript(transcript_db, ticket, "txt"))
+
+        parts = render_transcript(transcript_db.db_path, ticket, "txt", max_part_size=4096)
+        assert len(parts) > 1
+        assert all(part.size <= 4096 for part in parts)
+        assert parts[0].filename == "ticket_1_transcript_parte1.txt"
+        assert read_all(parts) == whole
+
+    async def test_gzip_parts_round_trip(self, transcript_db: Database) -> None:
+        """Testar partes comprimidas que descomprimem no documento original."""
+        ticket = await transcript_db.get("SELECT * FROM tickets WHERE channel_id = '100'")
+        whole = read_all(await render_ticket_transcript(transcript_db, ticket, "html"))
+
+        parts = render_transcript(
+            transcript_db.db_path, ticket, "html", compress=True, max_part_size=2048
+        )
+        assert len(parts) > 1 and parts[-1].filename.endswith("_parte%d.html.gz" % len(parts))
+        assert all(part.size <= 2048 for part in parts)
+        assert gzip.decompress(read_all(parts)) == whole
@@ -0,0 +1,133 @@
+"""
+🧪 Testes Unitários - Acumulador de XP
+======================================
+
+Testes para src/utils/xp_accumulator.py
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.database import Database
+from src.utils.xp_accumulator import XPAccumulator, calculate_level, xp_for_level
+
+
+async def count_rows(db: Database) -> int:
+    """Contar linhas gravadas em user_levels."""
+    row = await db.get("SELECT COUNT(*) AS total FROM user_levels")
+    return row["total"]
+
+
+class TestXPAccumulator:
+    """Testes para a classe XPAccumulator."""
+
+    def test_level_formula_roundtrip(self) -> None:
+        """Testar que xp_for_level é o inverso de calculate_level."""
+        for level in range(50):
+            assert calculate_level(xp_for_level(level)) == level
+            assert calculate_level(xp_for_level(level + 1) - 1) == level
+
+    async def test_awards_stay_in_memory_until_flush(self, bot_db) -> None:
+        """Testar que XP só é gravado no flush, em lote."""
+        accumulator = XPAccumulator(bot_db, flush_interval=3600, max_pending=1000)
+
+        for _ in range(10):
+            await accumulator.add_xp("1", "10", 15)
+        await accumulator.add_xp("1", "20", 15)
+        assert await count_rows(bot_db) == 0
+
+        assert await accumulator.flush() == 2
+        row = await bot_db.get("SELECT * FROM user_levels WHERE user_id = '10'")
+        assert row["total_xp"] == 150
+        assert row["messages_sent"] == 10
+        assert row["level"] == 1
+
+        # Segundo flush soma apenas o delta
+        await accumulator.add_xp("1", "10", 50)
+        await accumulator.close()
+        row = await bot_db.get("SELECT * FROM user_levels WHERE user_id = '10'")
+        assert row["total_xp"] == 200
+        assert row["messages_sent"] == 11
+
+    async def test_level_up_detected_in_memory(self, bot_db) -> None:
+        """Testar que o level up é calculado sem ler o banco de novo."""
+        await bot_db.run(
+            "INSERT INTO user_levels (guild_id, user_id, total_xp, level) VALUES ('1', '10', 390, 1)"
+        )
+        accumulator = XPAccumulator(bot_db, flush_interval=3600)
+
+        award = await accumulator.add_xp("1", "10", 5)
+        assert not award.leveled_up
+        award = await accumulator.add_xp("1", "10", 5)
+        assert award.leveled_up
+        assert (award.old_level, award.new_level, award.total_xp) == (1, 2, 400)
+        await accumulator.close()
+
+    async def test_flush_on_max_pending(self, bot_db) -> None:
+        """Testar que o limite de pendências dispara o flush."""
+        accumulator = XPAccumulator(bot_db, flush_interval=3600, max_pending=3)
+
+        await accumulator.add_xp("1", "10", 15)
+        await accumulator.add_xp("1", "20", 15)
+        assert await count_rows(bot_db) == 0
+        await accumulator.add_xp("1", "30", 15)
+        assert await count_rows(bot_db) == 3
+        assert accumulator.stats()["pending_awards"] == 0
+        await accumulator.close()
+
+    async def test_max_pending_waits_for_running_flush(self, bot_db, monkeypatch) -> None:
+        """Testar que o limite aguarda o flush em andamento e grava o restante."""
+        accumulator = XPAccumulator(bot_db, flush_interval=3600, max_pending=2)
+        await accumulator.add_xp("1", "10", 15)
+        release = asyncio.Event()
+        run_many = bot_db.run_many
+
+        async def slow_run_many(query, params):
+            await release.wait()
+            return await run_many(query, params)
+
+        monkeypatch.setattr(bot_db, "run_many", slow_run_many)
+        running = asyncio.create_task(accumulator.flush())
+        await asyncio.sleep(0)
+        await accumulator.add_xp("1", "20", 15)
+        award = asyncio.create_task(accumulator.add_xp("1", "30", 15))
+        await asyncio.sleep(0.01)
+        assert not award.done()
+
+        release.set()
+        await asyncio.gather(running, award)
+        assert accumulator.stats()["pending_awards"] == 0
+        assert await count_rows(bot_db) == 3
+        await accumulator.close()
+
+    async def test_failed_flush_keeps_pending(self, bot_db, monkeypatch) -> None:
+        """Testar que XP não se perde quando o flush falha."""
+        accumulator = XPAccumulator(bot_db, flush_interval=3600)
+        await accumulator.add_xp("1", "10", 15)
+
+        async def broken_run_many(query, params):
+            raise RuntimeError("disk I/O error")
+
+        monkeypatch.setattr(bot_db, "run_many", broken_run_many)
+        with pytest.raises(RuntimeError):
+            await accumulator.flush()
+        assert accumulator.stats()["flush_failures"] == 1
+
+        monkeypatch.undo()
+        assert await accumulator.flush() == 1
+        row = await bot_db.get("SELECT total_xp FROM user_levels")
+        assert row["total_xp"] == 15
+
+    async def test_database_reads_see_pending_xp(self, bot_db) -> None:
+        """Testar que get_user_level e o close do Database enxergam o pendente."""
+        await bot_db.add_xp("1", "10", 120)
+        assert await count_rows(bot_db) == 0
+
+        data = await bot_db.get_user_level("1", "10")
+        assert data["total_xp"] == 120
+        assert data["level"] == 1
+
+        await bot_db.close()
+        row = await bot_db.get("SELECT total_xp FROM user_levels")
+        assert row["total_xp"] == 120